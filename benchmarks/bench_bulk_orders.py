@@ -0,0 +1,263 @@
+"""대량 주문 변환 벤치마크: 예전 iterrows 구현 vs orders.bulk의 열 단위 구현.
+
+예전 구현(행마다 iterrows + 셀마다 _text/_number/_quantity)을 그대로 두고, 같은 DataFrame에서
+두 결과가 완전히 같은지(repr 비교)도 함께 확인한다.
+
+    python benchmarks/bench_bulk_orders.py [줄 수 ...]   (기본 20000)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Mapping
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from orders import bulk  # noqa: E402
+from orders.bulk import _number, _quantity, _text  # noqa: E402
+
+
+def _normalize_key(value):
+    if value is None or pd.isna(value):
+        return ""
+    text = str(value).strip()
+    return text[:-2] if text.endswith(".0") else text
+
+
+def _iterrows_coupang(
+    dataframe: pd.DataFrame,
+    columns: Mapping[str, object],
+    product_codes: Mapping[str, str],
+    option_to_product_no: Mapping[str, str],
+    normalize_mapping_key,
+) -> dict[str, dict]:
+    orders: dict[str, dict] = {}
+    for _, row in dataframe.iterrows():
+        order_number = _text(row[columns["주문번호"]]).strip()
+        if not order_number:
+            continue
+        if order_number not in orders:
+            orders[order_number] = {
+                "수취인이름": _text(row[columns["수취인이름"]]),
+                "수취인주소": _text(row[columns["수취인 주소"]]),
+                "수취인전화번호": _text(row[columns["수취인전화번호"]]),
+                "배송메세지": _text(row[columns["배송메세지"]]),
+                "우편번호": _text(row[columns["우편번호"]]),
+                "상품목록": [], "결제액": 0,
+            }
+        payment_column = columns.get("결제액")
+        if payment_column is not None:
+            orders[order_number]["결제액"] += _number(row[payment_column])
+        option_id = normalize_mapping_key(row[columns["옵션ID"]])
+        orders[order_number]["상품목록"].append({
+            "상품명": _text(row[columns["노출상품명(옵션명)"]]),
+            "옵션": _text(row[columns["등록옵션명"]]),
+            "수량": _quantity(row[columns["구매수(수량)"]]),
+            "상품코드": product_codes.get(option_id, ""),
+            "쿠팡상품번호": option_to_product_no.get(option_id, "") if option_id else "",
+        })
+    return orders
+
+
+def _iterrows_11st(dataframe: pd.DataFrame, columns: Mapping[str, object]) -> dict[str, dict]:
+    orders: dict[str, dict] = {}
+    for _, row in dataframe.iterrows():
+        order_number = _text(row[columns["주문번호"]]).strip()
+        if not order_number:
+            continue
+        if order_number not in orders:
+            orders[order_number] = {
+                "수취인명": _text(row[columns["수취인"]]),
+                "주소": _text(row[columns["주소"]]),
+                "휴대폰번호": _text(row[columns["휴대폰번호"]]),
+                "전화번호": _text(row[columns["전화번호"]]),
+                "우편번호": _text(row[columns["우편번호"]]),
+                "배송메시지": _text(row[columns.get("배송메시지")]) if columns.get("배송메시지") is not None else "",
+                "상품목록": [],
+                "주문금액": _number(row[columns["주문금액"]]) if columns.get("주문금액") is not None else 0,
+            }
+        option = _text(row[columns["옵션"]]).strip() or "없음"
+        orders[order_number]["상품목록"].append({
+            "상품명": _text(row[columns["상품명"]]), "옵션": option,
+            "수량": _quantity(row[columns["수량"]]),
+        })
+    return orders
+
+
+def _iterrows_naver(
+    dataframe: pd.DataFrame,
+    columns: Mapping[str, object],
+    product_codes: Mapping[str, str],
+    normalize_mapping_key,
+) -> dict[str, dict]:
+    orders: dict[str, dict] = {}
+    grouped_rows: dict[str, list[tuple[str, pd.Series]]] = {}
+
+    for _, row in dataframe.iterrows():
+        order_number = _text(row[columns["주문번호"]]).strip()
+        if not order_number:
+            continue
+        pattern = order_number[:13] if len(order_number) >= 13 else order_number
+        grouped_rows.setdefault(pattern, []).append((order_number, row))
+
+    amount_column = columns.get("최종 상품별 총 주문금액")
+    for pattern, rows in grouped_rows.items():
+        first_order = rows[0][1]
+        delivery_column = columns["배송방법(구매자 요청)"]
+        first_delivery = _text(first_order[delivery_column]) or "배송방법 오류"
+        order = {
+            "주문번호목록": [order_number for order_number, _ in rows],
+            "수취인명": _text(first_order[columns["수취인명"]]),
+            "수취인연락처1": _text(first_order[columns["수취인연락처1"]]),
+            "통합배송지": _text(first_order[columns["통합배송지"]]),
+            "구매자연락처": _text(first_order[columns["구매자연락처"]]),
+            "배송메세지": _text(first_order[columns["배송메세지"]]),
+            "우편번호": _text(first_order[columns["우편번호"]]),
+            "배송방법": first_delivery,
+            "상품수": 0,
+            "상품목록": [],
+            "주문총액": 0,
+        }
+        has_standard_delivery = False
+        for _, row in rows:
+            delivery_method = _text(row[delivery_column])
+            if delivery_method == "택배,등기,소포":
+                has_standard_delivery = True
+            product_number = normalize_mapping_key(row[columns["상품번호"]])
+            product_amount = _number(row[amount_column]) if amount_column is not None else 0
+            order["주문총액"] += product_amount
+            order["상품수"] += 1
+            order["상품목록"].append({
+                "상품명": _text(row[columns["상품명"]]),
+                "수량": _quantity(row[columns["수량"]]),
+                "옵션": _text(row[columns["옵션정보"]]) or "없음",
+                "상품코드": product_codes.get(product_number, "") or "        ",
+                "금액": product_amount,
+                "상품번호": product_number,
+            })
+        if has_standard_delivery:
+            order["배송방법"] = "택배,등기,소포"
+        orders[pattern] = order
+    return orders
+
+
+def _iterrows_gmarket(dataframe: pd.DataFrame, columns: Mapping[str, object]) -> dict[str, dict]:
+    orders: dict[str, dict] = {}
+    sale_column = columns.get("판매금액")
+    shipping_column = columns.get("배송비 금액")
+    additional_column = columns.get("추가구성")
+
+    for _, row in dataframe.iterrows():
+        order_number = _text(row[columns["주문번호"]]).strip()
+        if not order_number:
+            continue
+        if order_number not in orders:
+            orders[order_number] = {
+                "수령인명": _text(row[columns["수령인명"]]),
+                "주소": _text(row[columns["주소"]]),
+                "수령인 전화번호": _text(row[columns["수령인 전화번호"]]),
+                "수령인 휴대폰": _text(row[columns["수령인 휴대폰"]]),
+                "배송시 요구사항": _text(row[columns["배송시 요구사항"]]),
+                "우편번호": _text(row[columns["우편번호"]]),
+                "상품목록": [],
+                "판매금액": _number(row[sale_column]) if sale_column is not None else 0,
+                "배송비 금액": _number(row[shipping_column]) if shipping_column is not None else 0,
+            }
+        option = _text(row[columns["옵션"]]).strip()
+        if option.lower() in ("nan", ""):
+            option = "없음"
+        additional_config = _text(row[additional_column]).strip() if additional_column is not None else ""
+        if additional_config.lower() == "nan":
+            additional_config = ""
+        orders[order_number]["상품목록"].append({
+            "상품명": _text(row[columns["상품명"]]),
+            "옵션": option,
+            "수량": _quantity(row[columns["수량"]]),
+            "추가구성": additional_config,
+        })
+    return orders
+
+
+COUPANG = {
+    "주문번호": "주문번호", "수취인이름": "수취인이름", "수취인 주소": "수취인 주소",
+    "수취인전화번호": "수취인전화번호", "배송메세지": "배송메세지", "우편번호": "우편번호",
+    "노출상품명(옵션명)": "노출상품명(옵션명)", "등록옵션명": "등록옵션명",
+    "구매수(수량)": "구매수(수량)", "옵션ID": "옵션ID", "결제액": "결제액",
+}
+ST11 = {name: name for name in (
+    "주문번호", "수취인", "상품명", "옵션", "수량", "주문금액", "휴대폰번호", "전화번호",
+    "우편번호", "주소", "배송메시지")}
+NAVER = {name: name for name in (
+    "주문번호", "수취인명", "수취인연락처1", "통합배송지", "구매자연락처", "배송메세지", "상품명",
+    "옵션정보", "수량", "우편번호", "상품번호", "배송방법(구매자 요청)", "최종 상품별 총 주문금액")}
+GMARKET = {name: name for name in (
+    "주문번호", "수령인명", "주소", "수령인 전화번호", "수령인 휴대폰", "상품명", "옵션", "수량",
+    "배송시 요구사항", "우편번호", "판매금액", "추가구성", "배송비 금액")}
+
+
+def _frame(columns, count, rng, order_number):
+    """주문 하나에 1~4줄, 가끔 빈 값·빈 주문번호가 섞인 주문 파일 DataFrame."""
+    rows = []
+    order = 0
+    while len(rows) < count:
+        order += 1
+        for line in range(rng.randint(1, 4)):
+            row = {}
+            for name in columns:
+                if name == "주문번호":
+                    row[name] = order_number(order, line) if rng.random() > 0.01 else None
+                elif name in ("수량", "구매수(수량)"):
+                    row[name] = rng.choice((1, 2, 3, None, 1.0))
+                elif "금액" in name or name == "결제액":
+                    row[name] = rng.choice((f"{rng.randint(1, 90) * 1000:,}", rng.randint(1, 9) * 500, None))
+                elif name in ("옵션ID", "상품번호"):
+                    row[name] = rng.choice((100 + order % 50, f"{200 + order % 50}", None))
+                elif rng.random() < 0.05:
+                    row[name] = None
+                else:
+                    row[name] = f"{name}{order % 97}"
+            rows.append(row)
+    return pd.DataFrame(rows[:count], columns=list(columns))
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main(counts) -> None:
+    rng = random.Random(20)
+    codes = {str(number): f"P{number}" for number in range(100, 250)}
+    cases = [
+        ("coupang", COUPANG, lambda o, _l: f"3000{o:08d}",
+         lambda df: _iterrows_coupang(df, COUPANG, codes, codes, _normalize_key),
+         lambda df: bulk.build_coupang_orders(df, COUPANG, codes, codes, _normalize_key)),
+        ("11st", ST11, lambda o, _l: f"2026{o:010d}",
+         lambda df: _iterrows_11st(df, ST11),
+         lambda df: bulk.build_11st_orders(df, ST11)),
+        ("naver", NAVER, lambda o, line: f"2026081{o:06d}{line:03d}",
+         lambda df: _iterrows_naver(df, NAVER, codes, _normalize_key),
+         lambda df: bulk.build_naver_orders(df, NAVER, codes, _normalize_key)),
+        ("gmarket", GMARKET, lambda o, _l: f"4{o:09d}",
+         lambda df: _iterrows_gmarket(df, GMARKET),
+         lambda df: bulk.build_gmarket_orders(df, GMARKET)),
+    ]
+    print(f"{'store':>8}{'lines':>8}{'iterrows':>12}{'columnar':>12}{'speedup':>10}")
+    for count in counts:
+        for store, columns, order_number, old, new in cases:
+            frame = _frame(columns, count, rng, order_number)
+            expected, old_sec = _timed(old, frame)
+            actual, new_sec = _timed(new, frame)
+            assert repr(actual) == repr(expected), store
+            print(f"{store:>8}{count:>8}{old_sec:>11.3f}s{new_sec:>11.3f}s{old_sec / new_sec:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [20_000])
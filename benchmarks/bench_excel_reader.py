@@ -0,0 +1,83 @@
+"""송장 Excel 읽기 벤치마크: pd.read_excel(header=6) 전체 vs read_excel_columns(필요한 열만).
+
+우체국 송장 내보내기 모양(안내 6줄 + 헤더 + 20열)의 파일을 만들어 openpyxl read-only 경로와
+(설치돼 있으면) python-calamine 경로의 시간과 tracemalloc 최대 메모리를 비교한다.
+고른 열의 값이 pd.read_excel 결과와 같은지도 함께 확인한다.
+
+    python benchmarks/bench_excel_reader.py [행 수 ...]   (기본 50000)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from orders.workbook import read_excel_columns  # noqa: E402
+
+NEEDED = ("등기번호", "수취인명", "수취인 이동통신", "수취인상세주소", "고객주문번호")
+HEADERS = list(NEEDED) + [f"기타{index}" for index in range(15)]
+
+
+def _write_invoice(path: Path, count: int) -> None:
+    rng = random.Random(count)
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    for line in range(6):
+        sheet.append([f"안내 {line}"])
+    sheet.append(HEADERS)
+    for index in range(count):
+        sheet.append([
+            6865000000000 + index, f"수취인{index % 997}", f"010-{rng.randint(1000, 9999)}-{index % 10000:04d}",
+            f"서울시 어딘가 {index}", f"2026081{index:09d}",
+        ] + [rng.choice((f"값{index}", rng.randint(0, 99999), None)) for _ in range(15)])
+    workbook.save(path)
+
+
+def _measure(func):
+    started = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 1024 / 1024
+
+
+def _engines() -> list[str]:
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return ["openpyxl"]
+    return ["openpyxl", "calamine"]
+
+
+def main(counts) -> None:
+    engines = _engines()
+    print(f"{'rows':>8}{'read_excel':>12}{'peak MB':>9}" + "".join(f"{engine:>12}{'peak MB':>9}" for engine in engines))
+    with tempfile.TemporaryDirectory() as folder:
+        for count in counts:
+            path = Path(folder) / f"invoice-{count}.xlsx"
+            _write_invoice(path, count)
+            full, full_sec, full_mb = _measure(lambda: pd.read_excel(path, header=6))
+            line = f"{count:>8}{full_sec:>11.2f}s{full_mb:>9.1f}"
+            for engine in engines:
+                (picked, _, _), picked_sec, picked_mb = _measure(
+                    lambda: read_excel_columns(path, NEEDED, header=6, engine=engine))
+                pd.testing.assert_frame_equal(picked, full[list(picked.columns)])
+                line += f"{picked_sec:>11.2f}s{picked_mb:>9.1f}"
+            print(line)
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [50_000])
@@ -0,0 +1,74 @@
+"""송장 매칭 벤치마크: 예전 송장별 마스크 루프 vs orders.invoice_match.join_invoices.
+
+쿠팡 방식(수취인명+전화번호 문자열)으로 주문서 N행(상품 행 2개씩)과 송장 N/2건을 만들어
+두 방식의 시간을 재고, 주문 행마다 남는 송장번호가 같은지도 확인한다.
+
+    python benchmarks/bench_invoice_match.py [주문 행 수 ...]   (기본 2000 6000)
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from orders.invoice_match import join_invoices, text_key  # noqa: E402
+
+
+def _frames(count: int) -> tuple[pd.DataFrame, pd.DataFrame]:
+    orders = pd.DataFrame({
+        "수취인이름": [f"수취인{index // 2 % 997}" for index in range(count)],
+        "수취인전화번호": [f"010-{index // 2 // 10000:04d}-{index // 2 % 10000:04d}" for index in range(count)],
+    })
+    invoices = pd.DataFrame({
+        "등기번호": [f"68650{index:08d}" for index in range(count // 2)],
+        "수취인명": orders["수취인이름"].iloc[::2].tolist(),
+        "수취인 전화번호": orders["수취인전화번호"].iloc[::2].tolist(),
+    })
+    return orders, invoices
+
+
+def _old(orders: pd.DataFrame, invoices: pd.DataFrame) -> dict:
+    assigned = {}
+    for _, row in invoices.iterrows():
+        name, phone = text_key(row["수취인명"]), text_key(row["수취인 전화번호"])
+        mask = (orders["수취인이름"].map(text_key) == name) & (orders["수취인전화번호"].map(text_key) == phone)
+        for label in orders[mask].index:
+            assigned[label] = row["등기번호"]
+    return assigned
+
+
+def _new(orders: pd.DataFrame, invoices: pd.DataFrame) -> dict:
+    numbers = invoices["등기번호"].tolist()
+    join = join_invoices(
+        list(zip(invoices["수취인명"].map(text_key), invoices["수취인 전화번호"].map(text_key))),
+        list(zip(orders["수취인이름"].map(text_key), orders["수취인전화번호"].map(text_key))),
+    )
+    assigned = {}
+    for invoice_pos, order_positions in join.matches:
+        for position in order_positions:
+            assigned[position] = numbers[invoice_pos]
+    return assigned
+
+
+def main(counts) -> None:
+    print(f"{'orders':>8}{'invoices':>10}{'mask loop':>12}{'hash join':>12}")
+    for count in counts:
+        orders, invoices = _frames(count)
+        started = time.perf_counter()
+        expected = _old(orders, invoices)
+        old_sec = time.perf_counter() - started
+        started = time.perf_counter()
+        actual = _new(orders, invoices)
+        new_sec = time.perf_counter() - started
+        assert actual == expected
+        print(f"{count:>8}{len(invoices):>10}{old_sec:>11.2f}s{new_sec:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [2_000, 6_000])
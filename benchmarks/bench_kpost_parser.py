@@ -0,0 +1,110 @@
+"""우체국 종추적 XML 파서 마이크로 벤치마크.
+
+fixtures/kpost/*.xml 응답마다 이전 파서(트리 2회 순회), 1회 순회 파서, 요약 전용 모드를 번갈아 돌려
+1건당 평균 처리 시간(µs)을 출력한다. 이전 파서는 kpost_tracker에서 빼 이 파일에 기준 구현으로 둔다.
+
+    python benchmarks/bench_kpost_parser.py [반복 횟수]
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import kpost_tracker  # noqa: E402
+from kpost_tracker import COMPLETE_KEYWORDS, _event_from_item, _is_admin_receipt, _local  # noqa: E402
+
+
+def _parse_error(root):
+    for el in root.iter():
+        if _local(el.tag) != "error":
+            continue
+        code, msg = "", ""
+        for ch in el:
+            ln = _local(ch.tag)
+            if ln == "error_code":
+                code = (ch.text or "").strip()
+            elif ln == "message":
+                msg = (ch.text or "").strip()
+        return code or "오류", msg or "알 수 없는 오류"
+    return None
+
+
+def parse_tracking_tree(xml_text):
+    """전체 트리를 만든 뒤 두 번 훑는 이전 파서. fixtures/kpost/*.expected.json은 이 결과를 기록한 것이다."""
+    base = {"ok": False, "error_code": "", "error": "", "complete": False,
+            "status": "", "where": "", "time": "", "recipient": "", "events": []}
+    try:
+        root = ET.fromstring(xml_text)
+    except ET.ParseError:
+        base.update(error_code="XML", error="응답을 XML로 해석할 수 없습니다.")
+        return base
+    err = _parse_error(root)
+    if err:
+        base.update(error_code=err[0], error=err[1])
+        return base
+
+    recipient = ""
+    top_eventnm = ""
+    events = []
+    for el in root.iter():
+        ln = _local(el.tag)
+        if ln == "recevnm" and not recipient:
+            recipient = (el.text or "").strip()
+        elif ln == "eventnm" and not top_eventnm:
+            top_eventnm = (el.text or "").strip()
+        elif ln == "item":
+            ev = _event_from_item(el)
+            if any(ev.values()):
+                events.append(ev)
+
+    events.sort(key=lambda e: (e.get("date", ""), e.get("time", "")))
+    statuses = [e["status"] for e in events]
+    complete = any(k in top_eventnm for k in COMPLETE_KEYWORDS) or any(
+        any(k in s for k in COMPLETE_KEYWORDS) for s in statuses
+    )
+
+    if complete:
+        done = next((e for e in reversed(events)
+                     if any(k in e["status"] for k in COMPLETE_KEYWORDS)), None)
+        cur = done or (events[-1] if events else None)
+        status = "배달완료"
+    else:
+        # 현재상태: 선구분-후접수 같은 행정 접수는 제외하고 가장 최신(우체국 웹과 동일)
+        meaningful = [e for e in events if not _is_admin_receipt(e)]
+        cur = meaningful[-1] if meaningful else (events[-1] if events else None)
+        status = cur["status"] if cur else ""
+
+    where = cur["where"] if cur else ""
+    when = ((cur["date"] + " " + cur["time"]).strip()) if cur else ""
+    base.update(ok=True, complete=complete, status=status, where=where,
+                time=when, recipient=recipient, events=events)
+    return base
+
+
+PARSERS = (
+    ("tree", parse_tracking_tree),
+    ("single", kpost_tracker.parse_tracking),
+    ("summary", lambda text: kpost_tracker.parse_tracking(text, with_events=False)),
+)
+
+
+def main(number: int = 2000) -> None:
+    fixtures = sorted((ROOT / "fixtures" / "kpost").glob("*.xml"))
+    print(f"{'fixture':<28}" + "".join(f"{name:>12}" for name, _parser in PARSERS))
+    for fixture in fixtures:
+        text = fixture.read_text(encoding="utf-8")
+        cells = []
+        for _name, parser in PARSERS:
+            best = min(timeit.repeat(lambda: parser(text), number=number, repeat=3))
+            cells.append(f"{best / number * 1e6:>10.1f}µs")
+        print(f"{fixture.name:<28}" + "".join(cells))
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
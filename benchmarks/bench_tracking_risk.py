@@ -0,0 +1,92 @@
+"""배송추적 위험 판정 벤치마크: 행마다 evaluate_risk vs 열 단위 evaluate_tracking_rows_risk.
+
+행마다 경로는 표·다이제스트가 예전에 하던 대로 시각 파싱 + evaluate_risk(이전 반복식 영업시간)
+를 부른다. 결과가 같은지도 함께 확인한다.
+
+    python benchmarks/bench_tracking_risk.py [행 수 ...]   (기본 10000 100000)
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from tracking import service  # noqa: E402
+
+THRESHOLDS = dict(service.STALE_DEFAULTS)
+REMOTE_BONUS = service.STALE_REMOTE_BONUS_DEFAULT
+
+
+def _loop_business_hours(ref_dt, now_dt):
+    if now_dt <= ref_dt:
+        return 0.0
+    weekend = 0.0
+    current = ref_dt
+    while current < now_dt:
+        day_end = datetime(current.year, current.month, current.day) + timedelta(days=1)
+        segment_end = min(day_end, now_dt)
+        if current.weekday() >= 5:
+            weekend += (segment_end - current).total_seconds()
+        current = segment_end
+    return ((now_dt - ref_dt).total_seconds() - weekend) / 3600.0
+
+
+def _rows(count, now_dt):
+    rng = random.Random(count)
+    statuses = ["운송장출력", "접수", "발송", "도착", "배달준비"]
+    wheres = ["서울강남우체국", "동서울우편집중국", "부산물류센터", "제주우체국", ""]
+    rows = []
+    for index in range(count):
+        registered = now_dt - timedelta(hours=rng.uniform(0, 24 * 20))
+        event = registered + timedelta(hours=rng.uniform(0, 48))
+        rows.append([
+            f"68650{index:08d}", registered.strftime("%Y-%m-%d %H:%M:%S"), "", "", "",
+            "우체국", rng.choice(statuses), rng.choice(("N", "N", "N", "Y")),
+            rng.choice(wheres), "", "", event.strftime("%Y.%m.%d %H:%M"), "추적중",
+        ])
+    return rows
+
+
+def _per_row(rows, now_dt, business_hours):
+    original = service.business_elapsed_hours
+    service.business_elapsed_hours = business_hours
+    try:
+        out = []
+        for row in rows:
+            ref = (service.parse_tracking_list_timestamp(row[11])
+                   or service.parse_tracking_list_timestamp(row[1]))
+            out.append(service.evaluate_risk(
+                row[6], row[8], row[7].strip().upper() == "Y", ref, now_dt,
+                THRESHOLDS, REMOTE_BONUS, row[12])[0])
+        return out
+    finally:
+        service.business_elapsed_hours = original
+
+
+def _timed(func, *args):
+    started = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started
+
+
+def main(counts) -> None:
+    now_dt = datetime(2026, 8, 13, 12)
+    print(f"{'rows':>8}{'loop/row':>12}{'closed/row':>12}{'batch':>12}")
+    for count in counts:
+        rows = _rows(count, now_dt)
+        loop, loop_sec = _timed(_per_row, rows, now_dt, _loop_business_hours)
+        closed, closed_sec = _timed(_per_row, rows, now_dt, service.business_elapsed_hours)
+        (batch, _elapsed), batch_sec = _timed(
+            service.evaluate_tracking_rows_risk, rows, now_dt, THRESHOLDS, REMOTE_BONUS)
+        assert loop == closed == batch
+        print(f"{count:>8}{loop_sec:>11.3f}s{closed_sec:>11.3f}s{batch_sec:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or [10_000, 100_000])
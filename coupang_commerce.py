@@ -28,6 +28,8 @@ try:
 except ImportError:  # requests 는 이미 의존성이지만 방어적으로 처리
     requests = None
 
+import http_sessions
+
 API_GATEWAY = "https://api-gateway.coupang.com"
 PATH_PREFIX = "/v2/providers/openapi/apis/api/v5/vendors"
 DEFAULT_TIMEOUT = 15
@@ -83,7 +85,7 @@ def _get(path, params, access_key, secret_key):
         "Authorization": auth,
         "Content-Type": "application/json;charset=UTF-8",
     }
-    resp = requests.get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
+    resp = http_sessions.get_session(API_GATEWAY).get(url, headers=headers, timeout=DEFAULT_TIMEOUT)
     _raise_for_status_with_body(resp)
     return resp.json()
 
@@ -11,8 +11,6 @@ from pathlib import Path
 import pandas as pd
 import numpy as np
 import subprocess
-import tempfile
-import msoffcrypto
 import shutil
 from PySide6.QtWidgets import (QApplication, QMainWindow, QFileDialog, QMessageBox, 
                               QInputDialog, QLineEdit, QTableWidgetItem, QLabel, 
@@ -28,6 +26,7 @@ from PySide6.QtCore import (
     Qt,
     QSize,
     QUrl,
+    QObject,
     QTimer,
     QThread,
     Signal,
@@ -59,7 +58,6 @@ from io import BytesIO
 import warnings
 import logging
 import json
-import hashlib
 import traceback
 import xml.etree.ElementTree as ET
 from html.parser import HTMLParser
@@ -73,14 +71,22 @@ from tracking.service import (
     read_inquiry_work_hours as _read_inquiry_work_hours,
     tracking_management_state as _tracking_management_state,
 )
+from tracking.config_cache import config_cache
 from tracking.repository import (
+    cached_config_values as _cached_config_values,
+    claim_lease,
     normalize_tracking_no as _normalize_tracking_no,
     open_config_worksheet,
-    read_config_values_map as _read_config_values_map,
     write_config_values as _write_config_values,
 )
 from tracking.controller import TrackingController
-from tracking.workers import TrackingConfigWriteThread, run_tracking_list_worker
+from tracking.sheet_handles import sheet_handles
+from tracking.workers import (
+    TrackingConfigWriteThread,
+    register_tracking_write_handlers,
+    run_tracking_list_worker,
+)
+from tracking.write_queue import sheet_write_queue
 from orders.quick import (
     detect_quick_store,
     extract_zip_code,
@@ -98,6 +104,20 @@ from orders.bulk import (
     consolidate_gmarket_orders,
 )
 from orders.invoice import INVOICE_COLUMNS, build_invoice_rows
+from orders.invoice_match import (
+    build_index,
+    digits_key,
+    join_invoices,
+    order_number_key,
+    text_key,
+)
+from orders.parse_cache import file_sha1, order_parse_cache
+from orders.workbook import (
+    ORDER_FILE_PASSWORD,
+    decrypt_workbook,
+    open_order_workbook,
+    read_excel_columns,
+)
 from post_parcel import (
     ParcelApiError,
     ParcelValidationError,
@@ -107,6 +127,8 @@ from post_parcel import (
     submit_test_order,
 )
 from post_parcel_receipt_store import ParcelReceiptStore, ReceiptStoreError
+import http_sessions
+from sheets_quota import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, sheets_governor, sheets_priority
 
 try:
     import gspread
@@ -125,6 +147,12 @@ ORDER_INDEX_SHEET_TITLE = "일별 주문번호"
 ORDER_INDEX_SHEET_HEADERS = ["날짜", "네이버", "쿠팡", "지마켓"]
 ORDER_INDEX_SHEET_POLL_MS = 150_000  # 2.5분 (2~3분 간격)
 ORDER_INDEX_SHEET_PUSH_DEBOUNCE_MS = 800
+ORDER_INDEX_WRITE_KIND = "order_index"  # 시트 쓰기 큐(tracking.write_queue) 종류
+# 우체국 송장 파일: 7번째 행이 헤더. 아래 열만 한 줄씩 읽는다(orders.workbook.read_excel_columns).
+INVOICE_FILE_HEADER_ROW = 6
+INVOICE_FILE_COLUMNS = (
+    "등기번호", "수취인명", "수취인 이동통신", "수취인 전화번호", "수취인상세주소", "고객주문번호",
+)
 # 주문번호 인덱스 변경이력(공유) — 누가·언제·이전값→새값을 남겨 실수 시 1클릭 되돌리기.
 ORDER_INDEX_LOG_SHEET_TITLE = "주문번호 변경이력"
 ORDER_INDEX_LOG_HEADERS = ["시각", "사용자", "스토어", "이전값", "새값", "사유"]
@@ -136,7 +164,7 @@ TRACKING_SHEET_TITLE = "송장추적"
 TRACKING_SHEET_HEADERS = [
     "등기번호", "등록일시", "스토어", "주문번호", "수취인명",
     "택배사코드", "배송상태", "완료여부", "마지막위치", "최근조회시각", "비고",
-    "최근이벤트시각", "관리상태",
+    "최근이벤트시각", "관리상태", "수정시각",
 ]
 TRACKING_SHEET_PUSH_DEBOUNCE_MS = 1200
 # 택배사 제출용 「당일 접수목록」 xlsx 파일명 접두어(관리자가 하루 1회 택배사에 전달).
@@ -154,11 +182,10 @@ def _standalone_open_config_ws(gc):
 
 
 CONFIG_KEY_SLACK_WEBHOOK = "slack_webhook_url"
-# 배송추적 백그라운드 자동 새로고침(전원 공유). 간격(분)과 마지막 자동조회 시각.
-# 마지막 시각은 다중 PC가 같은 창에서 우체국을 중복 조회하지 않도록 하는 소프트 락으로 쓴다:
-# 여러 대가 켜져 있어도 간격이 지난 뒤 먼저 도는 1대만 실제 조회하고 나머지는 건너뛴다.
+# 배송추적 백그라운드 자동 새로고침(전원 공유) 간격(분).
+# 다중 PC 중복 조회는 설정 탭 lease(tracking.repository.claim_lease)로 막는다:
+# 여러 대가 켜져 있어도 lease를 잡은 1대만 실제 조회하고 나머지는 건너뛴다.
 CONFIG_KEY_AUTO_REFRESH_MIN = "tracking_auto_refresh_min"     # 자동 새로고침 간격(분). 0/빈=끔
-CONFIG_KEY_LAST_AUTO_REFRESH = "tracking_last_auto_refresh"   # 마지막 자동조회 시각(YYYY-MM-DD HH:MM:SS)
 TRACKING_AUTO_REFRESH_DEFAULT_MIN = 60
 # 네이버 커머스API 문의 알림: client_id/secret 은 비공개 시트(설정 탭)에만 저장한다.
 CONFIG_KEY_NAVER_CLIENT_ID = "naver_client_id"
@@ -181,8 +208,10 @@ INQUIRY_SHEET_HEADERS = [
     "감지시각", "최근알림시각", "상태",
 ]
 NAVER_INQUIRY_POLL_MS = 300_000  # 5분
+SHEETS_QUOTA_STATUS_MS = 5_000  # 상태바 Sheets 호출 수 갱신 간격
 NAVER_INQUIRY_LOOKBACK_DAYS = 30  # 미답변은 오래 묵을 수 있어 넉넉히(페이지네이션 안전)
 NAVER_INQUIRY_REMIND_MIN = 60  # 미답변 리마인더 재알림 주기(분)
+LEASE_INQUIRY_POLL = "inquiry_poll"  # 문의 조회·알림을 맡는 PC를 정하는 설정 탭 lease 이름
 # 미답변 알림 허용 시간대(근무시간) 기본값: 평일 10:00~19:00. 그 외에는 알림을 보내지 않고
 # 「최근알림시각」도 건드리지 않는다 → 근무 시작 시각에 밀린 미답변이 한 번에 환기된다.
 # 설정 팝업에서 사용자가 시작/종료 시각을 바꿀 수 있고, 공유 「설정」 탭으로 전원 적용된다.
@@ -253,13 +282,20 @@ def _order_index_sheet_row_looks_like_header(row):
     return cell in ("날짜", "date", "Date")
 
 
+def _standalone_sheet_at(gc, index):
+    """탭 순서(0부터)로 워크시트를 찾는다. 공용 핸들 캐시를 쓰므로 get_worksheet 왕복이 없다."""
+    worksheets = sheet_handles().worksheets(gc, SPREADSHEET_ID)
+    if index >= len(worksheets):
+        raise ValueError(f"스프레드시트에 {index + 1}번째 탭이 없습니다. (현재 탭 {len(worksheets)}개)")
+    return worksheets[index]
+
+
 def _standalone_open_order_index_ws(gc):
-    """백그라운드 스레드용. worksheets() 메타데이터 한 번으로 워크시트를 찾고,
-    없으면 생성합니다. (기존의 get_worksheet 중복 호출로 인한 추가 API 왕복 제거.
+    """백그라운드 스레드용. 공용 핸들 캐시(sheet_handles)의 워크시트 목록으로 찾고,
+    없으면 생성합니다. (캐시가 살아 있으면 메타데이터 API 왕복 없음.
     빈 시트 초기화·레거시 헤더 처리는 값을 한 번 읽은 뒤
     _standalone_normalize_order_index_values 에서 재읽기 없이 수행합니다.)"""
-    spreadsheet = gc.open_by_key(SPREADSHEET_ID)
-    worksheets = spreadsheet.worksheets()
+    worksheets = sheet_handles().worksheets(gc, SPREADSHEET_ID)
     if len(worksheets) < ORDER_INDEX_WORKSHEET_INDEX:
         raise ValueError(
             f"스프레드시트에「{ORDER_INDEX_SHEET_TITLE}」({ORDER_INDEX_WORKSHEET_INDEX + 1}번째 탭)을 "
@@ -268,8 +304,8 @@ def _standalone_open_order_index_ws(gc):
         )
     if len(worksheets) == ORDER_INDEX_WORKSHEET_INDEX:
         # add_worksheet 는 생성된 워크시트를 반환하므로 별도 get_worksheet 불필요.
-        ws = spreadsheet.add_worksheet(
-            title=ORDER_INDEX_SHEET_TITLE,
+        ws = sheet_handles().add_worksheet(
+            gc, SPREADSHEET_ID, ORDER_INDEX_SHEET_TITLE,
             rows=100,
             cols=10,
             index=ORDER_INDEX_WORKSHEET_INDEX,
@@ -373,6 +409,7 @@ def run_order_index_read_sync_worker():
             "row": {"naver": 1, "coupang": 1, "gmarket": 1},
         }
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -386,12 +423,13 @@ def _current_actor():
         return "unknown"
 
 
-def _standalone_open_order_index_log_ws(spreadsheet):
+def _standalone_open_order_index_log_ws(gc):
     """주문번호 변경이력 워크시트를 제목으로 찾고, 없으면 맨 끝에 생성+헤더 기록."""
-    for ws in spreadsheet.worksheets():
-        if ws.title == ORDER_INDEX_LOG_SHEET_TITLE:
-            return ws
-    ws = spreadsheet.add_worksheet(title=ORDER_INDEX_LOG_SHEET_TITLE, rows=2000, cols=6)
+    handles = sheet_handles()
+    ws = handles.worksheet(gc, SPREADSHEET_ID, ORDER_INDEX_LOG_SHEET_TITLE)
+    if ws is not None:
+        return ws
+    ws = handles.add_worksheet(gc, SPREADSHEET_ID, ORDER_INDEX_LOG_SHEET_TITLE, rows=2000, cols=6)
     ws.update([ORDER_INDEX_LOG_HEADERS], range_name="A1:F1")
     return ws
 
@@ -408,16 +446,17 @@ def _append_order_index_log(gc, changed, reason):
                      "" if old is None else old, new, reason])
     if not rows:
         return
-    log_ws = _standalone_open_order_index_log_ws(gc.open_by_key(SPREADSHEET_ID))
+    log_ws = _standalone_open_order_index_log_ws(gc)
     log_ws.append_rows(rows, value_input_option="USER_ENTERED")
 
 
-def run_order_index_write_worker(naver, coupang, gmarket, reason="변경"):
+def run_order_index_write_worker(naver, coupang, gmarket, reason="변경", expected=None):
     """
     UI 스레드가 아닌 곳에서 호출. 오늘 날짜 행에 인덱스 3종을 기록합니다.
     시트 전체 읽기는 한 번만 수행하고 그 값을 그대로 재사용합니다.
     변경된 스토어는 「주문번호 변경이력」에 누가·언제·이전값→새값으로 남깁니다.
-    반환 dict: ok — 또는 ok False, error
+    expected({naver, coupang, gmarket})가 있으면 시트의 오늘 값이 그와 같을 때만 씁니다.
+    반환 dict: ok, written — 다르면 ok, conflict — 또는 ok False, error
     """
     if gspread is None:
         return {"ok": False, "error": "gspread 패키지가 필요합니다. (pip install gspread)"}
@@ -431,6 +470,9 @@ def run_order_index_write_worker(naver, coupang, gmarket, reason="변경"):
         values = ws.get_all_values()  # 쓰기 위치 판단용 단일 읽기
         values = _standalone_normalize_order_index_values(ws, values)
         old = _standalone_read_today_order_indices_from_values(values) or {}
+        if expected is not None and any(
+                str(old.get(k)) != str(expected.get(k)) for k in ("naver", "coupang", "gmarket")):
+            return {"ok": True, "conflict": True, "written": None}
         _standalone_write_order_indices_ws(ws, naver, coupang, gmarket, values=values)
         new = {"naver": naver, "coupang": coupang, "gmarket": gmarket}
         changed = [(k, old.get(k), new[k]) for k in ("naver", "coupang", "gmarket")
@@ -440,11 +482,40 @@ def run_order_index_write_worker(naver, coupang, gmarket, reason="변경"):
                 _append_order_index_log(gc, changed, reason)
             except Exception as le:
                 print(f"! 인덱스 변경이력 기록 실패: {le}")
-        return {"ok": True}
+        return {"ok": True, "written": new}
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
+def flush_order_index_writes(entries):
+    """시트 쓰기 큐 handler: 오늘 날짜로 쌓인 인덱스 쓰기(마지막 값 하나)를 시트에 보냅니다.
+
+    다른 날짜에 쌓인 항목은 버립니다. 이전 실행에서 넘어온 항목은 그때 맞춰 둔 시트 값(base)이
+    지금도 그대로일 때만 씁니다(그 사이 다른 PC가 올린 인덱스를 되돌리지 않도록).
+    반환 dict: written, conflict, replayed — 실패하면 예외(큐가 저널에 남겨 두고 다시 시도)
+    """
+    today = date.today().strftime("%Y-%m-%d")
+    entry = next((e for e in reversed(entries) if e["key"] == today), None)
+    if entry is None:
+        return {"written": None, "conflict": False, "replayed": False, "stale": True}
+    payload = entry["payload"]
+    replayed = bool(entry["replayed"])
+    expected = None
+    if replayed:
+        base = payload.get("base")
+        if not base:
+            return {"written": None, "conflict": True, "replayed": True}
+        expected = dict(zip(("naver", "coupang", "gmarket"), base))
+    result = run_order_index_write_worker(
+        payload["naver"], payload["coupang"], payload["gmarket"],
+        reason=payload.get("reason") or "변경", expected=expected,
+    )
+    if not result.get("ok"):
+        raise RuntimeError(result.get("error", ""))
+    return {"written": result.get("written"), "conflict": bool(result.get("conflict")),
+            "replayed": replayed}
+
 def run_order_index_undo_worker():
     """오늘자 '되돌리기'가 아닌 마지막 인덱스 변경을, 그 변경의 이전값으로 복구합니다.
     반환: ok, reverted(bool), store_ko, frm, to — 또는 ok False, error."""
@@ -456,8 +527,7 @@ def run_order_index_undo_worker():
         return {"ok": False, "error": str(e)}
     try:
         gc = get_authorized_gspread_client()
-        ss = gc.open_by_key(SPREADSHEET_ID)
-        log_ws = _standalone_open_order_index_log_ws(ss)
+        log_ws = _standalone_open_order_index_log_ws(gc)
         log = log_ws.get_all_values()
         today = date.today().strftime("%Y-%m-%d")
         rows = log[1:] if (log and log[0] and log[0][0] == "시각") else log
@@ -500,17 +570,18 @@ def run_order_index_undo_worker():
         return {"ok": True, "reverted": True, "store_ko": store_ko,
                 "frm": cur_val, "to": old_int}
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
 def _standalone_open_inquiry_ws(gc):
     """공유 「문의알림」 탭을 제목으로 찾고, 없으면 맨 끝에 생성하고 헤더를 기록합니다."""
-    spreadsheet = gc.open_by_key(SPREADSHEET_ID)
-    for ws in spreadsheet.worksheets():
-        if ws.title == INQUIRY_SHEET_TITLE:
-            return ws
-    ws = spreadsheet.add_worksheet(
-        title=INQUIRY_SHEET_TITLE, rows=500, cols=len(INQUIRY_SHEET_HEADERS)
+    handles = sheet_handles()
+    ws = handles.worksheet(gc, SPREADSHEET_ID, INQUIRY_SHEET_TITLE)
+    if ws is not None:
+        return ws
+    ws = handles.add_worksheet(
+        gc, SPREADSHEET_ID, INQUIRY_SHEET_TITLE, rows=500, cols=len(INQUIRY_SHEET_HEADERS)
     )
     ws.update([list(INQUIRY_SHEET_HEADERS)], range_name="A1", value_input_option="RAW")
     print(f"✓ 스프레드시트에 「{INQUIRY_SHEET_TITLE}」 탭을 만들었습니다.")
@@ -542,6 +613,194 @@ def _build_inquiry_slack_text(records):
     return "\n".join(lines)
 
 
+def _poll_naver_inquiries(gc, cfg):
+    """run_naver_inquiry_poll_worker의 본 조회·알림. 문의 알림 lease를 잡은 뒤 부른다."""
+    import naver_commerce
+    import coupang_commerce
+    import slack_notify
+
+    client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
+    client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
+    cp_vendor = cfg.get(CONFIG_KEY_COUPANG_VENDOR_ID, "")
+    cp_access = cfg.get(CONFIG_KEY_COUPANG_ACCESS_KEY, "")
+    cp_secret = cfg.get(CONFIG_KEY_COUPANG_SECRET_KEY, "")
+    webhook = cfg.get(CONFIG_KEY_SLACK_WEBHOOK, "")
+    naver_on = bool(client_id and client_secret)
+    coupang_on = bool(cp_vendor and cp_access and cp_secret)
+    if not naver_on and not coupang_on:
+        return {"ok": False,
+                "error": "네이버·쿠팡 키가 모두 미설정 — 설정 팝업의 「키 설정」에서 등록하세요."}
+    now_dt = datetime.now()
+    from_dt = now_dt - timedelta(days=NAVER_INQUIRY_LOOKBACK_DAYS)
+    records = []
+    errors = []
+    if naver_on:
+        try:
+            token = naver_commerce.get_access_token(client_id, client_secret)
+        except Exception as e:
+            token = None
+            errors.append(f"네이버 토큰 발급 실패: {e}")
+        if token:
+            # 상품문의(미답변)
+            try:
+                for it in naver_commerce.fetch_product_qnas(token, from_dt, now_dt, answered=False):
+                    qid = it.get("questionId")
+                    if qid is None:
+                        continue
+                    records.append({
+                        "id": f"Q{qid}",
+                        "type": "네이버상품문의",
+                        "reg": str(it.get("createDate", "") or ""),
+                        "target": str(it.get("productName", "") or ""),
+                        "writer": str(it.get("maskedWriterId", "") or ""),
+                        "content": str(it.get("question", "") or ""),
+                    })
+            except Exception as e:
+                errors.append(f"네이버 상품문의 조회 실패: {e}")
+            # 고객문의(미답변)
+            try:
+                for it in naver_commerce.fetch_customer_inquiries(token, from_dt, now_dt, answered=False):
+                    ino = it.get("inquiryNo")
+                    if ino is None:
+                        continue
+                    records.append({
+                        "id": f"C{ino}",
+                        "type": "네이버고객문의",
+                        "reg": str(it.get("inquiryRegistrationDateTime", "") or ""),
+                        "target": str(it.get("productName") or it.get("orderId", "") or ""),
+                        "writer": str(it.get("customerName", "") or ""),
+                        "content": str(it.get("title") or it.get("inquiryContent", "") or ""),
+                    })
+            except Exception as e:
+                errors.append(f"네이버 고객문의 조회 실패: {e}")
+    if coupang_on:
+        # 쿠팡 온라인 고객문의(상품문의, 미답변)
+        try:
+            for it in coupang_commerce.fetch_online_inquiries(
+                    cp_vendor, cp_access, cp_secret, from_dt, now_dt, answered=False):
+                iid = it.get("inquiryId")
+                if iid is None:
+                    continue
+                records.append({
+                    "id": f"KO{iid}",
+                    "type": "쿠팡상품문의",
+                    "reg": str(it.get("inquiryAt", "") or ""),
+                    "target": str(it.get("productName") or it.get("productId", "") or ""),
+                    "writer": str(it.get("buyerEmail", "") or ""),
+                    "content": str(it.get("content", "") or ""),
+                })
+        except Exception as e:
+            errors.append(f"쿠팡 상품문의 조회 실패: {e}")
+        # 쿠팡 콜센터(CS) 문의(미답변)
+        try:
+            for it in coupang_commerce.fetch_callcenter_inquiries(
+                    cp_vendor, cp_access, cp_secret, from_dt, now_dt, answered=False):
+                iid = it.get("inquiryId")
+                if iid is None:
+                    continue
+                records.append({
+                    "id": f"KC{iid}",
+                    "type": "쿠팡CS문의",
+                    "reg": str(it.get("inquiryAt") or it.get("inquiryDateTime", "") or ""),
+                    "target": str(it.get("itemName") or it.get("orderId", "") or ""),
+                    "writer": "",
+                    "content": str(it.get("content", "") or ""),
+                })
+        except Exception as e:
+            errors.append(f"쿠팡 CS문의 조회 실패: {e}")
+    if not records and errors:
+        return {"ok": False, "error": " / ".join(errors)}
+
+    ws = _standalone_open_inquiry_ws(gc)
+    values = ws.get_all_values()
+    # 헤더가 옛 형식이면 새 형식으로 교체(기존 데이터 행은 보존; 옛 「알림」값은
+    # 「최근알림시각」 자리에서 파싱 불가→미알림 취급되어 다음 근무시간에 한 번 환기됨).
+    if not values or values[0] != list(INQUIRY_SHEET_HEADERS):
+        need_cols = len(INQUIRY_SHEET_HEADERS)
+        if getattr(ws, "col_count", need_cols) < need_cols:
+            ws.add_cols(need_cols - ws.col_count)  # 옛 8열 시트 → 9열로 확장 후 헤더 교체
+        ws.update([list(INQUIRY_SHEET_HEADERS)], range_name="A1",
+                  value_input_option="RAW")
+        if not values:
+            values = [list(INQUIRY_SHEET_HEADERS)]
+    # 문의ID → (시트 행번호, 최근알림시각 dt) 인덱스
+    index = {}
+    for i, row in enumerate(values[1:], start=2):
+        rid = (row[0] or "").strip() if row else ""
+        if not rid:
+            continue
+        last_s = row[7].strip() if len(row) > 7 else ""
+        try:
+            last_dt = datetime.strptime(last_s, "%Y-%m-%d %H:%M:%S")
+        except (ValueError, AttributeError):
+            last_dt = None
+        index[rid] = (i, last_dt)
+
+    start_h, end_h = _read_inquiry_work_hours(cfg)
+    allowed = _inquiry_alerts_allowed(now_dt, start_h, end_h)
+    remind_delta = timedelta(minutes=NAVER_INQUIRY_REMIND_MIN)
+    now = now_dt.strftime("%Y-%m-%d %H:%M:%S")
+    new_rows = []        # 신규 미답변 → 시트 append
+    ts_updates = []      # 기존 행 「최근알림시각」 갱신용 batch_update
+    to_notify = []       # 이번에 슬랙으로 보낼 레코드
+    seen_batch = set()
+    for r in records:
+        rid = r["id"]
+        if rid in seen_batch:
+            continue
+        seen_batch.add(rid)
+        if rid not in index:
+            # 새 미답변: 행 추가. 근무시간이면 즉시 알림(최근알림시각=now),
+            # 아니면 최근알림시각을 비워 둬 다음 근무시간에 알리도록 한다.
+            notify_now = allowed
+            new_rows.append([
+                rid, r["type"], r["reg"], r["target"], r["writer"],
+                (r["content"] or "")[:200], now,
+                now if notify_now else "", "미답변",
+            ])
+            if notify_now:
+                r["_kind"] = "new"
+                to_notify.append(r)
+        else:
+            # 기존 미답변: 근무시간 + 재알림 조건 충족 시 리마인더.
+            row_no, last_dt = index[rid]
+            if rid.startswith("KC"):
+                # 쿠팡 CS문의: 하루 1회만 리마인더. 자동 반품수거처럼 회사 도착까지
+                # 판매자가 액션할 수 없는 건이 많아 매시간 알림이 소음이 된다.
+                # 마지막 알림이 오늘 이전 날짜면 재알림(그날 이미 알렸으면 스킵→다음날 1회).
+                due = last_dt is None or last_dt.date() < now_dt.date()
+            else:
+                # 그 외 채널(네이버 상품/고객문의, 쿠팡 상품문의 KO): R분 경과 시 재알림.
+                due = last_dt is None or now_dt - last_dt >= remind_delta
+            if allowed and due:
+                r["_kind"] = "remind"
+                to_notify.append(r)
+                ts_updates.append({"range": f"H{row_no}", "values": [[now]]})
+    if new_rows:
+        ws.append_rows(new_rows, value_input_option="RAW")
+    sent = 0
+    if to_notify and webhook:
+        res = slack_notify.send_slack(webhook, _build_inquiry_slack_text(to_notify))
+        if res.get("ok"):
+            sent = len(to_notify)
+            if ts_updates:
+                ws.batch_update(ts_updates, value_input_option="RAW")
+        else:
+            errors.append(f"슬랙 전송 실패: {res.get('error', '')}")
+    elif to_notify and not webhook:
+        errors.append("슬랙 웹훅 미설정 — 알림을 보내지 못했습니다.")
+    new_cnt = sum(1 for r in to_notify if r.get("_kind") == "new")
+    return {
+        "ok": True,
+        "open": len(seen_batch),
+        "new": new_cnt,
+        "reminded": len(to_notify) - new_cnt,
+        "sent": sent,
+        "off_hours": (not allowed),
+        "errors": errors,
+    }
+
+
 def run_naver_inquiry_poll_worker():
     """네이버 상품문의·고객문의(미답변)를 조회해 「문의알림」 시트에 누적하고, 처리될 때까지
     주기적으로 슬랙에 알립니다.
@@ -551,9 +810,10 @@ def run_naver_inquiry_poll_worker():
         매시간 알림이 소음이 됨 — 그날 알렸으면 스킵하고 다음날 다시 1회).
       • 누군가 답변하면 다음 조회의 미답변 목록에서 사라져 알림이 자동으로 멈춘다.
     알림은 근무시간(평일 10~19시)에만 보내고, 그 외 시간엔 발송도 「최근알림시각」 갱신도 하지
-    않아 근무 시작 시각에 밀린 미답변이 한 번에 환기된다. 「최근알림시각」이 전원 공유 시트에
-    있어 R 창 안에서는 먼저 조회한 1대만 발송한다(4~5대 동시 가동 중복 방지).
+    않아 근무 시작 시각에 밀린 미답변이 한 번에 환기된다. 조회·발송은 설정 탭의 문의 알림
+    lease를 잡은 1대만 하므로 4~5대가 동시에 켜져 있어도 같은 알림을 두 번 보내지 않는다.
     반환 dict: ok, open, new, reminded, sent, off_hours, errors — 또는 ok False, error.
+    다른 PC가 lease를 쥐고 있으면 ok True, skipped_lease True.
     """
     if gspread is None:
         return {"ok": False, "error": "gspread 패키지가 필요합니다."}
@@ -561,196 +821,29 @@ def run_naver_inquiry_poll_worker():
         from google_sheets_oauth import get_authorized_gspread_client
     except ImportError as e:
         return {"ok": False, "error": str(e)}
-    try:
-        import naver_commerce
-        import coupang_commerce
-        import slack_notify
-    except ImportError as e:
-        return {"ok": False, "error": str(e)}
     try:
         gc = get_authorized_gspread_client()
-        cfg = _read_config_values_map(_standalone_open_config_ws(gc))
-        client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
-        client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
-        cp_vendor = cfg.get(CONFIG_KEY_COUPANG_VENDOR_ID, "")
-        cp_access = cfg.get(CONFIG_KEY_COUPANG_ACCESS_KEY, "")
-        cp_secret = cfg.get(CONFIG_KEY_COUPANG_SECRET_KEY, "")
-        webhook = cfg.get(CONFIG_KEY_SLACK_WEBHOOK, "")
-        naver_on = bool(client_id and client_secret)
-        coupang_on = bool(cp_vendor and cp_access and cp_secret)
-        if not naver_on and not coupang_on:
-            return {"ok": False,
-                    "error": "네이버·쿠팡 키가 모두 미설정 — 설정 팝업의 「키 설정」에서 등록하세요."}
-        now_dt = datetime.now()
-        from_dt = now_dt - timedelta(days=NAVER_INQUIRY_LOOKBACK_DAYS)
-        records = []
-        errors = []
-        if naver_on:
-            try:
-                token = naver_commerce.get_access_token(client_id, client_secret)
-            except Exception as e:
-                token = None
-                errors.append(f"네이버 토큰 발급 실패: {e}")
-            if token:
-                # 상품문의(미답변)
-                try:
-                    for it in naver_commerce.fetch_product_qnas(token, from_dt, now_dt, answered=False):
-                        qid = it.get("questionId")
-                        if qid is None:
-                            continue
-                        records.append({
-                            "id": f"Q{qid}",
-                            "type": "네이버상품문의",
-                            "reg": str(it.get("createDate", "") or ""),
-                            "target": str(it.get("productName", "") or ""),
-                            "writer": str(it.get("maskedWriterId", "") or ""),
-                            "content": str(it.get("question", "") or ""),
-                        })
-                except Exception as e:
-                    errors.append(f"네이버 상품문의 조회 실패: {e}")
-                # 고객문의(미답변)
-                try:
-                    for it in naver_commerce.fetch_customer_inquiries(token, from_dt, now_dt, answered=False):
-                        ino = it.get("inquiryNo")
-                        if ino is None:
-                            continue
-                        records.append({
-                            "id": f"C{ino}",
-                            "type": "네이버고객문의",
-                            "reg": str(it.get("inquiryRegistrationDateTime", "") or ""),
-                            "target": str(it.get("productName") or it.get("orderId", "") or ""),
-                            "writer": str(it.get("customerName", "") or ""),
-                            "content": str(it.get("title") or it.get("inquiryContent", "") or ""),
-                        })
-                except Exception as e:
-                    errors.append(f"네이버 고객문의 조회 실패: {e}")
-        if coupang_on:
-            # 쿠팡 온라인 고객문의(상품문의, 미답변)
-            try:
-                for it in coupang_commerce.fetch_online_inquiries(
-                        cp_vendor, cp_access, cp_secret, from_dt, now_dt, answered=False):
-                    iid = it.get("inquiryId")
-                    if iid is None:
-                        continue
-                    records.append({
-                        "id": f"KO{iid}",
-                        "type": "쿠팡상품문의",
-                        "reg": str(it.get("inquiryAt", "") or ""),
-                        "target": str(it.get("productName") or it.get("productId", "") or ""),
-                        "writer": str(it.get("buyerEmail", "") or ""),
-                        "content": str(it.get("content", "") or ""),
-                    })
-            except Exception as e:
-                errors.append(f"쿠팡 상품문의 조회 실패: {e}")
-            # 쿠팡 콜센터(CS) 문의(미답변)
+        cfg_ws = _standalone_open_config_ws(gc)
+        # 조회·알림은 문의 알림 lease를 잡은 1대만 한다. 성공하면 다음 조회 주기까지 쥔 채로 두고,
+        # 실패하면 바로 놓아 다른 PC가 이어서 시도하게 한다.
+        started = datetime.now()
+        lease = claim_lease(cfg_ws, LEASE_INQUIRY_POLL)
+        if lease is None:
+            return {"ok": True, "skipped_lease": True}
+        hold_until = None
+        try:
+            with lease.keep_alive():
+                result = _poll_naver_inquiries(gc, _cached_config_values(cfg_ws))
+            if result.get("ok"):
+                hold_until = started + timedelta(milliseconds=NAVER_INQUIRY_POLL_MS)
+            return result
+        finally:
             try:
-                for it in coupang_commerce.fetch_callcenter_inquiries(
-                        cp_vendor, cp_access, cp_secret, from_dt, now_dt, answered=False):
-                    iid = it.get("inquiryId")
-                    if iid is None:
-                        continue
-                    records.append({
-                        "id": f"KC{iid}",
-                        "type": "쿠팡CS문의",
-                        "reg": str(it.get("inquiryAt") or it.get("inquiryDateTime", "") or ""),
-                        "target": str(it.get("itemName") or it.get("orderId", "") or ""),
-                        "writer": "",
-                        "content": str(it.get("content", "") or ""),
-                    })
+                lease.release(hold_until=hold_until)
             except Exception as e:
-                errors.append(f"쿠팡 CS문의 조회 실패: {e}")
-        if not records and errors:
-            return {"ok": False, "error": " / ".join(errors)}
-
-        ws = _standalone_open_inquiry_ws(gc)
-        values = ws.get_all_values()
-        # 헤더가 옛 형식이면 새 형식으로 교체(기존 데이터 행은 보존; 옛 「알림」값은
-        # 「최근알림시각」 자리에서 파싱 불가→미알림 취급되어 다음 근무시간에 한 번 환기됨).
-        if not values or values[0] != list(INQUIRY_SHEET_HEADERS):
-            need_cols = len(INQUIRY_SHEET_HEADERS)
-            if getattr(ws, "col_count", need_cols) < need_cols:
-                ws.add_cols(need_cols - ws.col_count)  # 옛 8열 시트 → 9열로 확장 후 헤더 교체
-            ws.update([list(INQUIRY_SHEET_HEADERS)], range_name="A1",
-                      value_input_option="RAW")
-            if not values:
-                values = [list(INQUIRY_SHEET_HEADERS)]
-        # 문의ID → (시트 행번호, 최근알림시각 dt) 인덱스
-        index = {}
-        for i, row in enumerate(values[1:], start=2):
-            rid = (row[0] or "").strip() if row else ""
-            if not rid:
-                continue
-            last_s = row[7].strip() if len(row) > 7 else ""
-            try:
-                last_dt = datetime.strptime(last_s, "%Y-%m-%d %H:%M:%S")
-            except (ValueError, AttributeError):
-                last_dt = None
-            index[rid] = (i, last_dt)
-
-        start_h, end_h = _read_inquiry_work_hours(cfg)
-        allowed = _inquiry_alerts_allowed(now_dt, start_h, end_h)
-        remind_delta = timedelta(minutes=NAVER_INQUIRY_REMIND_MIN)
-        now = now_dt.strftime("%Y-%m-%d %H:%M:%S")
-        new_rows = []        # 신규 미답변 → 시트 append
-        ts_updates = []      # 기존 행 「최근알림시각」 갱신용 batch_update
-        to_notify = []       # 이번에 슬랙으로 보낼 레코드
-        seen_batch = set()
-        for r in records:
-            rid = r["id"]
-            if rid in seen_batch:
-                continue
-            seen_batch.add(rid)
-            if rid not in index:
-                # 새 미답변: 행 추가. 근무시간이면 즉시 알림(최근알림시각=now),
-                # 아니면 최근알림시각을 비워 둬 다음 근무시간에 알리도록 한다.
-                notify_now = allowed
-                new_rows.append([
-                    rid, r["type"], r["reg"], r["target"], r["writer"],
-                    (r["content"] or "")[:200], now,
-                    now if notify_now else "", "미답변",
-                ])
-                if notify_now:
-                    r["_kind"] = "new"
-                    to_notify.append(r)
-            else:
-                # 기존 미답변: 근무시간 + 재알림 조건 충족 시 리마인더.
-                row_no, last_dt = index[rid]
-                if rid.startswith("KC"):
-                    # 쿠팡 CS문의: 하루 1회만 리마인더. 자동 반품수거처럼 회사 도착까지
-                    # 판매자가 액션할 수 없는 건이 많아 매시간 알림이 소음이 된다.
-                    # 마지막 알림이 오늘 이전 날짜면 재알림(그날 이미 알렸으면 스킵→다음날 1회).
-                    due = last_dt is None or last_dt.date() < now_dt.date()
-                else:
-                    # 그 외 채널(네이버 상품/고객문의, 쿠팡 상품문의 KO): R분 경과 시 재알림.
-                    due = last_dt is None or now_dt - last_dt >= remind_delta
-                if allowed and due:
-                    r["_kind"] = "remind"
-                    to_notify.append(r)
-                    ts_updates.append({"range": f"H{row_no}", "values": [[now]]})
-        if new_rows:
-            ws.append_rows(new_rows, value_input_option="RAW")
-        sent = 0
-        if to_notify and webhook:
-            res = slack_notify.send_slack(webhook, _build_inquiry_slack_text(to_notify))
-            if res.get("ok"):
-                sent = len(to_notify)
-                if ts_updates:
-                    ws.batch_update(ts_updates, value_input_option="RAW")
-            else:
-                errors.append(f"슬랙 전송 실패: {res.get('error', '')}")
-        elif to_notify and not webhook:
-            errors.append("슬랙 웹훅 미설정 — 알림을 보내지 못했습니다.")
-        new_cnt = sum(1 for r in to_notify if r.get("_kind") == "new")
-        return {
-            "ok": True,
-            "open": len(seen_batch),
-            "new": new_cnt,
-            "reminded": len(to_notify) - new_cnt,
-            "sent": sent,
-            "off_hours": (not allowed),
-            "errors": errors,
-        }
+                print(f"! Lease release failed ({LEASE_INQUIRY_POLL}): {e}")
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -832,8 +925,7 @@ def run_product_code_map_load_worker(store_type: str):
         return {"ok": False, "error": str(e), "store_type": store_type}
     try:
         gc = get_authorized_gspread_client()
-        spreadsheet = gc.open_by_key(SPREADSHEET_ID)
-        worksheet = spreadsheet.get_worksheet(sheet_index)
+        worksheet = _standalone_sheet_at(gc, sheet_index)
         values = worksheet.get_all_values()
         data_start_idx = header_row_num
 
@@ -863,6 +955,7 @@ def run_product_code_map_load_worker(store_type: str):
             out["coupang_vp"] = coupang_vp
         return out
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e), "store_type": store_type}
 
 
@@ -881,7 +974,7 @@ def run_naver_order_fetch_worker(days):
         return {"ok": False, "error": str(e)}
     try:
         gc = get_authorized_gspread_client()
-        cfg = _read_config_values_map(_standalone_open_config_ws(gc))
+        cfg = _cached_config_values(_standalone_open_config_ws(gc))
         client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
         client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
         if not (client_id and client_secret):
@@ -894,6 +987,7 @@ def run_naver_order_fetch_worker(days):
             client_id, client_secret, from_dt, now_dt, debug=False)
         return {"ok": True, "rows": rows, "count": len(rows)}
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -936,7 +1030,7 @@ def run_naver_product_search_worker(query):
             stage = "Google Sheets 인증"
             gc = get_authorized_gspread_client()
             stage = "공유 설정 시트 조회"
-            cfg = _read_config_values_map(_standalone_open_config_ws(gc))
+            cfg = _cached_config_values(_standalone_open_config_ws(gc))
             stage = "네이버 API 키 확인"
             client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
             client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
@@ -974,7 +1068,7 @@ def run_naver_order_lookup_worker(order_id):
         return {"ok": False, "error": f"주문 조회 모듈을 불러오지 못했습니다: {exc}"}
     try:
         gc = get_authorized_gspread_client()
-        cfg = _read_config_values_map(_standalone_open_config_ws(gc))
+        cfg = _cached_config_values(_standalone_open_config_ws(gc))
         client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
         client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
         if not (client_id and client_secret):
@@ -986,6 +1080,7 @@ def run_naver_order_lookup_worker(order_id):
         order = naver_commerce.fetch_order_for_transaction_statement(token, normalized_order_id)
         return {"ok": True, "order": order}
     except Exception as exc:
+        sheet_handles().forget_on_error(exc)
         return {"ok": False, "error": str(exc)}
 
 
@@ -1005,7 +1100,7 @@ def run_coupang_order_lookup_worker(order_id):
         return {"ok": False, "error": f"쿠팡 주문 조회 모듈을 불러오지 못했습니다: {exc}"}
     try:
         gc = get_authorized_gspread_client()
-        cfg = _read_config_values_map(_standalone_open_config_ws(gc))
+        cfg = _cached_config_values(_standalone_open_config_ws(gc))
         vendor_id = cfg.get(CONFIG_KEY_COUPANG_VENDOR_ID, "")
         access_key = cfg.get(CONFIG_KEY_COUPANG_ACCESS_KEY, "")
         secret_key = cfg.get(CONFIG_KEY_COUPANG_SECRET_KEY, "")
@@ -1019,6 +1114,7 @@ def run_coupang_order_lookup_worker(order_id):
         )
         return {"ok": True, "order": order}
     except Exception as exc:
+        sheet_handles().forget_on_error(exc)
         return {"ok": False, "error": str(exc)}
 
 
@@ -1063,7 +1159,7 @@ def run_naver_dispatch_worker(records):
         return {"ok": False, "error": str(e)}
     try:
         gc = get_authorized_gspread_client()
-        cfg = _read_config_values_map(_standalone_open_config_ws(gc))
+        cfg = _cached_config_values(_standalone_open_config_ws(gc))
         client_id = cfg.get(CONFIG_KEY_NAVER_CLIENT_ID, "")
         client_secret = cfg.get(CONFIG_KEY_NAVER_CLIENT_SECRET, "")
         if not (client_id and client_secret):
@@ -1073,6 +1169,7 @@ def run_naver_dispatch_worker(records):
         res = naver_commerce.dispatch_orders_by_tracking(token, records)
         return res
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -1090,31 +1187,29 @@ class NaverDispatchThread(QThread):
 
 
 class OrderIndexReadSyncThread(QThread):
-    """스프레드시트 인덱스를 백그라운드에서 읽습니다(앱 시작·주기적 폴링 공용)."""
+    """스프레드시트 인덱스를 백그라운드에서 읽습니다(앱 시작·주기적 폴링 공용).
 
-    result_ready = Signal(dict)
-
-    def run(self):
-        self.result_ready.emit(run_order_index_read_sync_worker())
-
-
-class OrderIndexWriteThread(QThread):
-    """현재 인덱스 값을 백그라운드에서 스프레드시트에 기록합니다."""
+    background=True(주기 폴링)면 Sheets 요청을 낮은 우선순위로 보낸다.
+    """
 
     result_ready = Signal(dict)
 
-    def __init__(self, naver, coupang, gmarket, parent=None, reason="변경"):
+    def __init__(self, parent=None, background=False):
         super().__init__(parent)
-        self._naver = naver
-        self._coupang = coupang
-        self._gmarket = gmarket
-        self._reason = reason
+        self._background = background
 
     def run(self):
-        self.result_ready.emit(
-            run_order_index_write_worker(
-                self._naver, self._coupang, self._gmarket, reason=self._reason)
-        )
+        if self._background:
+            with sheets_priority(PRIORITY_BACKGROUND):
+                self.result_ready.emit(run_order_index_read_sync_worker())
+        else:
+            self.result_ready.emit(run_order_index_read_sync_worker())
+
+
+class SheetWriteQueueBridge(QObject):
+    """쓰기 큐 flush 스레드의 결과를 UI 스레드로 넘기는 시그널."""
+
+    flushed = Signal(str, dict)
 
 
 class OrderIndexUndoThread(QThread):
@@ -1132,7 +1227,8 @@ class NaverInquiryPollThread(QThread):
     result_ready = Signal(dict)
 
     def run(self):
-        self.result_ready.emit(run_naver_inquiry_poll_worker())
+        with sheets_priority(PRIORITY_BACKGROUND):
+            self.result_ready.emit(run_naver_inquiry_poll_worker())
 
 
 class NaverCredsValidateThread(QThread):
@@ -1416,7 +1512,7 @@ class ImageDialog(QDialog):
         """창이 닫힐 때 호출되는 이벤트"""
         # 종료 중 새 백그라운드 작업(폴링·푸시)이 뜨지 않도록 타이머 정지
         for _tname in ("_index_sheet_push_timer", "_index_sheet_poll_timer",
-                       "_tracking_list_timer", "_tracking_push_timer",
+                       "_tracking_list_timer",
                        "_naver_inquiry_timer", "_timer"):
             _t = getattr(self, _tname, None)
             try:
@@ -2136,6 +2232,10 @@ class MainWindow(QMainWindow):
         self.current_idx_11st = 1
 
         self._index_sheet_push_pending = False
+        # 쓰기 큐에 넣고 아직 결과를 받지 못한 인덱스 쓰기가 있으면 True(그동안 시트 읽기는 미룸)
+        self._index_sheet_write_queued = False
+        # 마지막으로 시트와 맞춘 인덱스(네이버, 쿠팡, 지마켓). 재실행 후 남은 쓰기의 충돌 판단용
+        self._index_sheet_base = None
         self._index_sheet_last_sync_display = None
         self._index_sheet_push_timer = QTimer(self)
         self._index_sheet_push_timer.setSingleShot(True)
@@ -2164,6 +2264,7 @@ class MainWindow(QMainWindow):
 
         self._tracking_controller = TrackingController(self)
         self._tracking_controller.initialize_runtime()
+        self._setup_sheet_write_queue()
         # API·알림 설정 팝업(작업자에겐 숨기고 작은 버튼으로만 노출)
         self._admin_tracking_built = False
         self._dlg_key_status = None
@@ -2252,8 +2353,7 @@ class MainWindow(QMainWindow):
             raise ValueError(f"지원되지 않는 store_type: {store_type}")
 
         gc = self._get_gspread_client()
-        spreadsheet = gc.open_by_key(SPREADSHEET_ID)
-        worksheet = spreadsheet.get_worksheet(sheet_index)
+        worksheet = _standalone_sheet_at(gc, sheet_index)
 
         values = worksheet.get_all_values()
         data_start_idx = header_row_num  # 0-based index에서 header 다음 행
@@ -2533,8 +2633,8 @@ class MainWindow(QMainWindow):
     def _on_tracking_context_menu(self, pos):
         return self._tracking_controller._on_tracking_context_menu(pos)
 
-    def _load_tracking_list(self):
-        return self._tracking_controller._load_tracking_list()
+    def _load_tracking_list(self, background=False):
+        return self._tracking_controller._load_tracking_list(background=background)
 
     def _on_tracking_list_finished(self, payload: dict):
         return self._tracking_controller._on_tracking_list_finished(payload)
@@ -2545,6 +2645,9 @@ class MainWindow(QMainWindow):
     def _populate_tracking_table(self, *_args):
         return self._tracking_controller._populate_tracking_table(*_args)
 
+    def _apply_tracking_table_filter(self, *_args):
+        return self._tracking_controller._apply_tracking_table_filter(*_args)
+
     def _parse_event_dt(self, s):
         return self._tracking_controller._parse_event_dt(s)
 
@@ -2566,23 +2669,14 @@ class MainWindow(QMainWindow):
     def _on_tracking_management_update_finished(self, payload):
         return self._tracking_controller._on_tracking_management_update_finished(payload)
 
-    def _cleanup_tracking_management_update_thread(self):
-        return self._tracking_controller._cleanup_tracking_management_update_thread()
-
-    def _on_tracking_item_changed(self, item):
-        return self._tracking_controller._on_tracking_item_changed(item)
-
-    def _flush_tracking_notes(self):
-        return self._tracking_controller._flush_tracking_notes()
+    def _on_tracking_memo_edited(self, regino, text):
+        return self._tracking_controller._on_tracking_memo_edited(regino, text)
 
     def _on_tracking_notes_update_finished(self, payload):
         return self._tracking_controller._on_tracking_notes_update_finished(payload)
 
-    def _cleanup_tracking_notes_update_thread(self):
-        return self._tracking_controller._cleanup_tracking_notes_update_thread()
-
-    def _on_tracking_cell_double_clicked(self, row, col):
-        return self._tracking_controller._on_tracking_cell_double_clicked(row, col)
+    def _on_tracking_double_clicked(self, index):
+        return self._tracking_controller._on_tracking_double_clicked(index)
 
     def _on_tracking_refresh_one_clicked(self):
         return self._tracking_controller._on_tracking_refresh_one_clicked()
@@ -2662,6 +2756,8 @@ class MainWindow(QMainWindow):
     def _on_naver_inquiry_poll(self):
         if gspread is None or self._naver_inquiry_thread is not None:
             return
+        if sheets_governor().near_quota():
+            return  # 쿼터가 빠듯하면 다음 주기에 조회
         thread = NaverInquiryPollThread(self)
         self._naver_inquiry_thread = thread
         thread.result_ready.connect(self._on_naver_inquiry_result)
@@ -2676,6 +2772,9 @@ class MainWindow(QMainWindow):
             print(f"! 문의 조회 실패: {err}")
             self._set_naver_inquiry_status(f"실패: {err[:60]} · {t}")
             return
+        if payload.get("skipped_lease"):
+            self._set_naver_inquiry_status(f"다른 PC가 이번 주기 조회·알림을 맡음 · {t}")
+            return
         open_cnt = payload.get("open", 0)
         new = payload.get("new", 0)
         reminded = payload.get("reminded", 0)
@@ -3030,34 +3129,79 @@ class MainWindow(QMainWindow):
             self._update_index_sheet_sync_label()
             return
         if self._index_sheet_op_thread is not None:
-            # 다른 시트 작업(폴링·이전 쓰기)이 진행 중 → 디바운스 타이머를 재가동해
-            # 잠시 후 최신 값으로 다시 시도(쓰기 유실 방지).
+            # 시트 읽기(폴링 등)가 진행 중 → 디바운스 타이머를 재가동해
+            # 잠시 후 최신 값으로 다시 시도(읽기 결과가 새 값을 덮지 않도록).
             self._index_sheet_push_pending = True
             self._index_sheet_push_timer.start(ORDER_INDEX_SHEET_PUSH_DEBOUNCE_MS)
             self._update_index_sheet_sync_label()
             return
         n, c, g = self.current_idx_naver, self.current_idx_coupang, self.current_idx_gmarket
         reason = getattr(self, "_pending_index_reason", "변경")
-        thread = OrderIndexWriteThread(n, c, g, self, reason=reason)
-        self._index_sheet_op_thread = thread
-        thread.result_ready.connect(self._on_order_index_write_finished)
-        thread.finished.connect(self._cleanup_index_sheet_op_thread)
-        thread.finished.connect(thread.deleteLater)
-        thread.start()
+        # 저널에 바로 기록하고 돌아온다. 실제 시트 쓰기는 큐 스레드가 모아서 보낸다.
+        today = date.today().strftime("%Y-%m-%d")
+        try:
+            sheet_write_queue().enqueue(ORDER_INDEX_WRITE_KIND, {today: {
+                "naver": n, "coupang": c, "gmarket": g, "reason": reason,
+                "base": list(self._index_sheet_base) if self._index_sheet_base else None,
+            }}, priority=PRIORITY_INTERACTIVE)
+        except Exception as e:
+            print(f"! 인덱스 쓰기 저널 기록 실패: {e}")
+            self._index_sheet_push_pending = True
+            self._update_index_sheet_sync_label()
+            return
+        self._index_sheet_push_pending = True
+        self._index_sheet_write_queued = True
+        self._update_index_sheet_sync_label()
 
     def _on_order_index_write_finished(self, payload: dict):
-        if payload.get("ok"):
-            self._index_sheet_push_pending = False
-            self._index_sheet_last_sync_display = datetime.now()
-        else:
+        self._index_sheet_write_queued = False
+        if not payload.get("ok"):
             self._index_sheet_push_pending = True
-            print(f"! 스프레드시트 인덱스 반영 실패: {payload.get('error', '')}")
+            print(f"! 스프레드시트 인덱스 반영 실패(자동 재시도): {payload.get('error', '')}")
+            self._update_index_sheet_sync_label()
+            return
+        self._index_sheet_push_pending = bool(
+            self._index_sheet_push_timer.isActive()
+            or sheet_write_queue().pending_count(ORDER_INDEX_WRITE_KIND)
+        )
+        written = payload.get("written")
+        if written:
+            self._index_sheet_base = (written["naver"], written["coupang"], written["gmarket"])
+            self._index_sheet_last_sync_display = datetime.now()
+        if payload.get("conflict"):
+            print("! 이전 실행에서 남은 인덱스 쓰기를 건너뜀: 그 사이 시트 값이 바뀌었습니다.")
+        if (payload.get("conflict") or payload.get("replayed")) and not self._index_sheet_push_pending:
+            # 재실행 후 보낸(또는 건너뛴) 쓰기 → 화면을 시트 값으로 다시 맞춘다.
+            self._begin_order_index_read(interactive=False, on_applied=None, defer_if_busy=True)
         self._update_index_sheet_sync_label()
 
+    def _setup_sheet_write_queue(self):
+        """배송추적·주문 인덱스 시트 쓰기를 모아 보내는 큐를 연결하고 남은 항목부터 보냅니다."""
+        queue = sheet_write_queue()
+        register_tracking_write_handlers(queue)
+        queue.register(ORDER_INDEX_WRITE_KIND, flush_order_index_writes)
+        self._sheet_write_bridge = SheetWriteQueueBridge(self)
+        self._sheet_write_bridge.flushed.connect(self._on_sheet_write_flushed)
+        queue.add_listener(self._sheet_write_bridge.flushed.emit)
+        try:
+            if queue.pending_count(ORDER_INDEX_WRITE_KIND):
+                self._index_sheet_push_pending = True
+                self._index_sheet_write_queued = True
+        except Exception as e:
+            print(f"! 시트 쓰기 저널 확인 실패: {e}")
+        if gspread is not None:
+            queue.start()
+
+    def _on_sheet_write_flushed(self, kind, result):
+        if kind == ORDER_INDEX_WRITE_KIND:
+            self._on_order_index_write_finished(result)
+        else:
+            self._tracking_controller._on_tracking_write_flushed(kind, result)
+
     def _update_index_sheet_sync_label(self):
         if not hasattr(self.ui, "label_index_sheet_sync"):
             return
-        if self._index_sheet_push_timer.isActive():
+        if self._index_sheet_push_timer.isActive() or self._index_sheet_write_queued:
             self.ui.label_index_sheet_sync.setText(
                 "저장 대기: 스프레드시트에 곧 반영됩니다…"
             )
@@ -3094,7 +3238,8 @@ class MainWindow(QMainWindow):
                 on_applied()
             return
 
-        if self._index_sheet_op_thread is not None:
+        if self._index_sheet_op_thread is not None or self._index_sheet_write_queued:
+            # 다른 읽기가 진행 중이거나, 큐에 넣은 인덱스 쓰기가 아직 시트에 닿지 않았음
             if defer_if_busy:
                 QTimer.singleShot(
                     300,
@@ -3111,7 +3256,9 @@ class MainWindow(QMainWindow):
         self._index_sheet_push_timer.stop()
         self._index_sheet_read_interactive = interactive
         self._index_sheet_read_on_applied = on_applied
-        thread = OrderIndexReadSyncThread(self)
+        # 주기 폴링(대화형도 아니고 이어서 처리할 작업도 없음)만 낮은 우선순위로 읽는다.
+        thread = OrderIndexReadSyncThread(
+            self, background=not interactive and on_applied is None)
         self._index_sheet_op_thread = thread
         thread.result_ready.connect(self._on_order_index_read_finished)
         thread.finished.connect(self._cleanup_index_sheet_op_thread)
@@ -3151,12 +3298,14 @@ class MainWindow(QMainWindow):
     def _on_order_index_sheet_poll(self):
         if not self._startup_order_index_sync_done:
             return
-        if self._index_sheet_op_thread is not None:
+        if self._index_sheet_op_thread is not None or self._index_sheet_write_queued:
             return  # 진행 중인 시트 작업(읽기·쓰기)이 있으면 이번 폴링은 건너뜀
         if self._index_sheet_push_timer.isActive() or self._index_sheet_push_pending:
             return  # 반영 대기 중인 로컬 변경이 있으면 시트 값으로 덮어쓰지 않음
         if self._index_idx_field_has_focus():
             return
+        if sheets_governor().near_quota():
+            return  # Sheets 쿼터가 빠듯하면 이번 폴링은 건너뛰고 대화형 작업에 양보
         self._begin_order_index_read(interactive=False, on_applied=None, defer_if_busy=False)
 
     def _on_push_button_index_sheet_refresh_clicked(self):
@@ -3702,6 +3851,7 @@ class MainWindow(QMainWindow):
         if kind == "created":
             self._last_refresh_created_today_row = True
             self._apply_order_indices_to_ui(1, 1, 1)
+            self._index_sheet_base = (1, 1, 1)
             try:
                 self._persist_index_values_to_json()
             except Exception as e:
@@ -3717,6 +3867,7 @@ class MainWindow(QMainWindow):
 
         row = payload["row"]
         na, co, gm = row["naver"], row["coupang"], row["gmarket"]
+        self._index_sheet_base = (na, co, gm)
         self._last_refresh_created_today_row = False
         if (
             self.current_idx_naver == na
@@ -3758,15 +3909,9 @@ class MainWindow(QMainWindow):
     def _enqueue_tracking_registration(self, records):
         return self._tracking_controller._enqueue_tracking_registration(records)
 
-    def _flush_tracking_records(self):
-        return self._tracking_controller._flush_tracking_records()
-
     def _on_tracking_upsert_finished(self, payload: dict):
         return self._tracking_controller._on_tracking_upsert_finished(payload)
 
-    def _cleanup_tracking_op_thread(self):
-        return self._tracking_controller._cleanup_tracking_op_thread()
-
     def _set_tracking_summary(self, text):
         return self._tracking_controller._set_tracking_summary(text)
 
@@ -4214,6 +4359,35 @@ class MainWindow(QMainWindow):
         # 상태바 메시지 변경 시그널 연결
         statusbar.messageChanged.connect(update_status_label)
         statusbar.showMessage("준비")  # 초기 메시지 설정
+
+        # 오른쪽: 이 PC의 Sheets API 분당 호출 수(쿼터 대비). 1분마다 콘솔 로그에도 남긴다.
+        self.sheets_quota_label = QLabel()
+        self.sheets_quota_label.setStyleSheet("QLabel { color: #888888; font-size: 8pt; padding: 0 8px; }")
+        statusbar.addPermanentWidget(self.sheets_quota_label)
+        self._sheets_quota_ticks = 0
+        self._sheets_quota_timer = QTimer(self)
+        self._sheets_quota_timer.timeout.connect(self._refresh_sheets_quota_status)
+        self._sheets_quota_timer.start(SHEETS_QUOTA_STATUS_MS)
+        self._refresh_sheets_quota_status()
+
+    def _refresh_sheets_quota_status(self):
+        governor = sheets_governor()
+        stats = governor.snapshot()
+        self.sheets_quota_label.setText(governor.status_text())
+        self.sheets_quota_label.setToolTip(
+            f"앱 시작 후 Sheets 요청: 읽기 {stats['total_reads']}건 · 쓰기 {stats['total_writes']}건\n"
+            f"쿼터 때문에 늦춘 요청 {stats['delayed']}건 · 429 응답 {stats['rate_limited']}회"
+        )
+        self._sheets_quota_ticks += 1
+        if self._sheets_quota_ticks % (60_000 // SHEETS_QUOTA_STATUS_MS):
+            return
+        if stats["reads_per_min"] or stats["writes_per_min"]:
+            print(
+                f"Sheets quota: reads {stats['reads_per_min']}/{stats['read_quota']}, "
+                f"writes {stats['writes_per_min']}/{stats['write_quota']} per min · "
+                f"total {stats['total_reads']}/{stats['total_writes']} · "
+                f"delayed {stats['delayed']} · 429 {stats['rate_limited']}"
+            )
         
     def setup_connections(self):
         """버튼과 메뉴 동작을 연결합니다."""        
@@ -4286,7 +4460,7 @@ class MainWindow(QMainWindow):
                 self.ui.tableWidget_tracking.style())
             self.ui.tableWidget_tracking.setStyle(self._tracking_no_hover_style)
             # 클릭(행 선택) 하이라이트를 진한 파랑 → 옅은 파스텔로(팔레트 방식이라
-            # item.setBackground 위험행 색칠을 깨지 않음). 글자색은 진하게 유지.
+            # 모델 BackgroundRole 위험행 색칠을 깨지 않음). 글자색은 진하게 유지.
             _tpal = self.ui.tableWidget_tracking.palette()
             _tpal.setColor(QPalette.ColorRole.Highlight, QColor("#dcefff"))
             _tpal.setColor(QPalette.ColorRole.HighlightedText, QColor("#1a202c"))
@@ -4705,9 +4879,14 @@ class MainWindow(QMainWindow):
         self._on_detail_clear_inputs_clicked()
 
     def _invalidate_google_sheets_client_and_caches(self):
+        # 캐시한 워크시트 핸들은 이전 Client의 세션을 물고 있으므로 같이 버린다.
+        sheet_handles().invalidate()
+        config_cache().invalidate()
         self._gspread_client = None
         self._spreadsheet_product_code_maps = {}
         self._coupang_option_to_vp_product_no = {}
+        # 인증 문제로 재시도 대기 중인 시트 쓰기는 새 Client로 바로 다시 보낸다.
+        sheet_write_queue().retry_now()
 
     def _refresh_google_auth_status_ui(self):
         if not hasattr(self.ui, "label_google_auth_status"):
@@ -5142,7 +5321,8 @@ class MainWindow(QMainWindow):
             "currentPage": 1,
         }
         try:
-            resp = requests.get(KPOST_OPENAPI2_URL, params=params, timeout=15)
+            resp = http_sessions.get_session(KPOST_OPENAPI2_URL).get(
+                KPOST_OPENAPI2_URL, params=params, timeout=15)
             resp.raise_for_status()
         except requests.RequestException as e:
             return None, ("HTTP 오류", str(e))
@@ -5723,17 +5903,18 @@ class MainWindow(QMainWindow):
             return False
             
     def _file_sha1(self, file_path):
-        """파일 내용 SHA1(중복 로드 판별용). 실패 시 None."""
+        """파일 내용 SHA1(중복 로드 판별·파싱 캐시 키). 실패 시 None."""
         try:
-            h = hashlib.sha1()
-            with open(file_path, "rb") as f:
-                for chunk in iter(lambda: f.read(65536), b""):
-                    h.update(chunk)
-            return h.hexdigest()
+            return file_sha1(file_path)
         except Exception as e:
             print(f"! 파일 해시 계산 실패: {e}")
             return None
 
+    def _read_order_frame_cached(self, file_path, variant, reader):
+        """주문 파일 DataFrame을 내용 해시 캐시에서 꺼내고, 없으면 reader()로 읽어 저장합니다.
+        variant는 같은 파일을 읽는 방식(시트·헤더 행)마다 다르게 줍니다."""
+        return order_parse_cache().load(self._file_sha1(file_path), variant, reader)
+
     def _todays_loaded_hashes(self):
         """오늘 불러온 주문 파일 해시 집합(로컬). 과거 날짜는 무시."""
         today = date.today().strftime("%Y-%m-%d")
@@ -5901,116 +6082,9 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"! 파일 헤더 확인 실패: {str(e)}")
             
-            # 비밀번호 고정값 사용
-            password = "1234"
-            print(f"✓ 고정 비밀번호 사용: {password}")
-            
-            # 비밀번호 보호 파일 처리
-            try:
-                # 임시 파일 생성
-                temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx')
-                temp_file.close()
-                temp_path = temp_file.name
-                
-                print(f"✓ 임시 파일 생성: {temp_path}")
-                
-                # 파일 복호화
-                with open(self.selected_file_path, 'rb') as file:
-                    office_file = msoffcrypto.OfficeFile(file)
-                    office_file.load_key(password=password)
-                    
-                    with open(temp_path, 'wb') as output_file:
-                        office_file.decrypt(output_file)
-                
-                print("✓ 파일 복호화 완료")
-                
-                # 복호화된 파일 읽기
-                df = pd.read_excel(temp_path, header=1)
-                print(f"✓ 파일 읽기 성공")
-                print(f"데이터프레임 정보:")
-                print(f"- 행 수: {len(df)}")
-                print(f"- 열 수: {len(df.columns)}")
-                
-                # 임시 파일 삭제
-                os.unlink(temp_path)
-                print("✓ 임시 파일 삭제 완료")
-                
-            except Exception as e:
-                print(f"! 비밀번호 보호 파일 처리 실패: {str(e)}")
-                
-                # 기존 방식으로 시도
-                print("\n기존 방식으로 파일 읽기 시도...")
-                
-                # 다양한 엔진으로 파일 읽기 시도
-                engines_to_try = [
-                    ('openpyxl', {'engine': 'openpyxl'}),
-                    ('xlrd', {'engine': 'xlrd'}),
-                    ('openpyxl', {'engine': 'openpyxl', 'data_only': True}),
-                    ('pyxlsb', {'engine': 'pyxlsb'}),
-                ]
-                
-                df = None
-                last_error = None
-                
-                for engine_name, options in engines_to_try:
-                    try:
-                        print(f"\n✓ {engine_name} 엔진으로 시도 중... (옵션: {options})")
-                        options['header'] = 1  # 2행을 헤더로 사용
-                        
-                        # 시트 정보 확인
-                        if engine_name == 'openpyxl':
-                            import openpyxl
-                            wb = openpyxl.load_workbook(
-                                self.selected_file_path, 
-                                read_only=True, 
-                                data_only=options.get('data_only', False)
-                            )
-                            print(f"시트 목록: {wb.sheetnames}")
-                            print(f"활성 시트: {wb.active.title}")
-                            wb.close()
-                        
-                        df = pd.read_excel(self.selected_file_path, **options)
-                        print(f"✓ {engine_name} 엔진으로 파일 읽기 성공")
-                        print(f"데이터프레임 정보:")
-                        print(f"- 행 수: {len(df)}")
-                        print(f"- 열 수: {len(df.columns)}")
-                        
-                        # 임시 파일 삭제
-                        os.unlink(temp_path)
-                        print("✓ 임시 파일 삭제 완료")
-                        
-                        break
-                    except Exception as e:
-                        print(f"! {engine_name} 엔진 실패: {str(e)}")
-                        last_error = e
-                
-                if df is None:
-                    error_msg = "모든 엔진으로 파일 읽기 실패"
-                    if last_error:
-                        error_msg += f"\n마지막 오류: {str(last_error)}"
-                    print(f"\n파일 읽기 시도 결과:")
-                    print("- 파일이 손상되었거나 지원되지 않는 형식일 수 있습니다.")
-                    print("- 파일을 다시 저장하거나 다른 형식으로 변환해보세요.")
-                    
-                    # 파일 열기 시도
-                    msg = QMessageBox()
-                    msg.setIcon(QMessageBox.Critical)
-                    msg.setWindowTitle("파일 읽기 오류")
-                    msg.setText("엑셀 파일을 읽을 수 없습니다.")
-                    msg.setInformativeText(
-                        "파일이 손상되었거나 지원되지 않는 형식일 수 있습니다.\n"
-                        "파일을 직접 열어서 확인하시겠습니까?"
-                    )
-                    msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
-                    msg.setDefaultButton(QMessageBox.Yes)
-                    
-                    if msg.exec() == QMessageBox.Yes:
-                        if self.open_file_with_default_app(self.selected_file_path):
-                            print("✓ 파일을 기본 애플리케이션으로 열었습니다.")
-                        else:
-                            print("! 파일을 열 수 없습니다.")
-                    
-                    raise Exception(error_msg)
+            # 복호화·파싱 결과는 파일 내용 해시로 캐시 (같은 파일을 다시 열면 생략)
+            df = self._read_order_frame_cached(
+                self.selected_file_path, "naver", self._read_naver_order_excel)
             
             self._build_naver_orders_from_df(df, product_mapping)
             
@@ -6037,6 +6111,95 @@ class MainWindow(QMainWindow):
                     "3. 파일을 다시 저장하거나 다른 형식(.xlsx)으로 변환해보세요.",
                 )
 
+    def _read_naver_order_excel(self):
+        """선택한 네이버 주문 파일을 DataFrame으로 읽습니다(복호화 → 실패 시 엔진별 재시도)."""
+        # 비밀번호 고정값 사용
+        print(f"✓ 고정 비밀번호 사용: {ORDER_FILE_PASSWORD}")
+        
+        # 비밀번호 보호 파일 처리 (메모리에서 복호화해 바로 읽음, 임시 파일 없음)
+        try:
+            decrypted = decrypt_workbook(self.selected_file_path, ORDER_FILE_PASSWORD)
+            print("✓ 파일 복호화 완료")
+            
+            # 복호화된 파일 읽기
+            df = pd.read_excel(decrypted, header=1)
+            print(f"✓ 파일 읽기 성공")
+            print(f"데이터프레임 정보:")
+            print(f"- 행 수: {len(df)}")
+            print(f"- 열 수: {len(df.columns)}")
+            
+        except Exception as e:
+            print(f"! 비밀번호 보호 파일 처리 실패: {str(e)}")
+            
+            # 기존 방식으로 시도
+            print("\n기존 방식으로 파일 읽기 시도...")
+            
+            # 다양한 엔진으로 파일 읽기 시도
+            engines_to_try = [
+                ('openpyxl', {'engine': 'openpyxl'}),
+                ('xlrd', {'engine': 'xlrd'}),
+                ('openpyxl', {'engine': 'openpyxl', 'data_only': True}),
+                ('pyxlsb', {'engine': 'pyxlsb'}),
+            ]
+            
+            df = None
+            last_error = None
+            
+            for engine_name, options in engines_to_try:
+                try:
+                    print(f"\n✓ {engine_name} 엔진으로 시도 중... (옵션: {options})")
+                    options['header'] = 1  # 2행을 헤더로 사용
+                    
+                    # 시트 정보 확인
+                    if engine_name == 'openpyxl':
+                        import openpyxl
+                        wb = openpyxl.load_workbook(
+                            self.selected_file_path, 
+                            read_only=True, 
+                            data_only=options.get('data_only', False)
+                        )
+                        print(f"시트 목록: {wb.sheetnames}")
+                        print(f"활성 시트: {wb.active.title}")
+                        wb.close()
+                    
+                    df = pd.read_excel(self.selected_file_path, **options)
+                    print(f"✓ {engine_name} 엔진으로 파일 읽기 성공")
+                    print(f"데이터프레임 정보:")
+                    print(f"- 행 수: {len(df)}")
+                    print(f"- 열 수: {len(df.columns)}")
+                    break
+                except Exception as e:
+                    print(f"! {engine_name} 엔진 실패: {str(e)}")
+                    last_error = e
+            
+            if df is None:
+                error_msg = "모든 엔진으로 파일 읽기 실패"
+                if last_error:
+                    error_msg += f"\n마지막 오류: {str(last_error)}"
+                print(f"\n파일 읽기 시도 결과:")
+                print("- 파일이 손상되었거나 지원되지 않는 형식일 수 있습니다.")
+                print("- 파일을 다시 저장하거나 다른 형식으로 변환해보세요.")
+                
+                # 파일 열기 시도
+                msg = QMessageBox()
+                msg.setIcon(QMessageBox.Critical)
+                msg.setWindowTitle("파일 읽기 오류")
+                msg.setText("엑셀 파일을 읽을 수 없습니다.")
+                msg.setInformativeText(
+                    "파일이 손상되었거나 지원되지 않는 형식일 수 있습니다.\n"
+                    "파일을 직접 열어서 확인하시겠습니까?"
+                )
+                msg.setStandardButtons(QMessageBox.Yes | QMessageBox.No)
+                msg.setDefaultButton(QMessageBox.Yes)
+                
+                if msg.exec() == QMessageBox.Yes:
+                    if self.open_file_with_default_app(self.selected_file_path):
+                        print("✓ 파일을 기본 애플리케이션으로 열었습니다.")
+                    else:
+                        print("! 파일을 열 수 없습니다.")
+                
+                raise Exception(error_msg)
+        return df
 
     def _build_naver_orders_from_df(self, df, product_mapping):
         """엑셀/API 공통: 네이버 주문 DataFrame -> orders dict + 마크다운 생성.
@@ -6345,8 +6508,10 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"! 파일 헤더 확인 실패: {str(e)}")
             
-            # 엑셀 파일 읽기
-            df = pd.read_excel(self.selected_file_path)
+            # 엑셀 파일 읽기 (비밀번호 보호 파일이면 메모리에서 복호화, 같은 파일이면 캐시)
+            path = self.selected_file_path
+            df = self._read_order_frame_cached(
+                path, "coupang", lambda: pd.read_excel(open_order_workbook(path)))
             print(f"\n[열 정보]")
             print(f"감지된 열 목록: {', '.join(str(col) for col in df.columns)}")
 
@@ -6495,8 +6660,10 @@ class MainWindow(QMainWindow):
             except Exception as e:
                 print(f"! 파일 헤더 확인 실패: {str(e)}")
             
-            # 엑셀 파일 읽기
-            df = pd.read_excel(self.selected_file_path)
+            # 엑셀 파일 읽기 (비밀번호 보호 파일이면 메모리에서 복호화, 같은 파일이면 캐시)
+            path = self.selected_file_path
+            df = self._read_order_frame_cached(
+                path, "gmarket", lambda: pd.read_excel(open_order_workbook(path)))
             print(f"\n[열 정보]")
             print(f"감지된 열 목록: {', '.join(str(col) for col in df.columns)}")
             
@@ -6694,7 +6861,9 @@ class MainWindow(QMainWindow):
                 print(f"! 파일 헤더 확인 실패: {str(e)}")
 
             # 엑셀 파일 읽기 (.xls, 헤더가 3행에 위치 → header=2)
-            df = pd.read_excel(self.selected_file_path, header=2)
+            path = self.selected_file_path
+            df = self._read_order_frame_cached(
+                path, "11st", lambda: pd.read_excel(open_order_workbook(path), header=2))
             print(f"\n[열 정보]")
             print(f"감지된 열 목록: {', '.join(str(col) for col in df.columns)}")
 
@@ -7041,7 +7210,7 @@ class MainWindow(QMainWindow):
 
             QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
             try:
-                config = _read_config_values_map(
+                config = _cached_config_values(
                     _standalone_open_config_ws(get_authorized_gspread_client()),
                 )
                 suggestions = resolve_recipient_address(
@@ -8017,8 +8186,9 @@ class MainWindow(QMainWindow):
                 self.invoice_file_path = file_path
                 self._set_status_label(self.ui.label_invoice, filename, ok=True)
                 
-                # 엑셀 파일 읽기
-                df = pd.read_excel(file_path, header=6)  # 7번째 행을 헤더로 사용
+                # 엑셀 파일 읽기: 7번째 행을 헤더로, 필요한 열만 read-only로 한 줄씩 읽음
+                df, _, _ = read_excel_columns(
+                    file_path, INVOICE_FILE_COLUMNS, header=INVOICE_FILE_HEADER_ROW, compact=True)
                 
                 # 필요한 열 찾기
                 required_columns = {
@@ -8110,31 +8280,16 @@ class MainWindow(QMainWindow):
             return
             
         try:
-            # 임시 디렉토리 생성
-            temp_dir = Path("temp")
-            temp_dir.mkdir(exist_ok=True)
-            
-            # 파일 복사
-            temp_order_file = temp_dir / "temp_order.xlsx"
-            temp_invoice_file = temp_dir / "temp_invoice.xlsx"
-            shutil.copy2(self.selected_file_path, temp_order_file)
-            shutil.copy2(self.invoice_file_path, temp_invoice_file)
-            
-            # 스토어 타입에 따른 처리 분기
+            # 스토어 타입에 따른 처리 분기 (원본 파일을 읽기만 하므로 임시 사본을 만들지 않음)
             if self.store_type == "naver":
-                self._process_naver_invoice(temp_order_file, temp_invoice_file)
+                self._process_naver_invoice(self.selected_file_path, self.invoice_file_path)
             elif self.store_type == "coupang":
-                self._process_coupang_invoice(temp_order_file, temp_invoice_file)
+                self._process_coupang_invoice(self.selected_file_path, self.invoice_file_path)
             # 생성 결과를 송장 상태줄에 통합 표기(전용 라인 제거됨)
             _inv = os.path.basename(self.invoice_file_path) if self.invoice_file_path else "송장"
             self._set_status_label(
                 self.ui.label_invoice, f"{_inv} · 발송 생성 완료 ✓", ok=True)
 
-            # 임시 파일 정리
-            temp_order_file.unlink()
-            temp_invoice_file.unlink()
-            temp_dir.rmdir()
-
         except Exception as e:
             error_msg = str(e)
             print(f"❌ 일괄 발송 파일 생성 중 오류 발생: {error_msg}")
@@ -8146,23 +8301,19 @@ class MainWindow(QMainWindow):
                 f"일괄 발송 파일 생성 중 오류가 발생했습니다.\n\n{error_msg}"
             )
             
-    def _process_naver_invoice(self, temp_order_file, temp_invoice_file):
+    def _process_naver_invoice(self, order_file, invoice_file):
         """네이버 스토어 일괄 발송 파일 처리"""
         print("\n[네이버 스토어 일괄 발송 파일 처리 시작]")
         
         try:
-            # 1. 주문서 파일 복호화
-            password = "1234"
-            decrypted_order_file = Path("temp") / "decrypted_order.xlsx"
-            
-            with open(temp_order_file, 'rb') as file:
-                office_file = msoffcrypto.OfficeFile(file)
-                office_file.load_key(password=password)
-                with open(decrypted_order_file, 'wb') as output_file:
-                    office_file.decrypt(output_file)
-            
-            # 2. 주문서 데이터프레임 생성
-            order_df = pd.read_excel(decrypted_order_file, sheet_name='발주발송관리', header=None)
+            # 1~2. 주문서 파일 복호화(메모리) 후 데이터프레임 생성 (같은 파일이면 캐시)
+            order_df = self._read_order_frame_cached(
+                order_file, "naver-dispatch-sheet",
+                lambda: pd.read_excel(
+                    decrypt_workbook(order_file, ORDER_FILE_PASSWORD),
+                    sheet_name='발주발송관리', header=None,
+                ),
+            )
             order_df = order_df.drop(0).reset_index(drop=True)
             
             # 열 이름 설정
@@ -8231,8 +8382,9 @@ class MainWindow(QMainWindow):
                 if not delivery_request_col:
                     print("  - 배송방법(구매자 요청) 컬럼 없음")
             
-            # 4. 송장 파일 읽기
-            invoice_df = pd.read_excel(temp_invoice_file, header=6)
+            # 4. 송장 파일 읽기 (필요한 열만)
+            invoice_df, _, _ = read_excel_columns(
+                invoice_file, INVOICE_FILE_COLUMNS, header=INVOICE_FILE_HEADER_ROW)
             
             # 5. 열 매핑 설정
             column_mapping = {
@@ -8264,19 +8416,24 @@ class MainWindow(QMainWindow):
                     if col_str == key:  # 정확히 일치하는 경우에만 매칭
                         column_mapping['invoice'][key] = col
 
-            def _normalize_value(value):
-                if pd.isna(value):
-                    return ''
-                return str(value).strip()
+            def _invoice_column(key, normalize):
+                column = column_mapping['invoice'][key]
+                if column is None:
+                    return [''] * len(invoice_df)
+                return invoice_df[column].map(normalize).tolist()
 
-            def _normalize_digits(value):
-                if pd.isna(value):
-                    return ''
-                return ''.join(ch for ch in str(value) if ch.isdigit())
+            invoice_names = _invoice_column('수취인명', text_key)
+            invoice_phones = _invoice_column('수취인 이동통신', text_key)
+            invoice_numbers = _invoice_column('등기번호', text_key)
+            invoice_order_numbers = _invoice_column('고객주문번호', order_number_key)
 
-            order_number_series = None
+            order_numbers = []
+            full_order_numbers = []
             if column_mapping['order']['주문번호']:
-                order_number_series = order_df[column_mapping['order']['주문번호']].apply(_normalize_digits).str[:13]
+                full_order_numbers = order_df[column_mapping['order']['주문번호']].map(digits_key).tolist()
+                order_numbers = [number[:13] for number in full_order_numbers]
+            join = join_invoices(invoice_order_numbers, order_numbers)
+            addresses = order_df[column_mapping['order']['통합배송지']].tolist() if join.matches else []
             
             # 6. 매칭된 주문 정보 출력 및 운송장번호 업데이트
             print("\n[매칭된 주문 정보]")
@@ -8284,51 +8441,55 @@ class MainWindow(QMainWindow):
             naver_matched_records = []
             # API 발송처리용: (전체 주문번호 ↔ 등기번호) 쌍 — 상품주문번호는 발송 시 API로 해석
             self._naver_dispatch_records = []
+            # 주문 행 위치 → 송장번호 (같은 주문에 송장이 여럿이면 마지막 송장)
+            assigned = {}
+
+            for invoice_pos, order_positions in join.matches:
+                invoice_name = invoice_names[invoice_pos]
+                invoice_phone = invoice_phones[invoice_pos]
+                invoice_number = invoice_numbers[invoice_pos]
+                invoice_order_number = invoice_order_numbers[invoice_pos]
+
+                matched_count += 1
+                print(f"\n[매칭된 주문 {matched_count}]")
+                print(f"수취인명: {invoice_name}")
+                print(f"전화번호: {invoice_phone}")
+                print(f"고객주문번호: {invoice_order_number}")
+                print(f"송장번호: {invoice_number}")
+                print(f"주소: {addresses[order_positions[0]]}")
+                for position in order_positions:
+                    assigned[position] = invoice_number
+
+                naver_matched_records.append({
+                    "등기번호": invoice_number,
+                    "스토어": "naver",
+                    "주문번호": invoice_order_number,
+                    "수취인명": invoice_name,
+                })
 
-            for idx, invoice_row in invoice_df.iterrows():
-                invoice_name = _normalize_value(invoice_row[column_mapping['invoice']['수취인명']])
-                invoice_phone = _normalize_value(invoice_row[column_mapping['invoice']['수취인 이동통신']])
-                invoice_number = _normalize_value(invoice_row[column_mapping['invoice']['등기번호']])
-                invoice_order_number = ''
-                if column_mapping['invoice']['고객주문번호']:
-                    invoice_order_number = _normalize_digits(invoice_row[column_mapping['invoice']['고객주문번호']])[:13]
-
-                matching_rows = order_df.iloc[0:0]
-                if order_number_series is not None and invoice_order_number:
-                    matching_rows = order_df[
-                        order_number_series == invoice_order_number
-                    ]
-                
-                if not matching_rows.empty:
-                    matched_count += 1
-                    print(f"\n[매칭된 주문 {matched_count}]")
-                    print(f"수취인명: {invoice_name}")
-                    print(f"전화번호: {invoice_phone}")
-                    if invoice_order_number:
-                        print(f"고객주문번호: {invoice_order_number}")
-                    print(f"송장번호: {invoice_number}")
-                    print(f"주소: {matching_rows[column_mapping['order']['통합배송지']].iloc[0]}")
-                    
-                    # 운송장번호 업데이트
-                    order_df.loc[matching_rows.index, '송장번호'] = invoice_number
-                    print(f"✓ 송장번호 업데이트 완료")
-
-                    naver_matched_records.append({
-                        "등기번호": invoice_number,
-                        "스토어": "naver",
-                        "주문번호": invoice_order_number,
+                # 발송처리 API용: 주문서의 '전체' 주문번호(orderId)를 송장번호와 함께 저장
+                full_oid = full_order_numbers[order_positions[0]]
+                if full_oid and invoice_number:
+                    self._naver_dispatch_records.append({
+                        "orderId": full_oid,
+                        "trackingNumber": invoice_number,
                         "수취인명": invoice_name,
                     })
 
-                    # 발송처리 API용: 주문서의 '전체' 주문번호(orderId)를 송장번호와 함께 저장
-                    full_oid = _normalize_digits(
-                        matching_rows[column_mapping['order']['주문번호']].iloc[0])
-                    if full_oid and invoice_number:
-                        self._naver_dispatch_records.append({
-                            "orderId": full_oid,
-                            "trackingNumber": invoice_number,
-                            "수취인명": invoice_name,
-                        })
+            # 운송장번호 업데이트 (매칭된 행만 한 번에)
+            if assigned:
+                labels = order_df.index[list(assigned)]
+                order_df.loc[labels, '송장번호'] = pd.Series(list(assigned.values()), index=labels)
+
+            for key, positions in join.ambiguous.items():
+                print(f"⚠ 주문번호 {key}에 송장 {len(positions)}건이 매칭됨 — "
+                      f"마지막 송장({invoice_numbers[positions[-1]]})만 주문서에 남습니다.")
+            if join.unmatched_invoices:
+                print(f"⚠ 송장 {len(join.unmatched_invoices)}건은 주문서에서 같은 주문번호를 찾지 못했습니다.")
+                for position in join.unmatched_invoices:
+                    print(f"  - {invoice_names[position] or '(수취인명 없음)'} / "
+                          f"고객주문번호 {invoice_order_numbers[position] or '(없음)'} / "
+                          f"등기번호 {invoice_numbers[position]}")
 
             print(f"\n✓ 총 {matched_count}개의 주문이 매칭되었습니다.")
 
@@ -8337,9 +8498,6 @@ class MainWindow(QMainWindow):
 
             # 매칭된 건의 스토어·주문번호·수취인명을 공유 추적 시트에 보강
             self._enqueue_tracking_registration(naver_matched_records)
-
-            # 8. 임시 파일 정리
-            decrypted_order_file.unlink()
             
         except Exception as e:
             error_msg = str(e)
@@ -8347,14 +8505,15 @@ class MainWindow(QMainWindow):
             print(f"❌ 일괄 발송 파일 처리 중 오류 발생: {error_msg}")
             raise Exception(f"일괄 발송 파일 처리 중 오류가 발생했습니다: {error_msg}")
 
-    def _process_coupang_invoice(self, temp_order_file, temp_invoice_file):
+    def _process_coupang_invoice(self, order_file, invoice_file):
         """쿠팡 스토어 일괄 발송 파일 처리"""
         print("\n[쿠팡 스토어 일괄 발송 파일 처리 시작]")
         
         try:
             # 1. 쿠팡 주문서 파일 읽기
             print("\n[쿠팡 주문서 파일 읽기]")
-            order_df = pd.read_excel(temp_order_file)
+            order_df = self._read_order_frame_cached(
+                order_file, "coupang", lambda: pd.read_excel(open_order_workbook(order_file)))
             
             # 묶음배송번호, 주문번호를 문자열로 변환하여 정확한 값 유지
             if '묶음배송번호' in order_df.columns:
@@ -8401,7 +8560,8 @@ class MainWindow(QMainWindow):
             
             # 2. 우체국 송장 파일 읽기
             print("\n[우체국 송장 파일 읽기]")
-            invoice_df = pd.read_excel(temp_invoice_file, header=6)
+            invoice_df, _, _ = read_excel_columns(
+                invoice_file, INVOICE_FILE_COLUMNS, header=INVOICE_FILE_HEADER_ROW)
             
             # 데이터프레임 정보 출력
             print("\n[송장서 데이터프레임 정보]")
@@ -8439,37 +8599,45 @@ class MainWindow(QMainWindow):
                 "송장이 엉키면 오배송·CS 위험이 크기 때문입니다."
             )
             
-            def _coupang_norm_str(val):
-                if pd.isna(val):
-                    return ''
-                s = str(val).strip()
-                if s.lower() == 'nan':
-                    return ''
-                return s
-            
-            def _coupang_explain_invoice_unmatched(odf, inv_name, inv_phone):
-                nc = required_order_columns['수취인이름']
-                pc = required_order_columns['수취인전화번호']
+            name_col = required_order_columns['수취인이름']
+            phone_col = required_order_columns['수취인전화번호']
+            order_names = order_df[name_col].map(text_key).tolist()
+            order_phones = order_df[phone_col].map(text_key).tolist()
+            order_addresses = order_df[required_order_columns['수취인 주소']].tolist()
+            order_numbers = (
+                [str(value).strip() for value in order_df['주문번호'].tolist()]
+                if '주문번호' in order_df.columns else None
+            )
+            invoice_numbers = [str(value) for value in invoice_df[required_invoice_columns['등기번호']].tolist()]
+            invoice_names = invoice_df[required_invoice_columns['수취인명']].map(text_key).tolist()
+            invoice_phones = invoice_df[required_invoice_columns['수취인 전화번호']].map(text_key).tolist()
+
+            # 수취인명·전화번호 문자열이 둘 다 같은 주문 행에 매칭 (둘 다 빈 송장은 매칭하지 않음)
+            join = join_invoices(
+                list(zip(invoice_names, invoice_phones)), list(zip(order_names, order_phones)))
+            orders_by_name = build_index(order_names)
+            
+            def _coupang_explain_invoice_unmatched(inv_name, inv_phone):
                 reasons = []
                 if not inv_name:
                     reasons.append("송장 수취인명이 비어 있음")
                 if not inv_phone:
                     reasons.append("송장 수취인 전화번호가 비어 있음")
-                on = odf[nc].map(_coupang_norm_str)
-                same_name = odf[on == inv_name]
-                if same_name.empty:
+                same_name = orders_by_name.get(inv_name, []) if inv_name else []
+                if not same_name:
                     reasons.append(
                         "주문서에 동일한 수취인명이 없음 "
                         "(철자·띄어쓰기·괄호·별칭 등 표기 차이 가능)"
                     )
                 else:
-                    ophones = sorted(
-                        {p for p in same_name[pc].map(_coupang_norm_str).tolist() if p}
-                    )
+                    ophones = sorted({order_phones[pos] for pos in same_name if order_phones[pos]})
                     reasons.append(
                         f"이름은 주문서와 일치하나 전화번호 불일치 "
                         f"(송장: {inv_phone!r}, 주문서: {ophones})"
                     )
+                    inv_digits = digits_key(inv_phone)
+                    if inv_digits and any(digits_key(phone) == inv_digits for phone in ophones):
+                        reasons.append("숫자는 같고 하이픈·공백 등 표기만 다름")
                 return " / ".join(reasons)
             
             # 운송장번호 컬럼 추가
@@ -8477,60 +8645,60 @@ class MainWindow(QMainWindow):
             
             # 매칭 카운터
             matched_count = 0
-            unmatched_invoice = 0
             coupang_matched_records = []
+            # 주문 행 위치 → 송장번호 (같은 수취인에 송장이 여럿이면 마지막 송장)
+            assigned = {}
+
+            for invoice_pos, order_positions in join.matches:
+                invoice_number = invoice_numbers[invoice_pos]
+                invoice_name = invoice_names[invoice_pos]
+                invoice_phone = invoice_phones[invoice_pos]
+
+                matched_count += 1
+                print(f"\n[매칭된 주문 {matched_count}]")
+                print(f"수취인명: {invoice_name}")
+                print(f"전화번호: {invoice_phone}")
+                print(f"송장번호: {invoice_number}")
+                print(f"주소: {order_addresses[order_positions[0]]}")
+                for position in order_positions:
+                    assigned[position] = invoice_number
+
+                coupang_matched_records.append({
+                    "등기번호": invoice_number,
+                    "스토어": "coupang",
+                    "주문번호": order_numbers[order_positions[0]] if order_numbers is not None else "",
+                    "수취인명": invoice_name,
+                })
 
-            # 각 송장 행에 대해 매칭 시도
-            for idx, invoice_row in invoice_df.iterrows():
-                invoice_number = str(invoice_row[required_invoice_columns['등기번호']])
-                invoice_name = _coupang_norm_str(invoice_row[required_invoice_columns['수취인명']])
-                invoice_phone = _coupang_norm_str(invoice_row[required_invoice_columns['수취인 전화번호']])
-                
-                # 수취인명과 전화번호로 매칭
-                matching_rows = order_df[
-                    (order_df[required_order_columns['수취인이름']].map(_coupang_norm_str) == invoice_name) &
-                    (order_df[required_order_columns['수취인전화번호']].map(_coupang_norm_str) == invoice_phone)
-                ]
-                
-                if not matching_rows.empty:
-                    matched_count += 1
-                    print(f"\n[매칭된 주문 {matched_count}]")
-                    print(f"수취인명: {invoice_name}")
-                    print(f"전화번호: {invoice_phone}")
-                    print(f"송장번호: {invoice_number}")
-                    print(f"주소: {matching_rows[required_order_columns['수취인 주소']].iloc[0]}")
-                    
-                    order_df.loc[matching_rows.index, '운송장번호'] = invoice_number
-                    print(f"✓ 송장번호 업데이트 완료")
-
-                    onum = ""
-                    if '주문번호' in order_df.columns:
-                        onum = str(matching_rows['주문번호'].iloc[0]).strip()
-                    coupang_matched_records.append({
-                        "등기번호": invoice_number,
-                        "스토어": "coupang",
-                        "주문번호": onum,
-                        "수취인명": invoice_name,
-                    })
-                else:
-                    unmatched_invoice += 1
-                    why = _coupang_explain_invoice_unmatched(order_df, invoice_name, invoice_phone)
-                    print(f"\n[매칭 실패 — 송장 행 {unmatched_invoice}]")
-                    print(f"수취인명: {invoice_name or '(비어 있음)'}")
-                    print(f"전화번호: {invoice_phone or '(비어 있음)'}")
-                    print(f"등기번호: {invoice_number}")
-                    print(f"사유: {why}")
+            if assigned:
+                labels = order_df.index[list(assigned)]
+                order_df.loc[labels, '운송장번호'] = pd.Series(list(assigned.values()), index=labels)
+
+            for (name, phone), positions in join.ambiguous.items():
+                print(f"⚠ {name} / {phone} 주문에 송장 {len(positions)}건이 매칭됨 — "
+                      f"마지막 송장({invoice_numbers[positions[-1]]})만 주문서에 남습니다.")
+
+            unmatched_invoice = len(join.unmatched_invoices)
+            for failed_count, position in enumerate(join.unmatched_invoices, 1):
+                invoice_name = invoice_names[position]
+                invoice_phone = invoice_phones[position]
+                why = _coupang_explain_invoice_unmatched(invoice_name, invoice_phone)
+                print(f"\n[매칭 실패 — 송장 행 {failed_count}]")
+                print(f"수취인명: {invoice_name or '(비어 있음)'}")
+                print(f"전화번호: {invoice_phone or '(비어 있음)'}")
+                print(f"등기번호: {invoice_numbers[position]}")
+                print(f"사유: {why}")
             
             print(f"\n✓ 총 {matched_count}개의 주문이 매칭되었습니다.")
             if unmatched_invoice:
                 print(f"⚠ 송장 {unmatched_invoice}건은 주문서와 맞는 조합이 없어 운송장번호를 넣지 못했습니다.")
             
-            blank_tr = order_df['운송장번호'].map(_coupang_norm_str) == ''
+            blank_tr = order_df['운송장번호'].map(text_key) == ''
             if blank_tr.any():
                 print("\n[운송장번호가 비어 있는 주문 (위 매칭 실패와 대응되는 경우가 많음)]")
                 for _, orow in order_df[blank_tr].iterrows():
-                    oname = _coupang_norm_str(orow[required_order_columns['수취인이름']])
-                    ophone = _coupang_norm_str(orow[required_order_columns['수취인전화번호']])
+                    oname = text_key(orow[required_order_columns['수취인이름']])
+                    ophone = text_key(orow[required_order_columns['수취인전화번호']])
                     print(f"  - {oname} / {ophone}")
             
             # 4. 결과 파일 저장
@@ -8977,6 +9145,11 @@ def main():
     # 창을 닫으면 즉시 종료. 백그라운드 QThread 파괴로 인한 종료 크래시
     # (QThread: Destroyed while thread is still running)를 피하려고 Qt/파이썬 정리
     # 단계를 건너뛴다. 인덱스 등 로컬 저장은 변경 시 이미 동기로 기록된다.
+    # os._exit는 정리 단계를 건너뛰므로 keep-alive 연결은 여기서 직접 닫는다.
+    try:
+        http_sessions.close_all()
+    except Exception:
+        pass
     try:
         sys.stdout.flush()
     except Exception:
@@ -4,13 +4,24 @@ Google Sheets용 OAuth(gspread) 공통 모듈.
 easy-fulfill.py, database-sync.py에서 동일한 google-oauth/ 경로와 token.json을 사용합니다.
 database-sync는 시트 쓰기가 필요하므로 스코프는 spreadsheets(전체)입니다.
 기존 token.json이 spreadsheets.readonly로만 발급된 경우, token.json을 삭제한 뒤 재로그인하세요.
+
+Client는 프로세스당 하나만 만들어 모든 worker 스레드가 같은 인증 세션(연결 풀)을 나눠 쓴다.
+토큰이 만료되면 먼저 본 스레드 하나만 갱신하고 나머지는 갱신된 토큰을 그대로 쓴다.
+모든 요청은 sheets_quota의 공용 쿼터 조절기를 거친다.
 """
 
 from __future__ import annotations
 
+import json
+import threading
 from pathlib import Path
 
 import gspread
+from requests.adapters import HTTPAdapter
+
+from sheets_quota import GovernedHTTPClient
+from tracking.config_cache import config_cache
+from tracking.sheet_handles import sheet_handles
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
@@ -22,6 +33,14 @@ TOKEN_PATH = GOOGLE_AUTH_DIR / "token.json"
 
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
 
+# 공용 세션 연결 풀 크기(동시에 도는 worker 수보다 넉넉하게).
+GSPREAD_POOL_MAXSIZE = 16
+
+_client_lock = threading.RLock()
+_refresh_lock = threading.Lock()
+_shared_client = None
+_shared_credentials = None
+
 
 def _is_invalid_grant_error(error: BaseException) -> bool:
     """리프레시 토큰 폐기/만료(invalid_grant) 류 오류인지 문자열 기반 판별."""
@@ -33,13 +52,45 @@ def _is_invalid_grant_error(error: BaseException) -> bool:
     )
 
 
-def get_authorized_gspread_client():
-    """OAuth로 로그인한 gspread Client를 반환합니다. 브라우저 로그인이 필요할 수 있습니다."""
+class _SharedCredentials(Credentials):
+    """여러 스레드가 한 Credentials를 쓸 때 토큰 갱신을 한 번만 하고 token.json에 남긴다."""
+
+    def refresh(self, request):
+        try:
+            with _refresh_lock:
+                if self.valid:
+                    return  # 기다리는 동안 다른 스레드가 이미 갱신함
+                super().refresh(request)
+                try:
+                    TOKEN_PATH.write_text(self.to_json(), encoding="utf-8")
+                except OSError:
+                    pass  # 저장 실패해도 메모리의 토큰은 유효하다
+        except Exception as e:
+            # 리프레시 토큰이 만료/폐기되면 token.json과 공용 Client를 버려 다음 호출이 재인증하게 한다.
+            # (_refresh_lock을 놓은 뒤에 지워야 Client 생성 쪽 잠금과 순서가 엇갈리지 않는다.)
+            if _is_invalid_grant_error(e):
+                _discard_revoked_credentials(self)
+            raise
+
+
+def _discard_revoked_credentials(creds) -> None:
+    """creds가 지금 공용 Client의 것(또는 공용 Client가 없을 때)이면 token.json을 지운다.
+
+    재로그인 전에 받아 둔 예전 Credentials가 뒤늦게 invalid_grant를 내도 새로 만든 token.json은 남긴다.
+    """
+    with _client_lock:
+        stale = _shared_credentials is not None and _shared_credentials is not creds
+    if not stale:
+        delete_oauth_token_file()
+
+
+def _load_credentials() -> Credentials:
+    """token.json을 읽어 유효한 Credentials를 만든다. 브라우저 로그인이 필요할 수 있습니다."""
     GOOGLE_AUTH_DIR.mkdir(parents=True, exist_ok=True)
 
     creds = None
     if TOKEN_PATH.exists():
-        creds = Credentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
+        creds = _SharedCredentials.from_authorized_user_file(str(TOKEN_PATH), SCOPES)
 
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
@@ -49,7 +100,6 @@ def get_authorized_gspread_client():
                 # 리프레시 토큰이 만료/폐기되면 기존 token.json을 지우고 재인증으로 복구한다.
                 if not _is_invalid_grant_error(e):
                     raise
-                delete_oauth_token_file()
                 creds = None
         if not creds or not creds.valid:
             if not OAUTH_CREDENTIAL_PATH.exists():
@@ -60,15 +110,54 @@ def get_authorized_gspread_client():
             flow = InstalledAppFlow.from_client_secrets_file(
                 str(OAUTH_CREDENTIAL_PATH), SCOPES
             )
-            creds = flow.run_local_server(port=0)
+            creds = _SharedCredentials.from_authorized_user_info(
+                json.loads(flow.run_local_server(port=0).to_json()), SCOPES
+            )
 
         TOKEN_PATH.write_text(creds.to_json(), encoding="utf-8")
 
-    return gspread.authorize(creds)
+    return creds
+
+
+def _authorize(creds):
+    # 모든 Sheets 요청이 공용 쿼터 조절기(sheets_quota)를 거치게 한다.
+    gc = gspread.authorize(creds, http_client=GovernedHTTPClient)
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=GSPREAD_POOL_MAXSIZE)
+    gc.http_client.session.mount("https://", adapter)
+    return gc
+
+
+def get_authorized_gspread_client():
+    """OAuth로 로그인한 프로세스 공용 gspread Client를 반환합니다. 브라우저 로그인이 필요할 수 있습니다.
+
+    처음 부를 때(또는 reset 뒤)만 token.json을 읽고, 동시에 불러도 로그인·Client 생성은 한 번만 한다.
+    """
+    global _shared_client, _shared_credentials
+    with _client_lock:
+        if _shared_client is None:
+            creds = _load_credentials()
+            _shared_client = _authorize(creds)
+            _shared_credentials = creds
+        return _shared_client
+
+
+def reset_gspread_client() -> None:
+    """공용 Client를 버립니다. 다음 get_authorized_gspread_client()가 token.json부터 다시 읽습니다.
+
+    캐시한 워크시트 핸들은 이전 Client의 인증 세션을 물고 있으므로 설정 캐시와 함께 버린다.
+    (worker가 invalid_grant를 만나 버리는 경우도 화면 쪽 재인증과 같이 정리된다.)
+    """
+    global _shared_client, _shared_credentials
+    with _client_lock:
+        _shared_client = None
+        _shared_credentials = None
+    sheet_handles().invalidate()
+    config_cache().invalidate()
 
 
 def delete_oauth_token_file() -> bool:
-    """로컬 token.json만 삭제합니다. 있어서 지웠으면 True, 원래 없으면 False."""
+    """로컬 token.json을 삭제하고 공용 Client를 버립니다. 있어서 지웠으면 True, 원래 없으면 False."""
+    reset_gspread_client()
     if TOKEN_PATH.exists():
         TOKEN_PATH.unlink()
         return True
@@ -0,0 +1,111 @@
+"""외부 API 클라이언트가 함께 쓰는 HTTP 세션 레지스트리 (UI/Qt 비의존).
+
+host(scheme://netloc)마다 requests.Session 하나를 만들어 keep-alive 연결을 재사용한다.
+우체국(KPOST)·계약소포·네이버/쿠팡 커머스·슬랙 호출이 모두 이 레지스트리를 거치므로
+배송추적 일괄 새로고침이나 주문 조회에서 TCP/TLS 핸드셰이크를 매번 다시 하지 않는다.
+
+재시도 어댑터는 연결 실패와 502/503/504만 짧게 재시도한다. 읽기 타임아웃은 재시도하지
+않고 호출 측(배송추적 속도 조절 등)에 그대로 넘긴다. POST는 urllib3 기본값대로 연결 단계
+실패만 재시도되므로 발송처리 같은 요청이 두 번 전송되지 않는다.
+"""
+
+from __future__ import annotations
+
+import threading
+from urllib.parse import urlsplit
+
+try:
+    import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+except ImportError:  # requests 는 이미 의존성이지만 방어적으로 처리
+    requests = None
+
+DEFAULT_POOL_CONNECTIONS = 4
+DEFAULT_POOL_MAXSIZE = 10  # 배송추적 worker 수(KPOST_TRACKING_CONCURRENCY)보다 넉넉하게
+DEFAULT_RETRIES = 2
+DEFAULT_BACKOFF_FACTOR = 0.3
+RETRY_STATUS_CODES = (502, 503, 504)
+
+_lock = threading.Lock()
+_sessions: dict[str, "requests.Session"] = {}
+_host_options: dict[str, dict[str, object]] = {}
+
+
+def _host_key(url: str) -> str:
+    parts = urlsplit(str(url or "").strip())
+    if not parts.scheme or not parts.netloc:
+        raise ValueError(f"host를 알 수 없는 URL입니다: {url}")
+    return f"{parts.scheme.lower()}://{parts.netloc.lower()}"
+
+
+def _options(key: str) -> dict[str, object]:
+    options = {
+        "pool_connections": DEFAULT_POOL_CONNECTIONS,
+        "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+        "retries": DEFAULT_RETRIES,
+        "backoff_factor": DEFAULT_BACKOFF_FACTOR,
+    }
+    options.update(_host_options.get(key, {}))
+    return options
+
+
+def _new_session(key: str) -> "requests.Session":
+    options = _options(key)
+    retries = int(options["retries"])
+    retry = Retry(
+        total=retries,
+        connect=retries,
+        read=0,
+        status=retries,
+        status_forcelist=RETRY_STATUS_CODES,
+        backoff_factor=float(options["backoff_factor"]),
+        raise_on_status=False,
+        respect_retry_after_header=True,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=int(options["pool_connections"]),
+        pool_maxsize=int(options["pool_maxsize"]),
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount(key + "/", adapter)
+    return session
+
+
+def configure_host(url: str, **options) -> None:
+    """host별 pool_connections/pool_maxsize/retries/backoff_factor를 지정한다.
+
+    이미 만들어진 세션이 있으면 닫고 다음 호출에서 새 설정으로 다시 만든다.
+    """
+    unknown = set(options) - {"pool_connections", "pool_maxsize", "retries", "backoff_factor"}
+    if unknown:
+        raise TypeError(f"지원하지 않는 세션 옵션입니다: {', '.join(sorted(unknown))}")
+    key = _host_key(url)
+    with _lock:
+        _host_options.setdefault(key, {}).update(options)
+        session = _sessions.pop(key, None)
+    if session is not None:
+        session.close()
+
+
+def get_session(url: str) -> "requests.Session":
+    """URL의 host에 해당하는 공유 세션을 반환한다(없으면 만든다)."""
+    if requests is None:
+        raise RuntimeError("requests 패키지가 필요합니다. (pip install requests)")
+    key = _host_key(url)
+    with _lock:
+        session = _sessions.get(key)
+        if session is None:
+            session = _new_session(key)
+            _sessions[key] = session
+        return session
+
+
+def close_all() -> None:
+    """열린 세션과 연결 풀을 모두 닫는다(앱 종료 시)."""
+    with _lock:
+        sessions = list(_sessions.values())
+        _sessions.clear()
+    for session in sessions:
+        session.close()
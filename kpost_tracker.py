@@ -20,9 +20,14 @@ try:
 except ImportError:  # requests 는 이미 의존성이지만 방어적으로 처리
     requests = None
 
+import http_sessions
+
 KPOST_TRACE_URL = "http://biz.epost.go.kr/KpostPortal/openapi"
 DEFAULT_TIMEOUT = 12
 COMPLETE_KEYWORDS = ("배달완료", "배달 완료")
+TIMEOUT_ERROR_CODE = "TIMEOUT"
+# 호출 속도를 낮춰야 하는 응답: 시스템 부하 차단과 응답 시간 초과
+OVERLOAD_ERROR_CODES = ("ERR-131", TIMEOUT_ERROR_CODE)
 
 
 def _local(tag):
@@ -40,26 +45,12 @@ def fetch_tracking_text(regkey, regino, show_rec=True):
     params = {"regkey": regkey, "target": "trace", "query": str(regino).strip()}
     if show_rec:
         params["showRec"] = "Y"
-    resp = requests.get(KPOST_TRACE_URL, params=params, timeout=DEFAULT_TIMEOUT)
+    resp = http_sessions.get_session(KPOST_TRACE_URL).get(
+        KPOST_TRACE_URL, params=params, timeout=DEFAULT_TIMEOUT)
     resp.raise_for_status()
     return resp.content.decode("utf-8", errors="replace")
 
 
-def _parse_error(root):
-    for el in root.iter():
-        if _local(el.tag) != "error":
-            continue
-        code, msg = "", ""
-        for ch in el:
-            ln = _local(ch.tag)
-            if ln == "error_code":
-                code = (ch.text or "").strip()
-            elif ln == "message":
-                msg = (ch.text or "").strip()
-        return code or "오류", msg or "알 수 없는 오류"
-    return None
-
-
 def _is_admin_receipt(ev):
     """선구분-후접수 등 '행정상 접수' 이벤트인지. (우체국 웹도 현재상태에서 제외)"""
     return ev.get("status") == "접수" and (
@@ -67,70 +58,94 @@ def _is_admin_receipt(ev):
     )
 
 
-def parse_tracking(xml_text):
+def _event_from_item(item):
+    ev = {"date": "", "time": "", "where": "", "status": "", "reason": ""}
+    for ch in item:
+        cln = _local(ch.tag)
+        t = (ch.text or "").strip()
+        if cln == "sortingdate":
+            ev["date"] = t
+        elif cln == "eventhms":
+            ev["time"] = t
+        elif cln == "eventregiponm":
+            ev["where"] = t
+        elif cln == "tracestatus":
+            ev["status"] = t
+        elif cln == "nondelivreasnnm":
+            ev["reason"] = t
+    return ev
+
+
+def _is_complete_status(status):
+    return any(k in status for k in COMPLETE_KEYWORDS)
+
+
+def parse_tracking(xml_text, with_events=True):
     """종추적 XML → 요약 dict.
 
     실제 구조: <trace> ... <itemlist><item> 안에 sortingdate/eventhms/
     eventregiponm/tracestatus/nondelivreasnnm 가 단계별로 반복. 최상위 eventnm/
     eventymd 는 '배달결과' 요약(배달완료 시에만 채워짐).
 
+    오류·수취인·item을 트리 한 번 순회로 모두 처리한다. with_events=False면 이벤트 목록을
+    모으거나 정렬하지 않고 현재상태 후보만 갱신한다(events=[]).
+    (응답이 수 KB라 iterparse/XMLPullParser는 C 파서 fromstring보다 느려 쓰지 않는다.)
+
     반환: {ok, error_code, error, complete, status, where, time, recipient, events}
       events: [{date, time, where, status, reason} ...] 시간순
     """
     base = {"ok": False, "error_code": "", "error": "", "complete": False,
             "status": "", "where": "", "time": "", "recipient": "", "events": []}
+    recipient = ""
+    top_eventnm = ""
+    events = []
+    # 시간순 정렬(안정 정렬) 뒤 마지막 원소 = 키가 같으면 문서상 나중 것. 그래서 >= 로 갱신한다.
+    last = done = meaningful = None
     try:
         root = ET.fromstring(xml_text)
     except ET.ParseError:
         base.update(error_code="XML", error="응답을 XML로 해석할 수 없습니다.")
         return base
-    err = _parse_error(root)
-    if err:
-        base.update(error_code=err[0], error=err[1])
-        return base
-
-    recipient = ""
-    top_eventnm = ""
-    events = []
     for el in root.iter():
         ln = _local(el.tag)
+        if ln == "error":
+            code, msg = "", ""
+            for ch in el:
+                cln = _local(ch.tag)
+                if cln == "error_code":
+                    code = (ch.text or "").strip()
+                elif cln == "message":
+                    msg = (ch.text or "").strip()
+            base.update(error_code=code or "오류", error=msg or "알 수 없는 오류")
+            return base
         if ln == "recevnm" and not recipient:
             recipient = (el.text or "").strip()
         elif ln == "eventnm" and not top_eventnm:
             top_eventnm = (el.text or "").strip()
         elif ln == "item":
-            ev = {"date": "", "time": "", "where": "", "status": "", "reason": ""}
-            for ch in el:
-                cln = _local(ch.tag)
-                t = (ch.text or "").strip()
-                if cln == "sortingdate":
-                    ev["date"] = t
-                elif cln == "eventhms":
-                    ev["time"] = t
-                elif cln == "eventregiponm":
-                    ev["where"] = t
-                elif cln == "tracestatus":
-                    ev["status"] = t
-                elif cln == "nondelivreasnnm":
-                    ev["reason"] = t
-            if any(ev.values()):
+            ev = _event_from_item(el)
+            if not any(ev.values()):
+                continue
+            if with_events:
                 events.append(ev)
+            key = (ev["date"], ev["time"])
+            if last is None or key >= (last["date"], last["time"]):
+                last = ev
+            if _is_complete_status(ev["status"]) and (
+                    done is None or key >= (done["date"], done["time"])):
+                done = ev
+            if not _is_admin_receipt(ev) and (
+                    meaningful is None or key >= (meaningful["date"], meaningful["time"])):
+                meaningful = ev
 
     events.sort(key=lambda e: (e.get("date", ""), e.get("time", "")))
-    statuses = [e["status"] for e in events]
-    complete = any(k in top_eventnm for k in COMPLETE_KEYWORDS) or any(
-        any(k in s for k in COMPLETE_KEYWORDS) for s in statuses
-    )
-
+    complete = any(k in top_eventnm for k in COMPLETE_KEYWORDS) or done is not None
     if complete:
-        done = next((e for e in reversed(events)
-                     if any(k in e["status"] for k in COMPLETE_KEYWORDS)), None)
-        cur = done or (events[-1] if events else None)
+        cur = done or last
         status = "배달완료"
     else:
         # 현재상태: 선구분-후접수 같은 행정 접수는 제외하고 가장 최신(우체국 웹과 동일)
-        meaningful = [e for e in events if not _is_admin_receipt(e)]
-        cur = meaningful[-1] if meaningful else (events[-1] if events else None)
+        cur = meaningful or last
         status = cur["status"] if cur else ""
 
     where = cur["where"] if cur else ""
@@ -140,15 +155,24 @@ def parse_tracking(xml_text):
     return base
 
 
-def summarize_tracking(regkey, regino):
-    """단건 조회 후 요약 반환(네트워크 예외도 dict로 변환)."""
+def summarize_tracking(regkey, regino, with_events=False):
+    """단건 조회 후 요약 반환(네트워크 예외도 dict로 변환).
+
+    배송추적 새로고침은 상태·위치·시각만 쓰므로 기본값은 이벤트 목록 없이 요약만 만든다.
+    """
     try:
         text = fetch_tracking_text(regkey, regino)
     except Exception as e:
         out = parse_tracking("")  # base 형태
-        out.update(error_code="HTTP", error=str(e))
+        timed_out = requests is not None and isinstance(e, requests.Timeout)
+        out.update(error_code=TIMEOUT_ERROR_CODE if timed_out else "HTTP", error=str(e))
         return out
-    return parse_tracking(text)
+    return parse_tracking(text, with_events=with_events)
+
+
+def is_overload(summary):
+    """요약 dict가 속도를 낮춰야 하는 부하 신호(ERR-131·타임아웃)인지."""
+    return (summary.get("error_code") or "").upper() in OVERLOAD_ERROR_CODES
 
 
 def validate_key(regkey):
@@ -162,7 +186,7 @@ def validate_key(regkey):
         text = fetch_tracking_text(key, "1234567890123")
     except Exception as e:
         return {"ok": False, "valid": False, "error": str(e)}
-    res = parse_tracking(text)
+    res = parse_tracking(text, with_events=False)
     code = (res.get("error_code") or "").upper()
     if code == "ERR-123":
         return {"ok": True, "valid": False,
@@ -28,6 +28,8 @@ try:
 except ImportError:
     bcrypt = None
 
+import http_sessions
+
 API_BASE = "https://api.commerce.naver.com/external"
 TOKEN_URL = API_BASE + "/v1/oauth2/token"
 QNAS_URL = API_BASE + "/v1/contents/qnas"            # 상품문의
@@ -85,7 +87,7 @@ def get_access_token(client_id, client_secret, account_type="SELF"):
         "client_secret_sign": sign,
         "type": account_type,
     }
-    resp = requests.post(TOKEN_URL, data=data, timeout=DEFAULT_TIMEOUT)
+    resp = http_sessions.get_session(TOKEN_URL).post(TOKEN_URL, data=data, timeout=DEFAULT_TIMEOUT)
     _raise_for_status_with_body(resp)
     js = resp.json()
     token = js.get("access_token")
@@ -110,7 +112,8 @@ def validate_credentials(client_id, client_secret):
 
 def _get_json(url, token, params):
     headers = {"Authorization": f"Bearer {token}"}
-    resp = requests.get(url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
+    resp = http_sessions.get_session(url).get(
+        url, headers=headers, params=params, timeout=DEFAULT_TIMEOUT)
     _raise_for_status_with_body(resp)
     return resp.json()
 
@@ -202,7 +205,8 @@ DELIVERY_METHOD_LABELS = {
 
 def _post_json(url, token, payload):
     headers = {"Authorization": f"Bearer {token}", "Content-Type": "application/json"}
-    resp = requests.post(url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
+    resp = http_sessions.get_session(url).post(
+        url, headers=headers, json=payload, timeout=DEFAULT_TIMEOUT)
     _raise_for_status_with_body(resp)
     return resp.json()
 
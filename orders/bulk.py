@@ -7,12 +7,21 @@ from typing import Mapping
 import pandas as pd
 
 
-def find_columns(dataframe: pd.DataFrame, required: tuple[str, ...]) -> tuple[dict[str, object], list[str]]:
-    """공백을 제외한 헤더 정확 일치로 필요한 열을 찾는다."""
+def find_columns(
+    dataframe: pd.DataFrame, required: tuple[str, ...], compact: bool = False,
+) -> tuple[dict[str, object], list[str]]:
+    """공백을 제외한 헤더 정확 일치로 필요한 열을 찾는다.
+
+    compact=True면 헤더 중간의 공백까지 무시하고 비교한다('수취인 이동통신' == '수취인이동통신').
+    """
+    def _key(name: str) -> str:
+        return name.replace(" ", "") if compact else name
+
+    keys = {_key(name): name for name in required}
     columns = {name: None for name in required}
     for column in dataframe.columns:
-        name = str(column).strip()
-        if name in columns:
+        name = keys.get(_key(str(column).strip()))
+        if name is not None:
             columns[name] = column
     return columns, [name for name, column in columns.items() if column is None]
 
@@ -39,6 +48,41 @@ def _quantity(value) -> int:
         return 1
 
 
+def _texts(series: pd.Series) -> list[str]:
+    """열 전체에 _text를 적용한 값 목록."""
+    missing = series.isna().tolist()
+    return ["" if is_missing else str(value) for value, is_missing in zip(series.tolist(), missing)]
+
+
+def _numbers(series: pd.Series) -> list[float]:
+    return [_number(value) for value in series.tolist()]
+
+
+def _quantities(series: pd.Series) -> list[int]:
+    return [_quantity(value) for value in series.tolist()]
+
+
+def _column_texts(dataframe: pd.DataFrame, columns: Mapping[str, object], name: str) -> list[str]:
+    """선택 열(columns[name]이 없을 수 있음)의 _text 값. 열이 없으면 빈 문자열."""
+    column = columns.get(name)
+    if column is None:
+        return [""] * len(dataframe)
+    return _texts(dataframe[column])
+
+
+def _order_groups(order_numbers: list[str], keys: list[str] | None = None) -> list[list[int]]:
+    """빈 주문번호를 뺀 행 위치를 키(기본: 주문번호)별로, 처음 나온 순서대로 묶는다."""
+    keys = order_numbers if keys is None else keys
+    positions = [index for index, number in enumerate(order_numbers) if number]
+    if not positions:
+        return []
+    codes, _ = pd.factorize(pd.Series([keys[index] for index in positions], dtype=object), sort=False)
+    groups: list[list[int]] = [[] for _ in range(int(codes.max()) + 1)]
+    for position, code in zip(positions, codes.tolist()):
+        groups[code].append(position)
+    return groups
+
+
 def build_coupang_orders(
     dataframe: pd.DataFrame,
     columns: Mapping[str, object],
@@ -47,57 +91,71 @@ def build_coupang_orders(
     normalize_mapping_key,
 ) -> dict[str, dict]:
     """쿠팡 주문 DataFrame을 기존 orders 딕셔너리 구조로 변환한다."""
+    order_numbers = [number.strip() for number in _texts(dataframe[columns["주문번호"]])]
+    names = _texts(dataframe[columns["수취인이름"]])
+    addresses = _texts(dataframe[columns["수취인 주소"]])
+    phones = _texts(dataframe[columns["수취인전화번호"]])
+    messages = _texts(dataframe[columns["배송메세지"]])
+    zip_codes = _texts(dataframe[columns["우편번호"]])
+    products = _texts(dataframe[columns["노출상품명(옵션명)"]])
+    options = _texts(dataframe[columns["등록옵션명"]])
+    quantities = _quantities(dataframe[columns["구매수(수량)"]])
+    option_ids = [normalize_mapping_key(value) for value in dataframe[columns["옵션ID"]].tolist()]
+    payment_column = columns.get("결제액")
+    payments = _numbers(dataframe[payment_column]) if payment_column is not None else None
+
     orders: dict[str, dict] = {}
-    for _, row in dataframe.iterrows():
-        order_number = _text(row[columns["주문번호"]]).strip()
-        if not order_number:
-            continue
-        if order_number not in orders:
-            orders[order_number] = {
-                "수취인이름": _text(row[columns["수취인이름"]]),
-                "수취인주소": _text(row[columns["수취인 주소"]]),
-                "수취인전화번호": _text(row[columns["수취인전화번호"]]),
-                "배송메세지": _text(row[columns["배송메세지"]]),
-                "우편번호": _text(row[columns["우편번호"]]),
-                "상품목록": [], "결제액": 0,
-            }
-        payment_column = columns.get("결제액")
-        if payment_column is not None:
-            orders[order_number]["결제액"] += _number(row[payment_column])
-        option_id = normalize_mapping_key(row[columns["옵션ID"]])
-        orders[order_number]["상품목록"].append({
-            "상품명": _text(row[columns["노출상품명(옵션명)"]]),
-            "옵션": _text(row[columns["등록옵션명"]]),
-            "수량": _quantity(row[columns["구매수(수량)"]]),
-            "상품코드": product_codes.get(option_id, ""),
-            "쿠팡상품번호": option_to_product_no.get(option_id, "") if option_id else "",
-        })
+    for group in _order_groups(order_numbers):
+        first = group[0]
+        orders[order_numbers[first]] = {
+            "수취인이름": names[first],
+            "수취인주소": addresses[first],
+            "수취인전화번호": phones[first],
+            "배송메세지": messages[first],
+            "우편번호": zip_codes[first],
+            "상품목록": [{
+                "상품명": products[index],
+                "옵션": options[index],
+                "수량": quantities[index],
+                "상품코드": product_codes.get(option_ids[index], ""),
+                "쿠팡상품번호": option_to_product_no.get(option_ids[index], "") if option_ids[index] else "",
+            } for index in group],
+            "결제액": sum(payments[index] for index in group) if payments is not None else 0,
+        }
     return orders
 
 
 def build_11st_orders(dataframe: pd.DataFrame, columns: Mapping[str, object]) -> dict[str, dict]:
     """11번가 주문 DataFrame을 기존 orders 딕셔너리 구조로 변환한다."""
+    order_numbers = [number.strip() for number in _texts(dataframe[columns["주문번호"]])]
+    names = _texts(dataframe[columns["수취인"]])
+    addresses = _texts(dataframe[columns["주소"]])
+    mobiles = _texts(dataframe[columns["휴대폰번호"]])
+    phones = _texts(dataframe[columns["전화번호"]])
+    zip_codes = _texts(dataframe[columns["우편번호"]])
+    messages = _column_texts(dataframe, columns, "배송메시지")
+    amount_column = columns.get("주문금액")
+    amounts = _numbers(dataframe[amount_column]) if amount_column is not None else None
+    products = _texts(dataframe[columns["상품명"]])
+    options = [option.strip() or "없음" for option in _texts(dataframe[columns["옵션"]])]
+    quantities = _quantities(dataframe[columns["수량"]])
+
     orders: dict[str, dict] = {}
-    for _, row in dataframe.iterrows():
-        order_number = _text(row[columns["주문번호"]]).strip()
-        if not order_number:
-            continue
-        if order_number not in orders:
-            orders[order_number] = {
-                "수취인명": _text(row[columns["수취인"]]),
-                "주소": _text(row[columns["주소"]]),
-                "휴대폰번호": _text(row[columns["휴대폰번호"]]),
-                "전화번호": _text(row[columns["전화번호"]]),
-                "우편번호": _text(row[columns["우편번호"]]),
-                "배송메시지": _text(row[columns.get("배송메시지")]) if columns.get("배송메시지") is not None else "",
-                "상품목록": [],
-                "주문금액": _number(row[columns["주문금액"]]) if columns.get("주문금액") is not None else 0,
-            }
-        option = _text(row[columns["옵션"]]).strip() or "없음"
-        orders[order_number]["상품목록"].append({
-            "상품명": _text(row[columns["상품명"]]), "옵션": option,
-            "수량": _quantity(row[columns["수량"]]),
-        })
+    for group in _order_groups(order_numbers):
+        first = group[0]
+        orders[order_numbers[first]] = {
+            "수취인명": names[first],
+            "주소": addresses[first],
+            "휴대폰번호": mobiles[first],
+            "전화번호": phones[first],
+            "우편번호": zip_codes[first],
+            "배송메시지": messages[first],
+            "상품목록": [
+                {"상품명": products[index], "옵션": options[index], "수량": quantities[index]}
+                for index in group
+            ],
+            "주문금액": amounts[first] if amounts is not None else 0,
+        }
     return orders
 
 
@@ -112,92 +170,88 @@ def build_naver_orders(
     주문번호 앞 13자리를 하나의 주문으로 묶는 기존 규칙과,
     '택배,등기,소포' 요청이 하나라도 있으면 해당 주문 전체에 적용하는 규칙을 보존한다.
     """
-    orders: dict[str, dict] = {}
-    grouped_rows: dict[str, list[tuple[str, pd.Series]]] = {}
-
-    for _, row in dataframe.iterrows():
-        order_number = _text(row[columns["주문번호"]]).strip()
-        if not order_number:
-            continue
-        pattern = order_number[:13] if len(order_number) >= 13 else order_number
-        grouped_rows.setdefault(pattern, []).append((order_number, row))
-
+    order_numbers = [number.strip() for number in _texts(dataframe[columns["주문번호"]])]
+    patterns = [number[:13] for number in order_numbers]
+    names = _texts(dataframe[columns["수취인명"]])
+    recipient_phones = _texts(dataframe[columns["수취인연락처1"]])
+    addresses = _texts(dataframe[columns["통합배송지"]])
+    buyer_phones = _texts(dataframe[columns["구매자연락처"]])
+    messages = _texts(dataframe[columns["배송메세지"]])
+    zip_codes = _texts(dataframe[columns["우편번호"]])
+    deliveries = _texts(dataframe[columns["배송방법(구매자 요청)"]])
+    product_numbers = [normalize_mapping_key(value) for value in dataframe[columns["상품번호"]].tolist()]
     amount_column = columns.get("최종 상품별 총 주문금액")
-    for pattern, rows in grouped_rows.items():
-        first_order = rows[0][1]
-        delivery_column = columns["배송방법(구매자 요청)"]
-        first_delivery = _text(first_order[delivery_column]) or "배송방법 오류"
-        order = {
-            "주문번호목록": [order_number for order_number, _ in rows],
-            "수취인명": _text(first_order[columns["수취인명"]]),
-            "수취인연락처1": _text(first_order[columns["수취인연락처1"]]),
-            "통합배송지": _text(first_order[columns["통합배송지"]]),
-            "구매자연락처": _text(first_order[columns["구매자연락처"]]),
-            "배송메세지": _text(first_order[columns["배송메세지"]]),
-            "우편번호": _text(first_order[columns["우편번호"]]),
-            "배송방법": first_delivery,
-            "상품수": 0,
-            "상품목록": [],
-            "주문총액": 0,
+    amounts = _numbers(dataframe[amount_column]) if amount_column is not None else [0] * len(dataframe)
+    products = _texts(dataframe[columns["상품명"]])
+    quantities = _quantities(dataframe[columns["수량"]])
+    options = [option or "없음" for option in _texts(dataframe[columns["옵션정보"]])]
+
+    orders: dict[str, dict] = {}
+    for group in _order_groups(order_numbers, patterns):
+        first = group[0]
+        has_standard_delivery = any(deliveries[index] == "택배,등기,소포" for index in group)
+        orders[patterns[first]] = {
+            "주문번호목록": [order_numbers[index] for index in group],
+            "수취인명": names[first],
+            "수취인연락처1": recipient_phones[first],
+            "통합배송지": addresses[first],
+            "구매자연락처": buyer_phones[first],
+            "배송메세지": messages[first],
+            "우편번호": zip_codes[first],
+            "배송방법": "택배,등기,소포" if has_standard_delivery else deliveries[first] or "배송방법 오류",
+            "상품수": len(group),
+            "상품목록": [{
+                "상품명": products[index],
+                "수량": quantities[index],
+                "옵션": options[index],
+                "상품코드": product_codes.get(product_numbers[index], "") or "        ",
+                "금액": amounts[index],
+                "상품번호": product_numbers[index],
+            } for index in group],
+            "주문총액": sum(amounts[index] for index in group),
         }
-        has_standard_delivery = False
-        for _, row in rows:
-            delivery_method = _text(row[delivery_column])
-            if delivery_method == "택배,등기,소포":
-                has_standard_delivery = True
-            product_number = normalize_mapping_key(row[columns["상품번호"]])
-            product_amount = _number(row[amount_column]) if amount_column is not None else 0
-            order["주문총액"] += product_amount
-            order["상품수"] += 1
-            order["상품목록"].append({
-                "상품명": _text(row[columns["상품명"]]),
-                "수량": _quantity(row[columns["수량"]]),
-                "옵션": _text(row[columns["옵션정보"]]) or "없음",
-                "상품코드": product_codes.get(product_number, "") or "        ",
-                "금액": product_amount,
-                "상품번호": product_number,
-            })
-        if has_standard_delivery:
-            order["배송방법"] = "택배,등기,소포"
-        orders[pattern] = order
     return orders
 
 
 def build_gmarket_orders(dataframe: pd.DataFrame, columns: Mapping[str, object]) -> dict[str, dict]:
     """지마켓 주문 DataFrame을 기존 orders 딕셔너리 구조로 변환한다."""
-    orders: dict[str, dict] = {}
+    order_numbers = [number.strip() for number in _texts(dataframe[columns["주문번호"]])]
+    names = _texts(dataframe[columns["수령인명"]])
+    addresses = _texts(dataframe[columns["주소"]])
+    phones = _texts(dataframe[columns["수령인 전화번호"]])
+    mobiles = _texts(dataframe[columns["수령인 휴대폰"]])
+    requests = _texts(dataframe[columns["배송시 요구사항"]])
+    zip_codes = _texts(dataframe[columns["우편번호"]])
     sale_column = columns.get("판매금액")
+    sales = _numbers(dataframe[sale_column]) if sale_column is not None else None
     shipping_column = columns.get("배송비 금액")
-    additional_column = columns.get("추가구성")
+    shipping = _numbers(dataframe[shipping_column]) if shipping_column is not None else None
+    products = _texts(dataframe[columns["상품명"]])
+    options = [option.strip() for option in _texts(dataframe[columns["옵션"]])]
+    options = ["없음" if option.lower() in ("nan", "") else option for option in options]
+    additional = [value.strip() for value in _column_texts(dataframe, columns, "추가구성")]
+    additional = ["" if value.lower() == "nan" else value for value in additional]
+    quantities = _quantities(dataframe[columns["수량"]])
 
-    for _, row in dataframe.iterrows():
-        order_number = _text(row[columns["주문번호"]]).strip()
-        if not order_number:
-            continue
-        if order_number not in orders:
-            orders[order_number] = {
-                "수령인명": _text(row[columns["수령인명"]]),
-                "주소": _text(row[columns["주소"]]),
-                "수령인 전화번호": _text(row[columns["수령인 전화번호"]]),
-                "수령인 휴대폰": _text(row[columns["수령인 휴대폰"]]),
-                "배송시 요구사항": _text(row[columns["배송시 요구사항"]]),
-                "우편번호": _text(row[columns["우편번호"]]),
-                "상품목록": [],
-                "판매금액": _number(row[sale_column]) if sale_column is not None else 0,
-                "배송비 금액": _number(row[shipping_column]) if shipping_column is not None else 0,
-            }
-        option = _text(row[columns["옵션"]]).strip()
-        if option.lower() in ("nan", ""):
-            option = "없음"
-        additional_config = _text(row[additional_column]).strip() if additional_column is not None else ""
-        if additional_config.lower() == "nan":
-            additional_config = ""
-        orders[order_number]["상품목록"].append({
-            "상품명": _text(row[columns["상품명"]]),
-            "옵션": option,
-            "수량": _quantity(row[columns["수량"]]),
-            "추가구성": additional_config,
-        })
+    orders: dict[str, dict] = {}
+    for group in _order_groups(order_numbers):
+        first = group[0]
+        orders[order_numbers[first]] = {
+            "수령인명": names[first],
+            "주소": addresses[first],
+            "수령인 전화번호": phones[first],
+            "수령인 휴대폰": mobiles[first],
+            "배송시 요구사항": requests[first],
+            "우편번호": zip_codes[first],
+            "상품목록": [{
+                "상품명": products[index],
+                "옵션": options[index],
+                "수량": quantities[index],
+                "추가구성": additional[index],
+            } for index in group],
+            "판매금액": sales[first] if sales is not None else 0,
+            "배송비 금액": shipping[first] if shipping is not None else 0,
+        }
     return orders
 
 
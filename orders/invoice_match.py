@@ -0,0 +1,95 @@
+"""우체국 송장 행을 주문서 행에 맞추는 해시 조인.
+
+송장마다 주문서 전체를 불리언 마스크로 거르면 송장 수 × 주문 수만큼 비교하게 된다. 여기서는
+주문서 키(주문번호 앞 13자리, 또는 수취인명+전화번호)로 dict를 한 번 만들고 송장을 한 번 훑어
+맞춘다. 키를 만드는 규칙은 기존 매칭과 같다.
+
+- 네이버: 고객주문번호와 주문서 주문번호의 숫자만 모은 앞 13자리가 같으면 매칭.
+- 쿠팡: 수취인명과 전화번호 문자열(앞뒤 공백 제거)이 모두 같으면 매칭.
+
+빈 키는 매칭하지 않는다. 같은 키의 송장이 여럿이면 주문 행에는 마지막 송장 값이 남는다(기존
+동작). 이런 키는 ambiguous로, 주문서에 없는 송장·송장이 없는 주문 행은 따로 알려 준다.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Hashable, Iterable
+
+import pandas as pd
+
+NAVER_ORDER_NUMBER_DIGITS = 13
+
+
+def text_key(value) -> str:
+    """앞뒤 공백을 뗀 문자열. NaN·'nan'은 빈 문자열."""
+    if pd.isna(value):
+        return ""
+    text = str(value).strip()
+    return "" if text.lower() == "nan" else text
+
+
+def digits_key(value) -> str:
+    """숫자만 남긴 문자열(전화번호 하이픈·공백 차이 무시용)."""
+    if pd.isna(value):
+        return ""
+    return "".join(ch for ch in str(value) if ch.isdigit())
+
+
+def order_number_key(value) -> str:
+    """네이버 주문번호 매칭 키: 숫자만 모은 앞 13자리."""
+    return digits_key(value)[:NAVER_ORDER_NUMBER_DIGITS]
+
+
+def build_index(keys: Iterable[Hashable]) -> dict[Hashable, list[int]]:
+    """키 → 그 키를 가진 위치(0부터) 목록. 빈 키('' 또는 요소가 모두 빈 튜플)는 넣지 않는다."""
+    index: dict[Hashable, list[int]] = {}
+    for position, key in enumerate(keys):
+        if _is_blank(key):
+            continue
+        index.setdefault(key, []).append(position)
+    return index
+
+
+def _is_blank(key) -> bool:
+    if isinstance(key, tuple):
+        return not any(key)
+    return not key
+
+
+@dataclass(frozen=True)
+class InvoiceJoin:
+    """join_invoices 결과. 위치는 모두 0부터 센 행 위치(iloc)."""
+
+    # (송장 위치, 그 송장이 채울 주문 행 위치들) — 송장 순서대로
+    matches: list[tuple[int, list[int]]]
+    # 주문서에 같은 키가 없는 송장 위치
+    unmatched_invoices: list[int]
+    # 어떤 송장과도 맞지 않은 주문 행 위치
+    unmatched_orders: list[int]
+    # 두 개 이상의 송장이 같은 주문 키에 매칭된 경우: 키 → 송장 위치들(마지막이 남음)
+    ambiguous: dict[Hashable, list[int]]
+
+
+def join_invoices(invoice_keys: Iterable[Hashable], order_keys: Iterable[Hashable]) -> InvoiceJoin:
+    """송장 키와 주문 키를 한 번씩 훑어 맞춘다(O(송장 + 주문))."""
+    order_keys = list(order_keys)
+    order_index = build_index(order_keys)
+    matches: list[tuple[int, list[int]]] = []
+    unmatched_invoices: list[int] = []
+    claimed: dict[Hashable, list[int]] = {}
+    for position, key in enumerate(invoice_keys):
+        rows = None if _is_blank(key) else order_index.get(key)
+        if not rows:
+            unmatched_invoices.append(position)
+            continue
+        matches.append((position, rows))
+        claimed.setdefault(key, []).append(position)
+    return InvoiceJoin(
+        matches=matches,
+        unmatched_invoices=unmatched_invoices,
+        unmatched_orders=[
+            position for position, key in enumerate(order_keys) if _is_blank(key) or key not in claimed
+        ],
+        ambiguous={key: positions for key, positions in claimed.items() if len(positions) > 1},
+    )
@@ -0,0 +1,132 @@
+"""주문 파일을 읽은 DataFrame을 파일 내용 해시로 보관하는 로컬 캐시.
+
+같은 주문 파일(DeliveryList, 스마트스토어 발주발송관리 등)을 다시 열면 복호화와 Excel 파싱을
+건너뛰고 저장해 둔 DataFrame을 그대로 쓴다. 키는 파일 SHA1 + 읽기 방식(variant) +
+ORDER_PARSE_CACHE_VERSION 이라, 읽는 코드가 바뀌면 버전만 올려 이전 항목을 무시한다.
+항목은 pickle 파일 하나씩이고, 개수·전체 크기 한도를 넘으면 가장 오래 쓰지 않은 것부터 지운다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Callable
+
+import pandas as pd
+
+# 주문 파일 읽기 방식(헤더 행, 복호화, 엔진 선택 등)이 바뀌면 올린다.
+ORDER_PARSE_CACHE_VERSION = 1
+ORDER_PARSE_CACHE_MAX_ENTRIES = 64
+ORDER_PARSE_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+
+def default_parse_cache_dir() -> Path:
+    """Git에 포함하지 않는 로컬 캐시 폴더."""
+    return Path(__file__).resolve().parent.parent / "output" / "order-parse-cache"
+
+
+def file_sha1(path: str | Path) -> str:
+    """파일 내용 SHA1 (64KB씩 읽음)."""
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class OrderParseCache:
+    """(SHA1, variant)마다 DataFrame 하나를 pickle로 보관한다. 읽을 때마다 mtime을 갱신해 LRU로 쓴다."""
+
+    def __init__(
+        self,
+        directory: Path | str | None = None,
+        max_entries: int = ORDER_PARSE_CACHE_MAX_ENTRIES,
+        max_bytes: int = ORDER_PARSE_CACHE_MAX_BYTES,
+        version: int = ORDER_PARSE_CACHE_VERSION,
+    ):
+        self.directory = Path(directory) if directory else default_parse_cache_dir()
+        self.max_entries = int(max_entries)
+        self.max_bytes = int(max_bytes)
+        self.version = int(version)
+        self._lock = threading.Lock()
+
+    def _path(self, sha1: str, variant: str) -> Path:
+        safe_variant = re.sub(r"[^0-9A-Za-z_-]+", "_", variant)
+        return self.directory / f"{sha1}-v{self.version}-{safe_variant}.pkl"
+
+    def get(self, sha1: str, variant: str) -> pd.DataFrame | None:
+        """저장해 둔 DataFrame. 없거나 읽지 못하면 None(깨진 항목은 지운다)."""
+        path = self._path(sha1, variant)
+        with self._lock:
+            if not path.exists():
+                return None
+            try:
+                dataframe = pd.read_pickle(path)
+                os.utime(path)
+            except Exception as error:
+                print(f"! 주문 파일 캐시 읽기 실패({path.name}): {error}")
+                path.unlink(missing_ok=True)
+                return None
+        return dataframe if isinstance(dataframe, pd.DataFrame) else None
+
+    def put(self, sha1: str, variant: str, dataframe: pd.DataFrame) -> None:
+        """DataFrame을 저장하고 한도를 넘은 오래된 항목을 지운다. 실패해도 예외를 던지지 않는다."""
+        path = self._path(sha1, variant)
+        temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with self._lock:
+            try:
+                self.directory.mkdir(parents=True, exist_ok=True)
+                dataframe.to_pickle(temp_path)
+                os.replace(temp_path, path)
+            except Exception as error:
+                print(f"! 주문 파일 캐시 저장 실패({path.name}): {error}")
+                temp_path.unlink(missing_ok=True)
+                return
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort(key=lambda entry: entry[0])
+        total = sum(size for _, size, _ in entries)
+        while entries and (len(entries) > self.max_entries or total > self.max_bytes):
+            _, size, path = entries.pop(0)
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def load(self, sha1: str | None, variant: str, reader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """캐시에 있으면 그 DataFrame, 없으면 reader()로 읽어 저장한 뒤 반환한다.
+
+        sha1이 None(해시 실패)이면 캐시 없이 reader()만 부른다. 반환값은 호출 쪽이 고쳐 써도
+        캐시에 영향이 없다(읽을 때마다 pickle에서 새로 만든다).
+        """
+        if not sha1:
+            return reader()
+        cached = self.get(sha1, variant)
+        if cached is not None:
+            print(f"✓ 주문 파일 캐시 사용 ({variant}, {len(cached)}행) — 복호화·파싱 생략")
+            return cached
+        dataframe = reader()
+        self.put(sha1, variant, dataframe)
+        return dataframe
+
+
+_parse_cache_lock = threading.Lock()
+_parse_cache: OrderParseCache | None = None
+
+
+def order_parse_cache() -> OrderParseCache:
+    """프로세스 공용 주문 파일 캐시."""
+    global _parse_cache
+    with _parse_cache_lock:
+        if _parse_cache is None:
+            _parse_cache = OrderParseCache()
+        return _parse_cache
@@ -0,0 +1,175 @@
+"""주문·송장 Excel 파일을 pandas에 넘기기 전에 여는 공용 함수.
+
+스마트스토어 주문 파일처럼 비밀번호로 보호된 통합문서는 msoffcrypto로 메모리(BytesIO)에서
+복호화해 그대로 pd.read_excel에 넘긴다. 복호화한 파일을 디스크에 쓰지 않으므로 임시 파일 정리나
+같은 이름의 임시 파일을 두 작업이 동시에 쓰는 문제가 없다.
+
+큰 송장·주문 내보내기에서 몇 개 열만 필요할 때는 read_excel_columns가 그 열만 남긴 DataFrame을
+만든다(pd.read_excel과 같은 값·dtype). python-calamine이 있으면 그 엔진으로 필요한 열만 읽고,
+없으면 openpyxl read-only로 한 줄씩 읽어 나머지 열을 버린다.
+"""
+
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+from typing import BinaryIO
+
+import msoffcrypto
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from .bulk import find_columns
+
+# 스마트스토어 「발주발송관리」 내려받기 파일의 고정 비밀번호.
+ORDER_FILE_PASSWORD = "1234"
+
+
+class WorkbookDecryptError(RuntimeError):
+    """비밀번호 보호 통합문서를 복호화하지 못했을 때의 오류."""
+
+
+def decrypt_workbook(source: str | Path, password: str = ORDER_FILE_PASSWORD) -> BytesIO:
+    """비밀번호 보호 통합문서를 메모리에서 복호화해 처음 위치로 되감은 BytesIO로 반환한다."""
+    try:
+        with open(source, "rb") as file:
+            office_file = msoffcrypto.OfficeFile(file)
+            office_file.load_key(password=password)
+            buffer = BytesIO()
+            office_file.decrypt(buffer)
+    except Exception as error:
+        raise WorkbookDecryptError(f"파일 복호화 실패: {error}") from error
+    buffer.seek(0)
+    return buffer
+
+
+def is_encrypted_workbook(source: str | Path) -> bool:
+    """비밀번호로 보호된 Office 파일이면 True. 형식을 알 수 없으면 False."""
+    try:
+        with open(source, "rb") as file:
+            return bool(msoffcrypto.OfficeFile(file).is_encrypted())
+    except Exception:
+        return False
+
+
+def open_order_workbook(source: str | Path, password: str = ORDER_FILE_PASSWORD) -> BytesIO | str | Path:
+    """pd.read_excel에 넘길 대상. 보호된 파일이면 복호화한 BytesIO, 아니면 경로 그대로."""
+    if is_encrypted_workbook(source):
+        return decrypt_workbook(source, password)
+    return source
+
+
+# openpyxl이 수식 오류 셀에 돌려주는 값. pd.read_excel은 이 셀을 NaN으로 읽는다.
+_EXCEL_ERROR_VALUES = frozenset(("#NULL!", "#DIV/0!", "#VALUE!", "#REF!", "#NAME?", "#NUM!", "#N/A"))
+
+
+def _excel_cell(value):
+    """pandas openpyxl 엔진(_convert_cell)과 같은 규칙으로 셀 값을 바꾼다."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, str) and value in _EXCEL_ERROR_VALUES:
+        return float("nan")
+    return value
+
+
+def _has_calamine() -> bool:
+    """python-calamine(Rust 기반 xlsx 파서)이 설치돼 있으면 True."""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _rewind(source) -> None:
+    if hasattr(source, "seek"):
+        source.seek(0)
+
+
+def _read_columns_calamine(source, required, header, sheet_name, compact):
+    """python-calamine 엔진: 헤더만 먼저 읽어 열 위치를 찾고 그 위치만 usecols로 읽는다."""
+    labels = list(pd.read_excel(source, engine="calamine", header=header, sheet_name=sheet_name, nrows=0).columns)
+    columns, missing = find_columns(pd.DataFrame(columns=labels), required, compact=compact)
+    names = list(dict.fromkeys(column for column in columns.values() if column is not None))
+    if not names:
+        return pd.DataFrame(), columns, missing
+    _rewind(source)
+    frame = pd.read_excel(
+        source, engine="calamine", header=header, sheet_name=sheet_name,
+        usecols=sorted(labels.index(name) for name in names),
+    )
+    return frame[names], columns, missing
+
+
+def _read_columns_openpyxl(source, required, header, sheet_name, compact):
+    """openpyxl read-only: iter_rows(values_only=True)로 한 줄씩 읽으며 필요한 열만 남긴다."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        worksheet = workbook[sheet_name] if isinstance(sheet_name, str) else workbook.worksheets[sheet_name]
+        worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+        header_row = None
+        for index, row in enumerate(rows):
+            if index == header:
+                header_row = [_excel_cell(value) for value in row]
+                break
+        if header_row is None:
+            raise ValueError(f"헤더 행({header + 1}행)이 없습니다.")
+        while header_row and header_row[-1] == "":
+            header_row.pop()
+        # 빈 헤더·중복 헤더 이름은 pandas가 붙이는 이름(Unnamed: n, 이름.1)을 그대로 쓴다.
+        labels = list(TextParser([header_row], header=0, skip_blank_lines=False).read().columns)
+        columns, missing = find_columns(pd.DataFrame(columns=labels), required, compact=compact)
+        names = list(dict.fromkeys(column for column in columns.values() if column is not None))
+        if not names:
+            return pd.DataFrame(), columns, missing
+        positions = [labels.index(name) for name in names]
+
+        data = []
+        last_with_data = -1
+        for row in rows:
+            data.append([_excel_cell(row[position]) if position < len(row) else "" for position in positions])
+            # pandas는 끝쪽의 완전히 빈 행만 버린다(고르지 않은 열에 값이 있으면 남긴다).
+            if any(value is not None and value != "" for value in row):
+                last_with_data = len(data) - 1
+    finally:
+        workbook.close()
+
+    data = data[: last_with_data + 1]
+    if not data:
+        return pd.DataFrame({name: pd.Series(dtype=object) for name in names}), columns, missing
+    frame = TextParser(data, names=names, header=None, skip_blank_lines=False).read()
+    return frame, columns, missing
+
+
+def read_excel_columns(
+    source: str | Path | BinaryIO,
+    required: tuple[str, ...],
+    header: int = 0,
+    sheet_name: str | int = 0,
+    compact: bool = False,
+    engine: str | None = None,
+) -> tuple[pd.DataFrame, dict[str, object], list[str]]:
+    """required 열만 담은 DataFrame을 만든다. 열은 header 번째 행(0부터)의 헤더 이름으로
+    orders.bulk.find_columns가 찾고, DataFrame의 열 순서는 required 순서를 따른다.
+
+    engine=None이면 python-calamine이 설치돼 있으면 그것을, 없으면 openpyxl read-only로 읽는다.
+    결과 값·dtype은 pd.read_excel(source, header=header)에서 그 열만 고른 것과 같다(빈 행 포함).
+    두 엔진 모두 실패하면(.xls 등) pd.read_excel 기본 엔진으로 전체를 읽은 뒤 같은 열을 고른다.
+    반환: (DataFrame, find_columns의 열 매핑, 찾지 못한 이름 목록)
+    """
+    engine = engine or ("calamine" if _has_calamine() else "openpyxl")
+    reader = _read_columns_calamine if engine == "calamine" else _read_columns_openpyxl
+    try:
+        return reader(source, required, header, sheet_name, compact)
+    except Exception as error:
+        print(f"! {engine} 열 단위 읽기 실패({error}) → pd.read_excel로 읽습니다.")
+    _rewind(source)
+    frame = pd.read_excel(source, header=header, sheet_name=sheet_name)
+    columns, missing = find_columns(frame, required, compact=compact)
+    names = list(dict.fromkeys(column for column in columns.values() if column is not None))
+    return frame[names], columns, missing
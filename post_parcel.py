@@ -14,7 +14,7 @@ import secrets
 from typing import Mapping, Sequence
 import xml.etree.ElementTree as ET
 
-import requests
+import http_sessions
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 
@@ -182,7 +182,7 @@ def _postcode_response_items(root: ET.Element) -> list[dict[str, str]]:
 
 def postcode_lookup_items(query: str, api_key: str) -> list[dict[str, str]]:
     """우편번호 OpenAPI의 도로명주소 후보를 조회한다."""
-    response = requests.get(
+    response = http_sessions.get_session(POSTCODE_API_URL).get(
         POSTCODE_API_URL,
         params={
             "regkey": api_key,
@@ -282,8 +282,9 @@ def _request_plain_data(values: Mapping[str, object]) -> str:
 
 
 def call_api(api_name: str, plain_data: str, api_key: str, security_key: str) -> ET.Element:
-    response = requests.get(
-        API_BASE_URL.format(api_name),
+    url = API_BASE_URL.format(api_name)
+    response = http_sessions.get_session(url).get(
+        url,
         params={"key": api_key, "regData": encrypt_reg_data(security_key, plain_data)},
         headers={
             "Connection": "keep-alive",
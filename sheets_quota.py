@@ -0,0 +1,223 @@
+"""Google Sheets API 호출 집계·조절기 (UI/Qt 비의존).
+
+공용 gspread Client(google_sheets_oauth)가 GovernedHTTPClient를 쓰므로 이 프로세스의 모든 Sheets
+요청이 여기를 거친다. 요청은 읽기(GET)·쓰기(그 밖)로 나눠 최근 1분 동안의 건수를 세고,
+- 백그라운드 폴링(주문 인덱스 폴링·배송추적 목록 폴링·자동 새로고침·문의 알림)은 분당 쿼터의
+  BACKGROUND_QUOTA_SHARE까지만 쓰고, 그 이상이면 창이 빌 때까지 기다린다.
+- 대화형 작업(버튼·파일 불러오기 등)은 쿼터 전체를 쓰며, 기다리는 대화형 요청이 있으면
+  백그라운드 요청은 그 뒤로 밀린다.
+- 429(쿼터 초과)를 받으면 지수 backoff 동안 모든 요청을 멈췄다가 다시 보낸다.
+쿼터는 Google 계정·프로젝트 단위라 다른 PC 호출은 보이지 않는다. 그 몫은 429 backoff가 맡는다.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Sheets API 기본 쿼터: 사용자당 분당 읽기 60건·쓰기 60건.
+SHEETS_READ_QUOTA_PER_MIN = 60
+SHEETS_WRITE_QUOTA_PER_MIN = 60
+SHEETS_QUOTA_WINDOW_SEC = 60.0
+# 백그라운드 폴링이 쓸 수 있는 쿼터 비율. 나머지는 대화형 작업 몫으로 남긴다.
+BACKGROUND_QUOTA_SHARE = 0.7
+QUOTA_MAX_RETRIES = 5
+QUOTA_BASE_BACKOFF_SEC = 2.0
+QUOTA_MAX_BACKOFF_SEC = 64.0
+# 기다리는 동안 다시 확인하는 최대 간격(대화형 요청이 끝났는지 등).
+_WAIT_SLICE_SEC = 0.5
+
+PRIORITY_INTERACTIVE = "interactive"
+PRIORITY_BACKGROUND = "background"
+
+_priority = threading.local()
+
+
+def current_priority() -> str:
+    """이 스레드에서 나가는 Sheets 요청의 우선순위. 지정하지 않았으면 대화형."""
+    return getattr(_priority, "value", PRIORITY_INTERACTIVE)
+
+
+@contextmanager
+def sheets_priority(priority: str):
+    """블록 안에서 이 스레드가 보내는 Sheets 요청의 우선순위를 정한다."""
+    previous = current_priority()
+    _priority.value = priority
+    try:
+        yield
+    finally:
+        _priority.value = previous
+
+
+def request_kind(method: str) -> str:
+    return "read" if str(method).upper() == "GET" else "write"
+
+
+class SheetsQuotaGovernor:
+    """최근 1분 읽기·쓰기 건수로 요청을 조절하고 누적 통계를 보관한다."""
+
+    def __init__(
+        self,
+        read_quota: int = SHEETS_READ_QUOTA_PER_MIN,
+        write_quota: int = SHEETS_WRITE_QUOTA_PER_MIN,
+        background_share: float = BACKGROUND_QUOTA_SHARE,
+        window_sec: float = SHEETS_QUOTA_WINDOW_SEC,
+        clock=time.monotonic,
+        sleep=time.sleep,
+        jitter=random.random,
+    ):
+        self._quota = {"read": int(read_quota), "write": int(write_quota)}
+        self._background_share = float(background_share)
+        self._window = float(window_sec)
+        self._clock = clock
+        self._sleep = sleep
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._recent = {"read": deque(), "write": deque()}
+        self._totals = {"read": 0, "write": 0}
+        self._interactive_waiting = 0
+        self._blocked_until = 0.0
+        self._delayed = 0
+        self._rate_limited = 0
+
+    def _prune(self, now: float) -> None:
+        for calls in self._recent.values():
+            while calls and now - calls[0] >= self._window:
+                calls.popleft()
+
+    def _limit(self, kind: str, priority: str) -> int:
+        quota = self._quota[kind]
+        if priority == PRIORITY_INTERACTIVE:
+            return quota
+        return max(1, int(quota * self._background_share))
+
+    def _wait_time(self, kind: str, priority: str, now: float) -> float:
+        """지금 보낼 수 있으면 0, 아니면 다시 확인할 때까지 기다릴 초."""
+        if now < self._blocked_until:
+            return self._blocked_until - now
+        if priority != PRIORITY_INTERACTIVE and self._interactive_waiting:
+            return _WAIT_SLICE_SEC
+        calls = self._recent[kind]
+        if len(calls) < self._limit(kind, priority):
+            return 0.0
+        # 한도를 넘긴 만큼 오래된 호출이 창 밖으로 나갈 때까지.
+        over = len(calls) - self._limit(kind, priority)
+        return max(calls[over] + self._window - now, 0.01)
+
+    def acquire(self, kind: str, priority: str | None = None) -> float:
+        """요청 하나를 보내도 될 때까지 기다렸다가 기록한다. 반환: 기다린 초."""
+        priority = priority or current_priority()
+        started = self._clock()
+        counted_wait = False
+        waiting_interactive = False
+        try:
+            while True:
+                with self._lock:
+                    now = self._clock()
+                    self._prune(now)
+                    wait = self._wait_time(kind, priority, now)
+                    if wait <= 0:
+                        self._recent[kind].append(now)
+                        self._totals[kind] += 1
+                        return now - started
+                    if not counted_wait:
+                        counted_wait = True
+                        self._delayed += 1
+                    if priority == PRIORITY_INTERACTIVE and not waiting_interactive:
+                        waiting_interactive = True
+                        self._interactive_waiting += 1
+                self._sleep(min(wait, _WAIT_SLICE_SEC))
+        finally:
+            if waiting_interactive:
+                with self._lock:
+                    self._interactive_waiting -= 1
+
+    def on_rate_limited(self, attempt: int) -> float:
+        """429를 받았을 때 호출한다. 모든 요청을 backoff 동안 멈추고 그 초를 반환한다."""
+        delay = min(QUOTA_MAX_BACKOFF_SEC, QUOTA_BASE_BACKOFF_SEC * (2 ** attempt))
+        delay = delay / 2 + self._jitter() * delay / 2
+        with self._lock:
+            self._rate_limited += 1
+            self._blocked_until = max(self._blocked_until, self._clock() + delay)
+        print(f"! Sheets quota exceeded (429): backing off {delay:.1f}s (attempt {attempt + 1})")
+        return delay
+
+    def near_quota(self) -> bool:
+        """백그라운드 한도에 닿았거나 backoff 중이면 True. 폴링 타이머가 이번 주기를 건너뛸 때 쓴다."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            if now < self._blocked_until:
+                return True
+            return any(
+                len(self._recent[kind]) >= self._limit(kind, PRIORITY_BACKGROUND)
+                for kind in self._recent
+            )
+
+    def snapshot(self) -> dict[str, float | int]:
+        """최근 1분 건수·쿼터와 누적 통계."""
+        with self._lock:
+            now = self._clock()
+            self._prune(now)
+            return {
+                "reads_per_min": len(self._recent["read"]),
+                "writes_per_min": len(self._recent["write"]),
+                "read_quota": self._quota["read"],
+                "write_quota": self._quota["write"],
+                "total_reads": self._totals["read"],
+                "total_writes": self._totals["write"],
+                "delayed": self._delayed,
+                "rate_limited": self._rate_limited,
+                "backoff_sec": round(max(0.0, self._blocked_until - now), 1),
+            }
+
+    def status_text(self) -> str:
+        """상태바에 붙이는 한 줄 요약."""
+        stats = self.snapshot()
+        text = (
+            f"Sheets 분당 읽기 {stats['reads_per_min']}/{stats['read_quota']}"
+            f" · 쓰기 {stats['writes_per_min']}/{stats['write_quota']}"
+        )
+        if stats["backoff_sec"]:
+            text += f" · 429 대기 {stats['backoff_sec']:.0f}초"
+        elif stats["rate_limited"]:
+            text += f" · 429 {stats['rate_limited']}회"
+        return text
+
+
+_GOVERNOR = SheetsQuotaGovernor()
+
+
+def sheets_governor() -> SheetsQuotaGovernor:
+    """프로세스 공용 조절기."""
+    return _GOVERNOR
+
+
+try:
+    from gspread.exceptions import APIError
+    from gspread.http_client import HTTPClient
+except ImportError:  # gspread 가 없으면 조절기·우선순위만 쓴다
+    HTTPClient = None
+
+if HTTPClient is not None:
+
+    class GovernedHTTPClient(HTTPClient):
+        """모든 요청을 공용 조절기에 통과시키고 429면 backoff 뒤 다시 보내는 gspread HTTP 클라이언트."""
+
+        def request(self, method, endpoint, *args, **kwargs):
+            governor = sheets_governor()
+            kind = request_kind(method)
+            attempt = 0
+            while True:
+                governor.acquire(kind)
+                try:
+                    return super().request(method, endpoint, *args, **kwargs)
+                except APIError as error:
+                    if error.code != 429 or attempt >= QUOTA_MAX_RETRIES:
+                        raise
+                    # backoff 동안은 다음 acquire가 (다른 스레드 요청과 함께) 기다린다.
+                    governor.on_rate_limited(attempt)
+                    attempt += 1
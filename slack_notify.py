@@ -9,6 +9,8 @@ try:
 except ImportError:
     requests = None
 
+import http_sessions
+
 DEFAULT_TIMEOUT = 10
 
 
@@ -20,7 +22,7 @@ def send_slack(webhook_url, text):
     if not url:
         return {"ok": False, "error": "슬랙 웹훅 URL이 비어 있습니다."}
     try:
-        resp = requests.post(url, json={"text": text}, timeout=DEFAULT_TIMEOUT)
+        resp = http_sessions.get_session(url).post(url, json={"text": text}, timeout=DEFAULT_TIMEOUT)
         resp.raise_for_status()
         return {"ok": True}
     except Exception as e:
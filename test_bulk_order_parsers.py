@@ -66,6 +66,23 @@ assert naver_orders["N123456789012"]["배송방법"] == "택배,등기,소포"
 assert naver_orders["N123456789012"]["상품목록"][0]["옵션"] == "없음"
 assert naver_orders["N123456789012"]["상품목록"][1]["수량"] == 1
 
+interleaved_orders = build_naver_orders(
+    pd.DataFrame([
+        ["N2222222222222-A", "정", "010", "부산", "011", "", "상품1", "소", 1, "12345", 100, "일반배송", None],
+        [None, "", "", "", "", "", "", "", 1, "", None, "", None],
+        ["N1111111111111", "한", "010", "대구", "011", "", "상품2", "", 1, "12345", 300, "", "500"],
+        ["N2222222222222-B", "정", "010", "부산", "011", "", "상품3", "대", 2, "12345", 200, "일반배송", "700"],
+    ], columns=naver_columns.values()),
+    naver_columns, {"100": "P100"},
+    lambda value: str(value).replace(".0", "") if not pd.isna(value) else "",
+)
+assert list(interleaved_orders) == ["N222222222222", "N111111111111"]
+assert interleaved_orders["N222222222222"]["주문번호목록"] == ["N2222222222222-A", "N2222222222222-B"]
+assert interleaved_orders["N222222222222"]["상품수"] == 2
+assert interleaved_orders["N222222222222"]["주문총액"] == 700.0
+assert interleaved_orders["N111111111111"]["배송방법"] == "배송방법 오류"
+assert interleaved_orders["N111111111111"]["상품목록"][0]["상품코드"] == "        "
+
 gmarket_columns = {
     "주문번호": "order", "수령인명": "name", "주소": "address", "수령인 전화번호": "phone",
     "수령인 휴대폰": "mobile", "상품명": "product", "옵션": "option", "수량": "quantity",
@@ -0,0 +1,83 @@
+from tracking import config_cache as cache_module
+from tracking.config_cache import ConfigValuesCache
+from tracking.repository import (
+    cached_config_values,
+    claim_lease,
+    read_config_values_map,
+    write_config_values,
+)
+
+
+class _ConfigSheet:
+    def __init__(self, title="설정"):
+        self.spreadsheet_id = "sheet"
+        self.title = title
+        self.rows = [["키", "값"], ["naver_client_id", "old"]]
+        self.reads = 0
+
+    def get_all_values(self):
+        self.reads += 1
+        return [list(row) for row in self.rows]
+
+    def append_rows(self, rows, value_input_option):
+        self.rows.extend(list(row) for row in rows)
+
+    def batch_update(self, updates, value_input_option):
+        for update in updates:
+            self.rows[int(update["range"][1:]) - 1][1] = update["values"][0][0]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+clock = _Clock()
+original = cache_module._CONFIG_CACHE
+cache_module._CONFIG_CACHE = cache = ConfigValuesCache(ttl_sec=60, clock=clock)
+try:
+    # TTL 안에서는 시트를 다시 읽지 않고, 돌려준 dict를 고쳐도 캐시는 그대로다.
+    sheet = _ConfigSheet()
+    first = cached_config_values(sheet)
+    assert first == {"naver_client_id": "old"} and sheet.reads == 1
+    first["naver_client_id"] = "changed"
+    assert cached_config_values(sheet)["naver_client_id"] == "old" and sheet.reads == 1
+    version = cache.version
+
+    # 이 프로세스가 쓴 값은 바로 캐시에 반영되고 version이 올라간다.
+    write_config_values(sheet, {"naver_client_id": " new ", "coupang_vendor_id": "A1"})
+    reads = sheet.reads
+    assert cached_config_values(sheet) == {"naver_client_id": "new", "coupang_vendor_id": "A1"}
+    assert sheet.reads == reads and cache.version > version
+
+    # 다른 PC가 바꾼 값은 TTL이 지나야 보인다. 같은 값을 다시 읽으면 version은 그대로다.
+    sheet.rows[1][1] = "other-pc"
+    assert cached_config_values(sheet)["naver_client_id"] == "new"
+    clock.now += 60
+    version = cache.version
+    assert cached_config_values(sheet)["naver_client_id"] == "other-pc"
+    assert cache.version == version + 1
+    read_config_values_map(sheet)
+    assert cache.version == version + 1
+
+    # lease 값은 캐시에 들어가지만 설정이 바뀐 것으로 세지 않는다.
+    version = cache.version
+    lease = claim_lease(sheet, "job", holder="pc1/10", settle_sec=0)
+    lease.heartbeat()
+    assert cache.version == version
+    assert cached_config_values(sheet)["lease_job"].startswith("pc1/10#")
+
+    # 탭은 (스프레드시트 id, 제목)별로 따로 보관하고, invalidate하면 다시 읽는다.
+    other = _ConfigSheet(title="설정2")
+    cached_config_values(other)
+    assert other.reads == 1
+    reads = sheet.reads
+    cache.invalidate(sheet)
+    cached_config_values(sheet)
+    cached_config_values(other)
+    assert sheet.reads == reads + 1 and other.reads == 1
+finally:
+    cache_module._CONFIG_CACHE = original
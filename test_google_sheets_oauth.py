@@ -0,0 +1,116 @@
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from google.oauth2.credentials import Credentials
+
+import google_sheets_oauth as oauth
+from tracking.config_cache import config_cache
+from tracking.sheet_handles import sheet_handles
+
+tmp = Path(tempfile.mkdtemp())
+original_token_path = oauth.TOKEN_PATH
+original_refresh = Credentials.refresh
+original_load, original_authorize = oauth._load_credentials, oauth._authorize
+refreshes = []
+
+
+def _fake_refresh(self, request):
+    refreshes.append(threading.get_ident())
+    time.sleep(0.05)
+    self.token = f"token-{len(refreshes)}"
+    self.expiry = datetime.utcnow() + timedelta(hours=1)
+
+
+oauth.TOKEN_PATH = tmp / "token.json"
+Credentials.refresh = _fake_refresh
+try:
+    # 만료된 토큰을 여러 스레드가 동시에 봐도 갱신은 한 번만 하고 token.json에 남긴다.
+    creds = oauth._SharedCredentials(
+        token="old", refresh_token="refresh", client_id="id", client_secret="secret",
+        token_uri="https://oauth2.googleapis.com/token", scopes=oauth.SCOPES,
+        expiry=datetime.utcnow() - timedelta(minutes=1),
+    )
+    threads = [threading.Thread(target=creds.refresh, args=(None,)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(refreshes) == 1 and creds.token == "token-1"
+    assert '"token": "token-1"' in oauth.TOKEN_PATH.read_text(encoding="utf-8")
+
+    # 공용 Client는 동시에 불러도 한 번만 만들고, 연결 해제하면 다시 만든다.
+    built = []
+
+    def _build(creds):
+        time.sleep(0.05)
+        built.append(object())
+        return built[-1]
+
+    oauth._load_credentials = lambda: creds
+    oauth._authorize = _build
+    oauth.reset_gspread_client()
+    clients = []
+    threads = [
+        threading.Thread(target=lambda: clients.append(oauth.get_authorized_gspread_client()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(built) == 1 and all(client is built[0] for client in clients)
+    assert oauth.delete_oauth_token_file()
+    assert oauth.get_authorized_gspread_client() is built[1]
+
+    # worker가 invalid_grant를 만나면 token.json·공용 Client와 함께 핸들·설정 캐시도 버린다.
+    # 재로그인 뒤에는 예전 Credentials가 다시 실패해도 새 token.json을 지우지 않는다.
+    class _Client:
+        def __init__(self, name):
+            self.name = name
+
+        def open_by_key(self, key):
+            return f"{self.name}:{key}"
+
+    def _revoked(self, request):
+        raise RuntimeError("invalid_grant: Token has been expired or revoked.")
+
+    old_creds = oauth._SharedCredentials(
+        token="old", refresh_token="refresh", client_id="id", client_secret="secret",
+        token_uri="https://oauth2.googleapis.com/token", scopes=oauth.SCOPES,
+        expiry=datetime.utcnow() - timedelta(minutes=1),
+    )
+    new_creds = oauth._SharedCredentials(token="new", scopes=oauth.SCOPES)
+    logins = iter([old_creds, new_creds])
+    oauth._load_credentials = lambda: next(logins)
+    oauth._authorize = lambda creds: _Client(creds.token)
+    oauth.reset_gspread_client()
+    old_client = oauth.get_authorized_gspread_client()
+    assert sheet_handles().spreadsheet(old_client, "sheet") == "old:sheet"
+    config_cache().store(type("Ws", (), {"spreadsheet_id": "sheet", "title": "설정"})(), {"k": "v"})
+    oauth.TOKEN_PATH.write_text("{}", encoding="utf-8")
+    Credentials.refresh = _revoked
+    try:
+        old_creds.refresh(None)
+    except RuntimeError:
+        pass
+    assert not oauth.TOKEN_PATH.exists()
+    assert sheet_handles()._entries == {} and config_cache()._entries == {}
+    new_client = oauth.get_authorized_gspread_client()
+    oauth.TOKEN_PATH.write_text("{}", encoding="utf-8")
+    assert sheet_handles().spreadsheet(new_client, "sheet") == "new:sheet"
+    try:
+        old_creds.refresh(None)
+    except RuntimeError:
+        pass
+    assert oauth.TOKEN_PATH.exists()
+    assert oauth.get_authorized_gspread_client() is new_client
+    # 다른 Client로 부르면 캐시한 핸들을 쓰지 않는다.
+    assert sheet_handles().spreadsheet(old_client, "sheet") == "old:sheet"
+finally:
+    Credentials.refresh = original_refresh
+    oauth._load_credentials, oauth._authorize = original_load, original_authorize
+    oauth.TOKEN_PATH = original_token_path
+    oauth.reset_gspread_client()
@@ -0,0 +1,62 @@
+"""외부 API 공유 HTTP 세션 레지스트리 검증."""
+
+import threading
+import unittest
+
+import http_sessions
+
+
+class HttpSessionRegistryTests(unittest.TestCase):
+    def tearDown(self):
+        http_sessions.close_all()
+        http_sessions._host_options.clear()
+
+    def test_reuses_one_session_per_host(self):
+        first = http_sessions.get_session("https://api.commerce.naver.com/external/v1/oauth2/token")
+        second = http_sessions.get_session("https://API.commerce.naver.com/external/v1/products/search")
+        other = http_sessions.get_session("https://api-gateway.coupang.com/v2/providers")
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+
+    def test_concurrent_callers_share_the_same_session(self):
+        sessions = []
+
+        def worker():
+            sessions.append(http_sessions.get_session("http://biz.epost.go.kr/KpostPortal/openapi"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len({id(session) for session in sessions}), 1)
+
+    def test_adapter_uses_pool_and_retry_settings(self):
+        http_sessions.configure_host("http://ship.epost.go.kr", pool_maxsize=3, retries=1)
+        session = http_sessions.get_session("http://ship.epost.go.kr/api.InsertOrder.jparcel")
+        adapter = session.get_adapter("http://ship.epost.go.kr/api.InsertOrder.jparcel")
+
+        self.assertEqual(adapter._pool_maxsize, 3)
+        self.assertEqual(adapter.max_retries.total, 1)
+        self.assertEqual(adapter.max_retries.read, 0)
+        self.assertIn(503, adapter.max_retries.status_forcelist)
+        self.assertNotIn("POST", adapter.max_retries.allowed_methods)
+
+    def test_configure_host_rebuilds_existing_session(self):
+        before = http_sessions.get_session("https://hooks.slack.com/services/x")
+        http_sessions.configure_host("https://hooks.slack.com", pool_maxsize=2)
+        after = http_sessions.get_session("https://hooks.slack.com/services/x")
+
+        self.assertIsNot(before, after)
+        with self.assertRaises(TypeError):
+            http_sessions.configure_host("https://hooks.slack.com", timeout=3)
+
+    def test_rejects_url_without_host(self):
+        with self.assertRaises(ValueError):
+            http_sessions.get_session("/relative/path")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+import math
+
+import pandas as pd
+
+from orders.invoice_match import (
+    build_index,
+    digits_key,
+    join_invoices,
+    order_number_key,
+    text_key,
+)
+
+
+assert text_key(math.nan) == "" and text_key(" nan ") == "" and text_key(" 김 ") == "김"
+assert digits_key("010-1234 5678") == "01012345678" and digits_key(None) == ""
+assert order_number_key("2026081512345678") == "2026081512345"
+assert order_number_key(2026081512345.0) == "2026081512345"
+assert build_index(["a", "", "b", "a", ("", "")]) == {"a": [0, 3], "b": [2]}
+
+
+def _old_naver(order_df, invoice_df):
+    """기존 매칭: 송장마다 주문번호 앞 13자리 마스크."""
+    order_numbers = order_df["주문번호"].apply(
+        lambda v: "" if pd.isna(v) else "".join(ch for ch in str(v) if ch.isdigit())).str[:13]
+    assigned = {}
+    for _, row in invoice_df.iterrows():
+        value = row["고객주문번호"]
+        key = "" if pd.isna(value) else "".join(ch for ch in str(value) if ch.isdigit())[:13]
+        if not key:
+            continue
+        for label in order_df[order_numbers == key].index:
+            assigned[label] = row["등기번호"]
+    return assigned
+
+
+def _old_coupang(order_df, invoice_df):
+    """기존 매칭: 송장마다 수취인명·전화번호 문자열 마스크."""
+    assigned = {}
+    for _, row in invoice_df.iterrows():
+        name, phone = text_key(row["수취인명"]), text_key(row["수취인 전화번호"])
+        mask = (order_df["수취인이름"].map(text_key) == name) & (order_df["수취인전화번호"].map(text_key) == phone)
+        for label in order_df[mask].index:
+            assigned[label] = row["등기번호"]
+    return assigned
+
+
+def _new(join, invoice_numbers):
+    assigned = {}
+    for invoice_pos, order_positions in join.matches:
+        for position in order_positions:
+            assigned[position] = invoice_numbers[invoice_pos]
+    return assigned
+
+
+# 네이버: 주문번호 앞 13자리, 하이픈·숫자형·NaN, 한 주문의 여러 상품 행, 같은 주문에 송장 두 건
+naver_orders = pd.DataFrame({"주문번호": [
+    "2026081512345001", "2026081512345002", "2026-0815-99999-01", math.nan, "2026081577777", "",
+]})
+naver_invoices = pd.DataFrame({
+    "등기번호": ["A1", "A2", "A3", "A4", "A5"],
+    "고객주문번호": [2026081512345, "20260815999990", math.nan, "2026081577777", "2026081577777-x"],
+})
+join = join_invoices(
+    naver_invoices["고객주문번호"].map(order_number_key).tolist(),
+    naver_orders["주문번호"].map(order_number_key).tolist(),
+)
+assert _new(join, naver_invoices["등기번호"].tolist()) == _old_naver(naver_orders, naver_invoices)
+assert [position for position, _ in join.matches] == [0, 1, 3, 4]
+assert join.matches[0] == (0, [0, 1])
+assert join.unmatched_invoices == [2]
+assert join.unmatched_orders == [3, 5]
+assert join.ambiguous == {"2026081577777": [3, 4]}
+
+# 쿠팡: 이름+전화번호 문자열이 모두 같아야 함(공백은 앞뒤만 무시, 하이픈 차이는 불일치)
+coupang_orders = pd.DataFrame({
+    "수취인이름": ["김쿠팡", "김쿠팡", "김쿠팡", "이쿠팡", " 박쿠팡 ", "최쿠팡"],
+    "수취인전화번호": ["010-1111-2222", "010-1111-2222", "010-9999-0000", "0501-000-1111", "010-3333-4444", math.nan],
+})
+coupang_invoices = pd.DataFrame({
+    "등기번호": ["B1", "B2", "B3", "B4", "B5"],
+    "수취인명": ["김쿠팡", "이쿠팡", "박쿠팡", "최쿠팡", "없는분"],
+    "수취인 전화번호": ["010-1111-2222", "05010001111", " 010-3333-4444", math.nan, "010"],
+})
+join = join_invoices(
+    list(zip(coupang_invoices["수취인명"].map(text_key), coupang_invoices["수취인 전화번호"].map(text_key))),
+    list(zip(coupang_orders["수취인이름"].map(text_key), coupang_orders["수취인전화번호"].map(text_key))),
+)
+assert _new(join, coupang_invoices["등기번호"].tolist()) == _old_coupang(coupang_orders, coupang_invoices)
+assert join.matches == [(0, [0, 1]), (2, [4]), (3, [5])]
+assert join.unmatched_invoices == [1, 4]
+assert join.unmatched_orders == [2, 3]
+assert join.ambiguous == {}
+
+# 수천 건도 한 번 훑기: 주문 1만 행 × 송장 5천 건
+orders = [f"20260815{index:05d}" for index in range(10_000)]
+invoices = [f"20260815{index:05d}" for index in range(0, 10_000, 2)]
+join = join_invoices(invoices, orders)
+assert len(join.matches) == 5_000 and len(join.unmatched_orders) == 5_000
@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+
+import kpost_tracker
+
+
+# 응답 XML 옆의 <이름>.expected.json은 예전 트리 파서(benchmarks/bench_kpost_parser.py)의
+# 결과를 기록해 둔 것이다.
+FIXTURES = sorted((Path(__file__).resolve().parent / "fixtures" / "kpost").glob("*.xml"))
+assert FIXTURES
+
+for fixture in FIXTURES:
+    text = fixture.read_text(encoding="utf-8")
+    expected = json.loads(fixture.with_suffix(".expected.json").read_text(encoding="utf-8"))
+    assert kpost_tracker.parse_tracking(text) == expected, fixture.name
+    summary = kpost_tracker.parse_tracking(text, with_events=False)
+    assert summary == {**expected, "events": []}, fixture.name
+
+transit = kpost_tracker.parse_tracking(
+    (FIXTURES[0].parent / "trace_in_transit.xml").read_text(encoding="utf-8"), with_events=False)
+assert (transit["status"], transit["where"], transit["time"]) == (
+    "도착", "부산우편집중국", "2026.08.13 03:12")  # 선구분-후접수는 현재상태에서 제외
+delivered = kpost_tracker.parse_tracking(
+    (FIXTURES[0].parent / "trace_delivered.xml").read_text(encoding="utf-8"))
+assert delivered["complete"] and delivered["time"] == "2026.08.13 14:02"
+assert [event["time"] for event in delivered["events"]] == ["17:55", "09:30", "14:02"]
+
+for broken in ("", "<trace><itemlist>", "not xml"):
+    assert kpost_tracker.parse_tracking(broken)["error_code"] == "XML"
+late_error = "<trace><item><tracestatus>접수</tracestatus></item><error><error_code>ERR-131</error_code></error></trace>"
+assert kpost_tracker.parse_tracking(late_error) == {
+    "ok": False, "error_code": "ERR-131", "error": "알 수 없는 오류", "complete": False,
+    "status": "", "where": "", "time": "", "recipient": "", "events": [],
+}
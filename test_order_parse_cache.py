@@ -0,0 +1,64 @@
+import hashlib
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from orders.parse_cache import OrderParseCache, file_sha1
+
+
+tmp = tempfile.TemporaryDirectory()
+folder = Path(tmp.name)
+order_file = folder / "DeliveryList(2026-08-13)_(0).xlsx"
+order_file.write_bytes(b"order-bytes")
+sha1 = file_sha1(order_file)
+assert sha1 == hashlib.sha1(b"order-bytes").hexdigest()
+
+cache = OrderParseCache(folder / "cache", max_entries=2)
+reads = []
+
+
+def _reader():
+    reads.append(1)
+    return pd.DataFrame({"주문번호": ["C1", "C2"], "수량": [1, 2]})
+
+
+first = cache.load(sha1, "coupang", _reader)
+first.loc[0, "주문번호"] = "changed by caller"
+second = cache.load(sha1, "coupang", _reader)
+assert len(reads) == 1
+assert second["주문번호"].tolist() == ["C1", "C2"]
+
+# 읽는 방식(variant)이나 파서 버전이 다르면 다른 항목이다.
+cache.load(sha1, "naver-dispatch-sheet", _reader)
+assert len(reads) == 2
+assert OrderParseCache(folder / "cache", version=99).get(sha1, "coupang") is None
+
+# 해시를 못 구했으면 캐시 없이 읽는다.
+cache.load(None, "coupang", _reader)
+assert len(reads) == 3
+
+# 개수 한도를 넘으면 가장 오래 쓰지 않은 항목부터 지운다(get이 사용 시각을 갱신).
+old = time.time() - 100
+for path in (folder / "cache").glob("*.pkl"):
+    os.utime(path, (old, old))
+assert cache.get(sha1, "coupang") is not None
+cache.put("f" * 40, "gmarket", pd.DataFrame({"a": [1]}))
+assert cache.get(sha1, "naver-dispatch-sheet") is None
+assert cache.get(sha1, "coupang") is not None
+assert cache.get("f" * 40, "gmarket") is not None
+
+# 깨진 항목은 지우고 다시 읽는다.
+cache._path(sha1, "coupang").write_bytes(b"not a pickle")
+cache.load(sha1, "coupang", _reader)
+assert len(reads) == 4
+assert cache.get(sha1, "coupang") is not None
+
+# 전체 크기 한도
+tiny = OrderParseCache(folder / "tiny", max_bytes=1)
+tiny.put(sha1, "coupang", pd.DataFrame({"a": [1]}))
+assert list((folder / "tiny").glob("*.pkl")) == []
+
+tmp.cleanup()
@@ -0,0 +1,87 @@
+import tempfile
+from io import BytesIO
+from pathlib import Path
+
+import pandas as pd
+from msoffcrypto.format.ooxml import OOXMLFile
+from openpyxl import Workbook
+
+from orders.workbook import (
+    ORDER_FILE_PASSWORD,
+    WorkbookDecryptError,
+    decrypt_workbook,
+    is_encrypted_workbook,
+    open_order_workbook,
+    read_excel_columns,
+)
+
+
+tmp = tempfile.TemporaryDirectory()
+folder = Path(tmp.name)
+plain = BytesIO()
+pd.DataFrame({"주문번호": ["N1", "N2"], "수량": [1, 2]}).to_excel(
+    plain, sheet_name="발주발송관리", index=False)
+plain_path = folder / "plain.xlsx"
+plain_path.write_bytes(plain.getvalue())
+plain.seek(0)
+encrypted_path = folder / "order.xlsx"
+with open(encrypted_path, "wb") as output:
+    OOXMLFile(plain).encrypt(ORDER_FILE_PASSWORD, output)
+
+assert is_encrypted_workbook(encrypted_path)
+assert not is_encrypted_workbook(plain_path)
+assert open_order_workbook(plain_path) == plain_path
+
+decrypted = decrypt_workbook(encrypted_path)
+assert decrypted.tell() == 0
+frame = pd.read_excel(decrypted, sheet_name="발주발송관리")
+assert frame["주문번호"].tolist() == ["N1", "N2"]
+assert pd.read_excel(open_order_workbook(encrypted_path))["수량"].tolist() == [1, 2]
+# 복호화한 파일을 디스크에 남기지 않는다.
+assert sorted(path.name for path in folder.iterdir()) == ["order.xlsx", "plain.xlsx"]
+
+try:
+    decrypt_workbook(encrypted_path, "wrong")
+except WorkbookDecryptError:
+    pass
+else:
+    raise AssertionError("wrong password must fail")
+
+
+# 우체국 송장처럼 7번째 행이 헤더인 파일에서 필요한 열만 읽어도 pd.read_excel과 같아야 한다.
+invoice_path = folder / "1744778498617.xlsx"
+workbook = Workbook()
+sheet = workbook.active
+for line in range(6):
+    sheet.append([f"안내 {line}"])
+sheet.append(["번호", "등기번호", "수취인명", "수취인 이동통신", None, "수취인명", "수취인상세주소 ", "고객주문번호"])
+sheet.append([1, 6865012345678, "김", "010-1111-2222", "x", "김2", "서울", 2026081312345670])
+sheet.append([2, None, "이", None, None, "이2", "부산", "N1"])
+sheet.append([None, None, None, None, None, None, None, None])
+sheet.append([3, 6865012345679.0, "#N/A", "01033334444", None, None, 12.5, None])
+sheet.append([None, None, None, None, "메모만 있는 행"])
+sheet.append([None, None, None, None, None])
+workbook.save(invoice_path)
+
+required = ("등기번호", "수취인명", "수취인 이동통신", "수취인상세주소", "고객주문번호", "없는열")
+expected = pd.read_excel(invoice_path, header=6)
+engines = ["openpyxl"]
+try:
+    import python_calamine  # noqa: F401
+    engines.append("calamine")
+except ImportError:
+    pass
+for engine in engines:
+    frame, columns, missing = read_excel_columns(invoice_path, required, header=6, engine=engine)
+    assert missing == ["없는열"]
+    assert columns["수취인명"] == "수취인명" and columns["수취인상세주소"] == "수취인상세주소 "
+    assert list(frame.columns) == ["등기번호", "수취인명", "수취인 이동통신", "수취인상세주소 ", "고객주문번호"]
+    pd.testing.assert_frame_equal(frame, expected[list(frame.columns)])
+    assert len(frame) == 5
+
+compact_frame, compact_columns, _ = read_excel_columns(
+    invoice_path, ("수취인이동통신",), header=6, compact=True)
+assert compact_columns == {"수취인이동통신": "수취인 이동통신"}
+assert list(compact_frame.columns) == ["수취인 이동통신"]
+
+tmp.cleanup()
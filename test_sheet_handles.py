@@ -0,0 +1,121 @@
+from tracking import sheet_handles as handles_module
+from tracking.repository import open_config_worksheet, open_tracking_worksheet
+from tracking.sheet_handles import SheetHandleCache, is_missing_worksheet_error
+
+
+class _Worksheet:
+    def __init__(self, title, header=()):
+        self.title = title
+        self.header = list(header)
+        self.col_count = 14
+        self.header_reads = 0
+
+    def row_values(self, row):
+        self.header_reads += 1
+        return list(self.header)
+
+    def update(self, values, range_name, value_input_option):
+        self.header = list(values[0])
+
+
+class _Spreadsheet:
+    def __init__(self, titles):
+        self.tabs = [_Worksheet(title) for title in titles]
+        self.listings = 0
+
+    def worksheets(self):
+        self.listings += 1
+        return list(self.tabs)
+
+    def add_worksheet(self, title, rows, cols, index=None):
+        worksheet = _Worksheet(title)
+        self.tabs.insert(len(self.tabs) if index is None else index, worksheet)
+        return worksheet
+
+
+class _Client:
+    def __init__(self, spreadsheet):
+        self.spreadsheet = spreadsheet
+        self.opens = 0
+
+    def open_by_key(self, key):
+        assert key == "sheet"
+        self.opens += 1
+        return self.spreadsheet
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class _APIError(Exception):
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+# 같은 스프레드시트·탭은 TTL 안에서 메타데이터를 다시 받지 않는다.
+spreadsheet = _Spreadsheet(["네이버", "쿠팡", "설정"])
+gc = _Client(spreadsheet)
+clock = _Clock()
+cache = SheetHandleCache(ttl_sec=300, clock=clock)
+config = cache.worksheet(gc, "sheet", "설정")
+assert config is spreadsheet.tabs[2]
+assert cache.worksheet(gc, "sheet", "설정") is config
+assert cache.worksheets(gc, "sheet")[0].title == "네이버"
+assert (gc.opens, spreadsheet.listings) == (1, 1)
+
+# 캐시에 없는 탭은 목록을 한 번 다시 받아 본다(다른 PC가 방금 만든 탭).
+spreadsheet.tabs.append(_Worksheet("문의알림"))
+assert cache.worksheet(gc, "sheet", "문의알림").title == "문의알림"
+assert spreadsheet.listings == 2
+assert cache.worksheet(gc, "sheet", "없는탭") is None
+assert spreadsheet.listings == 3
+
+# 만든 탭은 캐시한 목록에도 들어간다.
+created = cache.add_worksheet(gc, "sheet", "이력", rows=10, cols=6, index=2)
+assert cache.worksheets(gc, "sheet")[2] is created and spreadsheet.listings == 3
+
+# TTL이 지나거나 탭이 없어졌다는 오류를 받으면 핸들을 새로 받는다.
+clock.now += 300
+cache.worksheet(gc, "sheet", "설정")
+assert (gc.opens, spreadsheet.listings) == (2, 4)
+assert not cache.forget_on_error(ValueError("boom"))
+assert not cache.forget_on_error(_APIError(429, "Quota exceeded"))
+assert cache.forget_on_error(_APIError(400, "Unable to parse range: '설정'!A1:B"))
+cache.worksheet(gc, "sheet", "설정")
+assert (gc.opens, spreadsheet.listings) == (3, 5)
+assert is_missing_worksheet_error(type("WorksheetNotFound", (Exception,), {})())
+assert is_missing_worksheet_error(_APIError(404, "Requested entity was not found."))
+
+# first_use는 핸들을 새로 받은 뒤 탭마다 한 번만 True다.
+assert cache.first_use("sheet", "설정") and not cache.first_use("sheet", "설정")
+cache.invalidate("sheet")
+cache.worksheet(gc, "sheet", "설정")
+assert cache.first_use("sheet", "설정")
+
+# repository의 열기 함수는 공용 캐시를 쓰고, 송장추적 헤더 확인은 핸들을 받은 뒤 한 번만 한다.
+original = handles_module._SHEET_HANDLES
+handles_module._SHEET_HANDLES = SheetHandleCache(clock=clock)
+try:
+    spreadsheet = _Spreadsheet(["설정"])
+    gc = _Client(spreadsheet)
+    headers = ["등기번호", "등록일시", "수정시각"]
+    tracking = open_tracking_worksheet(gc, "sheet", "송장추적", headers)
+    assert tracking.header == headers and tracking.header_reads == 0
+    tracking.header = ["등기번호"]
+    assert open_tracking_worksheet(gc, "sheet", "송장추적", headers) is tracking
+    assert tracking.header_reads == 0  # 새로 만든 탭은 헤더를 다시 읽지 않는다
+    handles_module._SHEET_HANDLES.invalidate()
+    assert open_tracking_worksheet(gc, "sheet", "송장추적", headers) is tracking
+    assert tracking.header_reads == 1 and tracking.header == headers
+    open_tracking_worksheet(gc, "sheet", "송장추적", headers)
+    assert tracking.header_reads == 1
+    assert open_config_worksheet(gc, "sheet", "설정", ["키", "값"]) is spreadsheet.tabs[0]
+    assert gc.opens == 2 and spreadsheet.listings == 3  # 처음 없던 탭 확인 1회 포함
+finally:
+    handles_module._SHEET_HANDLES = original
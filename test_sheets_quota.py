@@ -0,0 +1,97 @@
+import threading
+
+import sheets_quota
+from sheets_quota import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    GovernedHTTPClient,
+    SheetsQuotaGovernor,
+    current_priority,
+    request_kind,
+    sheets_priority,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+
+clock = _Clock()
+governor = SheetsQuotaGovernor(
+    read_quota=10, write_quota=4, background_share=0.5,
+    clock=clock, sleep=clock.sleep, jitter=lambda: 1.0,
+)
+
+# 읽기·쓰기를 따로 세고, 백그라운드는 쿼터의 절반까지만 바로 보낸다.
+assert request_kind("get") == "read" and request_kind("POST") == "write"
+for _ in range(5):
+    assert governor.acquire("read", PRIORITY_BACKGROUND) == 0
+assert governor.near_quota()
+# 대화형은 남은 쿼터를 그대로 쓴다.
+for _ in range(5):
+    assert governor.acquire("read", PRIORITY_INTERACTIVE) == 0
+stats = governor.snapshot()
+assert (stats["reads_per_min"], stats["writes_per_min"], stats["delayed"]) == (10, 0, 0)
+
+# 한도에 닿으면 가장 오래된 호출이 1분 창 밖으로 나갈 때까지 기다린다.
+clock.now = 30.0
+waited = governor.acquire("read", PRIORITY_BACKGROUND)
+assert waited >= 30.0 and clock.now >= 60.0
+assert governor.snapshot()["delayed"] == 1
+assert governor.status_text().startswith("Sheets 분당 읽기 ")
+
+# 429를 받으면 backoff 동안 우선순위와 관계없이 모두 멈춘다.
+clock.now = 200.0
+assert governor.on_rate_limited(attempt=1) == 4.0
+assert governor.near_quota() and governor.snapshot()["backoff_sec"] == 4.0
+assert governor.acquire("write", PRIORITY_INTERACTIVE) >= 4.0
+assert "429 1회" in governor.status_text()
+
+# 우선순위는 스레드마다 따로 정해진다.
+seen = []
+with sheets_priority(PRIORITY_BACKGROUND):
+    worker = threading.Thread(target=lambda: seen.append(current_priority()))
+    worker.start()
+    worker.join()
+    assert current_priority() == PRIORITY_BACKGROUND
+assert current_priority() == PRIORITY_INTERACTIVE and seen == [PRIORITY_INTERACTIVE]
+
+
+# gspread HTTP 클라이언트는 요청마다 조절기를 거치고, 429면 backoff 뒤 다시 보낸다.
+class _Response:
+    def __init__(self, status):
+        self.status_code = status
+        self.ok = status < 400
+
+    def json(self):
+        return {"error": {"code": self.status_code, "message": "Quota exceeded", "status": "RESOURCE_EXHAUSTED"}}
+
+
+class _Session:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def request(self, **kwargs):
+        self.calls += 1
+        return _Response(self.statuses.pop(0))
+
+
+original = sheets_quota._GOVERNOR
+sheets_quota._GOVERNOR = shared = SheetsQuotaGovernor(clock=clock, sleep=clock.sleep, jitter=lambda: 0.0)
+try:
+    client = GovernedHTTPClient.__new__(GovernedHTTPClient)
+    client.session = _Session([429, 429, 200])
+    client.timeout = None
+    assert client.request("get", "https://sheets.example/values").ok
+    stats = shared.snapshot()
+    assert client.session.calls == 3 and stats["rate_limited"] == 2 and stats["total_reads"] == 3
+finally:
+    sheets_quota._GOVERNOR = original
@@ -0,0 +1,205 @@
+import os
+from datetime import datetime
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import tracking.workers as tracking_workers
+from tracking.mirror import parse_row_range
+from tracking.repository import (
+    archive_tracking_rows,
+    batch_update_tracking_rows,
+    find_archived_tracking_row,
+    find_tracking_rows,
+    read_tracking_archive_values,
+    tracking_archive_title,
+)
+from tracking.service import select_tracking_archive_rows
+from tracking.throttle import TokenBucket
+from tracking.workers import TRACKING_SHEET_HEADERS, new_kpost_rate_governor, refresh_tracking_rows
+
+
+class _FakeSpreadsheet:
+    def __init__(self):
+        self.sheets = []
+        self.requests = []
+
+    def worksheets(self):
+        return list(self.sheets)
+
+    def add_worksheet(self, title, rows, cols):
+        worksheet = _FakeWorksheet(self, title, [])
+        self.sheets.append(worksheet)
+        return worksheet
+
+    def batch_update(self, body):
+        self.requests.append(body)
+        for request in body["requests"]:
+            span = request["deleteDimension"]["range"]
+            target = next(ws for ws in self.sheets if ws.id == span["sheetId"])
+            del target.values[span["startIndex"]:span["endIndex"]]
+
+    def values_batch_get(self, ranges):
+        out = []
+        for a1 in ranges:
+            title = a1.split("!")[0].strip("'")
+            ws = next(ws for ws in self.sheets if ws.title == title)
+            out.append({"range": a1, "values": [list(row) for row in ws.values[1:]]})
+        return {"valueRanges": out}
+
+
+class _FakeWorksheet:
+    def __init__(self, spreadsheet, title, values):
+        self.spreadsheet = spreadsheet
+        self.title = title
+        self.values = values
+        self.id = len(spreadsheet.sheets) + 100
+
+    def update(self, values, range_name, value_input_option):
+        assert range_name == "A1"
+        self.values[:1] = [list(values[0])]
+
+    def append_rows(self, rows, value_input_option):
+        self.values.extend(list(row) for row in rows)
+
+    def batch_get(self, ranges):
+        assert ranges == ["A2:A"]
+        return [[[row[0]] if row else [] for row in self.values[1:]]]
+
+    def get_all_values(self):
+        return [list(row) for row in self.values]
+
+    def batch_update(self, updates, value_input_option):
+        for update in updates:
+            row, start, _end = parse_row_range(update["range"])
+            for offset, cells in enumerate(update["values"]):
+                target = self.values[row + offset - 1]
+                target[start:start + len(cells)] = cells
+
+
+def _row(regino, done, event, registered="2026-06-01 09:00:00"):
+    row = [""] * 14
+    row[0], row[1], row[7], row[11] = regino, registered, done, event
+    return row
+
+
+now_dt = datetime(2026, 8, 13, 12)
+rows = [
+    _row("A1", "Y", "2026.06.20 10:00"),   # 6월 완료 → 보관
+    _row("A2", "N", "2026.06.20 10:00"),   # 미완료
+    _row("A3", "Y", "2026.07.14 10:00"),   # 딱 30일 전 → 아직 보관 안 함
+    _row("A4", "Y", "2026.07.12 23:59"),   # 7월 완료 → 보관
+    _row("A5", "Y", ""),                   # 이벤트 없음 → 등록일시(6월) 기준 보관
+    _row("A6", "Y", "미상", registered=""),  # 시각 없음 → 보관 안 함
+]
+assert select_tracking_archive_rows(rows, now_dt, 30) == [
+    (2, "2026-06"), (5, "2026-07"), (6, "2026-06")]
+assert select_tracking_archive_rows(rows, now_dt, 0) == []
+assert select_tracking_archive_rows([], now_dt, 30) == []
+
+spreadsheet = _FakeSpreadsheet()
+hot = _FakeWorksheet(spreadsheet, "송장추적", [list(TRACKING_SHEET_HEADERS), *rows])
+spreadsheet.sheets.append(hot)
+values = hot.get_all_values()
+selections = select_tracking_archive_rows(values[1:], now_dt, 30)
+result = archive_tracking_rows(hot, values, selections, TRACKING_SHEET_HEADERS)
+assert result == {"archived": 3, "months": ["2026-06", "2026-07"]}
+assert [row[0] for row in hot.values[1:]] == ["A2", "A3", "A6"]
+# 아래쪽 구간부터 한 번의 요청으로 지운다.
+assert len(spreadsheet.requests) == 1
+assert [r["deleteDimension"]["range"]["startIndex"] for r in spreadsheet.requests[0]["requests"]] == [4, 1]
+june = next(ws for ws in spreadsheet.sheets if ws.title == tracking_archive_title("2026-06"))
+assert june.values[0] == list(TRACKING_SHEET_HEADERS)
+assert [row[0] for row in june.values[1:]] == ["A1", "A5"]
+assert [row[0] for row in read_tracking_archive_values(spreadsheet)] == ["A1", "A5", "A4"]
+assert [row[0] for row in read_tracking_archive_values(spreadsheet, ["2026-07"])] == ["A4"]
+assert find_archived_tracking_row(spreadsheet, "A4")[11] == "2026.07.12 23:59"
+assert find_archived_tracking_row(spreadsheet, "A2") is None
+
+# 보관 탭 추가 뒤 삭제 전에 실패했던 경우: 다시 돌려도 보관 탭에 중복 추가하지 않는다.
+hot.values.insert(1, list(june.values[1]))
+values = hot.get_all_values()
+result = archive_tracking_rows(hot, values, [(2, "2026-06")], TRACKING_SHEET_HEADERS)
+assert result["archived"] == 1
+assert [row[0] for row in june.values[1:]] == ["A1", "A5"]
+assert [row[0] for row in hot.values[1:]] == ["A2", "A3", "A6"]
+
+# 고른 뒤 다른 PC가 행을 바꿨다면(등기번호 불일치) 원본에서 지우지 않는다.
+hot.values.insert(1, _row("B1", "Y", "2026.06.01 10:00"))
+values = hot.get_all_values()
+hot.values[1][0] = "B2"
+result = archive_tracking_rows(hot, values, [(2, "2026-06")], TRACKING_SHEET_HEADERS)
+assert result["archived"] == 0
+assert [row[0] for row in hot.values[1:]] == ["B2", "A2", "A3", "A6"]
+
+# 자동 새로고침 슬롯: 하루 한 번만, 날짜를 먼저 기록한다.
+written = []
+original_write = tracking_workers._write_config_values
+original_read = tracking_workers.read_tracking_values
+tracking_workers._write_config_values = lambda _ws, updates: written.append(dict(updates))
+tracking_workers.read_tracking_values = lambda ws: ws.get_all_values()
+try:
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert tracking_workers._maybe_archive_tracking_rows(
+        hot, object(), {tracking_workers.CONFIG_KEY_LAST_ARCHIVE: today}) == 0
+    assert written == []
+    assert tracking_workers._maybe_archive_tracking_rows(
+        hot, object(), {"tracking_archive_days": "0"}) == 0
+    assert written == [{tracking_workers.CONFIG_KEY_LAST_ARCHIVE: today}]
+    days = (datetime.now().date() - datetime(2026, 7, 1).date()).days  # 7월 1일 이전 완료만
+    assert tracking_workers._maybe_archive_tracking_rows(
+        hot, object(), {"tracking_archive_days": str(days)}) == 1
+    assert [row[0] for row in hot.values[1:]] == ["A2", "A3", "A6"]
+finally:
+    tracking_workers._write_config_values = original_write
+    tracking_workers.read_tracking_values = original_read
+
+# 새로고침이 조회하는 동안 다른 PC가 보관(행 삭제)하면 행 번호가 밀린다. 쓰기 직전에
+# 등기번호로 행을 다시 맞추므로 다른 송장의 행에 상태·완료=Y를 쓰지 않는다.
+spreadsheet = _FakeSpreadsheet()
+hot = _FakeWorksheet(spreadsheet, "송장추적", [list(TRACKING_SHEET_HEADERS)])
+spreadsheet.sheets.append(hot)
+hot.values.extend([
+    _row("C1", "Y", "2026.06.01 10:00"), _row("C2", "N", ""), _row("C3", "Y", "2026.06.02 10:00"),
+    _row("C4", "N", ""), _row("C5", "N", ""),
+])
+values = hot.get_all_values()
+active = [(ridx, row[0], row) for ridx, row in enumerate(values[1:], start=2) if row[7] != "Y"]
+done = {"C2": "배달준비", "C4": "배달완료", "C5": "발송"}
+
+
+def _summarize_while_archiving(_regkey, regino):
+    if regino == "C2":
+        snapshot = hot.get_all_values()
+        archive_tracking_rows(hot, snapshot, select_tracking_archive_rows(snapshot[1:], now_dt, 30),
+                              TRACKING_SHEET_HEADERS)
+    return {"ok": True, "complete": regino == "C4", "status": done[regino], "where": "서울",
+            "time": "2026.08.13 11:00"}
+
+
+updates, _counts = refresh_tracking_rows(
+    "KEY", active, _summarize_while_archiving, now_dt, concurrency=1,
+    governor=new_kpost_rate_governor(TokenBucket(10_000, capacity=10), base_backoff=0.0))
+assert [row[0] for row in hot.values[1:]] == ["C2", "C4", "C5"]
+assert batch_update_tracking_rows(hot, updates, {ridx: regino for ridx, regino, _row in active}) == 0
+assert {row[0]: (row[6], row[7]) for row in hot.values[1:]} == {
+    "C2": ("배달준비", "N"), "C4": ("배달완료", "Y"), "C5": ("발송", "N")}
+# 그 사이 보관돼 시트에 없는 등기번호의 갱신은 버린다.
+before = hot.get_all_values()
+assert batch_update_tracking_rows(hot, [{"range": "G2:H3", "values": [["x", "Y"], ["y", "Y"]]}],
+                                  {2: "C1", 3: "C3"}) == 2
+assert hot.get_all_values() == before
+
+# 단건 새로고침: 방금 A열로 확인한 행이면 쓰기 전에 다시 읽지 않는다.
+reads = []
+original_batch_get = hot.batch_get
+hot.batch_get = lambda ranges: reads.append(ranges) or original_batch_get(ranges)
+ridx = find_tracking_rows(hot, ["C5"])["C5"]
+assert (ridx, len(reads)) == (4, 1)
+assert batch_update_tracking_rows(hot, [{"range": f"G{ridx}", "values": [["배달준비"]]}], {ridx: "C5"}) == 0
+assert len(reads) == 1 and hot.values[3][6] == "배달준비"
+# 같은 등기번호가 두 행에 있으면 읽은 행이 그대로일 때만 쓰고, 밀린 행은 어느 쪽인지 모르니 버린다.
+hot.values.append(_row("C4", "N", ""))
+assert batch_update_tracking_rows(hot, [{"range": "G3", "values": [["도착"]]},
+                                        {"range": "G6", "values": [["발송"]]}], {3: "C4", 6: "C4"}) == 1
+assert len(reads) == 2
+assert [row[6] for row in hot.values[1:]] == ["배달준비", "도착", "배달준비", ""]
@@ -0,0 +1,124 @@
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+from tracking.history import TrackingEventStore
+from tracking.throttle import TokenBucket
+from tracking.workers import (
+    _changed_cell_updates,
+    _coalesce_row_updates,
+    _with_checked_at,
+    new_kpost_rate_governor,
+    refresh_tracking_rows,
+)
+
+
+def _event(date, time, where, status, reason=""):
+    return {"date": date, "time": time, "where": where, "status": status, "reason": reason}
+
+
+with tempfile.TemporaryDirectory() as directory:
+    store = TrackingEventStore(Path(directory) / "history.sqlite3")
+    first = [
+        _event("2026.08.12", "18:40", "서울강남우체국", "접수"),
+        _event("2026.08.12", "23:05", "동서울우편집중국", "발송"),
+    ]
+    assert store.record("R1", first, datetime(2026, 8, 13, 9)) == 2
+    # 같은 이벤트는 다시 쌓지 않고 새 이벤트만 추가한다.
+    second = [*first, _event("2026.08.13", "15:05", "부산우편집중국", "도착")]
+    assert store.record("R1", second, datetime(2026, 8, 13, 16)) == 1
+    assert store.record("R1", second, datetime(2026, 8, 13, 18)) == 0
+    assert [event["where"] for event in store.events("R1")] == [
+        "서울강남우체국", "동서울우편집중국", "부산우편집중국"]
+    assert store.last_checked(["R1", "R2", ""]) == {"R1": datetime(2026, 8, 13, 18)}
+    assert store.record("", first, datetime(2026, 8, 13)) == 0
+
+    store.record("R2", [
+        _event("2026.08.13", "01:00", "동서울우편집중국", "발송"),
+        _event("2026.08.13", "05:00", "대전교환센터", "도착"),
+        _event("2026.08.13", "06:00", "대전우체국", "배달준비"),
+    ], datetime(2026, 8, 13, 7))
+    stats = store.dwell_hours()
+    assert list(stats["where"]) == ["동서울우편집중국", "대전교환센터"]
+    hub = stats.iloc[0]
+    assert hub["count"] == 2 and hub["mean_hours"] == 10.0 and hub["max_hours"] == 16.0
+    everywhere = store.dwell_hours(hubs_only=False)
+    assert set(everywhere["where"]) == {"서울강남우체국", "동서울우편집중국", "대전교환센터"}
+    assert store.dwell_hours(since=datetime(2026, 8, 13)).iloc[0]["where"] == "동서울우편집중국"
+    assert list(store.dwell_hours(since=datetime(2026, 8, 14)).columns) == [
+        "where", "count", "mean_hours", "median_hours", "max_hours"]
+
+    # 로컬 조회 시각이 더 최근이면 주기 계산용 행의 J만 바꾼다.
+    row = [""] * 13
+    row[9] = "2026-08-13 09:00:00"
+    assert _with_checked_at(row, None) is row
+    assert _with_checked_at(row, datetime(2026, 8, 13, 8)) is row
+    assert _with_checked_at(row, datetime(2026, 8, 13, 10))[9] == "2026-08-13 10:00:00"
+    assert row[9] == "2026-08-13 09:00:00"
+
+    # 시트 값이 그대로인 행은 쓰지 않는다. J가 오래됐거나 이력이 없으면 J만 쓴다.
+    now_dt = datetime(2026, 8, 13, 12)
+    now = "2026-08-13 12:00:00"
+    same = ["R3", "2026-08-13 09:00:00", "", "", "", "우체국",
+            "도착", "N", "부산우편집중국", "2026-08-13 10:00:00", "", "2026.08.13 03:12", "추적중"]
+    updates = [{"range": "G5:M5", "values": [[
+        "도착", "N", "부산우편집중국", now, "", "2026.08.13 03:12", "추적중"]]}]
+    assert _changed_cell_updates(5, same, updates, now_dt, stamp_checked=False) == ([], False)
+    assert _changed_cell_updates(5, same, updates, now_dt) == (
+        [{"range": "J5", "values": [[now]]}], False)
+    stale = list(same)
+    stale[9] = "2026-08-13 05:00:00"
+    assert _changed_cell_updates(5, stale, updates, now_dt, stamp_checked=False) == (
+        [{"range": "J5", "values": [[now]]}], False)
+    # 바뀐 셀 사이가 두 칸 이하면 범위를 나누지 않고 이어 쓴다.
+    moved = list(same)
+    moved[8] = "동서울우편집중국"
+    assert _changed_cell_updates(5, moved, updates, now_dt, stamp_checked=False) == (
+        [{"range": "I5:J5", "values": [["부산우편집중국", now]]}], True)
+    moved[12] = "폐기후보"
+    assert _changed_cell_updates(5, moved, updates, now_dt, stamp_checked=False)[0] == [
+        {"range": "I5:M5", "values": [["부산우편집중국", now, "", "2026.08.13 03:12", "추적중"]]}]
+    wide = [{"range": "C5:M5", "values": [["", "", "", "우체국", *updates[0]["values"][0]]]}]
+    moved[2] = "스토어"
+    assert [u["range"] for u in _changed_cell_updates(5, moved, wide, now_dt)[0]] == ["C5", "I5:M5"]
+    # 실패 payload(J:K + M)처럼 떨어진 범위는 payload에 없는 칸을 채워 잇지 않는다.
+    failed = [{"range": "J5:K5", "values": [[now, "timeout"]]}, {"range": "M5", "values": [["x"]]}]
+    assert [u["range"] for u in _changed_cell_updates(5, same, failed, now_dt)[0]] == ["J5:K5", "M5"]
+
+    assert _coalesce_row_updates([
+        {"range": "G2:J2", "values": [["a", "b", "c", "d"]]},
+        {"range": "L2", "values": [["e"]]},
+        {"range": "G3:J3", "values": [["f", "g", "h", "i"]]},
+        {"range": "J4", "values": [["j"]]},
+        {"range": "J5", "values": [["k"]]},
+        {"range": "J7", "values": [["l"]]},
+    ]) == [
+        {"range": "G2:J3", "values": [["a", "b", "c", "d"], ["f", "g", "h", "i"]]},
+        {"range": "L2", "values": [["e"]]},
+        {"range": "J4:J5", "values": [["j"], ["k"]]},
+        {"range": "J7", "values": [["l"]]},
+    ]
+
+    summaries = {
+        "R3": {"ok": True, "complete": False, "status": "도착", "where": "부산우편집중국",
+               "time": "2026.08.13 03:12",
+               "events": [_event("2026.08.13", "03:12", "부산우편집중국", "도착")]},
+        "R4": {"ok": True, "complete": True, "status": "배달완료", "where": "부산",
+               "time": "2026.08.13 11:00",
+               "events": [_event("2026.08.13", "11:00", "부산", "배달완료")]},
+        "R5": {"ok": False, "error_code": "HTTP", "error": "timeout"},
+    }
+    pending = list(same)
+    pending[0] = "R4"
+    failing = list(same)
+    failing[0] = "R5"
+    active = [(5, "R3", same), (6, "R4", pending), (7, "R5", failing)]
+    batch, counts = refresh_tracking_rows(
+        "KEY", active, lambda _key, regino: dict(summaries[regino]), now_dt,
+        concurrency=1, governor=new_kpost_rate_governor(TokenBucket(10_000, capacity=10)),
+        history=store,
+    )
+    assert [update["range"] for update in batch] == ["G6:L6", "J7:K7"]
+    assert counts["unchanged"] == 1 and counts["progress"] == 1 and counts["complete"] == 1
+    assert store.last_checked(["R3", "R4", "R5"]) == {"R3": now_dt, "R4": now_dt}
+    assert store.events("R4")[0]["status"] == "배달완료"
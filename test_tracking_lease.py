@@ -0,0 +1,130 @@
+import time
+from datetime import datetime, timedelta
+
+from tracking.repository import LEASE_KEY_PREFIX, claim_lease, read_lease, write_config_values
+
+
+class _ConfigSheet:
+    """설정 탭 키/값 읽기·쓰기만 흉내 내는 메모리 시트."""
+
+    def __init__(self):
+        self.rows = [["키", "값"]]
+        # stale_reads번의 읽기는 stale_rows를 돌려준다(다른 PC가 쓰기 전에 읽은 상태).
+        self.stale_reads = 0
+        self.stale_rows = []
+
+    def get_all_values(self):
+        if self.stale_reads:
+            self.stale_reads -= 1
+            return [list(row) for row in self.stale_rows]
+        return [list(row) for row in self.rows]
+
+    def append_rows(self, rows, value_input_option):
+        self.rows.extend(list(row) for row in rows)
+
+    def batch_update(self, updates, value_input_option):
+        for update in updates:
+            self.rows[int(update["range"][1:]) - 1][1] = update["values"][0][0]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = datetime(2026, 8, 13, 12)
+
+    def __call__(self):
+        return self.now
+
+
+clock = _Clock()
+sheet = _ConfigSheet()
+
+
+def _claim(holder, settle_sec=0, **options):
+    return claim_lease(sheet, "job", ttl_sec=180, holder=holder, settle_sec=settle_sec,
+                       clock=clock, **options)
+
+
+# 빈 lease는 바로 잡고, 만료 전에는 다른 보유자가 가져가지 못한다.
+first = _claim("pc1/10")
+assert first is not None and first.token.startswith("pc1/10#")
+assert read_lease(sheet, "job") == (first.token, datetime(2026, 8, 13, 12, 3))
+assert _claim("pc2/20") is None
+# 같은 보유자는 자기 lease를 다시 잡을 수 있다(다음 주기 타이머가 조금 일찍 울린 경우).
+again = _claim("pc1/10")
+assert again is not None and again.token != first.token
+assert not first.held() and again.held()
+
+# heartbeat로 만료를 늦추고, 만료가 지나면 다른 PC가 이어받는다.
+clock.now += timedelta(seconds=120)
+assert again.heartbeat()
+assert read_lease(sheet, "job")[1] == datetime(2026, 8, 13, 12, 5)
+clock.now += timedelta(seconds=179)
+assert _claim("pc2/20") is None
+clock.now += timedelta(seconds=2)
+second = _claim("pc2/20")
+assert second is not None
+# 빼앗긴 쪽의 heartbeat·release는 시트를 건드리지 않는다.
+assert not again.heartbeat() and again.lost
+again.release()
+assert read_lease(sheet, "job")[0] == second.token
+
+# 끝나고 다음 주기까지 잡아 두면 그때까지 다른 PC는 건너뛴다. 그냥 놓으면 바로 잡힌다.
+second.release(hold_until=clock.now + timedelta(minutes=60))
+assert _claim("pc1/10") is None
+clock.now += timedelta(minutes=60)
+third = _claim("pc1/10")
+third.release()
+assert _claim("pc3/30") is not None
+
+# 거의 동시에 선점하면 나중에 쓴 쪽 값만 남으므로 먼저 쓴 쪽은 다시 읽고 물러난다.
+clock.now += timedelta(hours=1)
+
+
+def _other_pc_writes(_seconds):
+    # 다른 PC도 만료된 값을 읽은 뒤 이쪽보다 조금 늦게 자기 값을 쓴다.
+    write_config_values(sheet, {LEASE_KEY_PREFIX + "job": "pc4/40#abcd|2026-08-13 23:59:59"})
+
+
+assert _claim("pc5/50", settle_sec=2, sleep=_other_pc_writes) is None
+assert read_lease(sheet, "job")[0] == "pc4/40#abcd"
+
+# 깨진 값은 만료된 것으로 본다.
+for row in sheet.rows:
+    if row[0] == LEASE_KEY_PREFIX + "job":
+        row[1] = "garbage"
+assert read_lease(sheet, "job") == ("", None)
+assert _claim("pc6/60") is not None
+
+# keep_alive는 블록이 도는 동안 heartbeat를 보낸다.
+lease = claim_lease(sheet, "beat", holder="pc1/10", settle_sec=0)
+before = read_lease(sheet, "beat")[1]
+with lease.keep_alive(interval_sec=0.01, ttl_sec=3600):
+    deadline = time.monotonic() + 2
+    while read_lease(sheet, "beat")[1] == before and time.monotonic() < deadline:
+        time.sleep(0.01)
+assert read_lease(sheet, "beat")[1] > before
+
+# 두 PC가 아직 없는 lease 키를 동시에 처음 잡으면 키 행이 두 개 생긴다. 마지막 행 값만
+# 읽히므로 쓰기도 마지막 행에 해야 이후 선점·heartbeat가 자기 값을 다시 읽을 수 있다.
+sheet = _ConfigSheet()
+
+
+def _racing_pc_claims(_seconds):
+    # 다른 PC는 이쪽이 행을 추가하기 전에 읽은 상태로 선점한다(읽기 두 번: read_lease, 쓰기 전 조회).
+    sheet.stale_reads = 2
+    sheet.stale_rows = [["키", "값"]]
+    racing.append(_claim("pc8/80"))
+
+
+racing = []
+assert _claim("pc7/70", settle_sec=2, sleep=_racing_pc_claims) is None
+winner, = racing
+assert winner is not None
+assert [row[0] for row in sheet.rows].count(LEASE_KEY_PREFIX + "job") == 2
+assert read_lease(sheet, "job")[0] == winner.token
+assert winner.heartbeat() and winner.held()
+clock.now += timedelta(hours=1)
+retry = _claim("pc7/70")
+assert retry is not None and retry.held()
+assert read_lease(sheet, "job")[0] == retry.token
+assert not winner.heartbeat()
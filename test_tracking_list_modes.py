@@ -0,0 +1,86 @@
+import random
+from datetime import datetime, timedelta
+
+from tracking.service import (
+    TRACKING_MANAGEMENT_EXCLUDED,
+    parse_tracking_list_timestamp,
+    select_tracking_list_row_numbers,
+    tracking_list_mode_masks,
+    tracking_rows_mode_masks,
+)
+
+
+def _reference_row_numbers(registrations, completions, events, managements, mode, now_dt,
+                           completed_lookback_days=14):
+    """행마다 문자열을 만들고 시각을 파싱하던 이전 구현."""
+    today = now_dt.date()
+    cutoff = today - timedelta(days=max(0, completed_lookback_days - 1))
+    count = max(len(registrations), len(completions), len(events), len(managements))
+
+    def cell(values, index):
+        return str(values[index] if index < len(values) else "").strip()
+
+    selected = []
+    for index in range(count):
+        registered = cell(registrations, index)
+        complete = cell(completions, index).upper() == "Y"
+        management = cell(managements, index)
+        if mode == "오늘":
+            include = registered.startswith(today.strftime("%Y-%m-%d"))
+        elif mode == "완료":
+            finished_at = (parse_tracking_list_timestamp(cell(events, index))
+                           or parse_tracking_list_timestamp(registered))
+            include = complete and finished_at is not None and finished_at.date() >= cutoff
+        elif mode == "추적 중지":
+            include = management == "수동 중지"
+        elif mode == "폐기 후보":
+            include = management == "폐기후보"
+        elif mode == "폐기":
+            include = management == "폐기(미발송)"
+        else:
+            include = not complete and management not in TRACKING_MANAGEMENT_EXCLUDED
+        if include:
+            selected.append(index + 2)
+    return selected
+
+
+rng = random.Random(20260813)
+now_dt = datetime(2026, 8, 13, 12, 30)
+
+
+def _stamp():
+    dt = now_dt - timedelta(hours=rng.uniform(-24, 24 * 30))
+    return rng.choice((
+        dt.strftime("%Y-%m-%d %H:%M:%S"), dt.strftime("%Y.%m.%d %H:%M"),
+        dt.strftime("%Y-%m-%d %H:%M"), " " + dt.strftime("%Y.%m.%d %H:%M:%S"), "", "미상",
+    ))
+
+
+count = 4000
+registrations = [_stamp() for _ in range(count)]
+completions = [rng.choice(("Y", "N", "", " y ")) for _ in range(count)]
+events = [_stamp() for _ in range(count - 7)]  # 뒤쪽 빈 셀이 잘린 열
+managements = [rng.choice(("", "추적중", "폐기후보", "폐기(미발송)", "수동 중지"))
+               for _ in range(count - 3)]
+
+masks = tracking_list_mode_masks(registrations, completions, events, managements, now_dt)
+assert set(masks) == {"배송중", "오늘", "추적 중지", "폐기 후보", "폐기", "완료", "전체"}
+assert all(len(mask) == count for mask in masks.values())
+assert masks["전체"].all()
+for mode in ("배송중", "오늘", "추적 중지", "폐기 후보", "폐기", "완료"):
+    expected = _reference_row_numbers(
+        registrations, completions, events, managements, mode, now_dt)
+    assert expected, mode
+    assert select_tracking_list_row_numbers(
+        registrations, completions, events, managements, mode, now_dt) == expected, mode
+assert select_tracking_list_row_numbers([], [], [], [], "완료", now_dt) == []
+assert select_tracking_list_row_numbers(
+    registrations, completions, events, managements, "전체", now_dt) == list(range(2, count + 2))
+
+rows = [["R", registrations[i], "", "", "", "", "", completions[i], "", "", "",
+         events[i] if i < len(events) else ""] for i in range(count)]
+for i, management in enumerate(managements):
+    rows[i].append(management)
+row_masks = tracking_rows_mode_masks(rows, now_dt)
+for mode, mask in masks.items():
+    assert (row_masks[mode] == mask).all(), mode
@@ -12,7 +12,7 @@ from PySide6.QtWidgets import (
     QAbstractItemView,
     QComboBox,
     QLineEdit,
-    QTableWidget,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
@@ -31,6 +31,7 @@ from tracking.service import (
 )
 from tracking.repository import (
     TRACKING_DETAIL_READ_BATCH_SIZE,
+    TrackingRowIndex,
     read_tracking_list_metadata,
     read_tracking_rows,
     update_tracking_management,
@@ -41,8 +42,6 @@ import tracking.workers as tracking_workers
 from tracking.workers import (
     DigestSendThread,
     SlackSendThread,
-    TrackingManagementUpdateThread,
-    TrackingNotesUpdateThread,
     TrackingKeyValidateThread,
     TrackingRefreshThread,
 )
@@ -111,7 +110,11 @@ class _TrackingWorksheetStub:
         self.batch_calls = []
 
     def get_all_values(self):
-        return [["등기번호"], ["123"]]
+        raise AssertionError("단건 갱신은 시트 전체를 읽지 않는다.")
+
+    def batch_get(self, ranges):
+        assert ranges == ["A2:A"]
+        return [[["123"]]]
 
     def batch_update(self, updates, value_input_option):
         assert value_input_option == "RAW"
@@ -127,6 +130,26 @@ assert update_tracking_notes(worksheet, {"123": "테스트 메모"}) == 1
 assert worksheet.batch_calls[-1] == [{"range": "K2", "values": [["테스트 메모"]]}]
 
 
+class _TrackingColumnStub:
+    def __init__(self, reginos):
+        self.column = [[regino] for regino in reginos]
+        self.reads = 0
+
+    def batch_get(self, ranges):
+        self.reads += 1
+        return [self.column]
+
+
+row_index = TrackingRowIndex()
+column_ws = _TrackingColumnStub(["111", "222", "333"])
+assert row_index.lookup(column_ws, ["333", "999"]) == {"333": 4}
+column_ws.column.pop(0)  # 행 수가 바뀌면 다시 만든다.
+assert row_index.lookup(column_ws, ["333"]) == {"333": 3}
+column_ws.column[0], column_ws.column[1] = column_ws.column[1], column_ws.column[0]
+assert row_index.lookup(column_ws, ["333"]) == {"333": 2}  # 같은 행 수라도 정렬은 감지
+assert column_ws.reads == 3
+
+
 class _TrackingListWorksheetStub:
     def __init__(self):
         self.ranges = []
@@ -191,8 +214,6 @@ finally:
 assert requested_modes == ["전체"]
 
 assert hasattr(TrackingRefreshThread, "progress")
-assert hasattr(TrackingManagementUpdateThread, "result_ready")
-assert hasattr(TrackingNotesUpdateThread, "result_ready")
 assert hasattr(SlackSendThread, "result_ready")
 assert hasattr(DigestSendThread, "result_ready")
 assert hasattr(TrackingKeyValidateThread, "result_ready")
@@ -217,7 +238,6 @@ class _TrackingControllerHost(QObject):
 runtime_host = _TrackingControllerHost()
 runtime_controller = TrackingController(runtime_host)
 runtime_controller.initialize_runtime()
-assert runtime_host._tracking_push_timer.isSingleShot()
 assert runtime_host._tracking_list_timer.interval() == 120000
 assert runtime_host._tracking_list_timer.isActive()
 assert runtime_host._tracking_auto_refresh_timer is not None
@@ -237,7 +257,7 @@ assert admin_host._dlg_auto_refresh is not None
 
 
 loading_host = _TrackingControllerHost()
-loading_host.ui = SimpleNamespace(tableWidget_tracking=QTableWidget())
+loading_host.ui = SimpleNamespace(tableWidget_tracking=QTableView())
 loading_host.ui.tableWidget_tracking.resize(400, 200)
 loading_controller = TrackingController(loading_host)
 loading_controller.bind_ui()
@@ -281,5 +301,5 @@ assert [combo.itemText(i) for i in range(combo.count())] == [
 search = ui.findChild(QLineEdit, "lineEdit_tracking_recipient_search")
 assert search.placeholderText() == "수취인명 검색"
 assert search.isClearButtonEnabled()
-table = ui.findChild(QTableWidget, "tableWidget_tracking")
+table = ui.findChild(QTableView, "tableWidget_tracking")
 assert table.editTriggers() == QAbstractItemView.EditTrigger.DoubleClicked
@@ -0,0 +1,129 @@
+import tempfile
+from pathlib import Path
+
+from tracking import repository
+from tracking.mirror import TRACKING_MIRROR_FULL_SYNC_SEC, TrackingMirror, parse_row_range
+
+
+HEADERS = [
+    "등기번호", "등록일시", "스토어", "주문번호", "수취인명",
+    "택배사코드", "배송상태", "완료여부", "마지막위치", "최근조회시각", "비고",
+    "최근이벤트시각", "관리상태", "수정시각",
+]
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class _Worksheet:
+    """A1 범위 batch_get/batch_update만 흉내 내는 메모리 시트."""
+
+    spreadsheet_id = "sheet"
+    id = 7
+
+    def __init__(self, rows):
+        self.rows = [list(HEADERS), *[list(row) for row in rows]]
+        self.full_reads = 0
+        self.ranges = []
+
+    def get_all_values(self):
+        self.full_reads += 1
+        return [list(row) for row in self.rows]
+
+    def _cell(self, row, col):
+        cells = self.rows[row - 1] if row - 1 < len(self.rows) else []
+        return cells[col] if col < len(cells) else ""
+
+    def batch_get(self, ranges):
+        self.ranges.append(list(ranges))
+        out = []
+        for a1 in ranges:
+            if a1.endswith(":A") or a1.endswith(":N"):
+                col = 0 if a1.startswith("A") else 13
+                out.append([[self._cell(row, col)] for row in range(2, len(self.rows) + 1)])
+                continue
+            row, start, end = parse_row_range(a1)
+            out.append([[self._cell(row, col) for col in range(start, end + 1)]])
+        return out
+
+    def batch_update(self, updates, value_input_option="RAW"):
+        for update in updates:
+            row, start, _end = parse_row_range(update["range"])
+            for offset, values in enumerate(update["values"]):
+                cells = self.rows[row + offset - 1]
+                cells.extend([""] * (start + len(values) - len(cells)))
+                cells[start:start + len(values)] = values
+
+
+def _row(regino, stamp):
+    return [regino, "2026-08-13 09:00:00", "", "", "", "우체국", "접수", "N",
+            "", "", "", "", "추적중", stamp]
+
+
+with tempfile.TemporaryDirectory() as tmp:
+    clock = _Clock()
+    mirror = TrackingMirror(Path(tmp) / "mirror.sqlite3", clock=clock)
+    sheet = _Worksheet([_row(f"R{index}", "v1") for index in range(5)])
+
+    # 첫 동기화는 전체 읽기 1회.
+    assert mirror.sync(sheet)["full"] is True
+    assert mirror.values() == sheet.rows
+
+    # 다른 PC가 한 행을 고치고 한 행을 추가하면 두 행만 다시 읽는다.
+    sheet.rows[2][6] = "배달완료"
+    sheet.rows[2][13] = "v2"
+    sheet.rows.append(_row("R5", "v1"))
+    sheet.ranges.clear()
+    result = mirror.sync(sheet)
+    assert result == {"pulled": 2, "removed": 0, "total": 6, "full": False}
+    assert sheet.full_reads == 1
+    assert sheet.ranges[-1] == ["A3:N3", "A7:N7"]
+    assert mirror.values() == sheet.rows
+    assert mirror.lookup("R5")[0] == 7
+
+    # 아래쪽 행이 지워지면 사본에서도 지운다.
+    del sheet.rows[-1]
+    assert mirror.sync(sheet)["removed"] == 1
+    assert mirror.lookup("R5") is None
+
+    # 일정 시간이 지나면 손으로 고친 셀까지 맞추려고 전체를 다시 읽는다.
+    clock.now += TRACKING_MIRROR_FULL_SYNC_SEC
+    assert mirror.sync(sheet)["full"] is True
+
+    # repository 쓰기는 수정시각을 덧붙여 Sheet와 사본에 함께 반영한다.
+    repository.attach_tracking_mirror(mirror)
+    try:
+        result = repository.update_tracking_management(sheet, ["R1"], "수동 중지")
+        assert result == {"updated": 1, "missing": 0}
+        stamp = sheet.rows[2][13]
+        assert sheet.rows[2][12] == "수동 중지" and stamp not in ("", "v1")
+        assert mirror.lookup("R1") == (3, sheet.rows[2])
+        repository.update_tracking_cell(sheet, 4, "K", "메모")
+        assert mirror.values() == sheet.rows
+        # 여러 행짜리 범위(연속 행 J열 묶음)도 행마다 수정시각을 붙인다.
+        repository.batch_update_tracking(
+            sheet, [{"range": "J4:J5", "values": [["2026-08-13 12:00:00"], ["2026-08-13 12:00:00"]]}])
+        assert sheet.rows[3][9] == sheet.rows[4][9] == "2026-08-13 12:00:00"
+        assert sheet.rows[3][13] == sheet.rows[4][13] != "v1"
+        assert mirror.values() == sheet.rows
+        # 자기 쓰기는 이미 사본에 있으므로 다음 동기화에서 다시 읽지 않는다.
+        sheet.ranges.clear()
+        assert mirror.sync(sheet)["pulled"] == 0
+        assert repository.read_tracking_values(sheet) == sheet.rows
+        # 방금 맞춘 사본과 행 번호가 같으면 쓰기 직전에 Sheet를 다시 읽지 않는다. 오래됐으면 다시 맞춘다.
+        assert mirror.row_numbers(["R1", "R9"]) == {"R1": [3]}
+        sheet.ranges.clear()
+        assert repository.batch_update_tracking_rows(
+            sheet, [{"range": "K3", "values": [["메모2"]]}], {3: "R1"}) == 0
+        assert sheet.ranges == [] and sheet.rows[2][10] == "메모2"
+        clock.now += repository.TRACKING_ROW_INDEX_FRESH_SEC + 1
+        assert repository.batch_update_tracking_rows(
+            sheet, [{"range": "K3", "values": [["메모3"]]}], {3: "R1"}) == 0
+        assert sheet.ranges and sheet.rows[2][10] == "메모3"
+    finally:
+        repository.attach_tracking_mirror(None)
@@ -0,0 +1,261 @@
+import threading
+import time
+from datetime import datetime
+
+import kpost_tracker
+from tracking.service import (
+    is_tracking_row_due,
+    order_tracking_refresh_queue,
+    read_stale_thresholds,
+    tracking_next_due,
+)
+from tracking.throttle import AdaptiveRateGovernor, TokenBucket
+import tracking.workers as tracking_workers
+from tracking.workers import new_kpost_rate_governor, refresh_tracking_rows
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+clock = _Clock()
+bucket = TokenBucket(2.0, capacity=2, clock=clock)
+assert bucket.try_acquire() == 0.0
+assert bucket.try_acquire() == 0.0
+assert bucket.try_acquire() == 0.5
+clock.now = 0.5
+assert bucket.try_acquire() == 0.0
+stopped = threading.Event()
+stopped.set()
+assert bucket.acquire(stopped) is False
+
+governed = TokenBucket(10.0, clock=clock)
+governor = AdaptiveRateGovernor(
+    governed, max_rate=10.0, min_rate=1.0, clock=clock, jitter=lambda: 0.5,
+)
+governor.on_overload()
+assert governed.rate == 5.0
+for _ in range(3):
+    governor.on_overload()
+assert governed.rate == 1.0  # min_rate 아래로 내려가지 않는다
+governor.on_success()
+assert governed.rate == 1.5
+assert governor.backoff_delay(0) == 0.75
+assert governor.backoff_delay(10) == 15.0  # max_backoff 20초 상한
+stats = governor.stats()
+assert stats["overloads"] == 4 and stats["retries"] == 2 and stats["lowest_rate"] == 1.0
+assert kpost_tracker.is_overload({"error_code": "err-131"})
+assert kpost_tracker.is_overload({"error_code": kpost_tracker.TIMEOUT_ERROR_CODE})
+assert not kpost_tracker.is_overload({"error_code": "ERR-001"})
+
+
+def _fast_governor():
+    return new_kpost_rate_governor(TokenBucket(10_000, capacity=10), base_backoff=0.0)
+
+
+def _row(regino, status="접수"):
+    row = [""] * 13
+    row[0] = regino
+    row[1] = "2026-08-13 09:00:00"
+    row[6] = status
+    row[12] = "추적중"
+    return row
+
+
+now_dt = datetime(2026, 8, 13, 12)
+active = [(index + 2, f"R{index}", _row(f"R{index}")) for index in range(6)]
+summaries = {
+    "R0": {"ok": True, "complete": True, "status": "배달완료", "where": "서울", "time": "2026.08.13 11:00"},
+    "R1": {"ok": True, "complete": False, "status": "배달준비", "where": "부산", "time": "2026.08.13 10:00"},
+    "R2": {"ok": False, "error_code": "ERR-001", "error": "없음"},
+    "R3": {"ok": False, "error_code": "HTTP", "error": "timeout"},
+    "R4": {"ok": True, "complete": False, "status": "발송", "where": "대전", "time": "2026.08.13 09:30"},
+    "R5": {"ok": True, "complete": True, "status": "배달완료", "where": "광주", "time": "2026.08.13 11:30"},
+}
+calls = []
+progress = []
+
+
+def _summarize(regkey, regino):
+    assert regkey == "KEY"
+    calls.append(regino)
+    time.sleep(0.001 * (6 - int(regino[1:])))  # 역순 완료를 유도해도 payload는 시트 순서
+    return dict(summaries[regino])
+
+
+updates, counts = refresh_tracking_rows(
+    "KEY", active, _summarize, now_dt,
+    progress_cb=lambda done, total: progress.append((done, total)),
+    concurrency=4, governor=_fast_governor(),
+)
+assert sorted(calls) == [f"R{index}" for index in range(6)]
+assert progress[-1] == (6, 6) and len(progress) == 6
+rate = counts.pop("rate")
+assert rate["calls"] == 6 and rate["overloads"] == 0
+assert counts == {"complete": 2, "progress": 3, "failed": 1, "checked": 6, "aborted": False,
+                  "deferred": 0, "unchanged": 0}
+# 기존 행과 다른 셀만 쓰고(K·M은 그대로), 같은 열 범위의 연속 행은 한 범위로 합친다.
+assert [update["range"] for update in updates] == ["G2:L3", "G4:J4", "J5:K5", "G6:L7"]
+assert updates[0]["values"] == [
+    ["배달완료", "Y", "서울", "2026-08-13 12:00:00", "", "2026.08.13 11:00"],
+    ["배달준비", "N", "부산", "2026-08-13 12:00:00", "", "2026.08.13 10:00"],
+]
+assert updates[1]["values"] == [["추적정보 없음", "N", "", "2026-08-13 12:00:00"]]
+assert updates[2]["values"] == [["2026-08-13 12:00:00", "timeout"]]
+
+# 일시적인 ERR-131은 속도를 낮춰 재시도하고 나머지 조회를 계속한다.
+overloaded = ["ERR-131", "ERR-131"]
+
+
+def _summarize_flaky(regkey, regino):
+    if regino == "R2" and overloaded:
+        calls.append(regino)
+        return {"ok": False, "error_code": overloaded.pop(), "error": "부하"}
+    return _summarize(regkey, regino)
+
+
+calls.clear()
+updates, counts = refresh_tracking_rows(
+    "KEY", active, _summarize_flaky, now_dt, concurrency=1, governor=_fast_governor(),
+)
+assert calls == ["R0", "R1", "R2", "R2", "R2", "R3", "R4", "R5"]
+rate = counts.pop("rate")
+assert rate["overloads"] == 2 and rate["retries"] == 2 and rate["calls"] == 8
+assert counts == {"complete": 2, "progress": 3, "failed": 1, "checked": 6, "aborted": False,
+                  "deferred": 0, "unchanged": 0}
+
+# 재시도 뒤에도 ERR-131이면 남은 조회를 시작하지 않고 받은 결과까지만 반영한다.
+summaries["R2"] = {"ok": False, "error_code": "ERR-131", "error": "부하"}
+calls.clear()
+updates, counts = refresh_tracking_rows(
+    "KEY", active, _summarize, now_dt, concurrency=1, governor=_fast_governor(),
+    max_retries=1,
+)
+assert calls == ["R0", "R1", "R2", "R2"]
+counts.pop("rate")
+assert counts == {"complete": 1, "progress": 1, "failed": 0, "checked": 3, "aborted": True,
+                  "deferred": 0, "unchanged": 0}
+assert updates[-1] == {
+    "range": "J4:K4",
+    "values": [["2026-08-13 12:00:00", "우체국 시스템 부하로 조회 중단(ERR-131)"]],
+}
+
+# 우선순위: 정체 기준을 넘긴 위험 건 → 위험 분류 → 오래 조회하지 않은 건 → 무이동이 긴 건.
+summaries["R2"] = {"ok": False, "error_code": "ERR-001", "error": "없음"}
+
+
+def _queued(regino, status, where, event, checked):
+    row = _row(regino, status)
+    row[8], row[11], row[9] = where, event, checked
+    return (int(regino[1:]) + 2, regino, row)
+
+
+queue = [
+    _queued("R0", "배달준비", "서울", "2026-08-13 08:00:00", "2026-08-13 11:00:00"),
+    _queued("R1", "발송", "서울", "2026-08-12 15:00:00", "2026-08-13 11:00:00"),
+    _queued("R2", "발송", "서울", "2026-08-12 15:00:00", ""),
+    _queued("R3", "도착", "동서울우편집중국", "2026-08-12 15:00:00", "2026-08-13 11:00:00"),
+    _queued("R4", "도착", "동서울우편집중국", "2026-08-10 09:00:00", "2026-08-13 11:00:00"),
+    _queued("R5", "운송장출력", "", "2026-08-11 09:00:00", "2026-08-13 11:00:00"),
+]
+thresholds, remote_bonus = read_stale_thresholds({"stale_hub_hours": "abc", "stale_pickup_hours": "30"})
+assert thresholds == {"허브정체": 12, "수거누락": 30, "이동정체": 48} and remote_bonus == 24
+ordered = order_tracking_refresh_queue(queue, now_dt, thresholds, remote_bonus)
+assert [regino for _ridx, regino, _row in ordered] == ["R4", "R3", "R5", "R2", "R1", "R0"]
+
+# 호출 한도를 넘긴 나머지는 조회하지 않고 deferred로 남긴다(payload는 시트 순서).
+calls.clear()
+updates, counts = refresh_tracking_rows(
+    "KEY", ordered, _summarize, now_dt, concurrency=1, governor=_fast_governor(),
+    request_budget=3,
+)
+assert calls == ["R4", "R3", "R5"]
+counts.pop("rate")
+assert counts["checked"] == 3 and counts["deferred"] == 3 and not counts["aborted"]
+assert [update["range"] for update in updates] == ["J5:K5", "G6:L7"]
+calls.clear()
+_, counts = refresh_tracking_rows(
+    "KEY", ordered, _summarize, now_dt, concurrency=2, governor=_fast_governor(),
+    time_budget_sec=1e-9,
+)
+assert calls == [] and counts["deferred"] == 6
+
+# 자동 새로고침 lease를 잃으면(heartbeat가 lost 표시) 새 조회를 시작하지 않는다.
+class _Lease:
+    name = "auto_refresh"
+
+    def __init__(self, lost_after, still_held=True):
+        self.lost = False
+        self.lost_after = lost_after
+        self.still_held = still_held
+
+    def held(self):
+        return self.still_held
+
+
+lease = _Lease(lost_after=2)
+
+
+def _summarize_losing_lease(regkey, regino):
+    result = _summarize(regkey, regino)
+    if len(calls) >= lease.lost_after:
+        lease.lost = True
+    return result
+
+
+calls.clear()
+updates, counts = refresh_tracking_rows(
+    "KEY", active, _summarize_losing_lease, now_dt, concurrency=1, governor=_fast_governor(),
+    should_stop=lambda: lease.lost,
+)
+assert calls == ["R0", "R1"] and counts["checked"] == 2
+assert [update["range"] for update in updates] == ["G2:L3"]
+
+# 조회를 다 마쳐도 쓰기 직전에 lease가 다른 PC로 넘어갔으면 시트에 쓰지 않는다.
+written = []
+patched = {
+    "_standalone_open_tracking_ws": lambda _gc: "ws",
+    "read_tracking_values": lambda _ws: [["등기번호"]] + [row for _ridx, _regino, row in active],
+    "_ensure_tracking_history": lambda: None,
+    "batch_update_tracking_rows": lambda _ws, batch, _rows: written.append(batch),
+    "_record_tracking_rate": lambda *args: None,
+}
+originals = {name: getattr(tracking_workers, name) for name in patched}
+original_summarize = kpost_tracker.summarize_tracking
+for name, value in patched.items():
+    setattr(tracking_workers, name, value)
+kpost_tracker.summarize_tracking = _summarize
+try:
+    calls.clear()
+    lease = _Lease(lost_after=99, still_held=False)
+    result = tracking_workers._refresh_tracking_sheet(
+        None, "KEY", {}, None, None, False, "all", 2, None, None, False, lease=lease)
+    assert len(calls) == 6 and written == []
+    assert result["ok"] and result["lease_lost"] and lease.lost
+    lease = _Lease(lost_after=99)
+    result = tracking_workers._refresh_tracking_sheet(
+        None, "KEY", {}, None, None, False, "all", 2, None, None, False, lease=lease)
+    assert len(written) == 1 and not result["lease_lost"]
+finally:
+    for name, value in originals.items():
+        setattr(tracking_workers, name, value)
+    kpost_tracker.summarize_tracking = original_summarize
+
+# 조회 주기: 배달준비는 20분, 정상 이동은 2시간, 오래 멈춘 건은 1시간, 당일 운송장출력은 수거 시각까지.
+moving = _queued("R1", "발송", "서울", "2026-08-13 09:00:00", "2026-08-13 11:00:00")[2]
+assert tracking_next_due(moving, now_dt) == datetime(2026, 8, 13, 13)
+assert not is_tracking_row_due(moving, now_dt)
+assert is_tracking_row_due(moving, datetime(2026, 8, 13, 12, 56))  # 5분 여유
+out_for_delivery = _queued("R0", "배달준비", "서울", "2026-08-13 08:00:00", "2026-08-13 11:30:00")[2]
+assert tracking_next_due(out_for_delivery, now_dt) == datetime(2026, 8, 13, 11, 50)
+assert is_tracking_row_due(queue[4][2], now_dt)  # 3일째 허브: 11시 조회 → 12시 예정
+assert tracking_next_due(queue[4][2], now_dt) == datetime(2026, 8, 13, 12)
+assert tracking_next_due(queue[2][2], now_dt) is None  # 미조회
+printed = _row("R6", "운송장출력")
+printed[1] = "2026-08-13 10:00:00"
+assert tracking_next_due(printed, now_dt, pickup_hour=18) == datetime(2026, 8, 13, 18)
+assert not is_tracking_row_due(printed, now_dt, pickup_hour=18)
@@ -0,0 +1,94 @@
+import math
+import random
+from datetime import datetime, timedelta
+
+from tracking.service import (
+    STALE_DEFAULTS,
+    business_elapsed_hours,
+    business_elapsed_hours_batch,
+    evaluate_risk,
+    evaluate_tracking_rows_risk,
+    parse_tracking_list_timestamp,
+)
+
+
+def _reference_business_hours(ref_dt, now_dt):
+    """하루씩 주말 구간을 빼던 이전 구현."""
+    if now_dt <= ref_dt:
+        return 0.0
+    weekend = 0.0
+    current = ref_dt
+    while current < now_dt:
+        day_end = datetime(current.year, current.month, current.day) + timedelta(days=1)
+        segment_end = min(day_end, now_dt)
+        if current.weekday() >= 5:
+            weekend += (segment_end - current).total_seconds()
+        current = segment_end
+    return ((now_dt - ref_dt).total_seconds() - weekend) / 3600.0
+
+
+rng = random.Random(20260813)
+base = datetime(2026, 8, 1)
+
+
+def _random_dt():
+    return base + timedelta(
+        days=rng.randint(-400, 60), seconds=rng.randint(0, 86399),
+        microseconds=rng.choice((0, 0, rng.randint(0, 999_999))),
+    )
+
+
+# 성질: 닫힌 식 = 이전 반복 구현 (주말 경계·음수 구간·같은 날 포함)
+pairs = [(_random_dt(), _random_dt()) for _ in range(3000)]
+pairs += [
+    (datetime(2026, 8, 8, 0), datetime(2026, 8, 10, 0)),       # 토 0시 ~ 월 0시
+    (datetime(2026, 8, 7, 23, 59, 59), datetime(2026, 8, 8)),  # 금 마지막 1초
+    (datetime(2026, 8, 9, 12), datetime(2026, 8, 9, 13)),      # 일요일 안
+    (datetime(1999, 12, 31, 10), datetime(2000, 1, 4, 10)),    # 기준점 이전
+]
+for ref_dt, now_dt in pairs:
+    expected = _reference_business_hours(ref_dt, now_dt)
+    assert math.isclose(business_elapsed_hours(ref_dt, now_dt), expected, abs_tol=1e-9), (ref_dt, now_dt)
+now_dt = datetime(2026, 8, 13, 12, 30)
+batch = business_elapsed_hours_batch([ref for ref, _now in pairs] + [None], now_dt)
+assert math.isnan(batch[-1])
+for ref_dt, hours in zip((ref for ref, _now in pairs), batch):
+    assert math.isclose(hours, business_elapsed_hours(ref_dt, now_dt), abs_tol=1e-9)
+
+# 성질: 열 단위 위험 판정 = 행마다 evaluate_risk
+statuses = ["운송장출력", "접수", "발송", "도착", "배달준비", " 도착 ", "", "추적정보 없음"]
+wheres = ["", "서울강남우체국", "동서울우편집중국", "부산물류센터", "제주우체국", "서귀포 허브", "울릉"]
+managements = ["", "추적중", "폐기후보", "폐기(미발송)", "수동 중지"]
+
+
+def _stamp(dt):
+    return rng.choice((
+        dt.strftime("%Y-%m-%d %H:%M:%S"), dt.strftime("%Y.%m.%d %H:%M"),
+        dt.strftime("%Y-%m-%d %H:%M"), dt.strftime("%Y.%m.%d %H:%M:%S"), "", "미상",
+    ))
+
+
+rows = []
+for _ in range(5000):
+    row = [""] * 14
+    row[1] = _stamp(now_dt - timedelta(hours=rng.uniform(0, 400)))
+    row[6] = rng.choice(statuses)
+    row[7] = rng.choice(("Y", "N", "", "y"))
+    row[8] = rng.choice(wheres)
+    row[11] = _stamp(now_dt - timedelta(hours=rng.uniform(-5, 300)))
+    row[12] = rng.choice(managements)
+    rows.append(row[:rng.randint(7, 14)])  # 뒤쪽 빈 셀이 잘린 행
+
+thresholds = {"허브정체": 10, "수거누락": 30, "이동정체": 40}
+risks, elapsed = evaluate_tracking_rows_risk(rows, now_dt, thresholds, 12)
+assert len(risks) == len(elapsed) == len(rows)
+for row, risk, hours in zip(rows, risks, elapsed):
+    def cell(index):
+        return row[index] if index < len(row) else ""
+    ref = parse_tracking_list_timestamp(cell(11)) or parse_tracking_list_timestamp(cell(1))
+    expected = evaluate_risk(
+        cell(6), cell(8), cell(7).strip().upper() == "Y", ref, now_dt, thresholds, 12, cell(12))
+    assert risk == expected[0], (row, risk, expected)
+    assert math.isclose(hours, expected[1], abs_tol=1e-9), (row, hours, expected)
+assert {risk for risk in risks} >= set(STALE_DEFAULTS) | {None}
+assert evaluate_tracking_rows_risk([], now_dt, thresholds, 12) == ([], [])
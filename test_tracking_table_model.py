@@ -0,0 +1,171 @@
+import os
+from datetime import datetime
+from types import SimpleNamespace
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PySide6.QtCore import QObject, Qt
+from PySide6.QtWidgets import QApplication, QComboBox, QLabel, QLineEdit, QTableView
+
+from tracking.controller import TrackingController
+from tracking.service import tracking_rows_mode_masks
+from tracking.table_model import (
+    TRACKING_RISK_BACKGROUNDS,
+    TrackingFilterProxyModel,
+    TrackingTableModel,
+)
+
+app = QApplication.instance() or QApplication([])
+
+
+def _row(regino, name, done="N", management="추적중", registered="2026-08-13 09:00:00", memo=""):
+    row = [""] * 14
+    row[0], row[1], row[4], row[7], row[10], row[12] = (
+        regino, registered, name, done, memo, management)
+    return row
+
+
+rows = [
+    _row("R1", "김하나"),
+    _row("R2", "이두리", done="Y"),
+    _row("R3", "박세나", management="수동 중지"),
+    _row("R4", "김네나", registered="2026-08-12 09:00:00"),
+]
+model = TrackingTableModel()
+signals = []
+model.modelReset.connect(lambda: signals.append("reset"))
+model.dataChanged.connect(lambda top, bottom, _roles=(): signals.append(
+    ("changed", top.row(), bottom.row())))
+model.rowsInserted.connect(lambda _p, first, last: signals.append(("inserted", first, last)))
+model.rowsRemoved.connect(lambda _p, first, last: signals.append(("removed", first, last)))
+edits = []
+model.memo_edited.connect(lambda regino, text: edits.append((regino, text)))
+
+assert model.set_rows(rows, [None, None, None, "허브정체"]) is True
+assert signals == ["reset"]
+regino_col = model.column_of(0)
+memo_col = model.column_of(10)
+assert model.data(model.index(0, regino_col)) == "R1"
+assert model.headerData(regino_col, Qt.Orientation.Horizontal) == "등기번호"
+assert model.data(model.index(0, 0), Qt.ItemDataRole.BackgroundRole) is None
+assert model.data(model.index(3, 0), Qt.ItemDataRole.BackgroundRole).color().name() == (
+    TRACKING_RISK_BACKGROUNDS["허브정체"])
+assert not model.flags(model.index(0, regino_col)) & Qt.ItemFlag.ItemIsEditable
+assert model.flags(model.index(0, memo_col)) & Qt.ItemFlag.ItemIsEditable
+
+# 재조회: R2 제거, R3 내용 변경, R5 추가 → 초기화 없이 행 단위 신호만
+signals.clear()
+refreshed = [list(rows[0]), _row("R3", "박세나", management="추적중"), list(rows[3]), _row("R5", "최다섯")]
+assert model.set_rows(refreshed, [None, None, "허브정체", None]) is False
+assert signals == [("removed", 1, 1), ("changed", 1, 1), ("inserted", 3, 3)]
+assert [model.regino(r) for r in range(model.rowCount())] == ["R1", "R3", "R4", "R5"]
+assert model.row_of("R5") == 3 and model.row_of("없음") == -1
+
+# 목록이 대부분 바뀌면 한 번에 초기화
+signals.clear()
+assert model.set_rows([_row("X1", "가"), _row("X2", "나"), list(rows[0])], [None] * 3) is True
+assert signals == ["reset"]
+
+# 메모 편집은 행을 새로 만들어 바꾸고 (등기번호, 메모)를 알린다
+assert model.setData(model.index(2, memo_col), "부재 시 경비실")
+assert edits == [("R1", "부재 시 경비실")]
+assert rows[0][10] == ""
+assert not model.setData(model.index(2, memo_col), "부재 시 경비실")
+assert not model.setData(model.index(2, regino_col), "바꿈")
+
+proxy = TrackingFilterProxyModel()
+proxy.setSourceModel(model)
+model.set_rows(rows, [None] * 4)
+assert proxy.rowCount() == 4  # mask 전에는 모든 행
+masks = tracking_rows_mode_masks(model.rows(), datetime(2026, 8, 13, 12))
+proxy.set_filter("배송중", "", masks)
+assert proxy.rowCount() == 2
+proxy.set_filter("배송중", " 김네")
+assert proxy.rowCount() == 1
+assert proxy.data(proxy.index(0, regino_col)) == "R4"
+proxy.set_filter("오늘", "")
+assert [proxy.data(proxy.index(r, regino_col)) for r in range(proxy.rowCount())] == [
+    "R1", "R2", "R3"]
+proxy.set_filter("추적 중지")
+assert proxy.rowCount() == 1
+proxy.set_filter("전체")
+assert proxy.rowCount() == 4
+model.set_rows([*rows, _row("R5", "새행")], [None] * 5)
+assert proxy.rowCount() == 4  # 새 행은 mask를 다시 계산할 때까지 숨김
+
+
+class _Host(QObject):
+    def __init__(self):
+        super().__init__()
+        combo = QComboBox()
+        combo.addItems(["배송중", "전체"])
+        self.ui = SimpleNamespace(
+            tableWidget_tracking=QTableView(),
+            comboBox_tracking_filter=combo,
+            lineEdit_tracking_recipient_search=QLineEdit(),
+            label_tracking_count=QLabel(),
+        )
+        self._tracking_list_thread = None
+
+    def get_app_setting(self, _key, default=None):
+        return default
+
+
+host = _Host()
+controller = TrackingController(host)
+controller.initialize_runtime()
+controller.bind_ui()
+controller._load_tracking_list = lambda: None  # 필터 변경 시 Sheet 재조회는 생략
+controller._evaluate_risk_rows = lambda data, _now: (
+    ["허브정체" if row[0] == "R4" else None for row in data], [0.0] * len(data))
+host._tracking_list_values = [["헤더"], *rows]
+controller._populate_tracking_table()
+table = host.ui.tableWidget_tracking
+assert host.ui.label_tracking_count.text() == "표시 2건  ·  ⚠️ 위험 1건 (허브 1 · 수거누락 0 · 이동 0)"
+table.setCurrentIndex(table.model().index(1, 0))
+assert controller._selected_tracking_regino() == "R4"
+
+# 자동 갱신: 같은 행 객체를 다시 받아도 선택이 유지된다
+host._tracking_list_values = [["헤더"], *rows, _row("R6", "정여섯")]
+controller._populate_tracking_table()
+assert controller._selected_tracking_regino() == "R4"
+assert host.ui.label_tracking_count.text().startswith("표시 3건")
+
+host.ui.lineEdit_tracking_recipient_search.setText("정여")
+assert host.ui.label_tracking_count.text() == "표시 1건"
+reloads = []
+controller._load_tracking_list = lambda: reloads.append("load")
+host.ui.comboBox_tracking_filter.setCurrentText("전체")
+assert reloads == ["load"]  # 모드별로 골라 읽은 목록이면 다시 읽는다
+
+# 전체 행을 받은 목록이면 필터 전환은 미리 계산한 mask로만 처리한다
+host._tracking_list_all_rows = True
+controller._apply_tracking_table_filter()
+assert host.ui.label_tracking_count.text() == "표시 1건 / 전체 5건"
+host.ui.comboBox_tracking_filter.setCurrentText("배송중")
+assert reloads == ["load"]
+assert host.ui.label_tracking_count.text() == "표시 1건"
+
+# 비고 편집·관리상태 변경은 목록 원본에 남아 표를 다시 그려도 유지된다.
+import tracking.controller as tracking_controller  # noqa: E402
+
+queued = []
+original_queue = tracking_controller.sheet_write_queue
+tracking_controller.sheet_write_queue = lambda: SimpleNamespace(
+    enqueue=lambda kind, entries, priority: queued.append((kind, entries, priority)))
+try:
+    host.ui.lineEdit_tracking_recipient_search.setText("")
+    source = table.model().sourceModel()
+    memo_index = source.index(source.row_of("R1"), source.column_of(10))
+    assert source.setData(memo_index, "메모!")
+    assert queued[-1][1:] == ({"R1": {"note": "메모!"}}, "interactive")
+    controller._populate_tracking_table()
+    assert source.data(source.index(source.row_of("R1"), source.column_of(10))) == "메모!"
+    # 목록 원본의 행을 제자리에서 고쳐도 모델은 복사본과 비교해 dataChanged를 낸다.
+    changed = []
+    source.dataChanged.connect(lambda top, _bottom, _roles=(): changed.append(top.row()))
+    controller._apply_tracking_management_locally(["R1"], "수동 중지")
+    assert changed == [source.row_of("R1")]
+    assert source.row_values(source.row_of("R1"))[12] == "수동 중지"
+finally:
+    tracking_controller.sheet_write_queue = original_queue
@@ -0,0 +1,166 @@
+import sqlite3
+import tempfile
+from pathlib import Path
+
+from sheets_quota import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, current_priority
+
+import tracking.workers as tracking_workers
+from tracking.workers import (
+    TRACKING_WRITE_MANAGEMENT,
+    TRACKING_WRITE_NOTES,
+    TRACKING_WRITE_UPSERT,
+    register_tracking_write_handlers,
+)
+from tracking.write_queue import (
+    WRITE_QUEUE_RETRY_BASE_SEC,
+    SheetWriteJournal,
+    SheetWriteQueue,
+)
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+tmp = tempfile.TemporaryDirectory()
+journal_path = Path(tmp.name) / "queue.sqlite3"
+clock = _Clock()
+queue = SheetWriteQueue(SheetWriteJournal(journal_path), flush_delay_sec=0, clock=clock)
+
+# 같은 키는 마지막 값 하나로 합쳐지고, handler는 종류마다 한 번만 불린다.
+calls = []
+queue.register("notes", lambda entries: calls.append(entries) or {"updated": len(entries)})
+notified = []
+queue.add_listener(lambda kind, result: notified.append((kind, result)))
+queue.enqueue("notes", {"A1": {"note": "첫 메모"}})
+queue.enqueue("notes", {"A1": {"note": "고친 메모"}, "B2": {"note": "다른 메모"}})
+assert queue.pending_count("notes") == 2
+assert queue.flush() == [("notes", {"ok": True, "count": 2, "updated": 2})]
+assert len(calls) == 1
+assert {entry["key"]: entry["payload"]["note"] for entry in calls[0]} == {
+    "A1": "고친 메모", "B2": "다른 메모",
+}
+assert not any(entry["replayed"] for entry in calls[0])
+assert notified == [("notes", {"ok": True, "count": 2, "updated": 2})]
+assert queue.pending_count() == 0
+
+# 보내는 동안 같은 키가 새 값으로 바뀌면 그 값은 지우지 않고 다음 flush에 보낸다.
+def _handler_with_concurrent_edit(entries):
+    queue.enqueue("memo", {"A1": {"note": "보내는 중에 바뀜"}})
+    return {}
+
+
+queue.register("memo", _handler_with_concurrent_edit)
+queue.enqueue("memo", {"A1": {"note": "처음"}})
+queue.flush()
+remaining = queue.journal.pending("memo", queue.session)
+assert [entry["payload"]["note"] for entry in remaining] == ["보내는 중에 바뀜"]
+queue.register("memo", lambda entries: {})
+queue.flush()
+assert queue.pending_count("memo") == 0
+
+# 실패하면 저널에 남기고 backoff 동안은 다시 부르지 않는다.
+failures = []
+
+
+def _failing(entries):
+    failures.append(len(entries))
+    raise RuntimeError("429 quota")
+
+
+queue.register("mgmt", _failing)
+queue.enqueue("mgmt", {"A1": {"management": "수동 중지"}})
+(kind, result), = queue.flush()
+assert kind == "mgmt" and result["ok"] is False
+assert result["attempts"] == 1 and result["retry_in_sec"] == WRITE_QUEUE_RETRY_BASE_SEC
+assert queue.flush() == []
+assert failures == [1]
+clock.now += WRITE_QUEUE_RETRY_BASE_SEC
+(_, result), = queue.flush()
+assert result["attempts"] == 2 and result["retry_in_sec"] == WRITE_QUEUE_RETRY_BASE_SEC * 2
+queue.retry_now()
+queue.register("mgmt", lambda entries: {"updated": 1})
+(_, result), = queue.flush()
+assert result["ok"] is True
+assert queue.pending_count() == 0
+
+# 앱을 다시 켜면(새 session) 남은 항목이 replayed=True로 handler에 전달된다.
+queue.enqueue("upsert", {"A1": {"등기번호": "A1"}})
+restarted = SheetWriteQueue(SheetWriteJournal(journal_path), flush_delay_sec=0, clock=clock)
+replayed = []
+restarted.register("upsert", lambda entries: replayed.extend(entries) or {})
+restarted.flush()
+assert [(entry["key"], entry["replayed"]) for entry in replayed] == [("A1", True)]
+assert restarted.pending_count() == 0
+
+# 사용자가 누른 변경(대화형)은 백그라운드 쿼터 한도 없이 먼저 보낸다. 한 종류 묶음에 대화형 항목이
+# 하나라도 있으면 묶음 전체를 대화형으로 보내고, 덮어써도 대화형 표시는 남는다.
+seen = []
+queue.register("poll", lambda entries: seen.append(("poll", current_priority())) or {})
+queue.register("click", lambda entries: seen.append(("click", current_priority())) or {})
+queue.enqueue("poll", {"A1": {"value": 1}})
+queue.enqueue("click", {"A1": {"value": 1}}, priority=PRIORITY_INTERACTIVE)
+queue.enqueue("click", {"A1": {"value": 2}, "B2": {"value": 3}})
+assert [entry["priority"] for entry in queue.journal.pending("click")] == [
+    PRIORITY_INTERACTIVE, PRIORITY_BACKGROUND,
+]
+queue.flush()
+assert seen == [("click", PRIORITY_INTERACTIVE), ("poll", PRIORITY_BACKGROUND)]
+
+# 우선순위 열이 없던 예전 저널도 열리고, 남은 항목은 백그라운드로 보낸다.
+legacy_path = Path(tmp.name) / "legacy.sqlite3"
+with sqlite3.connect(legacy_path) as legacy:
+    legacy.execute(
+        "CREATE TABLE sheet_writes (kind TEXT NOT NULL, key TEXT NOT NULL, payload TEXT NOT NULL, "
+        "revision INTEGER NOT NULL, session TEXT NOT NULL, queued_at TEXT NOT NULL, "
+        "attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT NOT NULL DEFAULT '', "
+        "PRIMARY KEY (kind, key))")
+    legacy.execute("INSERT INTO sheet_writes VALUES ('notes', 'A1', '{}', 1, 'old', '2026-08-13 12:00:00', 0, '')")
+legacy.close()
+assert [entry["priority"] for entry in SheetWriteJournal(legacy_path).pending("notes")] == [PRIORITY_BACKGROUND]
+
+# 배송추적 handler: 관리상태는 값마다 한 번, 메모는 한 번에 모아 보낸다.
+calls = []
+original = (
+    tracking_workers._open_tracking_ws_for_write,
+    tracking_workers.update_tracking_management,
+    tracking_workers.update_tracking_notes,
+)
+tracking_workers._open_tracking_ws_for_write = lambda: "ws"
+tracking_workers.update_tracking_management = lambda ws, reginos, management: (
+    calls.append(("management", sorted(reginos), management))
+    or {"updated": len(reginos), "missing": 0}
+)
+tracking_workers.update_tracking_notes = lambda ws, notes: calls.append(("notes", notes)) or len(notes)
+try:
+    tracking_queue = SheetWriteQueue(
+        SheetWriteJournal(Path(tmp.name) / "tracking.sqlite3"), flush_delay_sec=0, clock=clock)
+    register_tracking_write_handlers(tracking_queue)
+    assert set(tracking_queue._handlers) == {
+        TRACKING_WRITE_UPSERT, TRACKING_WRITE_MANAGEMENT, TRACKING_WRITE_NOTES,
+    }
+    tracking_queue.enqueue(TRACKING_WRITE_MANAGEMENT, {
+        "A1": {"management": "수동 중지"}, "B2": {"management": "수동 중지"},
+        "C3": {"management": ""},
+    })
+    tracking_queue.enqueue(TRACKING_WRITE_NOTES, {"A1": {"note": "메모"}})
+    results = dict(tracking_queue.flush())
+finally:
+    (
+        tracking_workers._open_tracking_ws_for_write,
+        tracking_workers.update_tracking_management,
+        tracking_workers.update_tracking_notes,
+    ) = original
+assert sorted(calls, key=repr) == sorted([
+    ("management", ["A1", "B2"], "수동 중지"),
+    ("management", ["C3"], ""),
+    ("notes", {"A1": "메모"}),
+], key=repr)
+assert results[TRACKING_WRITE_MANAGEMENT] == {"ok": True, "count": 3, "updated": 3, "missing": 0}
+assert results[TRACKING_WRITE_NOTES] == {"ok": True, "count": 1, "updated": 1}
+
+tmp.cleanup()
@@ -0,0 +1,84 @@
+"""프로세스 전체가 공유하는 「설정」 탭 키/값 캐시.
+
+worker마다 시작할 때 설정 탭 전체(get_all_values)를 다시 읽지 않도록, 마지막으로 읽은 값을
+CONFIG_CACHE_TTL_SEC 동안 재사용한다. 이 프로세스가 탭을 읽거나 쓸 때마다 캐시가 함께 갱신되고,
+다른 PC가 바꾼 값은 TTL이 지나 다시 읽을 때 반영된다. 값이 바뀔 때마다 version이 올라간다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Mapping
+
+CONFIG_CACHE_TTL_SEC = 60
+# lease 값(repository.LEASE_KEY_PREFIX)은 heartbeat마다 바뀌므로 version 비교에서 뺀다.
+VOLATILE_KEY_PREFIXES = ("lease_",)
+
+
+def _stable(values: Mapping[str, str]) -> dict[str, str]:
+    return {
+        key: value for key, value in values.items()
+        if not key.startswith(VOLATILE_KEY_PREFIXES)
+    }
+
+
+class ConfigValuesCache:
+    """(스프레드시트 id, 탭 제목)별 설정 키/값과 읽은 시각을 보관한다."""
+
+    def __init__(self, ttl_sec: float = CONFIG_CACHE_TTL_SEC, clock=time.monotonic):
+        self._ttl = float(ttl_sec)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], dict] = {}
+        self.version = 0
+
+    @staticmethod
+    def _key(worksheet) -> tuple[str, str]:
+        return str(getattr(worksheet, "spreadsheet_id", "") or ""), str(getattr(worksheet, "title", "") or "")
+
+    def get(self, worksheet) -> dict[str, str] | None:
+        """TTL 안에 읽은 값이 있으면 사본을, 없거나 오래됐으면 None."""
+        with self._lock:
+            entry = self._entries.get(self._key(worksheet))
+            if entry is None or self._clock() - entry["loaded_at"] >= self._ttl:
+                return None
+            return dict(entry["values"])
+
+    def store(self, worksheet, values: Mapping[str, str]) -> None:
+        """탭 전체를 방금 읽은 값으로 바꾼다."""
+        with self._lock:
+            key = self._key(worksheet)
+            previous = self._entries.get(key)
+            if previous is None or _stable(previous["values"]) != _stable(values):
+                self.version += 1
+            self._entries[key] = {"values": dict(values), "loaded_at": self._clock()}
+
+    def apply(self, worksheet, updates: Mapping[str, str]) -> None:
+        """이 프로세스가 쓴 키/값을 캐시에도 반영한다(읽은 시각은 그대로 둔다)."""
+        with self._lock:
+            entry = self._entries.get(self._key(worksheet))
+            if entry is None:
+                self.version += 1
+                return
+            values = entry["values"]
+            if any(values.get(k) != v for k, v in _stable(updates).items()):
+                self.version += 1
+            values.update(updates)
+
+    def invalidate(self, worksheet=None) -> None:
+        """worksheet 탭(없으면 전부)의 캐시를 버려 다음 읽기가 시트를 다시 읽게 한다."""
+        with self._lock:
+            if worksheet is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(self._key(worksheet), None)
+            self.version += 1
+
+
+_CONFIG_CACHE = ConfigValuesCache()
+
+
+def config_cache() -> ConfigValuesCache:
+    """프로세스 공용 설정 캐시."""
+    return _CONFIG_CACHE
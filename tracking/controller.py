@@ -18,7 +18,7 @@ except ImportError:
     gspread = None
 
 from PySide6.QtCore import QObject, Qt, QUrl
-from PySide6.QtGui import QColor, QDesktopServices
+from PySide6.QtGui import QDesktopServices
 from PySide6.QtWidgets import (
     QCheckBox,
     QFileDialog,
@@ -31,11 +31,13 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSpinBox,
-    QTableWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
+from sheets_quota import PRIORITY_INTERACTIVE
+
+from .config_cache import config_cache
 from .repository import normalize_tracking_no as _normalize_tracking_no
 from .service import (
     CONFIG_KEY_STALE_HUB,
@@ -47,19 +49,27 @@ from .service import (
     STALE_REMOTE_BONUS_DEFAULT,
     TRACKING_COMPLETED_LOOKBACK_DAYS,
     TRACKING_MANAGEMENT_ACTIVE,
-    TRACKING_MANAGEMENT_CANDIDATE,
     TRACKING_MANAGEMENT_COL,
-    TRACKING_MANAGEMENT_DISCARDED,
-    TRACKING_MANAGEMENT_EXCLUDED,
     TRACKING_MANAGEMENT_MANUAL_STOP,
     build_risk_digest_text,
     evaluate_risk,
+    evaluate_tracking_rows_risk,
     is_weekday as _is_weekday,
     risk_signature,
+    tracking_rows_mode_masks,
+)
+from .table_model import (
+    TRACKING_TABLE_COLUMNS,
+    TRACKING_TABLE_MEMO_COL,
+    TrackingFilterProxyModel,
+    TrackingTableModel,
 )
 from .workers import (
     CONFIG_KEY_KPOST_REGKEY,
     CONFIG_KEY_SLACK_WEBHOOK,
+    TRACKING_WRITE_MANAGEMENT,
+    TRACKING_WRITE_NOTES,
+    TRACKING_WRITE_UPSERT,
     DigestSendThread,
     SlackSendThread,
     TrackingConfigReadThread,
@@ -67,20 +77,24 @@ from .workers import (
     CourierReceiptExportThread,
     TrackingKeyValidateThread,
     TrackingListThread,
-    TrackingManagementUpdateThread,
-    TrackingNotesUpdateThread,
     TrackingRefreshOneThread,
     TrackingRefreshThread,
-    TrackingUpsertThread,
 )
+from .write_queue import sheet_write_queue
 
 
-TRACKING_SHEET_PUSH_DEBOUNCE_MS = 1200
 CONFIG_KEY_AUTO_REFRESH_MIN = "tracking_auto_refresh_min"
 TRACKING_AUTO_REFRESH_DEFAULT_MIN = 60
 COURIER_RECEIPT_PREFIX = "하이제니스"
 
 
+def _journal_text(value) -> str:
+    """None·NaN은 빈 문자열, 그 밖은 앞뒤 공백을 뗀 문자열."""
+    if value is None or value != value:
+        return ""
+    return str(value).strip()
+
+
 class TrackingController(QObject):
     """MainWindow에 보관된 상태와 배송추적 UI의 연결을 관리한다."""
 
@@ -91,11 +105,6 @@ class TrackingController(QObject):
 
     def initialize_runtime(self):
         """배송추적 전용 비동기 상태와 타이머를 한곳에서 초기화한다."""
-        self._tracking_op_thread = None
-        self._tracking_pending_records = []
-        self._tracking_inflight_records = []
-        self._tracking_push_timer = self._new_timer(single_shot=True)
-        self._tracking_push_timer.timeout.connect(self._flush_tracking_records)
         self._tracking_refresh_thread = None
         self._tracking_config_read_thread = None
         self._tracking_config_write_thread = None
@@ -104,11 +113,9 @@ class TrackingController(QObject):
         self._key_validate_pending_key = ""
         self._tracking_list_thread = None
         self._tracking_list_values = []
-        self._tracking_management_update_thread = None
-        self._tracking_notes_update_thread = None
-        self._tracking_notes_pending = {}
-        self._tracking_notes_inflight = {}
-        self._populating_tracking_table = False
+        self._tracking_list_all_rows = False
+        self._tracking_list_archived = False
+        self._tracking_list_masks = {}
         self._courier_export_thread = None
         self._tracking_list_timer = self._new_timer(interval=120000)
         self._tracking_list_timer.timeout.connect(self._on_tracking_list_poll)
@@ -139,7 +146,6 @@ class TrackingController(QObject):
         elif (name.startswith("_tracking_") or name.startswith("_slack_")
               or name.startswith("_dlg_") or name == "_admin_tracking_built"
               or name in {
-            "_populating_tracking_table",
             "_slack_notify_after_reload",
             "_digest_thread",
         }):
@@ -164,8 +170,8 @@ class TrackingController(QObject):
             )
         table = getattr(self.ui, "tableWidget_tracking", None)
         if table is not None:
-            table.cellDoubleClicked.connect(self._on_tracking_cell_double_clicked)
-            table.itemChanged.connect(self._on_tracking_item_changed)
+            self._tracking_table_models()
+            table.doubleClicked.connect(self._on_tracking_double_clicked)
             table.setContextMenuPolicy(Qt.ContextMenuPolicy.CustomContextMenu)
             table.customContextMenuRequested.connect(self._on_tracking_context_menu)
         if hasattr(self.ui, "comboBox_tracking_filter"):
@@ -174,7 +180,7 @@ class TrackingController(QObject):
             )
         if hasattr(self.ui, "lineEdit_tracking_recipient_search"):
             self.ui.lineEdit_tracking_recipient_search.textChanged.connect(
-                self._populate_tracking_table
+                self._apply_tracking_table_filter
             )
 
     def show_help(self):
@@ -197,17 +203,27 @@ class TrackingController(QObject):
 
     # ── 배송추적 목록(표) ────────────────────────────────────────────────
     # 표시 컬럼: (시트 컬럼 인덱스, 헤더 라벨)
-    _TRACKING_TABLE_COLUMNS = [
-        (4, "수취인명"), (6, "배송상태"), (8, "마지막위치"),
-        (11, "최근이벤트"), (12, "관리상태"), (7, "완료"),
-        (3, "주문번호"), (0, "등기번호"), (2, "스토어"),
-        (9, "최근조회"), (10, "메모"),
-    ]
+    _TRACKING_TABLE_COLUMNS = TRACKING_TABLE_COLUMNS
 
     @classmethod
     def _tracking_table_col(cls, source_col):
         return next(i for i, (idx, _label) in enumerate(cls._TRACKING_TABLE_COLUMNS)
                     if idx == source_col)
+
+    def _tracking_table_models(self):
+        """표 view에 연결된 (행 모델, 필터 프록시). 처음 부를 때 만들어 view에 붙인다."""
+        table = getattr(self.ui, "tableWidget_tracking", None)
+        if table is None:
+            return None, None
+        proxy = table.model()
+        if not isinstance(proxy, TrackingFilterProxyModel):
+            model = TrackingTableModel(self._TRACKING_TABLE_COLUMNS, table)
+            model.memo_edited.connect(self._on_tracking_memo_edited)
+            proxy = TrackingFilterProxyModel(table)
+            proxy.setSourceModel(model)
+            table.setModel(proxy)
+        return proxy.sourceModel(), proxy
+
     def _evaluate_risk(self, status, where, done, ref, now_dt, management=""):
         """분류별 영업시간 기준으로 위험 여부와 경과 시간을 계산한다."""
         thresholds = {
@@ -218,6 +234,14 @@ class TrackingController(QObject):
             status, where, done, ref, now_dt, thresholds,
             self._remote_bonus_hours(), management)
 
+    def _evaluate_risk_rows(self, rows, now_dt):
+        """시트 행 목록 전체의 위험 여부를 열 단위로 계산한다. 반환: (분류 목록, 경과시간 목록)."""
+        thresholds = {
+            category: self._stale_threshold(category)
+            for category in STALE_DEFAULTS
+        }
+        return evaluate_tracking_rows_risk(rows, now_dt, thresholds, self._remote_bonus_hours())
+
     def _on_tracking_list_poll(self):
         """주기 타이머: 배송추적 탭을 보고 있을 때만 목록을 자동 재로딩."""
         if gspread is None or self._tracking_list_thread is not None:
@@ -228,16 +252,20 @@ class TrackingController(QObject):
         cur = tw.currentWidget()
         if cur is None or cur.objectName() != "tab_tracking":
             return
-        self._load_tracking_list()
+        from sheets_quota import sheets_governor
+
+        if sheets_governor().near_quota():
+            return  # Sheets 쿼터가 빠듯하면 이번 주기는 건너뜀
+        self._load_tracking_list(background=True)
 
     def _on_tracking_context_menu(self, pos):
         """행 우클릭 메뉴: 단건 조회·웹조회·수동 추적 중지/재개."""
         table = getattr(self.ui, "tableWidget_tracking", None)
         if table is None:
             return
-        item = table.itemAt(pos)
-        if item is not None:
-            table.setCurrentCell(item.row(), self._tracking_table_col(0))
+        index = table.indexAt(pos)
+        if index.isValid():
+            table.setCurrentIndex(index.siblingAtColumn(self._tracking_table_col(0)))
         regino = self._selected_tracking_regino()
         if not regino:
             return
@@ -258,8 +286,11 @@ class TrackingController(QObject):
         elif chosen == act_management:
             self._change_tracking_management([regino], manual_stop)
 
-    def _load_tracking_list(self):
-        """현재 목록 모드에 필요한 송장추적 행만 백그라운드로 읽어온다."""
+    def _load_tracking_list(self, background=False):
+        """현재 목록 모드에 필요한 송장추적 행만 백그라운드로 읽어온다.
+
+        background=True(주기 폴링·자동 새로고침 후)면 Sheets 요청을 낮은 우선순위로 보낸다.
+        """
         if gspread is None or self._tracking_list_thread is not None:
             return
         if hasattr(self.ui, "label_tracking_count"):
@@ -268,7 +299,7 @@ class TrackingController(QObject):
         mode = "배송중"
         if hasattr(self.ui, "comboBox_tracking_filter"):
             mode = self.ui.comboBox_tracking_filter.currentText()
-        thread = TrackingListThread(mode, self)
+        thread = TrackingListThread(mode, self, background=background)
         self._tracking_list_thread = thread
         thread.result_ready.connect(self._on_tracking_list_finished)
         thread.finished.connect(self._cleanup_tracking_list_thread)
@@ -285,6 +316,8 @@ class TrackingController(QObject):
             return
         self._tracking_list_values = payload.get("values", []) or []
         self._tracking_list_total_rows = int(payload.get("total_rows", 0) or 0)
+        self._tracking_list_all_rows = bool(payload.get("all_rows"))
+        self._tracking_list_archived = bool(payload.get("archived"))
         self._populate_tracking_table()
         self._set_tracking_table_loading(False)
         if self._slack_notify_after_reload:
@@ -295,8 +328,13 @@ class TrackingController(QObject):
         self._tracking_list_thread = None
 
     def _on_tracking_filter_changed(self, _index):
-        """필터 변경 시 해당 모드의 상세 행만 다시 읽는다."""
-        self._load_tracking_list()
+        """필터 변경: 전체 행을 이미 받아 두었으면 미리 계산한 모드 mask로 바로 거르고,
+        아니면 해당 모드의 상세 행만 다시 읽는다. 「전체」는 보관 탭까지 받아 둔 경우만 재사용한다."""
+        mode = self.ui.comboBox_tracking_filter.currentText()
+        if self._tracking_list_all_rows and (mode != "전체" or self._tracking_list_archived):
+            self._apply_tracking_table_filter()
+        else:
+            self._load_tracking_list()
 
     def _set_tracking_table_loading(self, loading: bool):
         """기존 표를 남긴 채 목록 전환 중임을 반투명 오버레이로 표시한다."""
@@ -333,106 +371,69 @@ class TrackingController(QObject):
             overlay.hide()
 
     def _populate_tracking_table(self, *_args):
-        table = getattr(self.ui, "tableWidget_tracking", None)
-        if table is None:
+        """받아 둔 목록을 표 모델에 반영한다. 바뀐 행만 갱신되므로 선택·스크롤이 유지된다."""
+        model, proxy = self._tracking_table_models()
+        if model is None:
             return
+        table = self.ui.tableWidget_tracking
         values = self._tracking_list_values
         data_rows = values[1:] if len(values) > 1 else []
-        total = len(data_rows)
 
+        # 위험 판정: 미완료 + 마지막 이벤트(없으면 등록) 후 분류별 기준(영업시간) 무이동.
+        risks, _elapsed = self._evaluate_risk_rows(data_rows, datetime.now())
+        prev_regino = self._selected_tracking_regino()  # 모드 전환으로 초기화될 때 선택 복원용
+        reset = model.set_rows(data_rows, risks)
+        self._tracking_list_masks = tracking_rows_mode_masks(model.rows())
+        self._apply_tracking_table_filter()
+        if reset:
+            table.resizeColumnsToContents()
+            header = table.horizontalHeader()
+            if header is not None:
+                header.setStretchLastSection(True)
+            if prev_regino:
+                source_row = model.row_of(prev_regino)
+                if source_row >= 0:
+                    index = proxy.mapFromSource(
+                        model.index(source_row, self._tracking_table_col(0)))
+                    if index.isValid():
+                        table.setCurrentIndex(index)
+
+    def _apply_tracking_table_filter(self, *_args):
+        """목록 모드·수취인명 검색을 프록시에 반영하고 건수·위험 요약을 갱신한다."""
+        model, proxy = self._tracking_table_models()
+        if model is None:
+            return
         mode = "배송중"
         if hasattr(self.ui, "comboBox_tracking_filter"):
             mode = self.ui.comboBox_tracking_filter.currentText()
-        today = date.today().strftime("%Y-%m-%d")
-
-        def _cell(row, idx):
-            return row[idx] if idx < len(row) else ""
-
-        if mode == "오늘":
-            rows = [r for r in data_rows if _cell(r, 1).startswith(today)]
-        elif mode == "전체":
-            rows = list(data_rows)
-        elif mode == "완료":
-            rows = [r for r in data_rows if _cell(r, 7).strip().upper() == "Y"]
-        elif mode == "추적 중지":
-            rows = [r for r in data_rows
-                    if _cell(r, TRACKING_MANAGEMENT_COL) == TRACKING_MANAGEMENT_MANUAL_STOP]
-        elif mode == "폐기 후보":
-            rows = [r for r in data_rows
-                    if _cell(r, TRACKING_MANAGEMENT_COL) == TRACKING_MANAGEMENT_CANDIDATE]
-        elif mode == "폐기":
-            rows = [r for r in data_rows
-                    if _cell(r, TRACKING_MANAGEMENT_COL) == TRACKING_MANAGEMENT_DISCARDED]
-        else:  # 배송중(=미완료): 완료여부 != Y
-            rows = [r for r in data_rows
-                    if _cell(r, 7).strip().upper() != "Y"
-                    and _cell(r, TRACKING_MANAGEMENT_COL) not in TRACKING_MANAGEMENT_EXCLUDED]
         search = ""
         if hasattr(self.ui, "lineEdit_tracking_recipient_search"):
-            search = self.ui.lineEdit_tracking_recipient_search.text().strip().casefold()
-        if search:
-            rows = [r for r in rows if search in _cell(r, 4).casefold()]
+            search = self.ui.lineEdit_tracking_recipient_search.text()
+        proxy.set_filter(mode, search, self._tracking_list_masks)
 
-        # 위험 판정: 미완료 + 마지막 이벤트(없으면 등록) 후 분류별 기준(영업시간) 무이동.
-        now_dt = datetime.now()
-        bg_hub = QColor("#ffb3b3")      # 허브 정체 = 빨강(위험)
-        bg_warn = QColor("#ffe0b3")     # 수거누락·이동정체 = 주황(주의)
+        if not hasattr(self.ui, "label_tracking_count"):
+            return
+        shown = proxy.rowCount()
         counts = {"허브정체": 0, "수거누락": 0, "이동정체": 0}
-
-        cols = self._TRACKING_TABLE_COLUMNS
-        prev_regino = self._selected_tracking_regino()  # 자동 갱신 시 선택 유지용
-        table.setSortingEnabled(False)
-        self._populating_tracking_table = True
-        try:
-            table.clearContents()
-            table.setColumnCount(len(cols))
-            table.setHorizontalHeaderLabels([label for _, label in cols])
-            table.setRowCount(len(rows))
-            for r, row in enumerate(rows):
-                done = _cell(row, 7).strip().upper() == "Y"
-                ref = self._parse_event_dt(_cell(row, 11)) or self._parse_event_dt(_cell(row, 1))
-                risk, _elapsed = self._evaluate_risk(
-                    _cell(row, 6), _cell(row, 8), done, ref, now_dt,
-                    _cell(row, TRACKING_MANAGEMENT_COL))
-                if risk:
-                    counts[risk] += 1
-                bg = bg_hub if risk == "허브정체" else (bg_warn if risk else None)
-                for c, (src_idx, _label) in enumerate(cols):
-                    item = QTableWidgetItem(_cell(row, src_idx))
-                    if src_idx != 10:
-                        item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
-                    if bg is not None:
-                        item.setBackground(bg)
-                    table.setItem(r, c, item)
-        finally:
-            self._populating_tracking_table = False
-        table.setSortingEnabled(True)
-        table.resizeColumnsToContents()
-        header = table.horizontalHeader()
-        if header is not None:
-            header.setStretchLastSection(True)
-        if prev_regino:  # 자동 갱신 후 이전 선택 행 복원
-            for r in range(table.rowCount()):
-                it = table.item(r, self._tracking_table_col(0))
-                if it is not None and it.text().strip() == prev_regino:
-                    table.setCurrentCell(r, self._tracking_table_col(0))
-                    break
-        if hasattr(self.ui, "label_tracking_count"):
-            total_risk = sum(counts.values())
-            if mode == "전체":
-                txt = f"표시 {len(rows)}건 / 전체 {total}건"
-            elif mode == "완료":
-                txt = f"표시 {len(rows)}건 / 최근 {TRACKING_COMPLETED_LOOKBACK_DAYS}일 완료"
-            else:
-                txt = f"표시 {len(rows)}건"
-            if total_risk:
-                txt += (f"  ·  ⚠️ 위험 {total_risk}건"
-                        f" (허브 {counts['허브정체']} · 수거누락 {counts['수거누락']}"
-                        f" · 이동 {counts['이동정체']})")
-                self.ui.label_tracking_count.setStyleSheet("color:#c0392b; font-weight:bold;")
-            else:
-                self.ui.label_tracking_count.setStyleSheet("")
-            self.ui.label_tracking_count.setText(txt)
+        for r in range(shown):
+            risk = model.risk(proxy.mapToSource(proxy.index(r, 0)).row())
+            if risk:
+                counts[risk] += 1
+        total_risk = sum(counts.values())
+        if mode == "전체":
+            txt = f"표시 {shown}건 / 전체 {model.rowCount()}건"
+        elif mode == "완료":
+            txt = f"표시 {shown}건 / 최근 {TRACKING_COMPLETED_LOOKBACK_DAYS}일 완료"
+        else:
+            txt = f"표시 {shown}건"
+        if total_risk:
+            txt += (f"  ·  ⚠️ 위험 {total_risk}건"
+                    f" (허브 {counts['허브정체']} · 수거누락 {counts['수거누락']}"
+                    f" · 이동 {counts['이동정체']})")
+            self.ui.label_tracking_count.setStyleSheet("color:#c0392b; font-weight:bold;")
+        else:
+            self.ui.label_tracking_count.setStyleSheet("")
+        self.ui.label_tracking_count.setText(txt)
 
     @staticmethod
     def _parse_event_dt(s):
@@ -450,22 +451,22 @@ class TrackingController(QObject):
 
     def _selected_tracking_regino(self):
         table = getattr(self.ui, "tableWidget_tracking", None)
-        if table is None:
+        model, proxy = self._tracking_table_models()
+        if model is None:
             return ""
-        r = table.currentRow()
-        if r < 0:
+        index = table.currentIndex()
+        if not index.isValid():
             return ""
-        item = table.item(r, self._tracking_table_col(0))
-        return item.text().strip() if item is not None else ""
+        return model.regino(proxy.mapToSource(index).row())
 
     def _selected_tracking_reginos(self):
         table = getattr(self.ui, "tableWidget_tracking", None)
-        if table is None or table.selectionModel() is None:
+        model, proxy = self._tracking_table_models()
+        if model is None or table.selectionModel() is None:
             return []
-        regino_col = self._tracking_table_col(0)
-        return [table.item(index.row(), regino_col).text().strip()
-                for index in table.selectionModel().selectedRows()
-                if table.item(index.row(), regino_col) is not None]
+        reginos = [model.regino(proxy.mapToSource(index).row())
+                   for index in table.selectionModel().selectedRows()]
+        return [regino for regino in reginos if regino]
 
     def _tracking_management_for_regino(self, regino):
         for row in self._tracking_list_values[1:]:
@@ -481,8 +482,6 @@ class TrackingController(QObject):
             QMessageBox.warning(
                 self.host, "배송추적", "gspread 패키지가 필요합니다. (pip install gspread)")
             return
-        if self._tracking_management_update_thread is not None:
-            return
         reginos = list(dict.fromkeys(reginos))
         if not reginos:
             QMessageBox.information(
@@ -497,71 +496,69 @@ class TrackingController(QObject):
                 QMessageBox.StandardButton.No) != QMessageBox.StandardButton.Yes:
             return
         management = TRACKING_MANAGEMENT_MANUAL_STOP if stop else TRACKING_MANAGEMENT_ACTIVE
-        thread = TrackingManagementUpdateThread(reginos, management, self)
-        self._tracking_management_update_thread = thread
-        self._set_tracking_summary(f"선택 {len(reginos)}건 추적 {action} 중…")
-        thread.result_ready.connect(self._on_tracking_management_update_finished)
-        thread.finished.connect(self._cleanup_tracking_management_update_thread)
-        thread.finished.connect(thread.deleteLater)
-        thread.start()
+        # 시트 반영은 공용 쓰기 큐가 맡고, 표에는 바로 반영해 둔다.
+        sheet_write_queue().enqueue(TRACKING_WRITE_MANAGEMENT, {
+            _normalize_tracking_no(regino): {"management": management} for regino in reginos
+        }, priority=PRIORITY_INTERACTIVE)
+        self._apply_tracking_management_locally(reginos, management)
+        self._set_tracking_summary(f"선택 {len(reginos)}건 추적 {action} — 시트 반영 대기")
+
+    def _apply_tracking_management_locally(self, reginos, management):
+        keys = {_normalize_tracking_no(regino) for regino in reginos}
+        for row in self._tracking_list_values[1:]:
+            if row and _normalize_tracking_no(row[0]) in keys:
+                row.extend([""] * (TRACKING_MANAGEMENT_COL + 1 - len(row)))
+                row[TRACKING_MANAGEMENT_COL] = management
+        self._populate_tracking_table()
+
+    def _on_tracking_write_flushed(self, kind, result):
+        """공용 쓰기 큐가 배송추적 시트 쓰기를 보낸 뒤(성공·실패) 부른다."""
+        if kind == TRACKING_WRITE_MANAGEMENT:
+            self._on_tracking_management_update_finished(result)
+        elif kind == TRACKING_WRITE_NOTES:
+            self._on_tracking_notes_update_finished(result)
+        elif kind == TRACKING_WRITE_UPSERT:
+            self._on_tracking_upsert_finished(result)
 
     def _on_tracking_management_update_finished(self, payload):
         if payload.get("ok"):
             self._set_tracking_summary(f"추적 상태 변경 {payload.get('updated', 0)}건 완료")
             self._load_tracking_list()
         else:
-            QMessageBox.warning(
-                self.host, "배송추적", f"추적 상태를 변경하지 못했습니다.\n\n{payload.get('error', '')}")
-
-    def _cleanup_tracking_management_update_thread(self):
-        self._tracking_management_update_thread = None
-
-    def _on_tracking_item_changed(self, item):
-        table = getattr(self.ui, "tableWidget_tracking", None)
-        if self._populating_tracking_table or table is None:
-            return
-        if table.column(item) != self._tracking_table_col(10):
-            return
-        regino_item = table.item(table.row(item), self._tracking_table_col(0))
-        if regino_item is None:
-            return
-        regino = regino_item.text().strip()
-        if not regino:
-            return
-        self._tracking_notes_pending[regino] = item.text()
-        self._flush_tracking_notes()
-
-    def _flush_tracking_notes(self):
-        if self._tracking_notes_update_thread is not None or not self._tracking_notes_pending:
-            return
-        self._tracking_notes_inflight = self._tracking_notes_pending
-        self._tracking_notes_pending = {}
-        thread = TrackingNotesUpdateThread(self._tracking_notes_inflight, self)
-        self._tracking_notes_update_thread = thread
-        thread.result_ready.connect(self._on_tracking_notes_update_finished)
-        thread.finished.connect(self._cleanup_tracking_notes_update_thread)
-        thread.finished.connect(thread.deleteLater)
-        thread.start()
+            # 변경은 쓰기 큐에 남아 있어 자동으로 다시 보낸다.
+            print(f"! 추적 상태 시트 반영 실패: {payload.get('error', '')}")
+            self._set_tracking_summary("추적 상태 변경을 시트에 반영하지 못했습니다 — 잠시 후 자동 재시도")
+
+    def _on_tracking_memo_edited(self, regino, text):
+        key = _normalize_tracking_no(regino)
+        text = str(text or "")
+        # 목록 원본에도 넣어 두어야 시트 반영 전에 표를 다시 그려도 예전 비고로 돌아가지 않는다.
+        for row in (self._tracking_list_values or [])[1:]:
+            if row and _normalize_tracking_no(row[0]) == key:
+                row.extend([""] * (TRACKING_TABLE_MEMO_COL + 1 - len(row)))
+                row[TRACKING_TABLE_MEMO_COL] = text
+        sheet_write_queue().enqueue(TRACKING_WRITE_NOTES, {key: {"note": text}},
+                                    priority=PRIORITY_INTERACTIVE)
 
     def _on_tracking_notes_update_finished(self, payload):
-        if not payload.get("ok"):
+        if payload.get("ok"):
+            return
+        print(f"! 비고 시트 반영 실패: {payload.get('error', '')}")
+        if payload.get("attempts", 0) == 1:
+            # 처음 실패했을 때만 알린다. 비고는 쓰기 큐에 남아 자동으로 다시 보낸다.
             QMessageBox.warning(
-                self.host, "배송추적", f"비고를 저장하지 못했습니다.\n\n{payload.get('error', '')}")
-
-    def _cleanup_tracking_notes_update_thread(self):
-        self._tracking_notes_update_thread = None
-        self._tracking_notes_inflight = {}
-        self._flush_tracking_notes()
+                self.host, "배송추적",
+                f"비고를 시트에 저장하지 못했습니다. 잠시 후 자동으로 다시 시도합니다.\n\n"
+                f"{payload.get('error', '')}")
 
-    def _on_tracking_cell_double_clicked(self, row, col):
+    def _on_tracking_double_clicked(self, index):
         """행 더블클릭 → 그 등기번호의 우체국 배송조회 웹페이지를 엽니다."""
-        if col == self._tracking_table_col(10):
+        if index.column() == self._tracking_table_col(10):
             return  # 비고 열은 인라인 편집용
-        table = getattr(self.ui, "tableWidget_tracking", None)
-        if table is None:
+        model, proxy = self._tracking_table_models()
+        if model is None:
             return
-        item = table.item(row, self._tracking_table_col(0))
-        regino = item.text().strip() if item is not None else ""
+        regino = model.regino(proxy.mapToSource(index).row())
         if regino:
             QDesktopServices.openUrl(QUrl(self._kpost_trace_web_url.format(regino=regino)))
 
@@ -603,48 +600,32 @@ class TrackingController(QObject):
 
 
     def _enqueue_tracking_registration(self, records):
-        """송장 등기번호 등록 요청을 모아 디바운스 후 백그라운드 upsert.
-        gspread 미설치·미인증이어도 앱은 비차단(조용히 보류/스킵)."""
-        if not records:
-            return
-        self._tracking_pending_records.extend(records)
-        self._tracking_push_timer.start(TRACKING_SHEET_PUSH_DEBOUNCE_MS)
-
-    def _flush_tracking_records(self):
-        if gspread is None:
-            return  # 패키지 없으면 보류(레코드 유지). 다음 등록 시 함께 시도.
-        if not self._tracking_pending_records:
-            return
-        if self._tracking_op_thread is not None:
-            # 진행 중인 upsert가 있으면 잠시 후 재시도(유실 방지).
-            self._tracking_push_timer.start(TRACKING_SHEET_PUSH_DEBOUNCE_MS)
-            return
-        records = self._tracking_pending_records
-        self._tracking_pending_records = []
-        self._tracking_inflight_records = records
-        thread = TrackingUpsertThread(records, self)
-        self._tracking_op_thread = thread
-        thread.result_ready.connect(self._on_tracking_upsert_finished)
-        thread.finished.connect(self._cleanup_tracking_op_thread)
-        thread.finished.connect(thread.deleteLater)
-        thread.start()
+        """송장 등기번호 등록 요청을 공용 쓰기 큐에 넣는다(시트 upsert는 백그라운드에서 묶어 보냄).
+        gspread 미설치·미인증이어도 앱은 비차단(요청은 로컬 저널에 남아 다음에 보냄)."""
+        entries = {}
+        for record in records or []:
+            regino = _normalize_tracking_no(record.get("등기번호"))
+            if regino:
+                # 저널에는 JSON으로 남기므로 엑셀에서 온 숫자·NaN도 문자열로 바꿔 둔다.
+                entries[regino] = {
+                    "등기번호": regino,
+                    "스토어": _journal_text(record.get("스토어")),
+                    "주문번호": _normalize_tracking_no(record.get("주문번호")),
+                    "수취인명": _journal_text(record.get("수취인명")),
+                }
+        if entries:
+            sheet_write_queue().enqueue(TRACKING_WRITE_UPSERT, entries, priority=PRIORITY_INTERACTIVE)
 
     def _on_tracking_upsert_finished(self, payload: dict):
-        inflight = self._tracking_inflight_records
-        self._tracking_inflight_records = []
         if payload.get("ok"):
             reg = payload.get("registered", 0)
             upd = payload.get("updated", 0)
             if reg or upd:
                 print(f"✓ 송장추적 시트 반영: 신규 {reg} / 보강 {upd}")
         else:
-            # 실패 → 다음 등록 기회에 함께 재시도하도록 되돌림(자동 재폴링은 하지 않음).
-            self._tracking_pending_records = inflight + self._tracking_pending_records
+            # 실패한 등록은 쓰기 큐에 남아 backoff 뒤 자동으로 다시 보낸다.
             print(f"! 송장추적 시트 반영 실패: {payload.get('error', '')}")
 
-    def _cleanup_tracking_op_thread(self):
-        self._tracking_op_thread = None
-
     def export_courier_receipt(self):
         """오늘 등록한 송장을 택배사 접수목록 Excel로 내보낸다."""
         if gspread is None:
@@ -768,6 +749,12 @@ class TrackingController(QObject):
                 )
                 if payload.get("aborted"):
                     msg += " · 우체국 부하로 일부 중단(ERR-131)"
+                rate = payload.get("rate") or {}
+                if rate.get("overloads"):
+                    msg += (f" · 부하로 감속 {rate['overloads']}회"
+                            f"(실효 {rate.get('effective_rate', 0)}건/초)")
+                if payload.get("deferred"):
+                    msg += f" · 시간 한도로 {payload['deferred']}건은 다음 조회로"
                 msg += skip_note
                 self._set_tracking_summary(msg)
             # 갱신된 상태를 표에 반영하고, 반영 후 정체 건 슬랙 알림 검토
@@ -819,6 +806,10 @@ class TrackingController(QObject):
         minutes = self._auto_refresh_interval_min()
         if minutes <= 0:
             return
+        from sheets_quota import sheets_governor
+
+        if sheets_governor().near_quota():
+            return  # Sheets 쿼터가 빠듯하면 다음 타이머에서 다시 시도
         regkey = self._get_kpost_regkey()
         thread = TrackingRefreshThread(regkey, self, auto=True, interval_min=minutes)
         self._tracking_refresh_thread = thread
@@ -835,16 +826,24 @@ class TrackingController(QObject):
             return
         if payload.get("skipped_recent"):
             return  # 다른 PC가 최근에 조회했거나 설정상 꺼짐 → 아무 것도 안 함
+        if payload.get("lease_lost"):
+            return  # 조회 중 다른 PC가 lease를 가져감 → 결과는 그쪽이 시트에 쓴다
         total = payload.get("total", 0)
+        archived = payload.get("archived", 0)
         if total:
             t = datetime.now().strftime("%H:%M:%S")
+            not_due = payload.get("not_due", 0)
             self._set_tracking_summary(
                 f"자동 갱신 {t} · 총 {total} / 완료 {payload.get('complete', 0)} / "
                 f"진행 {payload.get('progress', 0)} / 실패 {payload.get('failed', 0)}"
+                + (f" · 조회 주기 전 {not_due}건 건너뜀" if not_due else "")
+                + (f" · 완료 {archived}건 보관 탭으로 이동" if archived else "")
             )
+        elif archived:
+            self._set_tracking_summary(f"완료 {archived}건 보관 탭으로 이동")
         # 갱신 결과를 표에 반영하고, 반영 후 정체 건 슬랙 다이제스트 검토(하루 1통, 시트로 중복 방지)
         self._slack_notify_after_reload = True
-        self._load_tracking_list()
+        self._load_tracking_list(background=True)
 
     def _sync_auto_refresh_spinbox(self):
         """설정 팝업의 자동 새로고침 간격 스핀박스를 현재 값으로 갱신(시그널 차단)."""
@@ -947,15 +946,11 @@ class TrackingController(QObject):
             return row[idx] if idx < len(row) else ""
 
         out = []
-        for row in data:
-            done = _cell(row, 7).strip().upper() == "Y"
-            ev = self._parse_event_dt(_cell(row, 11))
-            ref = ev or self._parse_event_dt(_cell(row, 1))
-            risk, elapsed_h = self._evaluate_risk(
-                _cell(row, 6), _cell(row, 8), done, ref, now_dt,
-                _cell(row, TRACKING_MANAGEMENT_COL))
+        risks, elapsed = self._evaluate_risk_rows(data, now_dt)
+        for row, risk, elapsed_h in zip(data, risks, elapsed):
             if not risk:
                 continue
+            ev = self._parse_event_dt(_cell(row, 11))
             out.append({
                 "regino": _cell(row, 0),
                 "name": _cell(row, 4),
@@ -1014,6 +1009,8 @@ class TrackingController(QObject):
             reason = payload.get("reason", "")
             if reason == "unchanged":
                 print("· 다이제스트 생략: 직전 발송과 내용 동일")
+            elif reason == "busy":
+                print("· 다이제스트 생략: 다른 PC가 발송 처리 중")
             else:
                 print("· 다이제스트 생략: 오늘 이미 발송됨")
         else:
@@ -1169,6 +1166,8 @@ class TrackingController(QObject):
         if payload.get("ok"):
             self._set_tracking_summary("인증키를 공유 시트에 저장했습니다. (직원 전원 자동 적용)")
         else:
+            # 일부만 써졌을 수 있으므로 다음 worker가 시트를 다시 읽게 한다.
+            config_cache().invalidate()
             print(f"! 공유 설정 저장 실패: {payload.get('error', '')}")
 
     def _cleanup_tracking_config_write_thread(self):
@@ -0,0 +1,171 @@
+"""우체국 종추적 이벤트 이력의 로컬 SQLite 저장소.
+
+새로고침마다 받은 이벤트 목록을 등기번호별로 쌓는다. 같은 이벤트(날짜·시각·위치·상태)는
+한 번만 저장하고 지우거나 고치지 않는다(append-only). 마지막 조회 시각도 함께 남겨,
+최신 이벤트가 그대로라 Sheet에 쓰지 않은 행도 조회 주기를 계산할 수 있게 한다.
+"""
+
+from __future__ import annotations
+
+import sqlite3
+import threading
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Mapping, Sequence
+
+import pandas as pd
+
+from .service import RISK_HUB_KEYWORDS
+
+TRACKING_EVENT_TIME_FORMAT = "%Y.%m.%d %H:%M"
+
+
+class TrackingHistoryError(RuntimeError):
+    """종추적 이벤트 이력을 열거나 기록하지 못했을 때의 오류."""
+
+
+def default_tracking_history_path() -> Path:
+    """Git에 포함하지 않는 로컬 종추적 이력 파일 경로."""
+    return Path(__file__).resolve().parent.parent / "output" / "tracking-history.sqlite3"
+
+
+class TrackingEventStore:
+    """등기번호별 종추적 이벤트와 마지막 조회 시각을 보관한다."""
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.db_path = Path(db_path) if db_path else default_tracking_history_path()
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._initialize()
+        except (OSError, sqlite3.Error) as error:
+            raise TrackingHistoryError("종추적 이력 파일을 열지 못했습니다.") from error
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _initialize(self) -> None:
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tracking_events (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        regino TEXT NOT NULL,
+                        event_date TEXT NOT NULL,
+                        event_time TEXT NOT NULL,
+                        location TEXT NOT NULL,
+                        status TEXT NOT NULL,
+                        reason TEXT NOT NULL,
+                        recorded_at TEXT NOT NULL,
+                        UNIQUE (regino, event_date, event_time, location, status)
+                    )
+                    """,
+                )
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tracking_checks (
+                        regino TEXT PRIMARY KEY,
+                        checked_at TEXT NOT NULL
+                    )
+                    """,
+                )
+
+    def record(
+        self, regino: str, events: Sequence[Mapping[str, object]], checked_at: datetime,
+    ) -> int:
+        """조회 결과 이벤트를 추가하고 마지막 조회 시각을 남긴다. 반환: 새로 추가된 이벤트 수."""
+        regino = str(regino or "").strip()
+        if not regino:
+            return 0
+        stamp = checked_at.strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (regino, str(event.get("date", "") or "").strip(),
+             str(event.get("time", "") or "").strip(),
+             str(event.get("where", "") or "").strip(),
+             str(event.get("status", "") or "").strip(),
+             str(event.get("reason", "") or "").strip(), stamp)
+            for event in events or []
+        ]
+        try:
+            with self._lock, closing(self._connect()) as connection:
+                with connection:
+                    before = connection.total_changes
+                    connection.executemany(
+                        "INSERT OR IGNORE INTO tracking_events "
+                        "(regino, event_date, event_time, location, status, reason, recorded_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        rows,
+                    )
+                    added = connection.total_changes - before
+                    connection.execute(
+                        "INSERT OR REPLACE INTO tracking_checks (regino, checked_at) VALUES (?, ?)",
+                        (regino, stamp),
+                    )
+            return added
+        except sqlite3.Error as error:
+            raise TrackingHistoryError("종추적 이력을 기록하지 못했습니다.") from error
+
+    def last_checked(self, reginos: Sequence[str]) -> dict[str, datetime]:
+        """등기번호별 마지막 조회 시각. 기록이 없는 번호는 빠진다."""
+        keys = [str(regino or "").strip() for regino in reginos or []]
+        keys = [key for key in dict.fromkeys(keys) if key]
+        out = {}
+        with self._lock, closing(self._connect()) as connection:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                marks = ",".join("?" for _ in batch)
+                for row in connection.execute(
+                        f"SELECT regino, checked_at FROM tracking_checks WHERE regino IN ({marks})",
+                        batch):
+                    out[row["regino"]] = datetime.strptime(row["checked_at"], "%Y-%m-%d %H:%M:%S")
+        return out
+
+    def events(self, regino: str) -> list[dict[str, str]]:
+        """등기번호의 이벤트를 발생 순서(날짜·시각)로 반환한다."""
+        with self._lock, closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT event_date, event_time, location, status, reason FROM tracking_events "
+                "WHERE regino = ? ORDER BY event_date, event_time, id",
+                (str(regino or "").strip(),),
+            ).fetchall()
+        return [
+            {"date": row["event_date"], "time": row["event_time"], "where": row["location"],
+             "status": row["status"], "reason": row["reason"]}
+            for row in rows
+        ]
+
+    def dwell_hours(self, hubs_only: bool = True, since: datetime | None = None) -> pd.DataFrame:
+        """위치별 체류 시간 통계(시간). 체류 = 그 위치 이벤트부터 같은 송장의 다음 이벤트까지.
+
+        hubs_only면 물류센터·집중국 등 RISK_HUB_KEYWORDS 위치만 남긴다.
+        반환 열: where, count, mean_hours, median_hours, max_hours (mean_hours 내림차순).
+        """
+        with self._lock, closing(self._connect()) as connection:
+            frame = pd.read_sql_query(
+                "SELECT regino, event_date, event_time, location FROM tracking_events",
+                connection,
+            )
+        columns = ["where", "count", "mean_hours", "median_hours", "max_hours"]
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+        frame["at"] = pd.to_datetime(
+            frame["event_date"] + " " + frame["event_time"],
+            format=TRACKING_EVENT_TIME_FORMAT, errors="coerce")
+        frame = frame.dropna(subset=["at"]).sort_values(["regino", "at"], kind="stable")
+        frame["left_at"] = frame.groupby("regino")["at"].shift(-1)
+        frame = frame.dropna(subset=["left_at"])
+        if since is not None:
+            frame = frame[frame["at"] >= pd.Timestamp(since)]
+        if hubs_only:
+            frame = frame[frame["location"].str.contains("|".join(RISK_HUB_KEYWORDS), regex=True)]
+        if frame.empty:
+            return pd.DataFrame(columns=columns)
+        frame["hours"] = (frame["left_at"] - frame["at"]).dt.total_seconds() / 3600.0
+        stats = frame.groupby("location")["hours"].agg(
+            count="count", mean_hours="mean", median_hours="median", max_hours="max")
+        stats = stats.reset_index().rename(columns={"location": "where"})
+        return stats.sort_values("mean_hours", ascending=False, kind="stable").reset_index(drop=True)
@@ -0,0 +1,308 @@
+"""송장추적 Sheet의 로컬 SQLite 사본과 변경분 동기화.
+
+Sheet의 N열(수정시각)은 이 앱이 행을 쓸 때마다 새 값으로 찍는 행 버전이다.
+동기화는 등기번호(A)·수정시각(N) 두 열만 읽어 로컬 사본과 비교하고, 값이 달라졌거나
+새로 생긴 행만 A:N 상세를 다시 읽는다. 앱 밖에서 직접 고친 셀은 수정시각이 바뀌지
+않으므로 TRACKING_MIRROR_FULL_SYNC_SEC마다 한 번 전체를 다시 받아 맞춘다.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Mapping, Sequence
+
+
+TRACKING_MODIFIED_COL = 13
+TRACKING_MODIFIED_COLUMN = "N"
+TRACKING_MIRROR_LAST_COLUMN = TRACKING_MODIFIED_COLUMN
+TRACKING_MIRROR_FULL_SYNC_SEC = 600
+TRACKING_MIRROR_READ_BATCH_SIZE = 100
+# 바뀐 행이 이 비율을 넘으면 행별 batch_get보다 전체 읽기 1회가 싸다.
+TRACKING_MIRROR_FULL_READ_RATIO = 0.5
+
+_RANGE_PATTERN = re.compile(r"^([A-Z]+)(\d+)(?::([A-Z]+)(\d+))?$")
+
+
+class TrackingMirrorError(RuntimeError):
+    """송장추적 로컬 사본을 열거나 갱신하지 못했을 때의 오류."""
+
+
+def default_tracking_mirror_path() -> Path:
+    """Git에 포함하지 않는 로컬 송장추적 사본 파일 경로."""
+    return Path(__file__).resolve().parent.parent / "output" / "tracking-mirror.sqlite3"
+
+
+def column_index(letters: str) -> int:
+    """A1 표기의 열 문자를 0부터 시작하는 열 번호로 바꾼다."""
+    index = 0
+    for letter in letters:
+        index = index * 26 + (ord(letter) - ord("A") + 1)
+    return index - 1
+
+
+def column_letter(index: int) -> str:
+    """0부터 시작하는 열 번호를 A1 표기의 열 문자로 바꾼다."""
+    letters = ""
+    index += 1
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def parse_row_range(a1_range: str) -> tuple[int, int, int]:
+    """'G5:M5' 같은 범위를 (시작 행, 시작 열, 끝 열)로 바꾼다. 열은 0부터 센다."""
+    match = _RANGE_PATTERN.match(str(a1_range or "").strip().upper())
+    if match is None:
+        raise ValueError(f"지원하지 않는 범위입니다: {a1_range}")
+    start_col, start_row, end_col, _end_row = match.groups()
+    start = column_index(start_col)
+    end = column_index(end_col) if end_col else start
+    return int(start_row), start, end
+
+
+def new_row_stamp() -> str:
+    """행 버전으로 쓰는 수정시각. 여러 PC가 같은 초에 써도 겹치지 않게 마이크로초까지 쓴다."""
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+class TrackingMirror:
+    """송장추적 Sheet 행을 행 번호 기준으로 보관하고 등기번호로 찾는 SQLite 사본."""
+
+    def __init__(self, db_path: Path | str | None = None, clock=time.time):
+        self.db_path = Path(db_path) if db_path else default_tracking_mirror_path()
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._synced_at: float | None = None
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._initialize()
+        except (OSError, sqlite3.Error) as error:
+            raise TrackingMirrorError("송장추적 로컬 사본을 열지 못했습니다.") from error
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _initialize(self) -> None:
+        with closing(self._connect()) as connection:
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tracking_rows (
+                        row_number INTEGER PRIMARY KEY,
+                        regino TEXT NOT NULL,
+                        modified TEXT NOT NULL,
+                        cells TEXT NOT NULL
+                    )
+                    """,
+                )
+                connection.execute(
+                    "CREATE INDEX IF NOT EXISTS tracking_rows_regino ON tracking_rows (regino)"
+                )
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS tracking_meta (
+                        key TEXT PRIMARY KEY,
+                        value TEXT NOT NULL
+                    )
+                    """,
+                )
+
+    @staticmethod
+    def _sheet_identity(worksheet) -> str:
+        spreadsheet_id = getattr(worksheet, "spreadsheet_id", "") or ""
+        return f"{spreadsheet_id}:{getattr(worksheet, 'id', '')}"
+
+    def _meta(self, connection, key: str, default: str = "") -> str:
+        row = connection.execute(
+            "SELECT value FROM tracking_meta WHERE key = ?", (key,)).fetchone()
+        return row["value"] if row else default
+
+    @staticmethod
+    def _set_meta(connection, key: str, value: str) -> None:
+        connection.execute(
+            "INSERT OR REPLACE INTO tracking_meta (key, value) VALUES (?, ?)", (key, value))
+
+    @staticmethod
+    def _store_row(connection, row_number: int, cells: Sequence[object]) -> None:
+        cells = [str(cell if cell is not None else "") for cell in cells]
+        regino = cells[0].strip() if cells else ""
+        modified = cells[TRACKING_MODIFIED_COL] if len(cells) > TRACKING_MODIFIED_COL else ""
+        connection.execute(
+            "INSERT OR REPLACE INTO tracking_rows (row_number, regino, modified, cells) "
+            "VALUES (?, ?, ?, ?)",
+            (row_number, regino, modified, json.dumps(cells, ensure_ascii=False)),
+        )
+
+    def sync(self, worksheet, force_full: bool = False) -> dict[str, int | bool]:
+        """Sheet와 로컬 사본을 맞춘다. 바뀐 행만 상세를 읽는다.
+
+        반환: pulled(다시 읽은 행 수), removed(지운 행 수), total(Sheet 행 수), full(전체 읽기 여부).
+        """
+        with self._lock:
+            try:
+                result = self._sync(worksheet, force_full)
+            except sqlite3.Error as error:
+                raise TrackingMirrorError("송장추적 로컬 사본을 갱신하지 못했습니다.") from error
+            self._synced_at = self._clock()
+            return result
+
+    def synced_within(self, max_age_sec: float) -> bool:
+        """이 프로세스에서 max_age_sec 안에 Sheet와 맞췄는지."""
+        with self._lock:
+            return self._synced_at is not None and self._clock() - self._synced_at <= max_age_sec
+
+    def _sync(self, worksheet, force_full: bool) -> dict[str, int | bool]:
+        with closing(self._connect()) as connection:
+            identity = self._sheet_identity(worksheet)
+            last_full = float(self._meta(connection, "last_full_sync", "0") or 0)
+            stale = (
+                force_full
+                or self._meta(connection, "sheet") != identity
+                or self._clock() - last_full >= TRACKING_MIRROR_FULL_SYNC_SEC
+            )
+            if stale:
+                return self._full_sync(connection, worksheet, identity)
+
+            last = TRACKING_MIRROR_LAST_COLUMN
+            header_values, regino_values, modified_values = worksheet.batch_get(
+                [f"A1:{last}1", "A2:A", f"{last}2:{last}"])
+            reginos = [(row[0] if row else "").strip() for row in regino_values or []]
+            stamps = [row[0] if row else "" for row in modified_values or []]
+            total = max(len(reginos), len(stamps))
+            local = {
+                row["row_number"]: (row["regino"], row["modified"])
+                for row in connection.execute(
+                    "SELECT row_number, regino, modified FROM tracking_rows")
+            }
+            changed = []
+            for offset in range(total):
+                row_number = offset + 2
+                sheet_key = (
+                    reginos[offset] if offset < len(reginos) else "",
+                    stamps[offset] if offset < len(stamps) else "",
+                )
+                if local.get(row_number) != sheet_key:
+                    changed.append(row_number)
+            removed = [row_number for row_number in local if row_number > total + 1]
+            if total and len(changed) > total * TRACKING_MIRROR_FULL_READ_RATIO:
+                return self._full_sync(connection, worksheet, identity)
+
+            pulled = []
+            for start in range(0, len(changed), TRACKING_MIRROR_READ_BATCH_SIZE):
+                batch = changed[start:start + TRACKING_MIRROR_READ_BATCH_SIZE]
+                values = worksheet.batch_get([f"A{row}:{last}{row}" for row in batch])
+                pulled.extend(zip(batch, (value[0] if value else [] for value in values)))
+            with connection:
+                header = header_values[0] if header_values else []
+                self._set_meta(connection, "header", json.dumps(header, ensure_ascii=False))
+                for row_number, cells in pulled:
+                    self._store_row(connection, row_number, cells)
+                connection.executemany(
+                    "DELETE FROM tracking_rows WHERE row_number = ?",
+                    [(row_number,) for row_number in removed],
+                )
+            return {"pulled": len(pulled), "removed": len(removed), "total": total, "full": False}
+
+    def _full_sync(self, connection, worksheet, identity: str) -> dict[str, int | bool]:
+        values = worksheet.get_all_values()
+        header = values[0] if values else []
+        with connection:
+            connection.execute("DELETE FROM tracking_rows")
+            for row_number, cells in enumerate(values[1:], start=2):
+                self._store_row(connection, row_number, cells)
+            self._set_meta(connection, "header", json.dumps(header, ensure_ascii=False))
+            self._set_meta(connection, "sheet", identity)
+            self._set_meta(connection, "last_full_sync", str(self._clock()))
+        total = max(0, len(values) - 1)
+        return {"pulled": total, "removed": 0, "total": total, "full": True}
+
+    def values(self) -> list[list[str]]:
+        """get_all_values()와 같은 모양(헤더 + 행 번호 순서, 빈 행 유지)으로 반환한다."""
+        with self._lock, closing(self._connect()) as connection:
+            header = json.loads(self._meta(connection, "header", "[]"))
+            rows = connection.execute(
+                "SELECT row_number, cells FROM tracking_rows ORDER BY row_number").fetchall()
+        if not header and not rows:
+            return []
+        out = [header]
+        for row in rows:
+            while len(out) < row["row_number"] - 1:
+                out.append([])
+            out.append(json.loads(row["cells"]))
+        return out
+
+    def lookup(self, regino: str) -> tuple[int, list[str]] | None:
+        """등기번호의 첫 행 번호와 값을 반환한다. 없으면 None."""
+        with self._lock, closing(self._connect()) as connection:
+            row = connection.execute(
+                "SELECT row_number, cells FROM tracking_rows WHERE regino = ? "
+                "ORDER BY row_number LIMIT 1",
+                (str(regino or "").strip(),),
+            ).fetchone()
+        return (row["row_number"], json.loads(row["cells"])) if row else None
+
+    def row_numbers(self, reginos) -> dict[str, list[int]]:
+        """등기번호별 행 번호 목록(중복 등록이면 여럿). 사본에 없는 번호는 빠진다."""
+        keys = sorted({str(regino or "").strip() for regino in reginos or []} - {""})
+        if not keys:
+            return {}
+        found: dict[str, list[int]] = {}
+        with self._lock, closing(self._connect()) as connection:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                marks = ",".join("?" for _ in batch)
+                for row in connection.execute(
+                        f"SELECT regino, row_number FROM tracking_rows WHERE regino IN ({marks}) "
+                        "ORDER BY row_number", batch):
+                    found.setdefault(row["regino"], []).append(row["row_number"])
+        return found
+
+    def stamp_updates(self, updates: Sequence[Mapping[str, object]], stamp: str | None = None):
+        """갱신 payload가 건드리는 행마다 N열 수정시각 셀을 덧붙인 새 payload를 만든다."""
+        stamp = stamp or new_row_stamp()
+        rows = []
+        for update in updates or []:
+            start_row, _start, _end = parse_row_range(str(update["range"]))
+            for offset in range(len(update.get("values") or [[]])):
+                if start_row + offset not in rows:
+                    rows.append(start_row + offset)
+        return [*updates, *(
+            {"range": f"{TRACKING_MODIFIED_COLUMN}{row}", "values": [[stamp]]}
+            for row in rows
+        )]
+
+    def apply_updates(self, updates: Sequence[Mapping[str, object]]) -> None:
+        """Sheet에 반영한 batch_update payload를 로컬 사본에도 그대로 적용한다."""
+        with self._lock:
+            try:
+                with closing(self._connect()) as connection:
+                    with connection:
+                        for update in updates or []:
+                            self._apply_update(connection, update)
+            except sqlite3.Error as error:
+                raise TrackingMirrorError("송장추적 로컬 사본을 갱신하지 못했습니다.") from error
+
+    def _apply_update(self, connection, update: Mapping[str, object]) -> None:
+        start_row, start_col, end_col = parse_row_range(str(update["range"]))
+        for offset, new_cells in enumerate(update.get("values") or []):
+            row_number = start_row + offset
+            found = connection.execute(
+                "SELECT cells FROM tracking_rows WHERE row_number = ?", (row_number,)).fetchone()
+            if found is None:
+                continue  # 아직 받지 않은 행은 다음 동기화에서 읽는다.
+            cells = json.loads(found["cells"])
+            width = max(end_col, start_col + len(new_cells) - 1) + 1
+            cells.extend([""] * (width - len(cells)))
+            for index, value in enumerate(new_cells):
+                cells[start_col + index] = "" if value is None else str(value)
+            self._store_row(connection, row_number, cells)
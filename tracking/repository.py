@@ -2,27 +2,78 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+import os
+import socket
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Mapping, Sequence
 
 import pandas as pd
 
+from .config_cache import config_cache
+from .mirror import TrackingMirror, column_letter, new_row_stamp, parse_row_range
+from .sheet_handles import sheet_handles
+
 
 TRACKING_DETAIL_READ_BATCH_SIZE = 100
+# A열로 행 번호를 확인한 지 이 시간 안이면 쓰기 직전에 A열을 다시 읽지 않고 캐시를 믿는다.
+TRACKING_ROW_INDEX_FRESH_SEC = 10.0
+# 완료 후 오래된 행을 옮겨 두는 월별 보관 탭 제목 접두어. 예: 송장추적_보관_2026-07
+TRACKING_ARCHIVE_SHEET_PREFIX = "송장추적_보관_"
+# 공유 「설정」 탭에 lease를 적는 키 접두어. 값: "보유자#nonce|만료시각"
+LEASE_KEY_PREFIX = "lease_"
+LEASE_TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 보유 PC가 죽으면 이 시간 뒤 다른 PC가 이어받는다. 살아 있는 동안은 heartbeat로 연장한다.
+LEASE_TTL_SEC = 180
+LEASE_HEARTBEAT_SEC = 60
+# 기록 후 다시 읽기 전 대기. 거의 동시에 선점한 PC끼리는 나중에 쓴 쪽만 자기 값을 읽는다.
+LEASE_SETTLE_SEC = 2.0
+# 켜져 있으면 송장추적 읽기는 변경분만 받아 로컬 사본에서, 쓰기는 Sheet와 사본에 함께 반영한다.
+_tracking_mirror: TrackingMirror | None = None
+
+
+def attach_tracking_mirror(mirror: TrackingMirror | None) -> None:
+    """송장추적 로컬 사본을 연결한다. None이면 연결을 끊고 Sheet를 직접 읽는다."""
+    global _tracking_mirror
+    _tracking_mirror = mirror
+
+
+def tracking_mirror() -> TrackingMirror | None:
+    return _tracking_mirror
+
+
+def _column_letter(count: int) -> str:
+    letters = ""
+    while count > 0:
+        count, remainder = divmod(count - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
 
 
 def open_tracking_worksheet(
     gc, spreadsheet_id: str, sheet_title: str, headers: Sequence[str],
 ):
-    """배송추적 시트를 제목으로 열고 없으면 현재 스키마로 생성한다."""
-    spreadsheet = gc.open_by_key(spreadsheet_id)
-    for worksheet in spreadsheet.worksheets():
-        if worksheet.title == sheet_title:
-            if len(worksheet.row_values(1)) < len(headers):
-                worksheet.update([list(headers)], range_name="A1:M1", value_input_option="RAW")
-            return worksheet
-    worksheet = spreadsheet.add_worksheet(title=sheet_title, rows=2000, cols=len(headers))
-    worksheet.update([list(headers)], range_name="A1", value_input_option="RAW")
+    """배송추적 시트를 제목으로 열고 없으면 현재 스키마로 생성한다.
+
+    핸들은 프로세스 공용 캐시(sheet_handles)에서 꺼내고, 헤더 확인은 핸들을 새로 받았을 때만 한다.
+    """
+    handles = sheet_handles()
+    worksheet = handles.worksheet(gc, spreadsheet_id, sheet_title)
+    if worksheet is None:
+        worksheet = handles.add_worksheet(gc, spreadsheet_id, sheet_title, rows=2000, cols=len(headers))
+        worksheet.update([list(headers)], range_name="A1", value_input_option="RAW")
+        handles.first_use(spreadsheet_id, sheet_title)
+        return worksheet
+    if handles.first_use(spreadsheet_id, sheet_title) and len(worksheet.row_values(1)) < len(headers):
+        if getattr(worksheet, "col_count", len(headers)) < len(headers):
+            worksheet.add_cols(len(headers) - worksheet.col_count)
+        worksheet.update(
+            [list(headers)], range_name=f"A1:{_column_letter(len(headers))}1",
+            value_input_option="RAW",
+        )
     return worksheet
 
 
@@ -30,11 +81,11 @@ def open_config_worksheet(
     gc, spreadsheet_id: str, sheet_title: str, headers: Sequence[str],
 ):
     """공유 설정 시트를 제목으로 열고 없으면 현재 스키마로 생성한다."""
-    spreadsheet = gc.open_by_key(spreadsheet_id)
-    for worksheet in spreadsheet.worksheets():
-        if worksheet.title == sheet_title:
-            return worksheet
-    worksheet = spreadsheet.add_worksheet(title=sheet_title, rows=50, cols=2)
+    handles = sheet_handles()
+    worksheet = handles.worksheet(gc, spreadsheet_id, sheet_title)
+    if worksheet is not None:
+        return worksheet
+    worksheet = handles.add_worksheet(gc, spreadsheet_id, sheet_title, rows=50, cols=2)
     worksheet.update([list(headers)], range_name="A1", value_input_option="RAW")
     return worksheet
 
@@ -54,10 +105,9 @@ def normalize_tracking_no(value) -> str:
     return text[:-2] if text.endswith(".0") else text
 
 
-def read_config_values_map(worksheet) -> dict[str, str]:
-    """설정 시트의 키/값 행을 dict로 반환한다."""
+def _config_rows_to_map(rows) -> dict[str, str]:
     config = {}
-    for row in worksheet.get_all_values()[1:]:
+    for row in rows[1:]:
         if not row:
             continue
         key = (row[0] or "").strip()
@@ -66,12 +116,37 @@ def read_config_values_map(worksheet) -> dict[str, str]:
     return config
 
 
+def read_config_values_map(worksheet) -> dict[str, str]:
+    """설정 시트의 키/값 행을 시트에서 바로 읽어 dict로 반환한다. 읽은 값은 공용 캐시에도 넣는다."""
+    config = _config_rows_to_map(worksheet.get_all_values())
+    config_cache().store(worksheet, config)
+    return config
+
+
+def cached_config_values(worksheet) -> dict[str, str]:
+    """설정 키/값을 공용 캐시에서 꺼낸다. TTL(CONFIG_CACHE_TTL_SEC)이 지났으면 시트를 다시 읽는다.
+
+    worker 시작 시 키·기준값을 읽는 용도다. 다른 PC와 겨루는 값(lease 등)은 read_config_values_map으로
+    읽는다(claim_lease가 다시 읽은 직후라면 캐시도 그때 값이다).
+    """
+    cached = config_cache().get(worksheet)
+    if cached is not None:
+        return cached
+    return read_config_values_map(worksheet)
+
+
 def write_config_values(worksheet, updates: Mapping[str, object]) -> None:
-    """설정 시트의 키/값을 현재 행에 갱신하거나 새 행으로 추가한다."""
+    """설정 시트의 키/값을 현재 행에 갱신하거나 새 행으로 추가한다. 쓴 값은 공용 캐시에도 반영한다.
+
+    두 PC가 없던 키를 동시에 추가해 같은 키 행이 여럿이면, 읽기(_config_rows_to_map)와 같이
+    마지막 행에 쓴다. 첫 행에 쓰면 읽을 때 보이지 않아 lease 확인이 계속 실패한다.
+    """
+    rows = worksheet.get_all_values()
+    config_cache().store(worksheet, _config_rows_to_map(rows))
     key_to_row = {}
-    for row_index, row in enumerate(worksheet.get_all_values()[1:], start=2):
+    for row_index, row in enumerate(rows[1:], start=2):
         key = (row[0] if row else "").strip()
-        if key and key not in key_to_row:
+        if key:
             key_to_row[key] = row_index
     pairs = [(key, str(value)) for key, value in (updates or {}).items() if value is not None]
     new_rows = []
@@ -85,11 +160,226 @@ def write_config_values(worksheet, updates: Mapping[str, object]) -> None:
         worksheet.append_rows(new_rows, value_input_option="RAW")
     if batch_updates:
         worksheet.batch_update(batch_updates, value_input_option="RAW")
+    config_cache().apply(worksheet, {key: value.strip() for key, value in pairs})
+
+
+def lease_holder_id() -> str:
+    """이 프로세스의 lease 보유자 id(PC 이름/프로세스 번호)."""
+    return f"{socket.gethostname()}/{os.getpid()}"
+
+
+def _parse_lease(value: str) -> tuple[str, datetime | None]:
+    token, _sep, expires = str(value or "").strip().rpartition("|")
+    try:
+        return token, datetime.strptime(expires.strip(), LEASE_TIME_FORMAT)
+    except ValueError:
+        return token, None
+
+
+def read_lease(worksheet, name: str) -> tuple[str, datetime | None]:
+    """설정 탭의 lease 값을 (토큰, 만료시각)으로 읽는다. 없거나 깨진 값이면 만료시각 None."""
+    return _parse_lease(read_config_values_map(worksheet).get(LEASE_KEY_PREFIX + name, ""))
+
+
+class SheetLease:
+    """claim_lease로 얻은 공유 설정 탭 lease. heartbeat로 연장하고 release로 놓는다."""
+
+    def __init__(self, worksheet, name: str, token: str, expires_at: datetime, clock=datetime.now):
+        self.worksheet = worksheet
+        self.name = name
+        self.token = token
+        self.expires_at = expires_at
+        self.lost = False
+        self._clock = clock
+
+    def _write(self, expires_at: datetime) -> None:
+        write_config_values(self.worksheet, {
+            LEASE_KEY_PREFIX + self.name: f"{self.token}|{expires_at.strftime(LEASE_TIME_FORMAT)}",
+        })
+        self.expires_at = expires_at
+
+    def held(self) -> bool:
+        """시트 값이 아직 이 lease인지 다시 읽어 확인한다."""
+        return read_lease(self.worksheet, self.name)[0] == self.token
+
+    def heartbeat(self, ttl_sec: float = LEASE_TTL_SEC) -> bool:
+        """아직 보유 중이면 만료를 지금+ttl로 늦춘다. 다른 PC가 가져갔으면 False."""
+        if self.lost or not self.held():
+            self.lost = True
+            return False
+        self._write(self._clock() + timedelta(seconds=ttl_sec))
+        return True
+
+    @contextmanager
+    def keep_alive(self, interval_sec: float = LEASE_HEARTBEAT_SEC, ttl_sec: float = LEASE_TTL_SEC):
+        """블록을 실행하는 동안 백그라운드 스레드가 interval_sec마다 heartbeat를 보낸다."""
+        stop = threading.Event()
+
+        def beat():
+            while not stop.wait(interval_sec):
+                try:
+                    if not self.heartbeat(ttl_sec):
+                        return
+                except Exception as error:
+                    print(f"! Lease heartbeat failed ({self.name}): {error}")
+
+        thread = threading.Thread(target=beat, name=f"lease-{self.name}", daemon=True)
+        thread.start()
+        try:
+            yield self
+        finally:
+            stop.set()
+            thread.join()
+
+    def release(self, hold_until: datetime | None = None) -> None:
+        """lease를 놓는다. hold_until이 있으면 그때까지 다른 PC가 가져가지 못하게 남겨 둔다."""
+        if self.lost or not self.held():
+            self.lost = True
+            return
+        self._write(hold_until or self._clock())
+
+
+def claim_lease(
+    worksheet,
+    name: str,
+    ttl_sec: float = LEASE_TTL_SEC,
+    holder: str | None = None,
+    settle_sec: float = LEASE_SETTLE_SEC,
+    clock=datetime.now,
+    sleep=time.sleep,
+) -> SheetLease | None:
+    """공유 설정 탭의 lease `name`을 선점한다. 다른 보유자가 아직 쥐고 있으면 None.
+
+    만료됐거나 같은 보유자(같은 PC의 같은 프로세스)가 쥔 lease만 가져간다. 새 토큰과
+    만료시각(지금+ttl)을 쓰고 settle_sec 뒤 다시 읽어 그대로일 때만 성공이다(read-after-write
+    비교). 시각은 각 PC 시계를 쓰므로 PC 간 오차만큼 만료 판정이 앞뒤로 밀린다.
+    """
+    holder = holder or lease_holder_id()
+    token, expires_at = read_lease(worksheet, name)
+    now = clock()
+    current_holder = token.partition("#")[0]
+    if expires_at is not None and expires_at > now and current_holder != holder:
+        return None
+    lease = SheetLease(worksheet, name, f"{holder}#{uuid.uuid4().hex[:8]}", now, clock=clock)
+    lease._write(now + timedelta(seconds=ttl_sec))
+    if settle_sec:
+        sleep(settle_sec)
+    if not lease.held():
+        return None
+    return lease
 
 
 def read_tracking_values(worksheet) -> list[list[str]]:
-    """배송추적 시트 전체 값을 읽는다."""
-    return worksheet.get_all_values()
+    """배송추적 시트 전체 값을 읽는다. 로컬 사본이 있으면 바뀐 행만 받아 사본에서 읽는다."""
+    if _tracking_mirror is None:
+        return worksheet.get_all_values()
+    _tracking_mirror.sync(worksheet)
+    return _tracking_mirror.values()
+
+
+class TrackingRowIndex:
+    """등기번호 → Sheet 행 번호 캐시.
+
+    A2:A 한 열만 읽어 만들고, 읽은 열의 행 수가 바뀌었거나 캐시한 행의 등기번호가 열 값과
+    다르면(행 삭제·정렬) 다시 만든다. 단건 갱신이 시트 전체를 내려받지 않게 하는 용도다.
+    같은 등기번호가 여러 행에 있으면 행 번호를 모두 기억한다.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self._lock = threading.Lock()
+        self._rows: dict[str, list[int]] = {}
+        self._count = -1
+        self._checked_at: float | None = None
+        self._clock = clock
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rows = {}
+            self._count = -1
+            self._checked_at = None
+
+    def _rebuild(self, column: Sequence[str]) -> None:
+        rows: dict[str, list[int]] = {}
+        for row_index, value in enumerate(column, start=2):
+            regino = normalize_tracking_no(value)
+            if regino:
+                rows.setdefault(regino, []).append(row_index)
+        self._rows = rows
+        self._count = len(column)
+
+    def lookup(self, worksheet, reginos) -> dict[str, int]:
+        """정규화한 등기번호별 첫 행 번호를 반환한다. 시트에 없는 번호는 빠진다."""
+        return {key: rows[0] for key, rows in self.lookup_all(worksheet, reginos).items()}
+
+    def lookup_all(self, worksheet, reginos) -> dict[str, list[int]]:
+        """A열을 읽어 정규화한 등기번호별 행 번호 목록(중복 등록이면 여럿)을 반환한다."""
+        keys = [normalize_tracking_no(regino) for regino in reginos or []]
+        keys = [key for key in keys if key]
+        if not keys:
+            return {}
+        values = worksheet.batch_get(["A2:A"])
+        column = [row[0] if row else "" for row in (values[0] if values else None) or []]
+        with self._lock:
+            stale = self._count != len(column) or any(
+                normalize_tracking_no(column[row - 2]) != key
+                for key, rows in self._rows.items() if key in keys for row in rows
+            )
+            if stale:
+                self._rebuild(column)
+            self._checked_at = self._clock()
+            return {key: list(self._rows[key]) for key in keys if key in self._rows}
+
+    def cached(self, reginos, max_age_sec: float) -> dict[str, list[int]] | None:
+        """max_age_sec 안에 A열로 확인한 행 번호 목록(시트를 읽지 않는다). 오래됐으면 None."""
+        with self._lock:
+            if self._checked_at is None or self._clock() - self._checked_at > max_age_sec:
+                return None
+            keys = {normalize_tracking_no(regino) for regino in reginos or []}
+            return {key: list(self._rows[key]) for key in keys if key in self._rows}
+
+
+_tracking_row_index = TrackingRowIndex()
+
+
+def find_tracking_rows(worksheet, reginos) -> dict[str, int]:
+    """등기번호별 행 번호를 좁은 읽기(A열, 사본이 있으면 A·N열)로 찾는다."""
+    if _tracking_mirror is None:
+        return _tracking_row_index.lookup(worksheet, reginos)
+    _tracking_mirror.sync(worksheet)
+    found = {}
+    for regino in reginos or []:
+        key = normalize_tracking_no(regino)
+        hit = _tracking_mirror.lookup(key) if key else None
+        if hit is not None:
+            found[key] = hit[0]
+    return found
+
+
+def _tracking_row_numbers(worksheet, reginos, max_age_sec: float | None = None):
+    """등기번호별 현재 행 번호 목록. max_age_sec가 있으면 그 안에 확인한 캐시(사본)만 보고
+    시트는 읽지 않으며 오래됐으면 None, 없으면 A열(사본이 있으면 변경분)을 다시 읽는다."""
+    if _tracking_mirror is None:
+        if max_age_sec is not None:
+            return _tracking_row_index.cached(reginos, max_age_sec)
+        return _tracking_row_index.lookup_all(worksheet, reginos)
+    if max_age_sec is None:
+        _tracking_mirror.sync(worksheet)
+    elif not _tracking_mirror.synced_within(max_age_sec):
+        return None
+    return _tracking_mirror.row_numbers(
+        {normalize_tracking_no(regino) for regino in reginos or []} - {""})
+
+
+def find_tracking_row(worksheet, regino) -> tuple[int, list[str]] | None:
+    """등기번호 한 건의 (행 번호, A:M 값)을 반환한다. 없으면 None."""
+    key = normalize_tracking_no(regino)
+    if _tracking_mirror is not None:
+        _tracking_mirror.sync(worksheet)
+        return _tracking_mirror.lookup(key) if key else None
+    row_index = _tracking_row_index.lookup(worksheet, [key]).get(key)
+    if row_index is None:
+        return None
+    return row_index, read_tracking_rows(worksheet, [row_index])[0]
 
 
 def read_tracking_list_metadata(worksheet) -> tuple[list[str], list[list[str]]]:
@@ -119,13 +409,76 @@ def read_tracking_rows(worksheet, row_numbers: Sequence[int]) -> list[list[str]]
 
 
 def batch_update_tracking(worksheet, updates) -> None:
-    """배송추적 시트에 현재 payload 형식의 일괄 업데이트를 반영한다."""
-    if updates:
+    """배송추적 시트에 현재 payload 형식의 일괄 업데이트를 반영한다.
+
+    로컬 사본이 있으면 건드린 행의 N열 수정시각을 함께 쓰고, Sheet 반영이 끝난 뒤 사본에도 적용한다.
+    """
+    if not updates:
+        return
+    if _tracking_mirror is None:
         worksheet.batch_update(updates, value_input_option="RAW")
+        return
+    stamped = _tracking_mirror.stamp_updates(updates)
+    worksheet.batch_update(stamped, value_input_option="RAW")
+    _tracking_mirror.apply_updates(stamped)
+
+
+def batch_update_tracking_rows(worksheet, updates, reginos_by_row: Mapping[int, str]) -> int:
+    """앞서 읽은 행 번호로 만든 payload를 쓰기 직전에 등기번호로 다시 맞춰 쓴다.
+
+    reginos_by_row는 payload를 만들 때 읽은 {행 번호: 등기번호}다. 방금(TRACKING_ROW_INDEX_FRESH_SEC
+    안) 확인한 행 번호 캐시와 맞으면 시트를 읽지 않고 그대로 쓴다. 캐시가 오래됐거나 맞지 않으면
+    A열을 다시 읽고, 그 사이 다른 PC의 보관(archive_tracking_rows의 행 삭제)으로 밀린 행은 그
+    등기번호의 현재 행으로 옮긴다. 시트에서 사라졌거나 여러 행에 있어 어느 행인지 알 수 없는
+    등기번호의 갱신은 버린다. 옮기거나 버린 행은 하나씩 로그에 남긴다. 반환: 버린 행 수.
+    """
+    if not updates:
+        return 0
+    expected = {row: normalize_tracking_no(regino) for row, regino in reginos_by_row.items()}
+    keys = set(expected.values())
+    cached = _tracking_row_numbers(worksheet, keys, TRACKING_ROW_INDEX_FRESH_SEC)
+    if cached is not None and all(row in cached.get(regino, ()) for row, regino in expected.items()):
+        batch_update_tracking(worksheet, updates)
+        return 0
+    _tracking_row_index.invalidate()
+    current = _tracking_row_numbers(worksheet, keys)
+    if all(row in current.get(regino, ()) for row, regino in expected.items()):
+        batch_update_tracking(worksheet, updates)
+        return 0
+    moved = []
+    remapped = {}
+    dropped = {}
+    for update in updates:
+        start_row, start, end = parse_row_range(update["range"])
+        for offset, values in enumerate(update["values"]):
+            row = start_row + offset
+            regino = expected.get(row, "")
+            rows = current.get(regino, [])
+            if row in rows:
+                target = row
+            elif len(rows) == 1:
+                target = remapped[row] = rows[0]
+            else:
+                dropped[row] = "시트에 없음" if not rows else f"{len(rows)}개 행에 중복"
+                continue
+            a1 = f"{column_letter(start)}{target}"
+            if end > start:
+                a1 += f":{column_letter(end)}{target}"
+            moved.append({"range": a1, "values": [values]})
+    for row, target in sorted(remapped.items()):
+        print(f"! 송장추적 {expected[row]}: 행 번호가 바뀌어 {row}행 대신 {target}행에 씁니다.")
+    for row, reason in sorted(dropped.items()):
+        print(f"! 송장추적 {expected.get(row) or '?'}: {row}행 갱신을 건너뜁니다({reason}).")
+    if moved:
+        batch_update_tracking(worksheet, moved)
+    return len(dropped)
 
 
 def update_tracking_cell(worksheet, row_index: int, column: str, value: str) -> None:
     """배송추적 시트 단일 셀을 현재 RAW 방식으로 갱신한다."""
+    if _tracking_mirror is not None:
+        batch_update_tracking(worksheet, [{"range": f"{column}{row_index}", "values": [[value]]}])
+        return
     worksheet.update([[value]], range_name=f"{column}{row_index}", value_input_option="RAW")
 
 
@@ -182,12 +535,13 @@ def upsert_tracking_records(
         else:
             new_rows.append([
                 regino, timestamp, record["스토어"], record["주문번호"], record["수취인명"],
-                "우체국", "", "", "", "", "", "", management_active,
+                "우체국", "", "", "", "", "", "", management_active, new_row_stamp(),
             ])
             key_to_row[regino] = (None, None)
             registered += 1
     if new_rows:
         worksheet.append_rows(new_rows, value_input_option="RAW")
+        _tracking_row_index.invalidate()
     batch_update_tracking(worksheet, updates)
     return {"registered": registered, "updated": updated}
 
@@ -196,13 +550,11 @@ def update_tracking_management(worksheet, reginos, management: str) -> dict[str,
     """선택된 등기번호의 M열 관리상태를 일괄 갱신한다."""
     keys = {normalize_tracking_no(regino) for regino in reginos or []}
     keys.discard("")
-    found = set()
-    updates = []
-    for row_index, row in enumerate(read_tracking_values(worksheet)[1:], start=2):
-        regino = normalize_tracking_no(row[0] if row else "")
-        if regino in keys:
-            found.add(regino)
-            updates.append({"range": f"M{row_index}", "values": [[management]]})
+    found = find_tracking_rows(worksheet, keys)
+    updates = [
+        {"range": f"M{row_index}", "values": [[management]]}
+        for row_index in sorted(found.values())
+    ]
     batch_update_tracking(worksheet, updates)
     return {"updated": len(found), "missing": len(keys) - len(found)}
 
@@ -214,10 +566,124 @@ def update_tracking_notes(worksheet, notes: Mapping[str, object]) -> int:
         for regino, note in (notes or {}).items()
         if normalize_tracking_no(regino)
     }
-    updates = []
-    for row_index, row in enumerate(read_tracking_values(worksheet)[1:], start=2):
-        regino = normalize_tracking_no(row[0] if row else "")
-        if regino in normalized:
-            updates.append({"range": f"K{row_index}", "values": [[normalized[regino]]]})
+    found = find_tracking_rows(worksheet, normalized)
+    updates = [
+        {"range": f"K{row_index}", "values": [[normalized[regino]]]}
+        for regino, row_index in sorted(found.items(), key=lambda item: item[1])
+    ]
     batch_update_tracking(worksheet, updates)
     return len(updates)
+
+
+def tracking_archive_title(month: str) -> str:
+    return f"{TRACKING_ARCHIVE_SHEET_PREFIX}{month}"
+
+
+def list_tracking_archive_worksheets(spreadsheet) -> list:
+    """보관 탭을 월 순서로 반환한다."""
+    archives = [
+        worksheet for worksheet in spreadsheet.worksheets()
+        if worksheet.title.startswith(TRACKING_ARCHIVE_SHEET_PREFIX)
+    ]
+    return sorted(archives, key=lambda worksheet: worksheet.title)
+
+
+def _open_tracking_archive_worksheet(spreadsheet, existing, month: str, headers: Sequence[str]):
+    title = tracking_archive_title(month)
+    for worksheet in existing:
+        if worksheet.title == title:
+            return worksheet
+    worksheet = spreadsheet.add_worksheet(title=title, rows=1000, cols=len(headers))
+    worksheet.update([list(headers)], range_name="A1", value_input_option="RAW")
+    existing.append(worksheet)
+    return worksheet
+
+
+def archive_tracking_rows(
+    worksheet, values: Sequence[Sequence[object]], selections: Sequence[tuple[int, str]],
+    headers: Sequence[str],
+) -> dict[str, object]:
+    """선택한 송장추적 행을 월별 보관 탭으로 옮기고 원본 시트에서 지운다.
+
+    values는 selections를 고를 때 읽은 get_all_values() 모양의 값이다. 보관 탭에 먼저 추가한
+    뒤 원본에서 지우며, 지우기 직전 A열을 다시 읽어 등기번호가 그대로인 행만 지운다.
+    중간에 실패해 다시 돌려도 보관 탭에 이미 있는 등기번호는 중복 추가하지 않는다.
+    반환: archived(옮긴 행 수), months(추가한 보관월 목록).
+    """
+    spreadsheet = worksheet.spreadsheet
+    width = len(headers)
+    by_month: dict[str, list[tuple[int, list[str]]]] = {}
+    for row_number, month in selections:
+        if not 2 <= row_number <= len(values):
+            continue
+        row = [str(cell) for cell in values[row_number - 1]][:width]
+        if normalize_tracking_no(row[0] if row else ""):
+            by_month.setdefault(month, []).append((row_number, row + [""] * (width - len(row))))
+    if not by_month:
+        return {"archived": 0, "months": []}
+
+    existing = list_tracking_archive_worksheets(spreadsheet)
+    for month, rows in sorted(by_month.items()):
+        archive = _open_tracking_archive_worksheet(spreadsheet, existing, month, headers)
+        column = archive.batch_get(["A2:A"])
+        archived = {
+            normalize_tracking_no(row[0] if row else "")
+            for row in ((column[0] if column else None) or [])
+        }
+        new_rows = [row for _row_number, row in rows
+                    if normalize_tracking_no(row[0]) not in archived]
+        if new_rows:
+            archive.append_rows(new_rows, value_input_option="RAW")
+
+    current = worksheet.batch_get(["A2:A"])
+    current = [row[0] if row else "" for row in ((current[0] if current else None) or [])]
+    delete = sorted(
+        row_number
+        for rows in by_month.values()
+        for row_number, row in rows
+        if row_number - 2 < len(current)
+        and normalize_tracking_no(current[row_number - 2]) == normalize_tracking_no(row[0])
+    )
+    spans: list[list[int]] = []
+    for row_number in delete:
+        if spans and spans[-1][1] == row_number - 1:
+            spans[-1][1] = row_number
+        else:
+            spans.append([row_number, row_number])
+    if spans:
+        # 아래쪽 구간부터 지워야 앞 구간의 행 번호가 밀리지 않는다. 한 번의 요청으로 보낸다.
+        spreadsheet.batch_update({"requests": [
+            {"deleteDimension": {"range": {
+                "sheetId": worksheet.id, "dimension": "ROWS",
+                "startIndex": first - 1, "endIndex": last,
+            }}}
+            for first, last in reversed(spans)
+        ]})
+        _tracking_row_index.invalidate()
+    return {"archived": len(delete), "months": sorted(by_month)}
+
+
+def read_tracking_archive_values(spreadsheet, months: Sequence[str] | None = None) -> list[list[str]]:
+    """보관 탭의 행(헤더 제외)을 월 순서로 한 번의 요청으로 읽는다. months로 보관월을 좁힐 수 있다."""
+    titles = [worksheet.title for worksheet in list_tracking_archive_worksheets(spreadsheet)]
+    if months is not None:
+        wanted = {tracking_archive_title(month) for month in months}
+        titles = [title for title in titles if title in wanted]
+    if not titles:
+        return []
+    response = spreadsheet.values_batch_get([f"'{title}'!A2:N" for title in titles])
+    rows = []
+    for value_range in (response or {}).get("valueRanges", []):
+        rows.extend(row for row in value_range.get("values", []) if row)
+    return rows
+
+
+def find_archived_tracking_row(spreadsheet, regino) -> list[str] | None:
+    """보관 탭에서 등기번호 한 건의 행을 찾는다. 없으면 None."""
+    key = normalize_tracking_no(regino)
+    if not key:
+        return None
+    for row in reversed(read_tracking_archive_values(spreadsheet)):
+        if normalize_tracking_no(row[0]) == key:
+            return row
+    return None
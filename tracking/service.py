@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import hashlib
+import re
 from datetime import datetime, timedelta
 from typing import Mapping, Sequence
 
+import numpy as np
+import pandas as pd
+
 
 TRACKING_MANAGEMENT_COL = 12
 TRACKING_MANAGEMENT_ACTIVE = "추적중"
@@ -18,6 +22,15 @@ TRACKING_MANAGEMENT_EXCLUDED = {
     TRACKING_MANAGEMENT_MANUAL_STOP,
 }
 TRACKING_COMPLETED_LOOKBACK_DAYS = 14
+# 완료 후 이 일수가 지난 행은 월별 보관 탭으로 옮긴다. 설정 탭 값이 0이면 보관하지 않는다.
+TRACKING_ARCHIVE_AFTER_DAYS = 30
+CONFIG_KEY_ARCHIVE_DAYS = "tracking_archive_days"
+TRACKING_LIST_TIMESTAMP_FORMATS = (
+    "%Y-%m-%d %H:%M:%S",
+    "%Y-%m-%d %H:%M",
+    "%Y.%m.%d %H:%M:%S",
+    "%Y.%m.%d %H:%M",
+)
 
 TRACKING_DISCARD_CANDIDATE_HOURS = 48
 TRACKING_DISCARD_CONFIRM_HOURS = 72
@@ -41,6 +54,15 @@ CONFIG_KEY_INQUIRY_WORK_END = "inquiry_work_end_hour"
 NAVER_INQUIRY_WORK_START_HOUR = 10
 NAVER_INQUIRY_WORK_END_HOUR = 19
 
+# 행별 조회 주기(분). 다음 조회 예정 = 최근조회시각 + 주기. 배달준비는 곧 바뀌므로 짧게,
+# 오래 멈춘 건은 위험 확인을 위해 매시간, 정상 이동 중인 건은 그보다 드물게 본다.
+TRACKING_CADENCE_OUT_FOR_DELIVERY_MIN = 20
+TRACKING_CADENCE_STUCK_MIN = 60
+TRACKING_CADENCE_MOVING_MIN = 120
+TRACKING_CADENCE_STUCK_HOURS = 24
+# 자동 새로고침 주기와 딱 맞물려 한 주기씩 밀리지 않도록 예정 시각 조금 전이면 조회한다.
+TRACKING_CADENCE_GRACE_MIN = 5
+
 RISK_HUB_KEYWORDS = ("물류", "허브", "터미널", "집중국", "교환센터")
 RISK_EXCLUDE_STATUS = ("배달준비",)
 RISK_REMOTE_KEYWORDS = ("제주", "서귀포", "울릉", "백령", "연평", "흑산", "추자", "거문")
@@ -57,19 +79,42 @@ def is_weekday(now_dt: datetime | None = None) -> bool:
     return (now_dt or datetime.now()).weekday() < 5
 
 
+# 영업시간 누적의 기준점(월요일 0시). 기준점부터 각 시각까지의 평일 누적 µs 차이가 경과 시간이다.
+_BUSINESS_EPOCH = datetime(2000, 1, 3)
+_DAY_US = 86_400_000_000
+_HOUR_US = 3_600_000_000
+
+
+def _business_us(days, us_in_day):
+    """기준점부터 days일 + us_in_day 지난 시각까지의 평일 누적 µs(주 단위 + 남은 요일)."""
+    weeks, weekday = divmod(days, 7)
+    return weeks * 5 * _DAY_US + min(weekday, 5) * _DAY_US + (us_in_day if weekday < 5 else 0)
+
+
+def _business_us_at(value: datetime) -> int:
+    delta = value - _BUSINESS_EPOCH
+    return _business_us(delta.days, delta.seconds * 1_000_000 + delta.microseconds)
+
+
 def business_elapsed_hours(ref_dt: datetime, now_dt: datetime) -> float:
     """두 시각 사이에서 토·일을 제외한 경과 시간을 시간 단위로 반환한다."""
     if now_dt <= ref_dt:
         return 0.0
-    weekend = 0.0
-    current = ref_dt
-    while current < now_dt:
-        day_end = datetime(current.year, current.month, current.day) + timedelta(days=1)
-        segment_end = min(day_end, now_dt)
-        if current.weekday() >= 5:
-            weekend += (segment_end - current).total_seconds()
-        current = segment_end
-    return ((now_dt - ref_dt).total_seconds() - weekend) / 3600.0
+    return (_business_us_at(now_dt) - _business_us_at(ref_dt)) / _HOUR_US
+
+
+def business_elapsed_hours_batch(refs, now_dt: datetime) -> np.ndarray:
+    """business_elapsed_hours를 열 전체에 적용한다. 기준 시각이 없으면(None·NaT) NaN."""
+    values = pd.to_datetime(pd.Series(refs, dtype=object), errors="coerce").to_numpy(
+        dtype="datetime64[us]")
+    missing = np.isnat(values)
+    offset = (values - np.datetime64(_BUSINESS_EPOCH, "us")).astype(np.int64)
+    days = offset // _DAY_US
+    weeks, weekday = np.divmod(days, 7)
+    business = (weeks * 5 * _DAY_US + np.minimum(weekday, 5) * _DAY_US
+                + np.where(weekday < 5, offset - days * _DAY_US, 0))
+    hours = np.maximum(_business_us_at(now_dt) - business, 0) / _HOUR_US
+    return np.where(missing, np.nan, hours)
 
 
 def parse_timestamp(value: object) -> datetime | None:
@@ -86,12 +131,7 @@ def parse_timestamp(value: object) -> datetime | None:
 def parse_tracking_list_timestamp(value: object) -> datetime | None:
     """배송추적 목록의 등록·이벤트 시각 표기를 datetime으로 파싱한다."""
     text = str(value or "").strip()
-    for fmt in (
-        "%Y-%m-%d %H:%M:%S",
-        "%Y-%m-%d %H:%M",
-        "%Y.%m.%d %H:%M:%S",
-        "%Y.%m.%d %H:%M",
-    ):
+    for fmt in TRACKING_LIST_TIMESTAMP_FORMATS:
         try:
             return datetime.strptime(text, fmt)
         except ValueError:
@@ -99,47 +139,110 @@ def parse_tracking_list_timestamp(value: object) -> datetime | None:
     return None
 
 
-def select_tracking_list_row_numbers(
+def parse_tracking_timestamps(values) -> pd.Series:
+    """parse_tracking_list_timestamp의 열 단위 버전. 해석하지 못한 값은 NaT."""
+    text = pd.Series(values, dtype=object).fillna("").astype(str).str.strip()
+    parsed = pd.Series(pd.NaT, index=text.index, dtype="datetime64[us]")
+    for fmt in TRACKING_LIST_TIMESTAMP_FORMATS:
+        missing = parsed.isna() & (text != "")
+        if not missing.any():
+            break
+        parsed[missing] = pd.to_datetime(text[missing], format=fmt, errors="coerce")
+    return parsed
+
+
+def _text_column(values: Sequence[object], count: int) -> pd.Series:
+    text = pd.Series(list(values) + [""] * (count - len(values)), dtype=object)
+    return text.map(lambda value: str("" if value is None else value).strip())
+
+
+def tracking_list_mode_masks(
     registrations: Sequence[object],
     completions: Sequence[object],
     events: Sequence[object],
     managements: Sequence[object],
-    mode: str,
     now_dt: datetime | None = None,
     completed_lookback_days: int = TRACKING_COMPLETED_LOOKBACK_DAYS,
-) -> list[int]:
-    """목록 모드에 맞는 Sheet 행 번호만 골라 상세 행 읽기 범위를 줄인다."""
+) -> dict[str, np.ndarray]:
+    """목록 모드마다 포함할 행의 bool 배열. 등록·이벤트 시각 열은 한 번만 파싱한다."""
     now_dt = now_dt or datetime.now()
     today = now_dt.date()
-    cutoff = today - timedelta(days=max(0, completed_lookback_days - 1))
+    cutoff = pd.Timestamp(today - timedelta(days=max(0, completed_lookback_days - 1)))
     count = max(len(registrations), len(completions), len(events), len(managements))
 
-    def cell(values: Sequence[object], index: int) -> str:
-        return str(values[index] if index < len(values) else "" or "").strip()
-
-    selected = []
-    for index in range(count):
-        registered = cell(registrations, index)
-        complete = cell(completions, index).upper() == "Y"
-        management = cell(managements, index)
-        if mode == "오늘":
-            include = registered.startswith(today.strftime("%Y-%m-%d"))
-        elif mode == "완료":
-            finished_at = parse_tracking_list_timestamp(cell(events, index))
-            if finished_at is None:
-                finished_at = parse_tracking_list_timestamp(registered)
-            include = complete and finished_at is not None and finished_at.date() >= cutoff
-        elif mode == "추적 중지":
-            include = management == TRACKING_MANAGEMENT_MANUAL_STOP
-        elif mode == "폐기 후보":
-            include = management == TRACKING_MANAGEMENT_CANDIDATE
-        elif mode == "폐기":
-            include = management == TRACKING_MANAGEMENT_DISCARDED
-        else:  # 배송중
-            include = not complete and management not in TRACKING_MANAGEMENT_EXCLUDED
-        if include:
-            selected.append(index + 2)  # 헤더 다음 행부터 시작
-    return selected
+    registered = _text_column(registrations, count)
+    complete = (_text_column(completions, count).str.upper() == "Y").to_numpy(dtype=bool)
+    management = _text_column(managements, count)
+    finished_at = parse_tracking_timestamps(_text_column(events, count))
+    finished_at = finished_at.fillna(parse_tracking_timestamps(registered))
+
+    def is_management(value: str) -> np.ndarray:
+        return (management == value).to_numpy(dtype=bool)
+
+    return {
+        "배송중": ~complete & ~management.isin(TRACKING_MANAGEMENT_EXCLUDED).to_numpy(dtype=bool),
+        "오늘": registered.str.startswith(today.strftime("%Y-%m-%d")).to_numpy(dtype=bool),
+        "추적 중지": is_management(TRACKING_MANAGEMENT_MANUAL_STOP),
+        "폐기 후보": is_management(TRACKING_MANAGEMENT_CANDIDATE),
+        "폐기": is_management(TRACKING_MANAGEMENT_DISCARDED),
+        "완료": complete & (finished_at.dt.normalize() >= cutoff).to_numpy(dtype=bool),
+        "전체": np.ones(count, dtype=bool),
+    }
+
+
+def tracking_rows_mode_masks(
+    rows: Sequence[Sequence[object]],
+    now_dt: datetime | None = None,
+    completed_lookback_days: int = TRACKING_COMPLETED_LOOKBACK_DAYS,
+) -> dict[str, np.ndarray]:
+    """송장추적 행 목록에 대한 tracking_list_mode_masks. 목록 필터 전환용."""
+    columns = [
+        [row[index] if index < len(row) else "" for row in rows]
+        for index in (1, 7, 11, TRACKING_MANAGEMENT_COL)
+    ]
+    return tracking_list_mode_masks(*columns, now_dt, completed_lookback_days)
+
+
+def select_tracking_archive_rows(
+    rows: Sequence[Sequence[object]],
+    now_dt: datetime | None = None,
+    older_than_days: int = TRACKING_ARCHIVE_AFTER_DAYS,
+) -> list[tuple[int, str]]:
+    """보관 대상 (Sheet 행 번호, 보관월 YYYY-MM) 목록.
+
+    완료여부가 Y이고 완료 시각(최근이벤트, 없으면 등록일시)이 older_than_days일보다 오래된 행이다.
+    시각을 읽을 수 없는 행은 옮기지 않는다.
+    """
+    if older_than_days <= 0 or not rows:
+        return []
+    now_dt = now_dt or datetime.now()
+    cutoff = pd.Timestamp(now_dt.date() - timedelta(days=older_than_days))
+    columns = [
+        [row[index] if index < len(row) else "" for row in rows]
+        for index in (1, 7, 11)
+    ]
+    registered, completions, events = (_text_column(column, len(rows)) for column in columns)
+    finished_at = parse_tracking_timestamps(events).fillna(parse_tracking_timestamps(registered))
+    mask = ((completions.str.upper() == "Y") & (finished_at < cutoff)).to_numpy(dtype=bool)
+    months = finished_at.dt.strftime("%Y-%m")
+    return [(int(index) + 2, months.iloc[index]) for index in np.flatnonzero(mask)]
+
+
+def select_tracking_list_row_numbers(
+    registrations: Sequence[object],
+    completions: Sequence[object],
+    events: Sequence[object],
+    managements: Sequence[object],
+    mode: str,
+    now_dt: datetime | None = None,
+    completed_lookback_days: int = TRACKING_COMPLETED_LOOKBACK_DAYS,
+) -> list[int]:
+    """목록 모드에 맞는 Sheet 행 번호만 골라 상세 행 읽기 범위를 줄인다."""
+    masks = tracking_list_mode_masks(
+        registrations, completions, events, managements, now_dt, completed_lookback_days,
+    )
+    mask = masks.get(mode, masks["배송중"])
+    return (np.flatnonzero(mask) + 2).tolist()  # 헤더 다음 행부터 시작
 
 
 def tracking_management_state(
@@ -238,6 +341,156 @@ def evaluate_risk(
     return None, elapsed_h
 
 
+def read_stale_thresholds(cfg: Mapping[str, object]) -> tuple[dict[str, int], int]:
+    """설정 map에서 분류별 정체 기준과 도서산간 가산 시간을 읽고 없으면 기본값을 쓴다."""
+    def read_hours(key: str, default: int) -> int:
+        try:
+            text = str(cfg.get(key, "")).strip()
+            return int(text) if text else default
+        except (TypeError, ValueError):
+            return default
+
+    thresholds = {
+        category: read_hours(key, STALE_DEFAULTS[category])
+        for category, key in STALE_CONFIG_KEYS.items()
+    }
+    return thresholds, read_hours(CONFIG_KEY_STALE_REMOTE_BONUS, STALE_REMOTE_BONUS_DEFAULT)
+
+
+def tracking_refresh_priority(
+    row: Sequence[object], now_dt: datetime,
+    threshold_hours: Mapping[str, int] | None = None,
+    remote_bonus_hours: int = STALE_REMOTE_BONUS_DEFAULT,
+) -> tuple:
+    """새로고침 대기열 정렬 키. 작을수록 먼저 조회한다.
+
+    1) 이미 정체 기준을 넘긴 위험 건, 2) 위험 분류(허브정체 → 수거누락 → 이동정체),
+    3) 최근조회시각이 오래된(또는 한 번도 조회하지 않은) 건, 4) 영업시간 기준 무이동이 긴 건 순.
+    """
+    def cell(index: int) -> str:
+        return str(row[index] if index < len(row) else "").strip()
+
+    status, where, management = cell(6), cell(8), cell(TRACKING_MANAGEMENT_COL)
+    ref = parse_tracking_list_timestamp(cell(11)) or parse_tracking_list_timestamp(cell(1))
+    overdue, elapsed_h = evaluate_risk(
+        status, where, False, ref, now_dt, threshold_hours or STALE_DEFAULTS,
+        remote_bonus_hours, management,
+    )
+    bucket = overdue or risk_bucket(status, where, False, management)
+    checked_at = parse_timestamp(cell(9))
+    since_check_h = (
+        (now_dt - checked_at).total_seconds() / 3600.0 if checked_at is not None else float("inf")
+    )
+    return (
+        0 if overdue else 1,
+        RISK_CATEGORY_ORDER.get(bucket, len(RISK_CATEGORY_ORDER)),
+        -since_check_h,
+        -elapsed_h,
+    )
+
+
+def order_tracking_refresh_queue(
+    active: Sequence[tuple[int, str, Sequence[object]]], now_dt: datetime,
+    threshold_hours: Mapping[str, int] | None = None,
+    remote_bonus_hours: int = STALE_REMOTE_BONUS_DEFAULT,
+) -> list[tuple[int, str, Sequence[object]]]:
+    """(행 번호, 등기번호, 행 값) 목록을 위험·오래됨 순으로 정렬한다. 같으면 시트 순서."""
+    return sorted(active, key=lambda item: tracking_refresh_priority(
+        item[2], now_dt, threshold_hours, remote_bonus_hours))
+
+
+def tracking_next_due(
+    row: Sequence[object], now_dt: datetime, pickup_hour: int | None = None,
+) -> datetime | None:
+    """행의 다음 조회 예정 시각. 한 번도 조회하지 않았으면 None(바로 조회).
+
+    운송장출력은 당일 등록분이면 pickup_hour(우체국 수거 시각)까지 미룬다.
+    """
+    def cell(index: int) -> str:
+        return str(row[index] if index < len(row) else "").strip()
+
+    status = cell(6)
+    registered = parse_tracking_list_timestamp(cell(1))
+    if status == "운송장출력" and pickup_hour is not None and registered is not None:
+        if registered.date() == now_dt.date() and now_dt.hour < pickup_hour:
+            return datetime(now_dt.year, now_dt.month, now_dt.day, pickup_hour)
+    checked_at = parse_timestamp(cell(9))
+    if checked_at is None:
+        return None
+    if status == "배달준비":
+        minutes = TRACKING_CADENCE_OUT_FOR_DELIVERY_MIN
+    else:
+        ref = parse_tracking_list_timestamp(cell(11)) or registered
+        stuck = ref is None or business_elapsed_hours(ref, now_dt) >= TRACKING_CADENCE_STUCK_HOURS
+        minutes = TRACKING_CADENCE_STUCK_MIN if stuck else TRACKING_CADENCE_MOVING_MIN
+    return checked_at + timedelta(minutes=minutes)
+
+
+def is_tracking_row_due(
+    row: Sequence[object], now_dt: datetime, pickup_hour: int | None = None,
+) -> bool:
+    """다음 조회 예정 시각이 지났거나 TRACKING_CADENCE_GRACE_MIN 안으로 다가왔으면 True."""
+    due = tracking_next_due(row, now_dt, pickup_hour)
+    return due is None or due <= now_dt + timedelta(minutes=TRACKING_CADENCE_GRACE_MIN)
+
+
+def evaluate_risk_batch(
+    statuses, wheres, dones, refs, now_dt: datetime,
+    threshold_hours: Mapping[str, int], remote_bonus_hours: int, managements=None,
+) -> tuple[list[str | None], list[float]]:
+    """evaluate_risk를 열 단위(NumPy/pandas)로 계산한다. 반환은 행별 (위험 분류, 경과 시간) 두 목록."""
+    status = pd.Series(statuses, dtype=object).fillna("").astype(str).str.strip()
+    index = status.index
+    where = pd.Series(list(wheres), index=index, dtype=object).fillna("").astype(str)
+    done = pd.Series(list(dones), index=index, dtype=object).fillna(False).astype(bool)
+    management = (
+        pd.Series(list(managements), index=index, dtype=object).fillna("").astype(str)
+        if managements is not None else pd.Series("", index=index, dtype=object)
+    )
+    hub = where.str.contains("|".join(map(re.escape, RISK_HUB_KEYWORDS)), regex=True)
+    remote = where.str.contains("|".join(map(re.escape, RISK_REMOTE_KEYWORDS)), regex=True)
+    bucket = pd.Series("이동정체", index=index, dtype=object)
+    bucket[hub] = "허브정체"
+    bucket[status == "운송장출력"] = "수거누락"
+    bucket[done | management.isin(TRACKING_MANAGEMENT_EXCLUDED) | status.isin(RISK_EXCLUDE_STATUS)] = None
+
+    elapsed = business_elapsed_hours_batch(list(refs), now_dt)
+    scored = bucket.notna().to_numpy() & ~np.isnan(elapsed)
+    threshold = bucket.map({
+        category: int(threshold_hours.get(category, default))
+        for category, default in STALE_DEFAULTS.items()
+    }).fillna(0).to_numpy(dtype=float)
+    threshold = threshold + np.where(
+        (bucket == "이동정체").to_numpy() & remote.to_numpy(), remote_bonus_hours, 0)
+    elapsed = np.where(scored, elapsed, 0.0)
+    at_risk = scored & (elapsed > threshold)
+    risks = [category if flag else None for category, flag in zip(bucket.tolist(), at_risk)]
+    return risks, elapsed.tolist()
+
+
+def evaluate_tracking_rows_risk(
+    rows: Sequence[Sequence[object]], now_dt: datetime,
+    threshold_hours: Mapping[str, int], remote_bonus_hours: int,
+) -> tuple[list[str | None], list[float]]:
+    """송장추적 행 목록의 위험 여부를 한 번에 계산한다.
+
+    기준 시각은 최근이벤트시각(L), 없으면 등록일시(B)다. 표 색칠·다이제스트 수집용.
+    """
+    if not rows:
+        return [], []
+
+    def column(index: int) -> list[object]:
+        return [row[index] if index < len(row) else "" for row in rows]
+
+    refs = parse_tracking_timestamps(column(11))
+    refs = refs.fillna(parse_tracking_timestamps(column(1)))
+    dones = [str(value).strip().upper() == "Y" for value in column(7)]
+    return evaluate_risk_batch(
+        column(6), column(8), dones, refs.tolist(), now_dt,
+        threshold_hours, remote_bonus_hours, column(TRACKING_MANAGEMENT_COL),
+    )
+
+
 def risk_signature(risks: Sequence[Mapping[str, object]]) -> str:
     """위험 목록 내용의 서명을 계산해 같은 목록의 재발송을 막는다."""
     keys = sorted(
@@ -0,0 +1,110 @@
+"""프로세스 전체가 공유하는 Google Sheets 스프레드시트·워크시트 핸들 캐시.
+
+worker마다 open_by_key(스프레드시트 메타데이터)와 worksheets()를 다시 부르지 않도록, 한 번 받은
+핸들을 스프레드시트 id·탭 제목으로 SHEET_HANDLE_TTL_SEC 동안 재사용한다(같은 gspread Client일 때만). 찾는 탭이 캐시에 없으면
+목록을 한 번 다시 받아 본 뒤 없다고 판단하고, 탭이 지워져 생긴 오류를 받으면 캐시를 비운다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+SHEET_HANDLE_TTL_SEC = 300
+
+
+def is_missing_worksheet_error(error: BaseException) -> bool:
+    """탭·스프레드시트가 없어져 캐시한 핸들이 더는 맞지 않을 때 나는 오류인지."""
+    if type(error).__name__ in ("WorksheetNotFound", "SpreadsheetNotFound"):
+        return True
+    code = getattr(error, "code", None)
+    return code == 404 or (code == 400 and "Unable to parse range" in str(error))
+
+
+class SheetHandleCache:
+    """스프레드시트 id별 Spreadsheet 핸들과 워크시트 목록을 TTL 동안 보관한다."""
+
+    def __init__(self, ttl_sec: float = SHEET_HANDLE_TTL_SEC, clock=time.monotonic):
+        self._ttl = float(ttl_sec)
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: dict[str, dict] = {}
+
+    def _entry(self, gc, spreadsheet_id: str) -> dict:
+        entry = self._entries.get(spreadsheet_id)
+        # 다른 Client(재로그인 등)로 부르면 이전 인증에 묶인 핸들을 쓰지 않고 새로 받는다.
+        if entry is None or entry["client"] is not gc or self._clock() - entry["loaded_at"] >= self._ttl:
+            entry = {
+                "client": gc,
+                "spreadsheet": gc.open_by_key(spreadsheet_id),
+                "worksheets": None,
+                "checked": set(),
+                "loaded_at": self._clock(),
+            }
+            self._entries[spreadsheet_id] = entry
+        return entry
+
+    def spreadsheet(self, gc, spreadsheet_id: str):
+        with self._lock:
+            return self._entry(gc, spreadsheet_id)["spreadsheet"]
+
+    def worksheets(self, gc, spreadsheet_id: str, refresh: bool = False) -> list:
+        """워크시트 목록(탭 순서). refresh면 서버에서 다시 받는다."""
+        with self._lock:
+            entry = self._entry(gc, spreadsheet_id)
+            if refresh or entry["worksheets"] is None:
+                entry["worksheets"] = list(entry["spreadsheet"].worksheets())
+            return list(entry["worksheets"])
+
+    def worksheet(self, gc, spreadsheet_id: str, title: str):
+        """제목이 같은 워크시트. 캐시에 없으면 목록을 다시 받아 보고, 그래도 없으면 None."""
+        with self._lock:
+            for refresh in (False, True):
+                for worksheet in self.worksheets(gc, spreadsheet_id, refresh=refresh):
+                    if worksheet.title == title:
+                        return worksheet
+            return None
+
+    def add_worksheet(self, gc, spreadsheet_id: str, title: str, rows: int, cols: int, **options):
+        """탭을 만들고 캐시한 목록에도 넣는다."""
+        with self._lock:
+            entry = self._entry(gc, spreadsheet_id)
+            worksheet = entry["spreadsheet"].add_worksheet(title=title, rows=rows, cols=cols, **options)
+            if entry["worksheets"] is not None:
+                index = options.get("index")
+                if index is None:
+                    entry["worksheets"].append(worksheet)
+                else:
+                    entry["worksheets"].insert(index, worksheet)
+            return worksheet
+
+    def first_use(self, spreadsheet_id: str, title: str) -> bool:
+        """핸들을 새로 받은 뒤 이 탭을 처음 쓰면 True(헤더 확인 등 한 번만 할 일에 쓴다)."""
+        with self._lock:
+            entry = self._entries.get(spreadsheet_id)
+            if entry is None or title in entry["checked"]:
+                return entry is None
+            entry["checked"].add(title)
+            return True
+
+    def invalidate(self, spreadsheet_id: str | None = None) -> None:
+        with self._lock:
+            if spreadsheet_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(spreadsheet_id, None)
+
+    def forget_on_error(self, error: BaseException) -> bool:
+        """탭이 없어져 난 오류면 캐시를 모두 비우고 True. 다음 호출이 핸들을 새로 받는다."""
+        if not is_missing_worksheet_error(error):
+            return False
+        self.invalidate()
+        return True
+
+
+_SHEET_HANDLES = SheetHandleCache()
+
+
+def sheet_handles() -> SheetHandleCache:
+    """프로세스 공용 핸들 캐시."""
+    return _SHEET_HANDLES
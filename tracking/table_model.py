@@ -0,0 +1,235 @@
+"""배송추적 표의 model/view 구성.
+
+표는 송장추적 행 목록을 그대로 보관하는 TrackingTableModel과, 목록 모드·수취인명 검색으로
+행을 거르는 TrackingFilterProxyModel로 이루어진다. 목록을 다시 받아도 위젯을 새로 만들지 않고
+등기번호 기준으로 바뀐 행만 row 단위 신호(dataChanged/insert/remove)로 알린다.
+위험 배경색은 셀을 미리 칠하지 않고 view가 BackgroundRole을 물을 때 분류에서 바로 고른다.
+"""
+
+from __future__ import annotations
+
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QBrush, QColor
+
+from .repository import normalize_tracking_no
+
+# 표시 컬럼: (시트 컬럼 인덱스, 헤더 라벨)
+TRACKING_TABLE_COLUMNS = [
+    (4, "수취인명"), (6, "배송상태"), (8, "마지막위치"),
+    (11, "최근이벤트"), (12, "관리상태"), (7, "완료"),
+    (3, "주문번호"), (0, "등기번호"), (2, "스토어"),
+    (9, "최근조회"), (10, "메모"),
+]
+TRACKING_TABLE_MEMO_COL = 10
+# 허브 정체 = 빨강(위험), 수거누락·이동정체 = 주황(주의)
+TRACKING_RISK_BACKGROUNDS = {
+    "허브정체": "#ffb3b3",
+    "수거누락": "#ffe0b3",
+    "이동정체": "#ffe0b3",
+}
+# 남는 행이 이 비율보다 적으면 행 단위 신호 대신 모델을 한 번에 초기화한다(모드 전환 등).
+TRACKING_TABLE_RESET_KEEP_RATIO = 0.5
+
+
+def _cell(row: Sequence[object], index: int) -> str:
+    return str(row[index]) if index < len(row) else ""
+
+
+def _row_keys(rows: Sequence[Sequence[object]]) -> list[tuple[str, int]]:
+    """행마다 (등기번호, 같은 번호 중 순번) 키. 중복·빈 등기번호도 서로 구분된다."""
+    seen: dict[str, int] = {}
+    keys = []
+    for row in rows:
+        regino = normalize_tracking_no(_cell(row, 0))
+        occurrence = seen.get(regino, 0)
+        seen[regino] = occurrence + 1
+        keys.append((regino, occurrence))
+    return keys
+
+
+def _ranges(indices: Sequence[int]) -> list[tuple[int, int]]:
+    """정렬된 행 번호를 연속 구간 (처음, 끝) 목록으로 묶는다."""
+    out: list[tuple[int, int]] = []
+    for index in indices:
+        if out and out[-1][1] == index - 1:
+            out[-1] = (out[-1][0], index)
+        else:
+            out.append((index, index))
+    return out
+
+
+class TrackingTableModel(QAbstractTableModel):
+    """송장추적 행 목록을 그대로 보여주는 표 모델. 메모 열만 편집할 수 있다."""
+
+    memo_edited = Signal(str, str)  # (등기번호, 메모)
+
+    def __init__(self, columns=TRACKING_TABLE_COLUMNS, parent=None):
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._rows: list[Sequence[object]] = []
+        self._risks: list[str | None] = []
+        self._keys: list[tuple[str, int]] = []
+        self._brushes = {
+            risk: QBrush(QColor(color)) for risk, color in TRACKING_RISK_BACKGROUNDS.items()
+        }
+
+    # ── Qt 모델 인터페이스 ────────────────────────────────────────────
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if (orientation == Qt.Orientation.Horizontal
+                and role == Qt.ItemDataRole.DisplayRole
+                and 0 <= section < len(self._columns)):
+            return self._columns[section][1]
+        return super().headerData(section, orientation, role)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return _cell(self._rows[index.row()], self._columns[index.column()][0])
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._brushes.get(self._risks[index.row()])
+        return None
+
+    def flags(self, index):
+        flags = super().flags(index)
+        if index.isValid() and self._columns[index.column()][0] == TRACKING_TABLE_MEMO_COL:
+            flags |= Qt.ItemFlag.ItemIsEditable
+        return flags
+
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (role != Qt.ItemDataRole.EditRole or not index.isValid()
+                or self._columns[index.column()][0] != TRACKING_TABLE_MEMO_COL):
+            return False
+        text = "" if value is None else str(value)
+        row = list(self._rows[index.row()])
+        if _cell(row, TRACKING_TABLE_MEMO_COL) == text:
+            return False
+        row.extend([""] * (TRACKING_TABLE_MEMO_COL + 1 - len(row)))
+        row[TRACKING_TABLE_MEMO_COL] = text
+        self._rows[index.row()] = row
+        self.dataChanged.emit(index, index, [role, Qt.ItemDataRole.DisplayRole])
+        regino = self._keys[index.row()][0]
+        if regino:
+            self.memo_edited.emit(regino, text)
+        return True
+
+    # ── 행 목록 접근 ─────────────────────────────────────────────────
+    def column_of(self, source_col: int) -> int:
+        return next(i for i, (idx, _label) in enumerate(self._columns) if idx == source_col)
+
+    def rows(self) -> list[Sequence[object]]:
+        """모델 행 순서 그대로의 시트 행 목록(복사본 아님)."""
+        return self._rows
+
+    def row_values(self, row: int) -> Sequence[object]:
+        return self._rows[row]
+
+    def risk(self, row: int) -> str | None:
+        return self._risks[row]
+
+    def regino(self, row: int) -> str:
+        return self._keys[row][0] if 0 <= row < len(self._keys) else ""
+
+    def row_of(self, regino: str) -> int:
+        """등기번호가 있는 모델 행 번호. 없으면 -1."""
+        try:
+            return self._keys.index((normalize_tracking_no(regino), 0))
+        except ValueError:
+            return -1
+
+    def set_rows(self, rows: Sequence[Sequence[object]], risks: Sequence[str | None]) -> bool:
+        """새 행 목록을 반영한다. 모델을 초기화했으면 True, 행 단위 신호로 맞췄으면 False.
+
+        사라진 행은 제거, 남은 행은 내용·위험 분류가 바뀐 행만 dataChanged, 새 행은 끝에 추가한다.
+        행은 복사해 보관한다. 호출 측이 같은 행 list를 고쳐 다시 넘겨도 바뀐 내용을 비교할 수 있다.
+        """
+        rows = [list(row) for row in rows]
+        risks = list(risks)
+        keys = _row_keys(rows)
+        positions = {key: i for i, key in enumerate(keys)}
+        kept = sum(1 for key in self._keys if key in positions)
+        if not self._keys or kept < len(self._keys) * TRACKING_TABLE_RESET_KEEP_RATIO:
+            self.beginResetModel()
+            self._rows, self._risks, self._keys = rows, risks, keys
+            self.endResetModel()
+            return True
+
+        removed = [i for i, key in enumerate(self._keys) if key not in positions]
+        for first, last in reversed(_ranges(removed)):
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self._rows[first:last + 1]
+            del self._risks[first:last + 1]
+            del self._keys[first:last + 1]
+            self.endRemoveRows()
+
+        changed = []
+        for i, key in enumerate(self._keys):
+            j = positions[key]
+            if self._rows[i] != rows[j] or self._risks[i] != risks[j]:
+                self._rows[i] = rows[j]
+                self._risks[i] = risks[j]
+                changed.append(i)
+        last_col = len(self._columns) - 1
+        for first, last in _ranges(changed):
+            self.dataChanged.emit(self.index(first, 0), self.index(last, last_col))
+
+        current = set(self._keys)
+        added = [j for j, key in enumerate(keys) if key not in current]
+        if added:
+            start = len(self._rows)
+            self.beginInsertRows(QModelIndex(), start, start + len(added) - 1)
+            self._rows.extend(rows[j] for j in added)
+            self._risks.extend(risks[j] for j in added)
+            self._keys.extend(keys[j] for j in added)
+            self.endInsertRows()
+        return False
+
+
+class TrackingFilterProxyModel(QSortFilterProxyModel):
+    """목록 모드·수취인명 검색으로 표 행을 거르고, 헤더 클릭 정렬을 맡는다.
+
+    모드 판정은 service.tracking_rows_mode_masks가 모델 행 순서로 미리 계산한 mask를 쓴다.
+    mask가 없는 모드는 모든 행을 보여준다.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._mode = "배송중"
+        self._search = ""
+        self._masks: Mapping[str, np.ndarray] = {}
+        self.setDynamicSortFilter(True)
+
+    def set_filter(self, mode: str, search: str = "",
+                   masks: Mapping[str, np.ndarray] | None = None) -> None:
+        search = (search or "").strip().casefold()
+        if masks is None:
+            if (mode, search) == (self._mode, self._search):
+                return
+            masks = self._masks
+        self.beginFilterChange()
+        self._mode, self._search, self._masks = mode, search, masks
+        self.endFilterChange(QSortFilterProxyModel.Direction.Rows)
+
+    def filterAcceptsRow(self, source_row, source_parent):
+        mask = self._masks.get(self._mode)
+        if mask is not None and (source_row >= len(mask) or not mask[source_row]):
+            return False
+        if not self._search:
+            return True
+        return self._search in _cell(self.sourceModel().row_values(source_row), 4).casefold()
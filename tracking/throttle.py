@@ -0,0 +1,135 @@
+"""배송추적 외부 호출(우체국 종추적)의 요청 속도 제한 도구."""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """여러 worker 스레드가 함께 쓰는 토큰 버킷.
+
+    rate는 초당 채워지는 토큰 수, capacity는 한꺼번에 허용할 최대 연속 호출 수다.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        self._rate = float(rate)
+        self._capacity = max(1.0, float(capacity))
+        self._clock = clock
+        self._tokens = self._capacity
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    def set_rate(self, rate: float) -> None:
+        """지금까지 쌓인 토큰은 이전 속도로 정산한 뒤 새 속도를 적용한다."""
+        if rate <= 0:
+            raise ValueError("rate는 0보다 커야 합니다.")
+        with self._lock:
+            self._refill(self._clock())
+            self._rate = float(rate)
+
+    def _refill(self, now: float) -> None:
+        elapsed = max(0.0, now - self._updated)
+        self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """토큰이 있으면 1개 가져가고 0을, 없으면 다음 토큰까지 기다릴 초를 반환한다."""
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self._rate
+
+    def acquire(self, stop_event: threading.Event | None = None) -> bool:
+        """토큰 1개를 얻을 때까지 기다린다. stop_event가 먼저 설정되면 False."""
+        while True:
+            if stop_event is not None and stop_event.is_set():
+                return False
+            wait = self.try_acquire()
+            if wait <= 0:
+                return True
+            if stop_event is not None:
+                if stop_event.wait(wait):
+                    return False
+            else:
+                time.sleep(wait)
+
+
+class AdaptiveRateGovernor:
+    """부하 신호(ERR-131·타임아웃)에 속도를 줄이고 성공이 이어지면 다시 올리는 조절기.
+
+    감소는 곱셈(decrease 배), 증가는 성공 1건마다 max_rate * increase 만큼 더한다.
+    한 번의 새로고침 실행 동안 실제 호출 수와 속도 변화를 모아 stats()로 돌려준다.
+    """
+
+    def __init__(
+        self, bucket: TokenBucket, max_rate: float, min_rate: float,
+        decrease: float = 0.5, increase: float = 0.05,
+        base_backoff: float = 1.0, max_backoff: float = 20.0,
+        clock=time.monotonic, jitter=random.random,
+    ):
+        self._bucket = bucket
+        self._max_rate = float(max_rate)
+        self._min_rate = min(float(min_rate), self._max_rate)
+        self._decrease = decrease
+        self._step = self._max_rate * increase
+        self._base_backoff = base_backoff
+        self._max_backoff = max_backoff
+        self._clock = clock
+        self._jitter = jitter
+        self._lock = threading.Lock()
+        self._started = clock()
+        self._calls = 0
+        self._overloads = 0
+        self._retries = 0
+        self._lowest = bucket.rate
+
+    def acquire(self, stop_event: threading.Event | None = None) -> bool:
+        """공유 버킷에서 호출 허가를 받는다. 중단되면 False."""
+        if not self._bucket.acquire(stop_event):
+            return False
+        with self._lock:
+            self._calls += 1
+        return True
+
+    def on_success(self) -> None:
+        with self._lock:
+            rate = min(self._max_rate, self._bucket.rate + self._step)
+        self._bucket.set_rate(rate)
+
+    def on_overload(self) -> None:
+        with self._lock:
+            self._overloads += 1
+            rate = max(self._min_rate, self._bucket.rate * self._decrease)
+            self._lowest = min(self._lowest, rate)
+        self._bucket.set_rate(rate)
+
+    def backoff_delay(self, attempt: int) -> float:
+        """재시도 대기 시간. 지수 증가 상한 안에서 절반은 고정, 절반은 무작위로 준다."""
+        with self._lock:
+            self._retries += 1
+        delay = min(self._max_backoff, self._base_backoff * (2 ** attempt))
+        return delay / 2 + self._jitter() * delay / 2
+
+    def stats(self) -> dict[str, float | int]:
+        """실행 동안의 실효 호출 속도(건/초)와 조절 이력을 반환한다."""
+        with self._lock:
+            elapsed = max(self._clock() - self._started, 1e-9)
+            return {
+                "calls": self._calls,
+                "elapsed_sec": round(elapsed, 3),
+                "effective_rate": round(self._calls / elapsed, 3) if self._calls else 0.0,
+                "final_rate": round(self._bucket.rate, 3),
+                "lowest_rate": round(self._lowest, 3),
+                "overloads": self._overloads,
+                "retries": self._retries,
+            }
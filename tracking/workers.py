@@ -2,42 +2,59 @@
 
 from __future__ import annotations
 
+import functools
+import threading
 import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
+from pathlib import Path
 
 import pandas as pd
 from PySide6.QtCore import QThread, Signal
 
+from .history import TrackingEventStore, TrackingHistoryError
+from .mirror import TrackingMirror, TrackingMirrorError, column_letter, parse_row_range
 from .repository import (
-    batch_update_tracking,
-    normalize_tracking_no as _normalize_tracking_no,
+    archive_tracking_rows,
+    attach_tracking_mirror,
+    batch_update_tracking_rows,
+    cached_config_values,
+    claim_lease,
+    find_tracking_row,
     open_config_worksheet,
     open_tracking_worksheet,
-    read_config_values_map,
+    read_tracking_archive_values,
     read_tracking_list_metadata,
     read_tracking_rows,
     read_tracking_values,
-    update_tracking_cell,
+    tracking_mirror,
     update_tracking_management,
     update_tracking_notes,
     upsert_tracking_records,
     write_config_values,
 )
 from .service import (
+    CONFIG_KEY_ARCHIVE_DAYS,
     CONFIG_KEY_INQUIRY_WORK_END,
     CONFIG_KEY_INQUIRY_WORK_START,
     CONFIG_KEY_STALE_HUB,
     CONFIG_KEY_STALE_PICKUP,
     CONFIG_KEY_STALE_REMOTE_BONUS,
     CONFIG_KEY_STALE_TRANSIT,
+    TRACKING_ARCHIVE_AFTER_DAYS,
     TRACKING_MANAGEMENT_ACTIVE,
     TRACKING_MANAGEMENT_COL,
     TRACKING_MANAGEMENT_EXCLUDED,
-    TRACKING_MANAGEMENT_MANUAL_STOP,
+    is_tracking_row_due,
+    order_tracking_refresh_queue,
     parse_timestamp as _parse_ts,
+    read_stale_thresholds,
+    select_tracking_archive_rows,
     select_tracking_list_row_numbers,
     tracking_management_state as _tracking_management_state,
 )
+from .sheet_handles import sheet_handles
+from .throttle import AdaptiveRateGovernor, TokenBucket
 
 try:
     import gspread
@@ -49,7 +66,7 @@ TRACKING_SHEET_TITLE = "송장추적"
 TRACKING_SHEET_HEADERS = [
     "등기번호", "등록일시", "스토어", "주문번호", "수취인명",
     "택배사코드", "배송상태", "완료여부", "마지막위치", "최근조회시각", "비고",
-    "최근이벤트시각", "관리상태",
+    "최근이벤트시각", "관리상태", "수정시각",
 ]
 CONFIG_SHEET_TITLE = "설정"
 CONFIG_SHEET_HEADERS = ["키", "값"]
@@ -58,13 +75,152 @@ CONFIG_KEY_SLACK_WEBHOOK = "slack_webhook_url"
 CONFIG_KEY_DIGEST_DATE = "digest_last_date"
 CONFIG_KEY_DIGEST_SIG = "digest_last_sig"
 CONFIG_KEY_AUTO_REFRESH_MIN = "tracking_auto_refresh_min"
-CONFIG_KEY_LAST_AUTO_REFRESH = "tracking_last_auto_refresh"
+# 다중 PC 작업 lease 이름(설정 탭 키는 repository.LEASE_KEY_PREFIX + 이름)
+LEASE_AUTO_REFRESH = "tracking_auto_refresh"
+LEASE_RISK_DIGEST = "risk_digest"
+# 공용 쓰기 큐(write_queue) 종류. 키는 등기번호.
+TRACKING_WRITE_UPSERT = "tracking_upsert"
+TRACKING_WRITE_MANAGEMENT = "tracking_management"
+TRACKING_WRITE_NOTES = "tracking_notes"
+CONFIG_KEY_LAST_ARCHIVE = "tracking_last_archive_date"
 KPOST_PICKUP_HOUR = 18
 KPOST_TRACKING_REQUEST_DELAY_SEC = 0.1
+KPOST_TRACKING_CONCURRENCY = 4
+KPOST_TRACKING_MAX_RETRIES = 3
+KPOST_TRACKING_MIN_RATE = 0.5  # 부하가 계속돼도 이 속도(건/초) 아래로는 낮추지 않는다.
+# 자동 새로고침 1회 시간 한도. 넘으면 남은(우선순위 낮은) 행은 다음 주기로 미룬다.
+KPOST_TRACKING_AUTO_TIME_BUDGET_SEC = 600
+# 최신 이벤트가 그대로인 행은 Sheet에 쓰지 않지만, 최근조회시각(J)이 이보다 오래되면 J만 갱신한다.
+TRACKING_UNCHANGED_STAMP_HOURS = 6
+TRACKING_CHECKED_COL = 9  # J = 최근조회시각
+# 바뀐 셀 사이의 그대로인 셀이 이 칸 수 이하면 범위를 나누지 않고 이어 쓴다.
+TRACKING_DIFF_MERGE_GAP = 2
+KPOST_TRACKING_RATE_LOG_PATH = Path(__file__).resolve().parent.parent / "logs" / "kpost_tracking_rate.log"
+# 전체·단건 새로고침이 같은 regkey를 쓰므로 프로세스 전체에서 한 버킷을 공유한다.
+_KPOST_RATE_LIMITER = TokenBucket(1.0 / KPOST_TRACKING_REQUEST_DELAY_SEC)
+
+
+_tracking_mirror_lock = threading.Lock()
+_tracking_mirror_tried = False
+
+
+def _ensure_tracking_mirror():
+    """처음 시트를 열 때 로컬 사본을 연결한다. 열지 못하면 Sheet 직접 읽기로 계속한다."""
+    global _tracking_mirror_tried
+    with _tracking_mirror_lock:
+        if _tracking_mirror_tried:
+            return
+        _tracking_mirror_tried = True
+        try:
+            attach_tracking_mirror(TrackingMirror())
+        except TrackingMirrorError:
+            pass
+
+
+_tracking_history_lock = threading.Lock()
+_tracking_history: TrackingEventStore | None = None
+_tracking_history_tried = False
+
+
+def _ensure_tracking_history():
+    """종추적 이벤트 이력 저장소를 한 번만 연다. 열지 못하면 None(이력 없이 예전처럼 모두 쓴다)."""
+    global _tracking_history, _tracking_history_tried
+    with _tracking_history_lock:
+        if not _tracking_history_tried:
+            _tracking_history_tried = True
+            try:
+                _tracking_history = TrackingEventStore()
+            except TrackingHistoryError:
+                _tracking_history = None
+        return _tracking_history
+
+
+def _with_checked_at(row, checked_at):
+    """로컬 이력의 마지막 조회 시각이 J열보다 최근이면 J만 바꾼 행 복사본을 반환한다."""
+    if checked_at is None:
+        return row
+    current = _parse_ts(row[9] if len(row) > 9 else "")
+    if current is not None and current >= checked_at:
+        return row
+    row = list(row) + [""] * max(0, 10 - len(row))
+    row[9] = checked_at.strftime("%Y-%m-%d %H:%M:%S")
+    return row
+
+
+def _changed_cell_updates(ridx, row, updates, now_dt, stamp_checked=True):
+    """행 1건의 갱신 payload에서 기존 행과 값이 다른 셀만 남긴다.
+
+    최근조회시각(J)은 다른 셀이 바뀌었거나, stamp_checked(로컬 이력이 없어 J로만 주기를
+    계산하는 경우)이거나, J가 TRACKING_UNCHANGED_STAMP_HOURS보다 오래됐을 때만 쓴다.
+    바뀐 셀 사이가 TRACKING_DIFF_MERGE_GAP칸 이하로 떨어져 있으면 한 범위로 이어 쓴다.
+    반환: (updates, changed) — changed는 J 외에 바뀐 셀이 있는지.
+    """
+    cells = {}
+    for update in updates:
+        _row, start, _end = parse_row_range(update["range"])
+        for offset, value in enumerate(update["values"][0]):
+            cells[start + offset] = value
+
+    def current(index):
+        return str(row[index]) if index < len(row) else ""
+
+    changed = sorted(index for index, value in cells.items()
+                     if index != TRACKING_CHECKED_COL and str(value) != current(index))
+    if TRACKING_CHECKED_COL in cells:
+        checked_at = _parse_ts(current(TRACKING_CHECKED_COL))
+        stale = (checked_at is None or (now_dt - checked_at).total_seconds()
+                 >= TRACKING_UNCHANGED_STAMP_HOURS * 3600)
+        if changed or stamp_checked or stale:
+            changed_cells = sorted([*changed, TRACKING_CHECKED_COL])
+        else:
+            changed_cells = changed
+    else:
+        changed_cells = changed
+    runs = []
+    for index in changed_cells:
+        if runs and index - runs[-1][1] - 1 <= TRACKING_DIFF_MERGE_GAP and all(
+                gap in cells for gap in range(runs[-1][1] + 1, index)):
+            runs[-1][1] = index
+        else:
+            runs.append([index, index])
+    out = []
+    for first, last in runs:
+        a1 = f"{column_letter(first)}{ridx}"
+        if last > first:
+            a1 += f":{column_letter(last)}{ridx}"
+        out.append({"range": a1, "values": [[cells[index] for index in range(first, last + 1)]]})
+    return out, bool(changed)
+
+
+def _coalesce_row_updates(updates):
+    """같은 열 범위를 연속한 행에 쓰는 payload 항목을 여러 행짜리 범위 하나로 합친다.
+
+    payload 항목끼리 셀이 겹치지 않으므로 순서를 바꿔 합쳐도 결과는 같다. 행 번호 순서로 받는다.
+    """
+    merged = []
+    latest = {}  # (시작 열, 끝 열) → 그 열 범위로 마지막에 만든 항목
+    for update in updates:
+        row, start, end = parse_row_range(update["range"])
+        last = latest.get((start, end))
+        if last is not None and last[0] + len(last[3]) == row:
+            last[3].extend(update["values"])
+        else:
+            latest[(start, end)] = [row, start, end, list(update["values"])]
+            merged.append(latest[(start, end)])
+    out = []
+    for row, start, end, values in merged:
+        a1 = f"{column_letter(start)}{row}"
+        if end > start or len(values) > 1:
+            a1 += f":{column_letter(end)}{row + len(values) - 1}"
+        out.append({"range": a1, "values": values})
+    return out
 
 
 def _standalone_open_tracking_ws(gc):
-    return open_tracking_worksheet(gc, SPREADSHEET_ID, TRACKING_SHEET_TITLE, TRACKING_SHEET_HEADERS)
+    worksheet = open_tracking_worksheet(
+        gc, SPREADSHEET_ID, TRACKING_SHEET_TITLE, TRACKING_SHEET_HEADERS)
+    _ensure_tracking_mirror()
+    return worksheet
 
 
 def _standalone_open_config_ws(gc):
@@ -72,28 +228,90 @@ def _standalone_open_config_ws(gc):
 
 
 def _read_config_values_map(ws):
-    return read_config_values_map(ws)
+    return cached_config_values(ws)
 
 
 def _write_config_values(ws, updates):
     return write_config_values(ws, updates)
 
 
-def run_tracking_upsert_worker(records):
-    """배송추적 Sheet upsert를 repository에 위임하고 기존 payload를 반환한다."""
-    if gspread is None:
-        return {"ok": False, "error": "gspread 패키지가 필요합니다. (pip install gspread)"}
-    try:
-        from google_sheets_oauth import get_authorized_gspread_client
-    except ImportError as error:
-        return {"ok": False, "error": str(error)}
+def _maybe_archive_tracking_rows(ws, cfg_ws, cfg):
+    """하루 한 번, 자동 새로고침 슬롯을 잡은 PC가 오래된 완료 행을 월별 보관 탭으로 옮긴다.
+
+    날짜를 먼저 기록해 다른 PC가 같은 날 다시 보관하지 않게 한다. 반환: 옮긴 행 수.
+    """
+    today = datetime.now().strftime("%Y-%m-%d")
+    if (cfg.get(CONFIG_KEY_LAST_ARCHIVE, "") or "").strip() == today:
+        return 0
     try:
-        worksheet = _standalone_open_tracking_ws(get_authorized_gspread_client())
-        result = upsert_tracking_records(
-            worksheet, records, TRACKING_SHEET_HEADERS, TRACKING_MANAGEMENT_ACTIVE)
-        return {"ok": True, **result}
-    except Exception as error:
-        return {"ok": False, "error": str(error)}
+        days = int((cfg.get(CONFIG_KEY_ARCHIVE_DAYS, "") or "").strip() or TRACKING_ARCHIVE_AFTER_DAYS)
+    except ValueError:
+        days = TRACKING_ARCHIVE_AFTER_DAYS
+    _write_config_values(cfg_ws, {CONFIG_KEY_LAST_ARCHIVE: today})
+    if days <= 0:
+        return 0
+    values = read_tracking_values(ws)
+    selections = select_tracking_archive_rows(values[1:], datetime.now(), days)
+    if not selections:
+        return 0
+    return archive_tracking_rows(ws, values, selections, TRACKING_SHEET_HEADERS)["archived"]
+
+
+def _open_tracking_ws_for_write():
+    if gspread is None:
+        raise RuntimeError("gspread 패키지가 필요합니다. (pip install gspread)")
+    from google_sheets_oauth import get_authorized_gspread_client
+
+    return _standalone_open_tracking_ws(get_authorized_gspread_client())
+
+
+def _sheet_write_handler(handler):
+    """쓰기 큐 handler 공통: 탭이 없어져 난 오류면 핸들 캐시를 비우고 그대로 다시 던진다."""
+    @functools.wraps(handler)
+    def wrapper(entries):
+        try:
+            return handler(entries)
+        except Exception as error:
+            sheet_handles().forget_on_error(error)
+            raise
+    return wrapper
+
+
+@_sheet_write_handler
+def flush_tracking_upserts(entries):
+    """쓰기 큐: 등기번호별로 모인 등록 요청을 upsert 한 번으로 반영한다."""
+    return upsert_tracking_records(
+        _open_tracking_ws_for_write(), [entry["payload"] for entry in entries],
+        TRACKING_SHEET_HEADERS, TRACKING_MANAGEMENT_ACTIVE)
+
+
+@_sheet_write_handler
+def flush_tracking_management(entries):
+    """쓰기 큐: 등기번호별 마지막 관리상태를 값마다 batch_update 한 번으로 반영한다."""
+    groups = {}
+    for entry in entries:
+        groups.setdefault(entry["payload"]["management"], []).append(entry["key"])
+    worksheet = _open_tracking_ws_for_write()
+    totals = {"updated": 0, "missing": 0}
+    for management, reginos in groups.items():
+        result = update_tracking_management(worksheet, reginos, management)
+        totals["updated"] += result["updated"]
+        totals["missing"] += result["missing"]
+    return totals
+
+
+@_sheet_write_handler
+def flush_tracking_notes(entries):
+    """쓰기 큐: 등기번호별 마지막 메모를 K열 batch_update 한 번으로 반영한다."""
+    notes = {entry["key"]: entry["payload"]["note"] for entry in entries}
+    return {"updated": update_tracking_notes(_open_tracking_ws_for_write(), notes)}
+
+
+def register_tracking_write_handlers(queue):
+    """배송추적 시트 쓰기 종류를 공용 쓰기 큐에 등록한다."""
+    queue.register(TRACKING_WRITE_UPSERT, flush_tracking_upserts)
+    queue.register(TRACKING_WRITE_MANAGEMENT, flush_tracking_management)
+    queue.register(TRACKING_WRITE_NOTES, flush_tracking_notes)
 
 
 def _cell_date_tuple(s):
@@ -111,14 +329,313 @@ def _cell_date_tuple(s):
     return None
 
 
+def _tracking_summary_updates(ridx, row, summary, now, now_dt):
+    """종추적 요약 1건을 기존 G:M/J:K payload 항목과 집계 분류로 변환한다.
+
+    반환: (분류, updates). 분류는 complete/progress/failed/aborted 중 하나다.
+    """
+    code = (summary.get("error_code") or "").upper()
+    if not summary.get("ok"):
+        # ERR-131(시스템 부하 차단): 더 호출하면 차단되므로 중단
+        if code == "ERR-131":
+            return "aborted", [{
+                "range": f"J{ridx}:K{ridx}",
+                "values": [[now, "우체국 시스템 부하로 조회 중단(ERR-131)"]],
+            }]
+        # ERR-001(조회결과 없음): 아직 추적정보 없음 → 실패가 아님
+        if code == "ERR-001":
+            management = _tracking_management_state(
+                row, "추적정보 없음", error_code=code, now_dt=now_dt)
+            return "progress", [{
+                "range": f"G{ridx}:M{ridx}",
+                "values": [["추적정보 없음", "N", "", now, "", "", management]],
+            }]
+        management = _tracking_management_state(
+            row, (row[6] if len(row) > 6 else ""), error_code=code, now_dt=now_dt)
+        updates = [{
+            "range": f"J{ridx}:K{ridx}",
+            "values": [[now, summary.get("error", "조회 실패")]],
+        }]
+        if management != (row[TRACKING_MANAGEMENT_COL]
+                          if len(row) > TRACKING_MANAGEMENT_COL else ""):
+            updates.append({"range": f"M{ridx}", "values": [[management]]})
+        return "failed", updates
+    done_yn = "Y" if summary.get("complete") else "N"
+    management = _tracking_management_state(
+        row, summary.get("status", ""), summary.get("where", ""), now_dt=now_dt)
+    # G:M = 배송상태, 완료여부, 마지막위치, 최근조회시각, 비고, 최근이벤트시각, 관리상태
+    return ("complete" if summary.get("complete") else "progress"), [{
+        "range": f"G{ridx}:M{ridx}",
+        "values": [[summary.get("status", ""), done_yn, summary.get("where", ""),
+                    now, "", summary.get("time", ""), management]],
+    }]
+
+
+def new_kpost_rate_governor(bucket=None, **options):
+    """공유 버킷을 감싸 한 번의 새로고침 실행 동안 속도를 조절하는 governor를 만든다.
+
+    이전 실행에서 낮아진 속도는 그대로 이어받고, 성공이 이어지면 기본 속도까지 회복한다.
+    """
+    return AdaptiveRateGovernor(
+        bucket or _KPOST_RATE_LIMITER,
+        max_rate=1.0 / KPOST_TRACKING_REQUEST_DELAY_SEC,
+        min_rate=KPOST_TRACKING_MIN_RATE,
+        **options,
+    )
+
+
+def refresh_tracking_rows(regkey, active, summarize, now_dt, progress_cb=None,
+                          concurrency=None, governor=None,
+                          max_retries=KPOST_TRACKING_MAX_RETRIES,
+                          time_budget_sec=None, request_budget=None, history=None,
+                          should_stop=None):
+    """미완료 행을 제한된 worker pool로 조회해 시트 순서의 일괄 갱신 payload를 만든다.
+
+    active는 (행 번호, 등기번호, 행 값) 목록이고 이 순서대로 조회를 시작한다(우선순위는
+    호출 측이 order_tracking_refresh_queue로 정한다). summarize(regkey, 등기번호)는
+    kpost_tracker.summarize_tracking과 같은 dict를 반환한다. 모든 조회는 공유
+    토큰 버킷을 거치며, ERR-131·타임아웃이면 governor가 속도를 낮추고 지수 backoff로
+    최대 max_retries회 재시도한다. 재시도 뒤에도 ERR-131이면 아직 시작하지 않은
+    조회는 건너뛰고 이미 진행 중이던 조회 결과만 반영한다.
+    time_budget_sec(초)·request_budget(재시도 포함 호출 수)를 넘기면 남은 행은 조회하지
+    않고 deferred로 센다. should_stop()이 True를 반환하면(예: 자동 새로고침 lease를 잃음)
+    새 조회를 시작하지 않고 이미 받은 결과만 payload로 만든다.
+    payload에는 기존 행과 값이 다른 셀만 넣고, 같은 열 범위를 연속한 행에 쓰면 한 범위로 합친다.
+    J 외에 바뀐 값이 없는 행은 unchanged로 센다. history(TrackingEventStore)가 있으면 조회 결과
+    이벤트와 조회 시각을 이력에 남기고, unchanged 행은 J가 오래됐을 때만 J를 쓴다.
+    반환: (batch_updates, counts) — counts: complete, progress, failed, checked, aborted,
+    deferred, unchanged, rate.
+    """
+    import kpost_tracker
+
+    governor = governor or new_kpost_rate_governor()
+    total = len(active)
+    workers = max(1, min(int(concurrency or KPOST_TRACKING_CONCURRENCY), total or 1))
+    stop = threading.Event()
+    summaries = [None] * total
+    deadline = time.monotonic() + time_budget_sec if time_budget_sec else None
+    budget_lock = threading.Lock()
+    requests_used = 0
+
+    def within_budget():
+        nonlocal requests_used
+        with budget_lock:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            if request_budget is not None and requests_used >= request_budget:
+                return False
+            requests_used += 1
+            return True
+
+    def query(index):
+        summary = None
+        for attempt in range(max_retries + 1):
+            if not stop.is_set() and should_stop is not None and should_stop():
+                stop.set()
+            if stop.is_set():
+                break
+            if not within_budget():
+                return index, None, True
+            if not governor.acquire(stop):
+                break
+            summary = summarize(regkey, active[index][1])
+            if not kpost_tracker.is_overload(summary):
+                governor.on_success()
+                return index, summary, False
+            governor.on_overload()
+            if attempt < max_retries and stop.wait(governor.backoff_delay(attempt)):
+                break
+        if summary is not None and (summary.get("error_code") or "").upper() == "ERR-131":
+            stop.set()
+        return index, summary, False
+
+    checked = deferred = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="kpost-trace") as pool:
+        futures = [pool.submit(query, index) for index in range(total)]
+        for future in as_completed(futures):
+            index, summary, over_budget = future.result()
+            deferred += over_budget
+            if summary is None:
+                continue
+            summaries[index] = summary
+            checked += 1
+            if progress_cb is not None:
+                try:
+                    progress_cb(checked, total)
+                except Exception:
+                    pass
+
+    now = now_dt.strftime("%Y-%m-%d %H:%M:%S")
+    counts = {"complete": 0, "progress": 0, "failed": 0, "checked": checked,
+              "aborted": False, "deferred": deferred, "unchanged": 0, "rate": governor.stats()}
+    batch_updates = []
+    for (ridx, tno, row), summary in sorted(zip(active, summaries), key=lambda item: item[0][0]):
+        if summary is None:
+            continue
+        kind, updates = _tracking_summary_updates(ridx, row, summary, now, now_dt)
+        if kind == "aborted":
+            counts["aborted"] = True
+        else:
+            counts[kind] += 1
+        if history is not None and kind in ("complete", "progress"):
+            try:
+                history.record(tno, summary.get("events") or [], now_dt)
+            except TrackingHistoryError as error:
+                print(f"! Tracking history write failed: {error}")
+                history = None
+        # 조회 시각이 로컬 이력에 남으면 값이 그대로인 행은 J도 오래됐을 때만 쓴다.
+        updates, changed = _changed_cell_updates(
+            ridx, row, updates, now_dt,
+            stamp_checked=history is None or kind not in ("complete", "progress"))
+        if not changed and kind in ("complete", "progress"):
+            counts["unchanged"] += 1
+        batch_updates.extend(updates)
+    return _coalesce_row_updates(batch_updates), counts
+
+
+def _record_tracking_rate(scope, auto, total, counts):
+    """실행별 실효 조회 속도를 로컬 로그에 남겨 요청 간격 조정 근거로 쓴다."""
+    rate = counts.get("rate") or {}
+    line = (
+        f"[{datetime.now():%Y-%m-%d %H:%M:%S}] scope={scope} auto={'Y' if auto else 'N'} "
+        f"total={total} checked={counts.get('checked', 0)} calls={rate.get('calls', 0)} "
+        f"elapsed={rate.get('elapsed_sec', 0)}s effective={rate.get('effective_rate', 0)}/s "
+        f"final={rate.get('final_rate', 0)}/s lowest={rate.get('lowest_rate', 0)}/s "
+        f"overloads={rate.get('overloads', 0)} retries={rate.get('retries', 0)} "
+        f"aborted={'Y' if counts.get('aborted') else 'N'} deferred={counts.get('deferred', 0)} "
+        f"not_due={counts.get('not_due', 0)} unchanged={counts.get('unchanged', 0)} "
+        f"delay={KPOST_TRACKING_REQUEST_DELAY_SEC}s"
+    )
+    try:
+        KPOST_TRACKING_RATE_LOG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with KPOST_TRACKING_RATE_LOG_PATH.open("a", encoding="utf-8") as stream:
+            stream.write(line + "\n")
+    except OSError:
+        pass
+    print(line, flush=True)
+
+
+def _refresh_tracking_sheet(gc, regkey, cfg, cfg_ws, progress_cb, auto, scope, concurrency,
+                            time_budget_sec, request_budget, due_only, lease=None):
+    """run_tracking_refresh_worker의 본 조회. 자동 슬롯 판정은 호출 측이 끝낸 뒤 부른다.
+
+    lease가 있으면 heartbeat가 lease를 잃은 뒤로는 새 조회를 시작하지 않고, 시트에 쓰기 직전에
+    아직 보유 중인지 다시 읽어 확인한다. 다른 PC가 가져갔으면 결과를 쓰지 않는다.
+    """
+    import kpost_tracker
+
+    ws = _standalone_open_tracking_ws(gc)
+    archived = 0
+    if auto and cfg_ws is not None:
+        try:
+            archived = _maybe_archive_tracking_rows(ws, cfg_ws, cfg)
+        except Exception as error:
+            print(f"! Tracking archive failed: {error}")
+    values = read_tracking_values(ws)
+    if len(values) <= 1:
+        return {"ok": True, "total": 0, "complete": 0, "progress": 0,
+                "failed": 0, "checked": 0, "aborted": False, "archived": archived}
+    # scope: active=화면의 추적중, exceptions=폐기 후보/확정 재확인, all=자동 갱신.
+    # (어제 이전의 운송장출력은 수거 누락 후보이므로 제외하지 않고 조회한다.)
+    now_dt = datetime.now()
+    today_tuple = (now_dt.year, now_dt.month, now_dt.day)
+    before_pickup = now_dt.hour < KPOST_PICKUP_HOUR
+    active = []
+    skipped_pre_pickup = 0
+    not_due = 0
+    if due_only is None:
+        due_only = auto
+    history = _ensure_tracking_history()
+    checked = {}
+    if history is not None and due_only:
+        checked = history.last_checked(
+            [(row[0] if row else "").strip() for row in values[1:]])
+    for ridx, row in enumerate(values[1:], start=2):
+        tno = (row[0] if len(row) > 0 else "").strip()
+        if not tno:
+            continue
+        done = (row[7] if len(row) > 7 else "").strip().upper()
+        if done == "Y":
+            continue
+        management = (row[TRACKING_MANAGEMENT_COL]
+                      if len(row) > TRACKING_MANAGEMENT_COL else "").strip()
+        excluded = management in TRACKING_MANAGEMENT_EXCLUDED
+        if (scope == "active" and excluded) or (scope == "exceptions" and not excluded):
+            continue
+        status = (row[6] if len(row) > 6 else "").strip()
+        if before_pickup and status == "운송장출력":
+            item_d = (_cell_date_tuple(row[11] if len(row) > 11 else "")
+                      or _cell_date_tuple(row[1] if len(row) > 1 else ""))
+            if item_d == today_tuple:
+                skipped_pre_pickup += 1
+                continue
+        # 값이 그대로여서 J를 쓰지 않은 조회도 주기 계산에는 넣는다.
+        if due_only and not is_tracking_row_due(
+                _with_checked_at(row, checked.get(tno)), now_dt, KPOST_PICKUP_HOUR):
+            not_due += 1
+            continue
+        active.append((ridx, tno, row))
+    if not active:
+        return {"ok": True, "total": 0, "complete": 0, "progress": 0,
+                "failed": 0, "checked": 0, "aborted": False,
+                "skipped": skipped_pre_pickup, "not_due": not_due, "archived": archived}
+    thresholds, remote_bonus = read_stale_thresholds(cfg or {})
+    active = order_tracking_refresh_queue(active, now_dt, thresholds, remote_bonus)
+    if auto and time_budget_sec is None:
+        time_budget_sec = KPOST_TRACKING_AUTO_TIME_BUDGET_SEC
+    summarize = kpost_tracker.summarize_tracking
+    if history is not None:
+        summarize = functools.partial(kpost_tracker.summarize_tracking, with_events=True)
+    batch_updates, counts = refresh_tracking_rows(
+        regkey, active, summarize, now_dt,
+        progress_cb=progress_cb, concurrency=concurrency,
+        time_budget_sec=time_budget_sec, request_budget=request_budget,
+        history=history,
+        should_stop=(lambda: lease.lost) if lease is not None else None,
+    )
+    total_active = len(active)
+    lease_lost = False
+    if lease is not None and (lease.lost or not lease.held()):
+        # 읽기→쓰기→재확인 선점이라 두 PC가 함께 조회하는 창이 남는다. 진 쪽은 쓰지 않는다.
+        lease.lost = lease_lost = True
+        print(f"! Lease lost during refresh ({lease.name}); skipped {len(batch_updates)} sheet writes")
+    elif batch_updates:
+        # 조회하는 동안 다른 PC가 보관(행 삭제)했을 수 있으므로 등기번호로 행을 다시 맞춰 쓴다.
+        batch_update_tracking_rows(ws, batch_updates, {ridx: tno for ridx, tno, _row in active})
+    _record_tracking_rate(scope, auto, total_active, {**counts, "not_due": not_due})
+    return {
+        "ok": True,
+        "total": total_active,
+        **counts,
+        "skipped": skipped_pre_pickup,
+        "not_due": not_due,
+        "archived": archived,
+        "lease_lost": lease_lost,
+    }
+
+
 def run_tracking_refresh_worker(regkey, progress_cb=None, auto=False, interval_min=0,
-                                scope="all"):
+                                scope="all", concurrency=None, time_budget_sec=None,
+                                request_budget=None, due_only=None):
     """「송장추적」 시트의 미완료 행만 골라 우체국 종추적조회로 상태를 갱신합니다.
     progress_cb(done, total)이 주어지면 진행 상황을 보고합니다.
-    auto=True(백그라운드 자동 새로고침)면 공유 「설정」의 마지막 자동조회 시각을 보고,
-    간격(interval_min, 설정 탭 값이 있으면 그쪽 우선) 안이면 우체국을 부르지 않고 건너뜁니다
-    → 여러 대가 켜져 있어도 먼저 도는 1대만 실제 조회(다중 PC 중복 조회 방지).
-    반환 dict: ok, total, complete, progress, failed, checked, aborted — 또는 ok False, error.
+    concurrency는 동시에 조회할 worker 수(기본 KPOST_TRACKING_CONCURRENCY)이며,
+    호출 속도는 공유 토큰 버킷(KPOST_TRACKING_REQUEST_DELAY_SEC 간격)으로 제한합니다.
+    조회 순서는 시트 순서가 아니라 위험(정체 기준 초과·위험 분류)과 최근조회시각이 오래된
+    순이라, ERR-131이나 time_budget_sec/request_budget(자동은 기본 KPOST_TRACKING_AUTO_TIME_BUDGET_SEC)
+    으로 중간에 끊겨도 챙겨야 할 송장부터 갱신됩니다. 끊겨서 못 본 행 수는 deferred로 반환합니다.
+    due_only(자동 새로고침 기본값)면 행별 조회 주기(tracking_next_due)가 돌아온 행만 조회하고
+    나머지는 not_due로 셉니다. 수동 새로고침은 기본적으로 모든 미완료 행을 조회합니다.
+    auto=True(백그라운드 자동 새로고침)면 공유 「설정」의 자동 새로고침 lease를 먼저 잡고,
+    다른 PC가 쥐고 있거나 간격(interval_min, 설정 탭 값이 있으면 그쪽 우선) 안이면 우체국을
+    부르지 않고 건너뜁니다 → 여러 대가 켜져 있어도 lease를 잡은 1대만 실제 조회.
+    ERR-131·타임아웃은 속도를 낮춰 재시도하고, 실행별 실효 속도는 rate로 반환하며
+    logs/kpost_tracking_rate.log에도 남깁니다.
+    로컬 종추적 이력이 열려 있으면 이벤트를 쌓고, 시트 값이 그대로인 행은 쓰지 않습니다(unchanged).
+    하루 한 번 자동 새로고침은 오래된 완료 행을 보관 탭으로 옮깁니다(archived).
+    반환 dict: ok, total, complete, progress, failed, checked, aborted, deferred, unchanged,
+    not_due, archived, rate
+    — 또는 ok False, error.
     자동 스킵 시: ok True, skipped_recent True (disabled True 면 설정상 꺼짐).
     """
     if gspread is None:
@@ -127,22 +644,17 @@ def run_tracking_refresh_worker(regkey, progress_cb=None, auto=False, interval_m
         from google_sheets_oauth import get_authorized_gspread_client
     except ImportError as e:
         return {"ok": False, "error": str(e)}
-    try:
-        import kpost_tracker
-    except ImportError as e:
-        return {"ok": False, "error": f"kpost_tracker 모듈을 불러올 수 없습니다: {e}"}
     try:
         gc = get_authorized_gspread_client()
-        # 로컬에 키가 없거나 자동 새로고침이면 공유 「설정」 탭을 읽는다.
-        # (자동일 땐 regkey 폴백 외에 '마지막 자동조회 시각'으로 다중 PC 중복 조회를 막는다.)
+        # 공유 「설정」 탭: regkey 폴백, 우선순위용 정체 기준, 그리고 자동일 땐
+        # 자동 새로고침 lease로 다중 PC 중복 조회를 막는다.
         cfg = None
         cfg_ws = None
-        if not regkey or auto:
-            try:
-                cfg_ws = _standalone_open_config_ws(gc)
-                cfg = _read_config_values_map(cfg_ws)
-            except Exception:
-                cfg = None
+        try:
+            cfg_ws = _standalone_open_config_ws(gc)
+            cfg = _read_config_values_map(cfg_ws)
+        except Exception:
+            cfg = None
         if not regkey and cfg is not None:
             regkey = cfg.get(CONFIG_KEY_KPOST_REGKEY, "") or regkey
         if not regkey:
@@ -159,129 +671,29 @@ def run_tracking_refresh_worker(regkey, progress_cb=None, auto=False, interval_m
                         pass
             if eff_interval <= 0:
                 return {"ok": True, "skipped_recent": True, "disabled": True}
-            last = _parse_ts(cfg.get(CONFIG_KEY_LAST_AUTO_REFRESH, "")) if cfg is not None else None
-            if last is not None and (datetime.now() - last).total_seconds() < eff_interval * 60:
-                return {"ok": True, "skipped_recent": True}
-            # 슬롯 선점: 지금 시각을 먼저 기록해 다른 PC가 같은 창에서 중복 조회하지 않게 한다.
-            # (조회가 실패/중단돼도 갱신되므로, 부하 상황에서 여러 대가 재차 몰리지 않는다.)
+            # 슬롯 선점: 공유 lease를 쥔 1대만 조회한다. 끝나면(실패·중단 포함) 간격이 지날 때까지
+            # 쥔 채로 두어 다른 PC가 같은 창에서 다시 조회하지 않게 한다. 조회 중 PC가 죽으면
+            # heartbeat가 끊겨 LEASE_TTL_SEC 뒤 다른 PC가 이어받는다.
             if cfg_ws is not None:
+                started = datetime.now()
+                lease = claim_lease(cfg_ws, LEASE_AUTO_REFRESH)
+                if lease is None:
+                    return {"ok": True, "skipped_recent": True}
                 try:
-                    _write_config_values(cfg_ws, {
-                        CONFIG_KEY_LAST_AUTO_REFRESH: datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                    })
-                except Exception:
-                    pass
-        ws = _standalone_open_tracking_ws(gc)
-        values = read_tracking_values(ws)
-        if len(values) <= 1:
-            return {"ok": True, "total": 0, "complete": 0, "progress": 0,
-                    "failed": 0, "checked": 0, "aborted": False}
-        # scope: active=화면의 추적중, exceptions=폐기 후보/확정 재확인, all=자동 갱신.
-        # (어제 이전의 운송장출력은 수거 누락 후보이므로 제외하지 않고 조회한다.)
-        now_dt = datetime.now()
-        today_tuple = (now_dt.year, now_dt.month, now_dt.day)
-        before_pickup = now_dt.hour < KPOST_PICKUP_HOUR
-        active = []
-        skipped_pre_pickup = 0
-        for ridx, row in enumerate(values[1:], start=2):
-            tno = (row[0] if len(row) > 0 else "").strip()
-            if not tno:
-                continue
-            done = (row[7] if len(row) > 7 else "").strip().upper()
-            if done == "Y":
-                continue
-            management = (row[TRACKING_MANAGEMENT_COL]
-                          if len(row) > TRACKING_MANAGEMENT_COL else "").strip()
-            excluded = management in TRACKING_MANAGEMENT_EXCLUDED
-            if (scope == "active" and excluded) or (scope == "exceptions" and not excluded):
-                continue
-            status = (row[6] if len(row) > 6 else "").strip()
-            if before_pickup and status == "운송장출력":
-                item_d = (_cell_date_tuple(row[11] if len(row) > 11 else "")
-                          or _cell_date_tuple(row[1] if len(row) > 1 else ""))
-                if item_d == today_tuple:
-                    skipped_pre_pickup += 1
-                    continue
-            active.append((ridx, tno, row))
-        if not active:
-            return {"ok": True, "total": 0, "complete": 0, "progress": 0,
-                    "failed": 0, "checked": 0, "aborted": False,
-                    "skipped": skipped_pre_pickup}
-        now = now_dt.strftime("%Y-%m-%d %H:%M:%S")
-        complete = progress = failed = 0
-        batch_updates = []
-        total_active = len(active)
-        aborted = False
-        checked = 0
-        for done_i, (ridx, tno, row) in enumerate(active, start=1):
-            if progress_cb is not None:
-                try:
-                    progress_cb(done_i, total_active)
-                except Exception:
-                    pass
-            s = kpost_tracker.summarize_tracking(regkey, tno)
-            checked += 1
-            code = (s.get("error_code") or "").upper()
-            if not s.get("ok"):
-                # ERR-131(시스템 부하 차단): 더 호출하면 차단되므로 중단
-                if code == "ERR-131":
-                    aborted = True
-                    batch_updates.append({
-                        "range": f"J{ridx}:K{ridx}",
-                        "values": [[now, "우체국 시스템 부하로 조회 중단(ERR-131)"]],
-                    })
-                    break
-                # ERR-001(조회결과 없음): 아직 추적정보 없음 → 실패가 아님
-                if code == "ERR-001":
-                    progress += 1
-                    management = _tracking_management_state(
-                        row, "추적정보 없음", error_code=code, now_dt=now_dt)
-                    batch_updates.append({
-                        "range": f"G{ridx}:M{ridx}",
-                        "values": [["추적정보 없음", "N", "", now, "", "", management]],
-                    })
-                    time.sleep(KPOST_TRACKING_REQUEST_DELAY_SEC)
-                    continue
-                management = _tracking_management_state(
-                    row, (row[6] if len(row) > 6 else ""),
-                    error_code=code, now_dt=now_dt)
-                failed += 1
-                batch_updates.append({
-                    "range": f"J{ridx}:K{ridx}",
-                    "values": [[now, s.get("error", "조회 실패")]],
-                })
-                if management != (row[TRACKING_MANAGEMENT_COL]
-                                  if len(row) > TRACKING_MANAGEMENT_COL else ""):
-                    batch_updates.append({"range": f"M{ridx}", "values": [[management]]})
-                time.sleep(KPOST_TRACKING_REQUEST_DELAY_SEC)
-                continue
-            done_yn = "Y" if s.get("complete") else "N"
-            if s.get("complete"):
-                complete += 1
-            else:
-                progress += 1
-            management = _tracking_management_state(
-                row, s.get("status", ""), s.get("where", ""), now_dt=now_dt)
-            # G:M = 배송상태, 완료여부, 마지막위치, 최근조회시각, 비고, 최근이벤트시각, 관리상태
-            batch_updates.append({
-                "range": f"G{ridx}:M{ridx}",
-                "values": [[s.get("status", ""), done_yn, s.get("where", ""),
-                            now, "", s.get("time", ""), management]],
-            })
-            time.sleep(KPOST_TRACKING_REQUEST_DELAY_SEC)
-        if batch_updates:
-            batch_update_tracking(ws, batch_updates)
-        return {
-            "ok": True,
-            "total": total_active,
-            "complete": complete,
-            "progress": progress,
-            "failed": failed,
-            "checked": checked,
-            "aborted": aborted,
-            "skipped": skipped_pre_pickup,
-        }
+                    with lease.keep_alive():
+                        return _refresh_tracking_sheet(
+                            gc, regkey, cfg, cfg_ws, progress_cb, auto, scope, concurrency,
+                            time_budget_sec, request_budget, due_only, lease=lease)
+                finally:
+                    try:
+                        lease.release(hold_until=started + timedelta(minutes=eff_interval))
+                    except Exception as error:
+                        print(f"! Lease release failed ({LEASE_AUTO_REFRESH}): {error}")
+        return _refresh_tracking_sheet(
+            gc, regkey, cfg, cfg_ws, progress_cb, auto, scope, concurrency,
+            time_budget_sec, request_budget, due_only)
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -313,53 +725,59 @@ def run_tracking_refresh_one_worker(regkey, regino):
         if not regkey:
             return {"ok": False, "error": "우체국 OpenAPI 인증키가 없습니다."}
         ws = _standalone_open_tracking_ws(gc)
-        values = read_tracking_values(ws)
-        ridx = None
-        tracking_row = []
-        for i, row in enumerate(values[1:], start=2):
-            if (row[0] if row else "").strip() == regino:
-                ridx = i
-                tracking_row = row
-                break
-        if ridx is None:
+        found = find_tracking_row(ws, regino)
+        if found is None:
             return {"ok": False, "error": "시트에서 해당 등기번호를 찾지 못했습니다."}
-        s = kpost_tracker.summarize_tracking(regkey, regino)
+        ridx, tracking_row = found
+        _KPOST_RATE_LIMITER.acquire()
+        history = _ensure_tracking_history()
+        s = kpost_tracker.summarize_tracking(regkey, regino, with_events=history is not None)
         now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        if history is not None and s.get("ok"):
+            try:
+                history.record(regino, s.get("events") or [], datetime.now())
+            except TrackingHistoryError as error:
+                print(f"! Tracking history write failed: {error}")
         code = (s.get("error_code") or "").upper()
         if not s.get("ok"):
             if code == "ERR-001":
                 management = _tracking_management_state(
                     tracking_row, "추적정보 없음", error_code=code)
-                batch_update_tracking(ws, [{"range": f"G{ridx}:M{ridx}",
-                                             "values": [["추적정보 없음", "N", "", now, "", "", management]]}])
+                batch_update_tracking_rows(ws, [{"range": f"G{ridx}:M{ridx}",
+                                                  "values": [["추적정보 없음", "N", "", now, "", "", management]]}],
+                                           {ridx: regino})
                 return {"ok": True, "regino": regino, "status": "추적정보 없음", "complete": False}
             management = _tracking_management_state(
                 tracking_row, (tracking_row[6] if len(tracking_row) > 6 else ""),
                 error_code=code)
-            batch_update_tracking(ws, [{"range": f"J{ridx}:K{ridx}",
-                                        "values": [[now, s.get("error", "조회 실패")]]}])
+            updates = [{"range": f"J{ridx}:K{ridx}", "values": [[now, s.get("error", "조회 실패")]]}]
             if management != (tracking_row[TRACKING_MANAGEMENT_COL]
                               if len(tracking_row) > TRACKING_MANAGEMENT_COL else ""):
-                update_tracking_cell(ws, ridx, "M", management)
+                updates.append({"range": f"M{ridx}", "values": [[management]]})
+            batch_update_tracking_rows(ws, updates, {ridx: regino})
             return {"ok": True, "regino": regino, "status": "(조회 실패)",
                     "complete": False, "note": s.get("error", "")}
         done_yn = "Y" if s.get("complete") else "N"
         management = _tracking_management_state(
             tracking_row, s.get("status", ""), s.get("where", ""))
-        batch_update_tracking(ws, [{"range": f"G{ridx}:M{ridx}",
-                                    "values": [[s.get("status", ""), done_yn, s.get("where", ""),
-                                                now, "", s.get("time", ""), management]]}])
+        batch_update_tracking_rows(ws, [{"range": f"G{ridx}:M{ridx}",
+                                         "values": [[s.get("status", ""), done_yn, s.get("where", ""),
+                                                     now, "", s.get("time", ""), management]]}],
+                                   {ridx: regino})
         return {"ok": True, "regino": regino, "status": s.get("status", ""),
                 "complete": s.get("complete", False)}
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
 def run_tracking_list_worker(mode="배송중"):
     """목록 모드에 필요한 송장추적 행만 읽어 표시용으로 반환한다.
 
-    「전체」만 전체 이력을 읽고, 나머지 모드는 상태·날짜·관리상태 열로
-    행을 먼저 선별한 뒤 상세 행만 다시 읽는다.
+    「전체」만 전체 이력을 읽고(월별 보관 탭 포함, archived=True), 나머지 모드는
+    상태·날짜·관리상태 열로 행을 먼저 선별한 뒤 상세 행만 다시 읽는다. 로컬 사본이 붙어 있으면
+    모드와 관계없이 송장추적 전체 행을 돌려주고(all_rows=True), 화면은 모드 mask로 걸러
+    필터 전환 때 다시 읽지 않는다.
     """
     if gspread is None:
         return {"ok": False, "error": "gspread 패키지가 필요합니다. (pip install gspread)"}
@@ -370,13 +788,19 @@ def run_tracking_list_worker(mode="배송중"):
     try:
         gc = get_authorized_gspread_client()
         ws = _standalone_open_tracking_ws(gc)
-        if mode == "전체":
+        if mode == "전체" or tracking_mirror() is not None:
             values = read_tracking_values(ws)
+            total_rows = max(0, len(values) - 1)
+            archived = mode == "전체"
+            if archived and values:
+                values = [*values, *read_tracking_archive_values(ws.spreadsheet)]
             return {
                 "ok": True,
                 "values": values,
-                "total_rows": max(0, len(values) - 1),
+                "total_rows": total_rows,
                 "mode": mode,
+                "all_rows": True,
+                "archived": archived,
             }
         header, metadata = read_tracking_list_metadata(ws)
         registrations, completions, events, managements = metadata
@@ -394,6 +818,7 @@ def run_tracking_list_worker(mode="배송중"):
             "mode": mode,
         }
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -447,42 +872,6 @@ def run_courier_receipt_export_worker(save_path, today_str):
     return {"ok": True, "count": len(rows), "path": save_path}
 
 
-def run_tracking_management_update_worker(reginos, management):
-    """선택된 송장의 관리상태 갱신을 repository에 위임한다."""
-    if gspread is None:
-        return {"ok": False, "error": "gspread 패키지가 필요합니다. (pip install gspread)"}
-    if management not in (TRACKING_MANAGEMENT_ACTIVE, TRACKING_MANAGEMENT_MANUAL_STOP):
-        return {"ok": False, "error": "지원하지 않는 관리상태입니다."}
-    if not {_normalize_tracking_no(regino) for regino in reginos or []} - {""}:
-        return {"ok": False, "error": "등기번호가 비어 있습니다."}
-    try:
-        from google_sheets_oauth import get_authorized_gspread_client
-    except ImportError as error:
-        return {"ok": False, "error": str(error)}
-    try:
-        worksheet = _standalone_open_tracking_ws(get_authorized_gspread_client())
-        return {"ok": True, **update_tracking_management(worksheet, reginos, management)}
-    except Exception as error:
-        return {"ok": False, "error": str(error)}
-
-
-def run_tracking_notes_update_worker(notes):
-    """등기번호별 메모 K열 갱신을 repository에 위임한다."""
-    if gspread is None:
-        return {"ok": False, "error": "gspread 패키지가 필요합니다. (pip install gspread)"}
-    if not {_normalize_tracking_no(regino) for regino in (notes or {})} - {""}:
-        return {"ok": True, "updated": 0}
-    try:
-        from google_sheets_oauth import get_authorized_gspread_client
-    except ImportError as error:
-        return {"ok": False, "error": str(error)}
-    try:
-        worksheet = _standalone_open_tracking_ws(get_authorized_gspread_client())
-        return {"ok": True, "updated": update_tracking_notes(worksheet, notes)}
-    except Exception as error:
-        return {"ok": False, "error": str(error)}
-
-
 def run_tracking_config_read_worker():
     """공유 「설정」 탭에서 회사 공통 우체국 regkey 를 읽습니다.
     반환 dict: ok, regkey — 또는 ok False, error.
@@ -510,6 +899,7 @@ def run_tracking_config_read_worker():
             "auto_refresh_min": cfg.get(CONFIG_KEY_AUTO_REFRESH_MIN, ""),
         }
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -527,6 +917,7 @@ def run_tracking_config_write_worker(updates):
         _write_config_values(ws, updates)
         return {"ok": True}
     except Exception as e:
+        sheet_handles().forget_on_error(e)
         return {"ok": False, "error": str(e)}
 
 
@@ -540,7 +931,11 @@ def run_slack_send_worker(webhook_url, text):
 
 
 def run_digest_send_worker(webhook_url, text, today_str, sig):
-    """위험 다이제스트를 전송하고 공유 설정의 중복 방지 값을 갱신한다."""
+    """위험 다이제스트를 전송하고 공유 설정의 중복 방지 값을 갱신한다.
+
+    여러 PC가 같은 새로고침 결과로 동시에 부르므로, 다이제스트 lease를 잡은 1대만 발송 여부를
+    판단하고 보낸다. 못 잡으면 reason busy로 건너뛴다.
+    """
     if gspread is None:
         return {"ok": False, "error": "gspread 패키지가 필요합니다.", "sent": False}
     try:
@@ -549,42 +944,28 @@ def run_digest_send_worker(webhook_url, text, today_str, sig):
         return {"ok": False, "error": str(error), "sent": False}
     try:
         worksheet = _standalone_open_config_ws(get_authorized_gspread_client())
-        key_to_row = {}
-        last_date = ""
-        last_sig = ""
-        for row_index, row in enumerate(worksheet.get_all_values()[1:], start=2):
-            key = (row[0] if row else "").strip()
-            if not key or key in key_to_row:
-                continue
-            key_to_row[key] = row_index
-            if key == CONFIG_KEY_DIGEST_DATE:
-                last_date = (row[1] if len(row) > 1 else "").strip()
-            elif key == CONFIG_KEY_DIGEST_SIG:
-                last_sig = (row[1] if len(row) > 1 else "").strip()
-        if last_date == today_str:
-            return {"ok": True, "sent": False, "reason": "today"}
-        if sig and sig == last_sig:
-            return {"ok": True, "sent": False, "reason": "unchanged"}
-        result = run_slack_send_worker(webhook_url, text)
-        if not result.get("ok"):
-            return {"ok": False, "error": result.get("error", ""), "sent": False}
-        updates = {
-            CONFIG_KEY_DIGEST_DATE: today_str,
-            CONFIG_KEY_DIGEST_SIG: sig,
-        }
-        new_rows = []
-        batch_updates = []
-        for key, value in updates.items():
-            if key in key_to_row:
-                batch_updates.append({"range": f"B{key_to_row[key]}", "values": [[value]]})
-            else:
-                new_rows.append([key, value])
-        if new_rows:
-            worksheet.append_rows(new_rows, value_input_option="RAW")
-        if batch_updates:
-            worksheet.batch_update(batch_updates, value_input_option="RAW")
-        return {"ok": True, "sent": True, "reason": "changed"}
+        lease = claim_lease(worksheet, LEASE_RISK_DIGEST)
+        if lease is None:
+            return {"ok": True, "sent": False, "reason": "busy"}
+        try:
+            # lease를 잡은 뒤 다시 읽어야 직전에 다른 PC가 보낸 기록을 놓치지 않는다.
+            cfg = _read_config_values_map(worksheet)
+            if cfg.get(CONFIG_KEY_DIGEST_DATE, "") == today_str:
+                return {"ok": True, "sent": False, "reason": "today"}
+            if sig and sig == cfg.get(CONFIG_KEY_DIGEST_SIG, ""):
+                return {"ok": True, "sent": False, "reason": "unchanged"}
+            result = run_slack_send_worker(webhook_url, text)
+            if not result.get("ok"):
+                return {"ok": False, "error": result.get("error", ""), "sent": False}
+            _write_config_values(worksheet, {
+                CONFIG_KEY_DIGEST_DATE: today_str,
+                CONFIG_KEY_DIGEST_SIG: sig,
+            })
+            return {"ok": True, "sent": True, "reason": "changed"}
+        finally:
+            lease.release()
     except Exception as error:
+        sheet_handles().forget_on_error(error)
         return {"ok": False, "error": str(error), "sent": False}
 
 
@@ -601,40 +982,34 @@ def validate_tracking_key_worker(regkey):
     return kpost_tracker.validate_key(regkey)
 
 
-
-class TrackingUpsertThread(QThread):
-    """송장 등기번호를 「송장추적」 시트에 백그라운드로 upsert."""
-
-    result_ready = Signal(dict)
-
-    def __init__(self, records, parent=None):
-        super().__init__(parent)
-        self._records = records
-
-    def run(self):
-        self.result_ready.emit(run_tracking_upsert_worker(self._records))
-
-
 class TrackingRefreshThread(QThread):
     """「송장추적」 시트 미완료 행을 우체국 종추적조회로 조회·갱신(백그라운드)."""
 
     result_ready = Signal(dict)
     progress = Signal(int, int)  # (done, total)
 
-    def __init__(self, regkey, parent=None, auto=False, interval_min=0, scope="all"):
+    def __init__(self, regkey, parent=None, auto=False, interval_min=0, scope="all",
+                 time_budget_sec=None, request_budget=None):
         super().__init__(parent)
         self._regkey = regkey
         self._auto = auto
         self._interval_min = interval_min
         self._scope = scope
+        self._time_budget_sec = time_budget_sec
+        self._request_budget = request_budget
 
     def run(self):
-        self.result_ready.emit(
-            run_tracking_refresh_worker(
-                self._regkey, progress_cb=self.progress.emit,
-                auto=self._auto, interval_min=self._interval_min, scope=self._scope,
+        from sheets_quota import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, sheets_priority
+
+        # 자동 새로고침은 백그라운드 우선순위로 Sheets를 쓴다(버튼 조회는 대화형).
+        with sheets_priority(PRIORITY_BACKGROUND if self._auto else PRIORITY_INTERACTIVE):
+            self.result_ready.emit(
+                run_tracking_refresh_worker(
+                    self._regkey, progress_cb=self.progress.emit,
+                    auto=self._auto, interval_min=self._interval_min, scope=self._scope,
+                    time_budget_sec=self._time_budget_sec, request_budget=self._request_budget,
+                )
             )
-        )
 
 
 class TrackingListThread(QThread):
@@ -642,40 +1017,16 @@ class TrackingListThread(QThread):
 
     result_ready = Signal(dict)
 
-    def __init__(self, mode="배송중", parent=None):
+    def __init__(self, mode="배송중", parent=None, background=False):
         super().__init__(parent)
         self._mode = mode
+        self._background = background
 
     def run(self):
-        self.result_ready.emit(run_tracking_list_worker(self._mode))
-
-
-class TrackingManagementUpdateThread(QThread):
-    """선택 송장의 수동 추적 중지/재개를 백그라운드로 저장합니다."""
-
-    result_ready = Signal(dict)
+        from sheets_quota import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, sheets_priority
 
-    def __init__(self, reginos, management, parent=None):
-        super().__init__(parent)
-        self._reginos = reginos
-        self._management = management
-
-    def run(self):
-        self.result_ready.emit(
-            run_tracking_management_update_worker(self._reginos, self._management))
-
-
-class TrackingNotesUpdateThread(QThread):
-    """배송추적 비고 편집값을 백그라운드로 저장합니다."""
-
-    result_ready = Signal(dict)
-
-    def __init__(self, notes, parent=None):
-        super().__init__(parent)
-        self._notes = notes
-
-    def run(self):
-        self.result_ready.emit(run_tracking_notes_update_worker(self._notes))
+        with sheets_priority(PRIORITY_BACKGROUND if self._background else PRIORITY_INTERACTIVE):
+            self.result_ready.emit(run_tracking_list_worker(self._mode))
 
 
 class CourierReceiptExportThread(QThread):
@@ -0,0 +1,286 @@
+"""Google Sheets 쓰기를 모아 보내는 write-behind 큐와 로컬 SQLite 저널.
+
+UI는 변경을 enqueue만 하고(로컬 저널 파일에 바로 기록) 곧바로 돌아온다. 백그라운드 스레드 하나가
+저널에 쌓인 항목을 종류(kind)별로 모아 handler를 한 번 부르고, handler는 보통 batch_update 한 번으로
+시트에 보낸다. 같은 종류·같은 키(등기번호 등)의 항목은 마지막 값 하나로 합쳐진다.
+실패한 종류는 저널에 남겨 두고 backoff 뒤 다시 보내며, 앱을 다시 켜면 남은 항목부터 보낸다
+(이전 실행에서 넘어온 항목은 replayed=True로 handler에 전달된다).
+항목마다 Sheets 우선순위(sheets_quota)를 함께 기록한다. 사용자가 누른 변경은 대화형으로 넣어
+백그라운드 쿼터 한도에 묶이지 않게 하고, 한 종류에 대화형 항목이 있으면 그 종류 묶음 전체를
+대화형으로 먼저 보낸다.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Mapping
+
+from sheets_quota import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, sheets_priority
+
+WRITE_QUEUE_FLUSH_DELAY_SEC = 1.5  # 첫 항목이 들어온 뒤 이만큼 더 모아서 보낸다
+WRITE_QUEUE_POLL_SEC = 5.0  # 재시도 대기 중인 항목이 있는지 다시 보는 간격
+WRITE_QUEUE_RETRY_BASE_SEC = 5.0
+WRITE_QUEUE_RETRY_MAX_SEC = 300.0
+
+
+class WriteQueueError(RuntimeError):
+    """쓰기 저널을 열거나 기록하지 못했을 때의 오류."""
+
+
+def default_write_queue_path() -> Path:
+    """Git에 포함하지 않는 로컬 쓰기 저널 파일 경로."""
+    return Path(__file__).resolve().parent.parent / "output" / "sheet-write-queue.sqlite3"
+
+
+class SheetWriteJournal:
+    """(kind, key)마다 마지막으로 요청한 payload 하나를 보관하는 저널(SQLite WAL)."""
+
+    def __init__(self, db_path: Path | str | None = None):
+        self.db_path = Path(db_path) if db_path else default_write_queue_path()
+        self._lock = threading.Lock()
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._initialize()
+        except (OSError, sqlite3.Error) as error:
+            raise WriteQueueError("시트 쓰기 저널 파일을 열지 못했습니다.") from error
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.db_path, timeout=10)
+        connection.row_factory = sqlite3.Row
+        return connection
+
+    def _initialize(self) -> None:
+        with closing(self._connect()) as connection:
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                connection.execute(
+                    """
+                    CREATE TABLE IF NOT EXISTS sheet_writes (
+                        kind TEXT NOT NULL,
+                        key TEXT NOT NULL,
+                        payload TEXT NOT NULL,
+                        revision INTEGER NOT NULL,
+                        session TEXT NOT NULL,
+                        queued_at TEXT NOT NULL,
+                        attempts INTEGER NOT NULL DEFAULT 0,
+                        last_error TEXT NOT NULL DEFAULT '',
+                        priority TEXT NOT NULL DEFAULT 'background',
+                        PRIMARY KEY (kind, key)
+                    )
+                    """,
+                )
+                columns = {row["name"] for row in connection.execute("PRAGMA table_info(sheet_writes)")}
+                if "priority" not in columns:
+                    # 우선순위 열이 없던 저널: 남은 항목은 백그라운드로 보낸다.
+                    connection.execute(
+                        "ALTER TABLE sheet_writes ADD COLUMN priority TEXT NOT NULL DEFAULT 'background'")
+
+    def put(self, kind: str, entries: Mapping[str, object], session: str,
+            priority: str = PRIORITY_BACKGROUND) -> None:
+        """키별 payload를 기록한다. 같은 (kind, key)가 이미 있으면 새 값으로 바꾸고 revision을 올린다.
+        아직 보내지 않은 대화형 항목은 백그라운드 값으로 덮여도 대화형으로 남는다."""
+        stamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        rows = [
+            (kind, str(key), json.dumps(payload, ensure_ascii=False), session, stamp, priority)
+            for key, payload in (entries or {}).items()
+        ]
+        if not rows:
+            return
+        try:
+            with self._lock, closing(self._connect()) as connection:
+                with connection:
+                    connection.executemany(
+                        "INSERT INTO sheet_writes (kind, key, payload, revision, session, queued_at, priority) "
+                        "VALUES (?, ?, ?, 1, ?, ?, ?) "
+                        "ON CONFLICT (kind, key) DO UPDATE SET payload = excluded.payload, "
+                        "revision = sheet_writes.revision + 1, session = excluded.session, "
+                        "queued_at = excluded.queued_at, attempts = 0, last_error = '', "
+                        f"priority = CASE WHEN sheet_writes.priority = '{PRIORITY_INTERACTIVE}' "
+                        "THEN sheet_writes.priority ELSE excluded.priority END",
+                        rows,
+                    )
+        except sqlite3.Error as error:
+            raise WriteQueueError("시트 쓰기 저널에 기록하지 못했습니다.") from error
+
+    def kinds(self) -> list[str]:
+        """남은 항목의 종류. 대화형 항목이 있는 종류가 먼저 온다."""
+        with self._lock, closing(self._connect()) as connection:
+            return [row["kind"] for row in connection.execute(
+                "SELECT kind FROM sheet_writes GROUP BY kind "
+                "ORDER BY MAX(priority = ?) DESC, kind", (PRIORITY_INTERACTIVE,))]
+
+    def pending(self, kind: str, session: str = "") -> list[dict]:
+        """kind의 항목을 요청 순서대로. 각 항목: key, payload, revision, attempts, priority, replayed."""
+        with self._lock, closing(self._connect()) as connection:
+            rows = connection.execute(
+                "SELECT key, payload, revision, session, attempts, priority FROM sheet_writes "
+                "WHERE kind = ? ORDER BY queued_at, rowid",
+                (kind,),
+            ).fetchall()
+        return [
+            {"key": row["key"], "payload": json.loads(row["payload"]),
+             "revision": row["revision"], "attempts": row["attempts"],
+             "priority": row["priority"], "replayed": row["session"] != session}
+            for row in rows
+        ]
+
+    def count(self, kind: str | None = None) -> int:
+        with self._lock, closing(self._connect()) as connection:
+            if kind is None:
+                return connection.execute("SELECT COUNT(*) FROM sheet_writes").fetchone()[0]
+            return connection.execute(
+                "SELECT COUNT(*) FROM sheet_writes WHERE kind = ?", (kind,)).fetchone()[0]
+
+    def remove(self, kind: str, entries) -> None:
+        """보낸 항목을 지운다. 보내는 동안 새 값으로 바뀐 키(revision이 다름)는 남긴다."""
+        with self._lock, closing(self._connect()) as connection:
+            with connection:
+                connection.executemany(
+                    "DELETE FROM sheet_writes WHERE kind = ? AND key = ? AND revision = ?",
+                    [(kind, entry["key"], entry["revision"]) for entry in entries],
+                )
+
+    def mark_failed(self, kind: str, entries, error: str) -> int:
+        """실패 횟수를 올리고 오류를 남긴다. 반환: 이번 묶음의 최대 실패 횟수."""
+        with self._lock, closing(self._connect()) as connection:
+            with connection:
+                connection.executemany(
+                    "UPDATE sheet_writes SET attempts = attempts + 1, last_error = ? "
+                    "WHERE kind = ? AND key = ? AND revision = ?",
+                    [(str(error)[:500], kind, entry["key"], entry["revision"]) for entry in entries],
+                )
+        return max((entry["attempts"] + 1 for entry in entries), default=1)
+
+
+class SheetWriteQueue:
+    """저널에 쌓인 쓰기를 종류별 handler로 묶어 보내는 백그라운드 큐.
+
+    handler(entries)는 entries(SheetWriteJournal.pending 형식) 전체를 시트에 반영하고 결과 dict를
+    돌려준다. 예외를 던지면 그 종류의 항목은 저널에 남고 backoff 뒤 다시 시도한다.
+    handler는 묶음에 대화형 항목이 하나라도 있으면 대화형, 아니면 백그라운드 우선순위로 불린다.
+    listener(kind, result)는 flush 스레드에서 불리므로 UI는 시그널로 넘겨 받아야 한다.
+    """
+
+    def __init__(self, journal: SheetWriteJournal, flush_delay_sec: float = WRITE_QUEUE_FLUSH_DELAY_SEC,
+                 clock=time.monotonic):
+        self.journal = journal
+        self.session = uuid.uuid4().hex
+        self._flush_delay = float(flush_delay_sec)
+        self._clock = clock
+        self._handlers: dict[str, Callable] = {}
+        self._listeners: list[Callable[[str, dict], None]] = []
+        self._retry_at: dict[str, float] = {}
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, kind: str, handler: Callable) -> None:
+        self._handlers[kind] = handler
+
+    def add_listener(self, listener: Callable[[str, dict], None]) -> None:
+        self._listeners.append(listener)
+
+    def enqueue(self, kind: str, entries: Mapping[str, object],
+                priority: str = PRIORITY_BACKGROUND) -> None:
+        """키별 payload를 저널에 기록하고 flush 스레드를 깨운다(시트 호출 없이 바로 반환).
+        사용자가 누른 변경은 priority=PRIORITY_INTERACTIVE로 넣는다."""
+        self.journal.put(kind, entries, self.session, priority)
+        self._wake.set()
+
+    def pending_count(self, kind: str | None = None) -> int:
+        return self.journal.count(kind)
+
+    def flush(self) -> list[tuple[str, dict]]:
+        """보낼 때가 된 종류마다 handler를 한 번 부른다. 반환: (kind, 결과) 목록."""
+        results = []
+        with self._flush_lock:
+            for kind in self.journal.kinds():
+                handler = self._handlers.get(kind)
+                if handler is None or self._clock() < self._retry_at.get(kind, 0.0):
+                    continue
+                entries = self.journal.pending(kind, self.session)
+                if not entries:
+                    continue
+                priority = (PRIORITY_INTERACTIVE
+                            if any(entry["priority"] == PRIORITY_INTERACTIVE for entry in entries)
+                            else PRIORITY_BACKGROUND)
+                try:
+                    with sheets_priority(priority):
+                        result = dict(handler(entries) or {})
+                except Exception as error:
+                    attempts = self.journal.mark_failed(kind, entries, str(error))
+                    delay = min(WRITE_QUEUE_RETRY_MAX_SEC, WRITE_QUEUE_RETRY_BASE_SEC * 2 ** (attempts - 1))
+                    self._retry_at[kind] = self._clock() + delay
+                    result = {"ok": False, "error": str(error), "pending": len(entries),
+                              "attempts": attempts, "retry_in_sec": delay}
+                else:
+                    self.journal.remove(kind, entries)
+                    self._retry_at.pop(kind, None)
+                    result = {"ok": True, "count": len(entries), **result}
+                results.append((kind, result))
+        for kind, result in results:
+            for listener in self._listeners:
+                try:
+                    listener(kind, result)
+                except Exception as error:
+                    print(f"! Sheet write listener failed ({kind}): {error}")
+        return results
+
+    def retry_now(self) -> None:
+        """재시도 대기를 무시하고 바로 보내게 한다(재인증·네트워크 복구 직후 등)."""
+        self._retry_at.clear()
+        self._wake.set()
+
+    def start(self) -> None:
+        """flush 스레드를 띄운다. 이전 실행에서 남은 항목이 있으면 바로 보낸다."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="sheet-write-queue", daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            woke = self._wake.wait(WRITE_QUEUE_POLL_SEC)
+            self._wake.clear()
+            if woke and self._stop.wait(self._flush_delay):
+                return
+            try:
+                if self.journal.count():
+                    self.flush()
+            except Exception as error:
+                print(f"! Sheet write queue flush failed: {error}")
+
+
+_write_queue_lock = threading.Lock()
+_write_queue: SheetWriteQueue | None = None
+
+
+def sheet_write_queue() -> SheetWriteQueue:
+    """프로세스 공용 쓰기 큐. 기본 저널을 열지 못하면 임시 폴더의 저널을 쓴다."""
+    global _write_queue
+    with _write_queue_lock:
+        if _write_queue is None:
+            try:
+                journal = SheetWriteJournal()
+            except WriteQueueError as error:
+                print(f"! {error} 임시 폴더의 저널을 사용합니다.")
+                journal = SheetWriteJournal(Path(tempfile.gettempdir()) / "easy-fulfill-sheet-write-queue.sqlite3")
+            _write_queue = SheetWriteQueue(journal)
+        return _write_queue